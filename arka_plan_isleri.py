@@ -0,0 +1,164 @@
+"""
+ARKA PLAN İŞLERİ
+----------------
+
+Uzun süren işlemleri (Crimmins, konservatif filtre, K-Means, Fourier filtreleri) Tkinter
+ana döngüsünü bloklamadan ayrı bir iş parçacığında çalıştırır.
+
+Tkinter bileşenlerine yalnızca ana iş parçacığından erişilebilir. Bu nedenle işçi iş
+parçacığı arayüze hiç dokunmaz: sonucu ve ilerleme bilgisini Job nesnesine yazar. Ana
+iş parçacığı root.after ile yaklaşık 60 Hz'de (16 ms) işi yoklar, ilerlemeyi gösterir ve
+iş bittiğinde sonucu geri çağırma (callback) fonksiyonuna verir.
+
+Aynı anda tek bir güncel iş vardır. Yeni bir iş başlatıldığında önceki iş iptal edilir ve
+sonucu, bittiğinde sessizce atılır. İptal işbirliğine dayanır: iş fonksiyonu
+job.report(...) çağırdığında iptal edilmişse JobCancelled fırlatılır ve iş durur. Tek bir
+OpenCV çağrısından oluşan işler (örn. cv2.kmeans) yarıda kesilemez; bu işler arka planda
+tamamlanır ancak sonuçları kullanılmaz.
+"""
+
+import threading
+
+
+class JobCancelled(Exception):
+    """İptal edilen bir iş, ilerleme bildirirken bu hatayı fırlatır."""
+
+
+class Job:
+    """
+    Arka planda çalışan tek bir iş.
+
+    Nitelikler:
+        title (str): Arayüzde gösterilecek açıklama
+        progress (float): 0-1 arası ilerleme; iş ilerleme bildirmiyorsa None
+    """
+
+    def __init__(self, title):
+        self.title = title
+        self.progress = None
+        self.result = None
+        self.error = None
+        self._cancelled = threading.Event()
+        self._done = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    @property
+    def done(self):
+        return self._done.is_set()
+
+    def cancel(self):
+        """İşi iptal edildi olarak işaretler. Sonucu artık kullanılmaz."""
+        self._cancelled.set()
+
+    def report(self, done, total):
+        """
+        İş fonksiyonunun ilerleme bildirmesi için kullanılır.
+
+        Parametreler:
+            done (int): Tamamlanan adım sayısı
+            total (int): Toplam adım sayısı
+
+        Hata:
+            JobCancelled: İş iptal edilmişse
+        """
+        if self.cancelled:
+            raise JobCancelled()
+        self.progress = done / total if total else None
+
+    def _run(self, func):
+        try:
+            self.result = func(self)
+        except JobCancelled:
+            pass
+        except Exception as e:
+            self.error = e
+        finally:
+            self._done.set()
+
+
+class JobExecutor:
+    """
+    İşleri arka planda çalıştırır ve sonuçları Tkinter ana iş parçacığına taşır.
+
+    Parametreler:
+        root (tk.Tk): after() ile yoklama yapılacak ana pencere
+        on_status (callable): Her yoklamada güncel işle (iş yoksa None ile) çağrılır;
+            ilerleme çubuğunu güncellemek için kullanılır
+    """
+
+    # Yoklama aralığı (ms): arayüz ~60 Hz'de güncellenir
+    POLL_INTERVAL_MS = 16
+
+    def __init__(self, root, on_status=None):
+        self.root = root
+        self.on_status = on_status
+        self._current = None  # (iş, on_done, on_error)
+        self._polling = False
+
+    @property
+    def current_job(self):
+        return self._current[0] if self._current is not None else None
+
+    def submit(self, func, on_done, on_error=None, title=""):
+        """
+        Yeni bir iş başlatır. Çalışan bir iş varsa iptal edilir.
+
+        Parametreler:
+            func (callable): İşçi iş parçacığında func(job) olarak çağrılır; dönüş değeri
+                iş sonucudur. Tkinter'a erişmemelidir.
+            on_done (callable): Ana iş parçacığında on_done(sonuç) olarak çağrılır
+            on_error (callable): İş hata fırlatırsa ana iş parçacığında on_error(hata)
+                olarak çağrılır
+            title (str): Arayüzde gösterilecek açıklama
+
+        Dönüş:
+            Job: Başlatılan iş
+        """
+        self.cancel()
+
+        job = Job(title)
+        self._current = (job, on_done, on_error)
+        # daemon: pencere kapatıldığında yarıda kalan iş programın kapanmasını bekletmez
+        threading.Thread(target=job._run, args=(func,), daemon=True).start()
+
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.POLL_INTERVAL_MS, self._poll)
+        return job
+
+    def cancel(self):
+        """Güncel işi iptal eder; sonucu kullanılmaz."""
+        if self._current is not None:
+            self._current[0].cancel()
+            self._current = None
+            if self.on_status is not None:
+                self.on_status(None)
+
+    def _poll(self):
+        """Güncel işin durumunu ana iş parçacığında kontrol eder."""
+        if self._current is None:
+            self._polling = False
+            return
+
+        job, on_done, on_error = self._current
+        if not job.done:
+            if self.on_status is not None:
+                self.on_status(job)
+            self.root.after(self.POLL_INTERVAL_MS, self._poll)
+            return
+
+        self._current = None
+        self._polling = False
+        if self.on_status is not None:
+            self.on_status(None)
+
+        if job.cancelled:
+            return
+        if job.error is not None:
+            if on_error is not None:
+                on_error(job.error)
+            return
+        on_done(job.result)
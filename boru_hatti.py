@@ -0,0 +1,208 @@
+"""
+ARTIMLI İŞLEM ZİNCİRİ (PIPELINE)
+--------------------------------
+
+Bir işlem zinciri (örn. Gaussian -> Canny -> Hough) parametre denenerek ayarlanırken
+genellikle yalnızca bir aşamanın parametresi değişir. Bu modül her aşamanın çıktısını
+önbellekte tutar; zincir tekrar çalıştırıldığında değişmeyen aşamalar hesaplanmaz.
+
+Önbellek anahtarı:
+    aşama anahtarı = özet(girdi anahtarı, işlem adı, parametreler)
+İlk aşamanın girdi anahtarı görüntünün içeriğinden (BLAKE2 özeti) hesaplanır; sonraki
+aşamalar bir önceki aşamanın anahtarını girdi anahtarı olarak kullanır. Böylece ara
+çıktıların içeriği hiç özetlenmez, yalnızca başlangıç görüntüsü bir kez okunur.
+k. aşamanın parametresi değiştiğinde k. ve sonraki aşamaların anahtarları değişir, önceki
+aşamalar önbellekten gelir.
+
+Önbelleğin toplam boyutu bir bayt sınırıyla kısıtlıdır; sınır aşıldığında en uzun süredir
+kullanılmayan (LRU) çıktılar silinir.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+import goruntu_islemleri
+
+# Aşama çıktıları için varsayılan önbellek boyutu (bayt)
+PIPELINE_CACHE_LIMIT = 512 * 1024 ** 2
+
+
+def image_digest(image):
+    """
+    Görüntünün içeriğinden, boyutundan ve veri türünden bir özet hesaplar.
+
+    Parametreler:
+        image (numpy.ndarray): Görüntü
+
+    Dönüş:
+        str: 32 karakterlik onaltılık özet
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((image.shape, image.dtype.str)).encode())
+    # Bitişik olmayan dizilerde (örn. dilimler) özet, kopyalanmış veri üzerinden hesaplanır
+    digest.update(memoryview(image if image.flags.c_contiguous else image.copy()).cast("B"))
+    return digest.hexdigest()
+
+
+def stage_key(input_key, name, params):
+    """
+    Bir aşamanın önbellek anahtarını hesaplar.
+
+    Parametreler:
+        input_key (str): Aşamanın girdisinin anahtarı
+        name (str): İşlem adı
+        params (tuple): İşlem parametreleri
+
+    Dönüş:
+        str: Aşama anahtarı
+    """
+    digest = hashlib.blake2b(input_key.encode(), digest_size=16)
+    digest.update(repr((name, tuple(params))).encode())
+    return digest.hexdigest()
+
+
+class StageCache:
+    """
+    Toplam boyutu bayt sınırıyla kısıtlı, LRU silme politikalı görüntü önbelleği.
+    Arka plan işleri ve arayüz aynı anda erişebildiği için işlemler kilitle korunur.
+
+    Parametreler:
+        limit (int): Önbellekteki görüntülerin toplam boyutu için üst sınır (bayt)
+    """
+
+    def __init__(self, limit=PIPELINE_CACHE_LIMIT):
+        self.limit = limit
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key):
+        """Anahtara karşılık gelen görüntüyü döndürür; yoksa None."""
+        with self._lock:
+            image = self._items.get(key)
+            if image is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return image
+
+    def put(self, key, image):
+        """Görüntüyü önbelleğe ekler, sınır aşılırsa en eski görüntüleri siler."""
+        # Tek başına sınırı aşan görüntü önbelleğe alınmaz
+        if image.nbytes > self.limit:
+            return
+
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.nbytes -= old.nbytes
+            self._items[key] = image
+            self.nbytes += image.nbytes
+
+            while self.nbytes > self.limit:
+                _, evicted = self._items.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.nbytes = 0
+
+
+class Pipeline:
+    """
+    Aşama çıktılarını önbellekte tutarak işlem zincirlerini artımlı çalıştırır.
+
+    Parametreler:
+        cache_limit (int): Aşama önbelleğinin bayt sınırı
+    """
+
+    def __init__(self, cache_limit=PIPELINE_CACHE_LIMIT):
+        self.cache = StageCache(cache_limit)
+        # Son girdi görüntüsü ve özeti; aynı görüntü için özet tekrar hesaplanmaz
+        self._digest_memo = None
+
+    def _input_key(self, image):
+        memo = self._digest_memo
+        if memo is None or memo[0] is not image:
+            memo = (image, image_digest(image))
+            self._digest_memo = memo
+        return memo[1]
+
+    def stage_keys(self, image, chain):
+        """
+        Zincirdeki her aşamanın önbellek anahtarını hesaplar.
+
+        Parametreler:
+            image (numpy.ndarray): Zincirin girdisi
+            chain (list): (işlem adı, parametreler) çiftleri
+
+        Dönüş:
+            list: Aşama anahtarları
+        """
+        keys = []
+        key = self._input_key(image)
+        for name, params in chain:
+            key = stage_key(key, name, params)
+            keys.append(key)
+        return keys
+
+    def prime(self, image, chain, outputs):
+        """
+        Daha önce hesaplanmış aşama çıktılarını önbelleğe ekler (örn. işlem geçmişindeki
+        görüntüler). None olan çıktılar atlanır.
+
+        Parametreler:
+            image (numpy.ndarray): Zincirin girdisi
+            chain (list): (işlem adı, parametreler) çiftleri
+            outputs (list): Her aşamanın çıktısı veya None
+        """
+        for key, output in zip(self.stage_keys(image, chain), outputs):
+            if output is not None:
+                self.cache.put(key, output)
+
+    def run_stages(self, image, chain, progress=None):
+        """
+        Zinciri çalıştırır ve her aşamanın çıktısını döndürür. Önbellekte bulunan aşamalar
+        hesaplanmaz.
+
+        Parametreler:
+            image (numpy.ndarray): Zincirin girdisi
+            chain (list): (işlem adı, parametreler) çiftleri
+            progress (callable): Her aşamadan önce progress(tamamlanan, toplam) olarak çağrılır
+
+        Dönüş:
+            list: Aşama çıktıları (zincir boşsa boş liste)
+        """
+        outputs = []
+        current = image
+        for i, ((name, params), key) in enumerate(zip(chain, self.stage_keys(image, chain))):
+            if progress is not None:
+                progress(i, len(chain))
+
+            result = self.cache.get(key)
+            if result is None:
+                result = goruntu_islemleri.apply_operation(current, name, *params)
+                self.cache.put(key, result)
+
+            outputs.append(result)
+            current = result
+
+        return outputs
+
+    def run(self, image, chain, progress=None):
+        """
+        Zinciri çalıştırır ve son aşamanın çıktısını döndürür.
+
+        Dönüş:
+            numpy.ndarray: Zincirin çıktısı (zincir boşsa girdi görüntüsü)
+        """
+        outputs = self.run_stages(image, chain, progress)
+        return outputs[-1] if outputs else image
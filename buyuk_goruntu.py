@@ -0,0 +1,327 @@
+"""
+BELLEĞE SIĞMAYAN GÖRÜNTÜLER (MEMMAP OKUMA / ŞERİT ŞERİT KAYDETME)
+-----------------------------------------------------------------
+
+cv2.imread tüm görüntüyü belleğe okur; ardından yapılan renk dönüşümü ve kopyalar aynı
+boyutta yeni diziler oluşturur. Çok büyük ham görüntülerde bu, işleme başlamadan önce
+görüntünün birkaç katı bellek demektir.
+
+Bu modül sıkıştırılmamış formatlar için numpy.memmap tabanlı bir yol sunar:
+    - .npy dosyaları doğrudan np.load(..., mmap_mode="r") ile açılır.
+    - Sıkıştırılmamış, şeritleri (strip) art arda yazılmış 8-bit TIFF dosyalarının piksel
+      bölgesi numpy.memmap ile eşlenir.
+
+Çıktılar da dosya üzerinde önceden oluşturulan bir memmap'e karo karo veya şerit şerit
+yazılır. İşletim sistemi yalnızca o an kullanılan sayfaları bellekte tuttuğu için en yüksek
+bellek kullanımı görüntü boyutuna değil birkaç karoya bağlıdır.
+
+Bu formatlarda pikseller RGB sırasında saklanır; OpenCV'nin BGR dönüşümüne gerek kalmaz.
+"""
+
+import os
+import struct
+import tempfile
+
+import numpy as np
+
+import karolu_isleme
+
+# Memmap ile açılabilen / yazılabilen uzantılar
+MEMMAP_EXTENSIONS = (".npy", ".tif", ".tiff")
+
+# Şerit şerit kopyalamada bir şeridin satır sayısı
+STRIP_ROWS = 256
+
+# TIFF etiketleri
+_IMAGE_WIDTH = 256
+_IMAGE_LENGTH = 257
+_BITS_PER_SAMPLE = 258
+_COMPRESSION = 259
+_PHOTOMETRIC = 262
+_STRIP_OFFSETS = 273
+_SAMPLES_PER_PIXEL = 277
+_ROWS_PER_STRIP = 278
+_STRIP_BYTE_COUNTS = 279
+_PLANAR_CONFIGURATION = 284
+
+# TIFF alan türü -> struct biçimi (BYTE, SHORT, LONG)
+_TIFF_TYPES = {1: "B", 3: "H", 4: "I"}
+
+
+def _read_tiff_tags(f):
+    """
+    TIFF dosyasının ilk IFD'sindeki tamsayı etiketlerini okur.
+
+    Dönüş:
+        dict: etiket -> değer demeti
+    """
+    header = f.read(8)
+    if header[:2] == b"II":
+        byte_order = "<"
+    elif header[:2] == b"MM":
+        byte_order = ">"
+    else:
+        raise ValueError("Geçerli bir TIFF dosyası değil")
+
+    magic, ifd_offset = struct.unpack(byte_order + "HI", header[2:8])
+    if magic != 42:
+        raise ValueError("Yalnızca klasik TIFF desteklenir (BigTIFF desteklenmez)")
+
+    f.seek(ifd_offset)
+    (count,) = struct.unpack(byte_order + "H", f.read(2))
+
+    tags = {}
+    for _ in range(count):
+        tag, field_type, n, value = struct.unpack(byte_order + "HHI4s", f.read(12))
+        fmt = _TIFF_TYPES.get(field_type)
+        if fmt is None:
+            continue
+
+        size = struct.calcsize(fmt) * n
+        if size <= 4:
+            # Küçük değerler doğrudan girdinin içinde saklanır
+            data = value[:size]
+        else:
+            position = f.tell()
+            f.seek(struct.unpack(byte_order + "I", value)[0])
+            data = f.read(size)
+            f.seek(position)
+
+        tags[tag] = struct.unpack(byte_order + fmt * n, data)
+
+    return tags
+
+
+def _tiff_layout(path):
+    """
+    Sıkıştırılmamış TIFF dosyasının piksel bölgesinin konumunu ve boyutunu bulur.
+
+    Dönüş:
+        tuple: (piksel verisinin dosyadaki konumu, dizi boyutu)
+
+    Hata:
+        ValueError: Dosya memmap ile açılabilecek bir düzende değilse
+    """
+    with open(path, "rb") as f:
+        tags = _read_tiff_tags(f)
+
+    width = tags[_IMAGE_WIDTH][0]
+    height = tags[_IMAGE_LENGTH][0]
+    samples = tags.get(_SAMPLES_PER_PIXEL, (1,))[0]
+
+    if tags.get(_COMPRESSION, (1,))[0] != 1:
+        raise ValueError("Sıkıştırılmış TIFF dosyaları memmap ile açılamaz")
+    if any(bits != 8 for bits in tags.get(_BITS_PER_SAMPLE, (1,))):
+        raise ValueError("Yalnızca 8-bit TIFF dosyaları desteklenir")
+    if samples > 1 and tags.get(_PLANAR_CONFIGURATION, (1,))[0] != 1:
+        raise ValueError("Yalnızca iç içe (chunky) kanal düzeni desteklenir")
+    if tags.get(_PHOTOMETRIC, (1,))[0] not in (1, 2):
+        raise ValueError("Yalnızca gri (BlackIsZero) ve RGB TIFF dosyaları desteklenir")
+
+    # Şeritler dosyada art arda değilse tek bir memmap ile eşlenemez
+    offsets = tags[_STRIP_OFFSETS]
+    counts = tags[_STRIP_BYTE_COUNTS]
+    for i in range(len(offsets) - 1):
+        if offsets[i] + counts[i] != offsets[i + 1]:
+            raise ValueError("TIFF şeritleri dosyada art arda değil")
+    if sum(counts) < width * height * samples:
+        raise ValueError("TIFF piksel verisi eksik")
+
+    shape = (height, width) if samples == 1 else (height, width, samples)
+    return offsets[0], shape
+
+
+def open_image_memmap(path):
+    """
+    Görüntüyü belleğe okumadan, dosya üzerinde salt okunur bir memmap olarak açar.
+
+    Parametreler:
+        path (str): .npy veya sıkıştırılmamış .tif/.tiff dosyası
+
+    Dönüş:
+        numpy.memmap: (satır, sütun) veya (satır, sütun, kanal) boyutlu uint8 dizi.
+        4 kanallı (RGBA) TIFF dosyalarında yalnızca RGB kanalları döndürülür.
+
+    Hata:
+        ValueError: Format desteklenmiyorsa
+    """
+    ext = os.path.splitext(path)[1].lower()
+
+    if ext == ".npy":
+        image = np.load(path, mmap_mode="r")
+        if image.dtype != np.uint8:
+            raise ValueError(f"Yalnızca uint8 diziler desteklenir: {image.dtype}")
+        return image
+
+    if ext in (".tif", ".tiff"):
+        offset, shape = _tiff_layout(path)
+        image = np.memmap(path, dtype=np.uint8, mode="r", offset=offset, shape=shape)
+        if image.ndim == 3 and image.shape[2] == 4:
+            image = image[:, :, :3]
+        return image
+
+    raise ValueError(f"Memmap ile açılamayan dosya türü: {ext}")
+
+
+def _create_tiff_memmap(path, shape, rows_per_strip=STRIP_ROWS):
+    """
+    Sıkıştırılmamış bir TIFF dosyası oluşturur ve piksel bölgesini yazılabilir memmap
+    olarak döndürür. Başlık ve etiketler önceden yazılır; şeritler art arda yerleştirilir.
+    """
+    height, width = shape[:2]
+    samples = 1 if len(shape) == 2 else shape[2]
+    row_bytes = width * samples
+    data_size = height * row_bytes
+    strips = [(y, min(rows_per_strip, height - y)) for y in range(0, height, rows_per_strip)]
+
+    tag_count = 10
+    ifd_size = 2 + tag_count * 12 + 4
+    bits_offset = 8 + ifd_size
+    offsets_offset = bits_offset + 2 * samples
+    counts_offset = offsets_offset + 4 * len(strips)
+    # Piksel verisini 8 baytlık sınıra hizala
+    data_offset = (counts_offset + 4 * len(strips) + 7) // 8 * 8
+
+    if data_offset + data_size > 2**32 - 1:
+        raise ValueError("Görüntü klasik TIFF için çok büyük (4 GB); .npy kullanın")
+
+    def entry(tag, field_type, count, value):
+        # Sığan değerler girdinin içine, sola yaslanarak yazılır
+        if field_type == 3 and count == 1:
+            return struct.pack("<HHIHH", tag, field_type, count, value, 0)
+        return struct.pack("<HHII", tag, field_type, count, value)
+
+    entries = [
+        entry(_IMAGE_WIDTH, 4, 1, width),
+        entry(_IMAGE_LENGTH, 4, 1, height),
+        entry(_BITS_PER_SAMPLE, 3, 1, 8) if samples == 1 else entry(_BITS_PER_SAMPLE, 3, samples, bits_offset),
+        entry(_COMPRESSION, 3, 1, 1),
+        entry(_PHOTOMETRIC, 3, 1, 2 if samples >= 3 else 1),
+        entry(_STRIP_OFFSETS, 4, len(strips), data_offset) if len(strips) == 1
+        else entry(_STRIP_OFFSETS, 4, len(strips), offsets_offset),
+        entry(_SAMPLES_PER_PIXEL, 3, 1, samples),
+        entry(_ROWS_PER_STRIP, 4, 1, rows_per_strip),
+        entry(_STRIP_BYTE_COUNTS, 4, len(strips), data_size) if len(strips) == 1
+        else entry(_STRIP_BYTE_COUNTS, 4, len(strips), counts_offset),
+        entry(_PLANAR_CONFIGURATION, 3, 1, 1),
+    ]
+
+    with open(path, "wb") as f:
+        f.write(b"II" + struct.pack("<HI", 42, 8))
+        f.write(struct.pack("<H", tag_count) + b"".join(entries) + struct.pack("<I", 0))
+        f.write(struct.pack("<" + "H" * samples, *([8] * samples)))
+        f.write(struct.pack("<" + "I" * len(strips), *(data_offset + y * row_bytes for y, _ in strips)))
+        f.write(struct.pack("<" + "I" * len(strips), *(n * row_bytes for _, n in strips)))
+        f.seek(data_offset + data_size - 1)
+        f.write(b"\0")
+
+    return np.memmap(path, dtype=np.uint8, mode="r+", offset=data_offset, shape=tuple(shape))
+
+
+def create_output_memmap(path, shape):
+    """
+    Belirtilen boyutta uint8 bir çıktı dosyası oluşturur ve yazılabilir memmap döndürür.
+    Dönen dizi, karolu işlemlere out parametresi olarak verilebilir.
+
+    Parametreler:
+        path (str): .npy veya .tif/.tiff dosya yolu
+        shape (tuple): (satır, sütun) veya (satır, sütun, kanal)
+
+    Dönüş:
+        numpy.memmap: Dosyaya bağlı yazılabilir dizi
+    """
+    ext = os.path.splitext(path)[1].lower()
+
+    if ext == ".npy":
+        return np.lib.format.open_memmap(path, mode="w+", dtype=np.uint8, shape=tuple(shape))
+    if ext in (".tif", ".tiff"):
+        return _create_tiff_memmap(path, shape)
+
+    raise ValueError(f"Memmap ile yazılamayan dosya türü: {ext}")
+
+
+def save_image_streaming(path, image, strip_rows=STRIP_ROWS):
+    """
+    Görüntüyü şerit şerit kaydeder. Tam boyutlu bir ara kopya (örn. RGB -> BGR dönüşümü)
+    oluşturulmaz; girdi de bir memmap ise aynı anda bellekte yalnızca bir şerit bulunur.
+
+    Görüntü önce aynı klasördeki geçici bir dosyaya yazılır ve sonra hedefin yerine konur.
+    Böylece görüntü hedef dosyadan memmap ile açılmışsa, dosya okunmadan önce
+    kesilmez ve açık memmap eski içeriği görmeye devam eder.
+
+    Parametreler:
+        path (str): .npy veya .tif/.tiff dosya yolu
+        image (numpy.ndarray): uint8 RGB veya gri görüntü
+        strip_rows (int): Bir şeritteki satır sayısı
+
+    Hata:
+        ValueError: Dosya türü desteklenmiyorsa veya görüntü klasik TIFF için çok büyükse
+        OSError: Dosya yazılamazsa
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    # Geçici dosya, create_output_memmap'in biçimi seçebilmesi için aynı uzantıyı taşır
+    temp_path = os.path.join(directory, f".{name}.{os.getpid()}.tmp{os.path.splitext(name)[1]}")
+    try:
+        out = create_output_memmap(temp_path, image.shape)
+        for y in range(0, image.shape[0], strip_rows):
+            out[y:y + strip_rows] = image[y:y + strip_rows]
+        out.flush()
+        # Dosya eşlemesi kapatılmadan yerine konamaz (Windows)
+        del out
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def process_file_streaming(input_path, output_path, chain, tile_size=karolu_isleme.TILE_SIZE, workers=None):
+    """
+    Büyük bir görüntüye işlem zincirini, görüntüyü hiçbir zaman bütünüyle belleğe almadan
+    uygular. Girdi memmap olarak açılır, her işlem karolar halinde çalışır ve sonucunu
+    doğrudan dosyaya bağlı bir memmap'e yazar. Ara adımlar, çıktı klasöründe geçici .npy
+    dosyalarında tutulur.
+
+    Yalnızca karolu karşılığı olan işlemler (karolu_isleme.KAROLU_ISLEMLER) kullanılabilir.
+
+    Parametreler:
+        input_path (str): .npy veya sıkıştırılmamış .tif/.tiff girdi dosyası
+        output_path (str): .npy veya .tif/.tiff çıktı dosyası
+        chain (list): (işlem adı, parametreler) çiftleri
+        tile_size (int): Karo kenar uzunluğu
+        workers (int): İş parçacığı sayısı
+    """
+    unsupported = [name for name, _ in chain if name not in karolu_isleme.KAROLU_ISLEMLER]
+    if unsupported:
+        raise ValueError(f"Karolar halinde çalıştırılamayan işlemler: {', '.join(unsupported)}")
+    if not chain:
+        raise ValueError("İşlem zinciri boş")
+
+    source = open_image_memmap(input_path)
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+
+    with tempfile.TemporaryDirectory(dir=output_dir) as temp_dir:
+        if source.ndim == 2:
+            # İşlemler RGB girdi beklediği için gri görüntü önce şerit şerit 3 kanala açılır
+            rgb = create_output_memmap(os.path.join(temp_dir, "rgb.npy"), source.shape + (3,))
+            for y in range(0, source.shape[0], STRIP_ROWS):
+                rgb[y:y + STRIP_ROWS] = source[y:y + STRIP_ROWS, :, np.newaxis]
+            source = rgb
+            del rgb
+
+        for i, (name, params) in enumerate(chain):
+            last = i == len(chain) - 1
+            target_path = output_path if last else os.path.join(temp_dir, f"adim_{i}.npy")
+
+            # Tüm işlemler RGB görüntüden RGB görüntü üretir
+            out = create_output_memmap(target_path, source.shape[:2] + (3,))
+            karolu_isleme.KAROLU_ISLEMLER[name](source, *params, tile_size=tile_size, workers=workers, out=out)
+            out.flush()
+
+            # Önceki ara dosya artık gerekmez
+            del source
+            source = out
+            del out
+
+        # Geçici klasör silinmeden önce dosya eşlemeleri kapatılmalıdır
+        del source
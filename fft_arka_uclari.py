@@ -0,0 +1,353 @@
+"""
+FFT ARKA UÇLARI
+---------------
+
+Frekans alanı filtrelerinin (bkz. frekans_alani) kullandığı gerçel girdili Fourier
+dönüşümlerini farklı kütüphanelerle hesaplar:
+
+- opencv: cv2.dft / cv2.idft. Her zaman kullanılabilir; spektrumu OpenCV'nin paketlenmiş
+  CCS biçiminde (görüntüyle aynı boyutta gerçel dizi) üretir.
+- scipy: scipy.fft.rfft2 / irfft2, workers=-1 ile tüm çekirdekleri kullanır.
+- pyfftw: FFTW planları (görüntü boyutu başına bir kez hazırlanır, birden fazla iş
+  parçacığıyla çalışır). İstenirse FFTW'nin "wisdom" bilgisi bir dosyada saklanır
+  (GORUNTU_ISLEME_FFTW_WISDOM ortam değişkeni veya set_wisdom_path); planlar sonraki
+  çalıştırmalarda yeniden ölçülmeden hazırlanır. Dosya yolu verilmezse diske hiçbir şey
+  yazılmaz.
+
+SciPy ve pyFFTW isteğe bağlıdır (pip install scipy pyfftw); kurulu değillerse yalnızca
+OpenCV kullanılır. Bu iki kütüphane spektrumu yarım düzlem düzeninde, (satır, sütun // 2 + 1)
+boyutunda kompleks dizi olarak üretir.
+
+Birden fazla arka uç kullanılabiliyorsa arka uçlar birkaç temsilci boyutta (BENCHMARK_SIZES)
+kısa bir ölçümle (ileri + ters dönüşüm) karşılaştırılır; her dönüşüm boyutu alanca en yakın
+temsilci boyutun en hızlı arka ucunu kullanır. Görüntünün kendi boyutunda ölçüm yapılmaz.
+Ölçümler start_benchmark ile arka planda başlatılabilir (arayüz açılışta başlatır); ölçüm
+sürerken henüz ölçülmemiş boyutlar beklemeden varsayılan arka ucu kullanır. Arka plan
+ölçümü başlatılmamışsa gereken temsilci boyut ilk kullanımda bir kez ölçülür. Seçim
+set_backend ile sabitlenebilir.
+"""
+
+import math
+import os
+import pickle
+import threading
+import time
+
+import cv2
+import numpy as np
+
+try:
+    import scipy.fft as scipy_fft
+except ImportError:  # SciPy isteğe bağlıdır
+    scipy_fft = None
+
+try:
+    import pyfftw
+except ImportError:  # pyFFTW isteğe bağlıdır
+    pyfftw = None
+
+# FFTW wisdom dosyası (planlama ölçümlerinin sonuçları); None ise wisdom okunmaz ve yazılmaz
+FFTW_WISDOM_PATH = os.environ.get("GORUNTU_ISLEME_FFTW_WISDOM") or None
+
+# Arka uç karşılaştırmasında her arka uç için ölçüm tekrarı (en kısa süre kullanılır)
+BENCHMARK_REPEAT = 2
+
+# Arka uçların ölçüldüğü temsilci kare dönüşüm boyutları (kenar uzunluğu, piksel)
+BENCHMARK_SIZES = (256, 512, 1024, 2048)
+
+# Ölçülen veri türleri (frekans filtreleri float32, homomorfik filtre float64 kullanır)
+BENCHMARK_DTYPES = ("float32", "float64")
+
+
+class OpenCVBackend:
+    """cv2.dft ile CCS biçiminde yarım spektrum."""
+
+    name = "opencv"
+    layout = "ccs"
+
+    def spectrum_shape(self, shape):
+        return tuple(shape)
+
+    def spectrum_dtype(self, dtype):
+        return np.dtype(dtype)
+
+    def forward(self, image, dst=None):
+        """Gerçel görüntünün spektrumunu hesaplar (dst verilirse içine yazar)."""
+        return cv2.dft(image, dst=dst)
+
+    def inverse(self, spectrum, shape, scale=False):
+        """
+        Spektrumdan gerçel görüntüyü geri oluşturur.
+
+        Parametreler:
+            spectrum (numpy.ndarray): forward çıktısı
+            shape (tuple): Dönüşümün (satır, sütun) boyutu
+            scale (bool): Sonucu 1 / (satır * sütun) ile ölçekle (np.fft.ifft2 gibi)
+        """
+        flags = cv2.DFT_REAL_OUTPUT | (cv2.DFT_SCALE if scale else 0)
+        return cv2.idft(spectrum, flags=flags)
+
+    def multiply(self, spectrum, other):
+        """İki spektrumu frekans frekans kompleks çarpar (uzamsal alanda dairesel konvolüsyon)."""
+        # CCS dizisinde gerçel ve sanal kısımlar yan yana paketlendiği için eleman eleman
+        # çarpım yalnızca gerçel bir maske için doğrudur
+        return cv2.mulSpectrums(spectrum, other, 0)
+
+
+class ScipyBackend:
+    """scipy.fft ile tüm çekirdeklerde yarım düzlem spektrum."""
+
+    name = "scipy"
+    layout = "half"
+
+    def spectrum_shape(self, shape):
+        rows, cols = shape
+        return rows, cols // 2 + 1
+
+    def spectrum_dtype(self, dtype):
+        return np.result_type(dtype, np.complex64)
+
+    def forward(self, image, dst=None):
+        spectrum = scipy_fft.rfft2(image, workers=-1)
+        if dst is None:
+            return spectrum
+        dst[...] = spectrum
+        return dst
+
+    def inverse(self, spectrum, shape, scale=False):
+        # norm="forward": ölçekleme ileri dönüşümde yapılır, ters dönüşüm ölçeklenmez
+        return scipy_fft.irfft2(spectrum, s=shape, workers=-1, norm="backward" if scale else "forward")
+
+    def multiply(self, spectrum, other):
+        return spectrum * other
+
+
+class PyFFTWBackend:
+    """pyFFTW ile önceden planlanmış, çok iş parçacıklı yarım düzlem spektrum."""
+
+    name = "pyfftw"
+    layout = "half"
+
+    def __init__(self):
+        self._plans = {}
+        # FFTW plan nesneleri iç tampon kullandığı için aynı anda tek iş parçacığı çalıştırabilir
+        self._lock = threading.Lock()
+        _load_wisdom()
+
+    def spectrum_shape(self, shape):
+        rows, cols = shape
+        return rows, cols // 2 + 1
+
+    def spectrum_dtype(self, dtype):
+        return np.result_type(dtype, np.complex64)
+
+    def _plan(self, shape, dtype):
+        """(boyut, veri türü) için ileri ve ters dönüşüm planlarını döndürür."""
+        key = (tuple(shape), np.dtype(dtype).str)
+        plans = self._plans.get(key)
+        if plans is None:
+            threads = os.cpu_count() or 1
+            forward = pyfftw.builders.rfft2(pyfftw.empty_aligned(shape, dtype),
+                                            planner_effort="FFTW_MEASURE", threads=threads)
+            inverse = pyfftw.builders.irfft2(pyfftw.empty_aligned(forward.output_shape, forward.output_dtype),
+                                             s=shape, planner_effort="FFTW_MEASURE", threads=threads)
+            plans = self._plans[key] = (forward, inverse)
+            _save_wisdom()
+        return plans
+
+    def forward(self, image, dst=None):
+        with self._lock:
+            forward, _ = self._plan(image.shape, image.dtype)
+            # Girdi planın hizalı iç tamponuna kopyalanır. Plan çıktısı da iç tampondur; bir
+            # sonraki çağrıda üzerine yazılacağı için kopyalanır
+            forward.input_array[...] = image
+            spectrum = forward()
+            if dst is None:
+                return spectrum.copy()
+            dst[...] = spectrum
+            return dst
+
+    def inverse(self, spectrum, shape, scale=False):
+        real_dtype = np.float32 if spectrum.dtype == np.complex64 else np.float64
+        with self._lock:
+            _, inverse = self._plan(shape, real_dtype)
+            # FFTW'nin kompleks -> gerçel dönüşümü girdisinin üzerine yazar; spektrum
+            # değişmesin diye iç tampona kopyalanır
+            inverse.input_array[...] = spectrum
+            return inverse(normalise_idft=scale).copy()
+
+    def multiply(self, spectrum, other):
+        return spectrum * other
+
+
+_wisdom_loaded = None
+
+
+def _load_wisdom():
+    """FFTW_WISDOM_PATH verilmişse wisdom dosyasını (yol başına bir kez) okur."""
+    global _wisdom_loaded
+    if FFTW_WISDOM_PATH is None or _wisdom_loaded == FFTW_WISDOM_PATH:
+        return
+    _wisdom_loaded = FFTW_WISDOM_PATH
+    try:
+        with open(FFTW_WISDOM_PATH, "rb") as f:
+            pyfftw.import_wisdom(pickle.load(f))
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        pass  # Wisdom yoksa veya bozuksa planlar yeniden ölçülür
+
+
+def _save_wisdom():
+    """FFTW_WISDOM_PATH verilmişse güncel wisdom bilgisini dosyaya yazar."""
+    if FFTW_WISDOM_PATH is None:
+        return
+    try:
+        with open(FFTW_WISDOM_PATH, "wb") as f:
+            pickle.dump(pyfftw.export_wisdom(), f)
+    except OSError:
+        pass  # Wisdom kaydedilemezse yalnızca sonraki çalıştırmada planlama uzun sürer
+
+
+def set_wisdom_path(path):
+    """
+    pyFFTW wisdom dosyasını belirler. Dosya varsa hemen okunur; yeni planlar hazırlandıkça
+    dosya güncellenir.
+
+    Parametreler:
+        path (str): Wisdom dosyasının yolu; None ise wisdom okunmaz ve yazılmaz
+    """
+    global FFTW_WISDOM_PATH
+    FFTW_WISDOM_PATH = os.path.expanduser(path) if path else None
+    if pyfftw is not None:
+        _load_wisdom()
+
+
+def _available_backends():
+    backends = [OpenCVBackend()]
+    if scipy_fft is not None:
+        backends.append(ScipyBackend())
+    if pyfftw is not None:
+        backends.append(PyFFTWBackend())
+    return backends
+
+
+# Kullanılabilir arka uçlar (OpenCV her zaman ilk sıradadır)
+BACKENDS = {backend.name: backend for backend in _available_backends()}
+
+_forced_backend = None
+
+
+def set_backend(name):
+    """
+    Tüm dönüşümler için kullanılacak arka ucu sabitler.
+
+    Parametreler:
+        name (str): BACKENDS içindeki arka uç adı; None ise boyut başına ölçümle seçilir
+
+    Hata:
+        ValueError: Arka uç bilinmiyorsa veya kurulu değilse
+    """
+    global _forced_backend
+    if name is not None and name not in BACKENDS:
+        raise ValueError(f"FFT arka ucu kullanılamıyor: {name} (kullanılabilir: {', '.join(BACKENDS)})")
+    _forced_backend = name
+
+
+def _time_backend(backend, sample):
+    """Arka ucun bir ileri + ters dönüşüm süresini ölçer (en kısa süre)."""
+    # Ölçüm arka ucun yeni bir örneğiyle yapılır; temsilci boyutların planları ve tamponları
+    # ölçümden sonra bellekte kalmaz
+    backend = type(backend)()
+    # İlk çağrı planlama ve ısınma içindir, ölçüme katılmaz
+    backend.inverse(backend.forward(sample), sample.shape)
+    best = float("inf")
+    for _ in range(BENCHMARK_REPEAT):
+        start = time.perf_counter()
+        backend.inverse(backend.forward(sample), sample.shape)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark(shape, dtype):
+    """
+    Verilen dönüşüm boyutu için tüm arka uçları ölçer.
+
+    Parametreler:
+        shape (tuple): Dönüşümün (satır, sütun) boyutu
+        dtype (str): Girdinin veri türü ("float32" veya "float64")
+
+    Dönüş:
+        dict: Arka uç adı -> bir ileri + ters dönüşüm süresi (sn)
+    """
+    sample = np.random.default_rng(0).random(shape).astype(dtype)
+    return {name: _time_backend(backend, sample) for name, backend in BACKENDS.items()}
+
+
+# (temsilci boyut, veri türü) -> benchmark sonucu
+_timings = {}
+_timings_lock = threading.Lock()
+_benchmark_thread = None
+
+
+def nearest_benchmark_size(shape):
+    """Dönüşüm boyutuna alanca (logaritmik ölçekte) en yakın temsilci kenar uzunluğu."""
+    area = math.log(max(shape[0] * shape[1], 1))
+    return min(BENCHMARK_SIZES, key=lambda size: abs(area - 2 * math.log(size)))
+
+
+def _measure(size, dtype):
+    """Temsilci boyutu ölçer ve sonucu saklar; daha önce ölçülmüşse tekrar ölçmez."""
+    with _timings_lock:
+        timings = _timings.get((size, dtype))
+        if timings is None:
+            timings = _timings[(size, dtype)] = benchmark((size, size), dtype)
+    return timings
+
+
+def _measure_all():
+    for dtype in BENCHMARK_DTYPES:
+        for size in BENCHMARK_SIZES:
+            _measure(size, dtype)
+
+
+def start_benchmark():
+    """
+    Tüm temsilci boyutların ölçümünü bir arka plan iş parçacığında başlatır (bir kez).
+    Ölçüm sürerken backend_for beklemez; henüz ölçülmemiş boyutlar için varsayılan arka
+    ucu döndürür.
+    """
+    global _benchmark_thread
+    if len(BACKENDS) == 1 or _benchmark_thread is not None:
+        return
+    _benchmark_thread = threading.Thread(target=_measure_all, name="fft-benchmark", daemon=True)
+    _benchmark_thread.start()
+
+
+def _default_backend():
+    """Ölçüm sonucu yokken kullanılan arka uç (planlama gerektirmeyen en hızlı seçenek)."""
+    return BACKENDS.get("scipy", BACKENDS["opencv"])
+
+
+def backend_for(shape, dtype):
+    """
+    Verilen dönüşüm boyutu için kullanılacak arka ucu döndürür. Birden fazla arka uç varsa
+    boyuta en yakın temsilci boyuttaki ölçüm sonucu kullanılır.
+
+    Parametreler:
+        shape (tuple): Dönüşümün (satır, sütun) boyutu
+        dtype: Girdinin veri türü (np.float32 veya np.float64)
+
+    Dönüş:
+        Arka uç nesnesi (OpenCVBackend, ScipyBackend veya PyFFTWBackend)
+    """
+    if _forced_backend is not None:
+        return BACKENDS[_forced_backend]
+    if len(BACKENDS) == 1:
+        return BACKENDS["opencv"]
+
+    key = (nearest_benchmark_size(shape), np.dtype(dtype).name)
+    timings = _timings.get(key)
+    if timings is None:
+        if _benchmark_thread is not None and _benchmark_thread.is_alive():
+            return _default_backend()
+        timings = _measure(*key)
+    return BACKENDS[min(timings, key=timings.get)]
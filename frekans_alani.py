@@ -0,0 +1,798 @@
+"""
+FREKANS ALANI YARDIMCILARI
+--------------------------
+
+Bu modül, frekans alanında çalışan tüm Fourier filtrelerinin (alçak/yüksek geçiren,
+bant geçiren/durduran, Butterworth, Gauss ve homomorfik) kullandığı maskeleri üretir.
+
+Gerçel (reel) bir görüntünün Fourier dönüşümü eşlenik simetriktir: F(-u, -v) = F(u, v)*.
+Spektrumun yarısı diğer yarısını belirlediği için filtreler yalnızca yarım spektrumla
+çalışır: cv2.dft gerçel girdiyi OpenCV'nin paketlenmiş CCS biçiminde dönüştürür (görüntüyle
+aynı boyutta, tek kanallı gerçel dizi) ve cv2.idft(DFT_REAL_OUTPUT) doğrudan gerçel görüntü
+üretir. Tam kompleks spektruma göre dönüşüm süresi ve bellek yaklaşık yarıya iner.
+
+Maskeler yalnızca merkeze olan uzaklığa bağlı (ışınsal simetrik) ve gerçel olduğu için
+eşlenik simetriyi bozmaz; bu nedenle CCS dizisinin her elemanı, ait olduğu frekansın maske
+değeriyle doğrudan çarpılabilir. Maskeler fftshift uygulanmamış CCS düzeninde üretilir.
+Görselleştirme için merkezi kaydırılmış (fftshift) düzendeki maske ve genlik spektrumu da
+hesaplanabilir: spektrumun merkezi (rows // 2, cols // 2) noktasıdır.
+
+Dönüşümler fft_arka_uclari modülündeki arka uçlardan biriyle (OpenCV, SciPy veya pyFFTW)
+hesaplanır; arka uç her dönüşüm boyutu için ölçümle seçilir. SciPy ve pyFFTW spektrumu CCS
+yerine yarım düzlem düzeninde (satır, sütun // 2 + 1 boyutunda kompleks dizi) üretir; maske
+ve genlik spektrumu arka ucun düzenine göre hesaplanır.
+
+Modül ayrıca Fourier dönüşümü yardımcılarını ve maskeyi bir görüntüye uygulayan
+fonksiyonları içerir. Bu fonksiyonlar Tkinter'a bağlı değildir; NumPy dizisi alıp
+NumPy dizisi döndürür.
+
+Maske hesaplamaları döngü yerine tek bir dizi ifadesiyle yapılır ve iki seviyeli bir
+önbellek kullanılır:
+1. Uzaklık ızgarası: Görüntü boyutuna göre önbelleğe alınır. Örneğin d0 kaydırıcısı
+   değiştirildiğinde ızgara yeniden hesaplanmaz.
+2. Maske: (boyut, filtre türü, parametreler) anahtarıyla önbelleğe alınır. Aynı ayar
+   tekrar seçildiğinde maske hiç hesaplanmaz.
+
+Görüntünün ileri Fourier dönüşümleri (her kanal için, sıfırla genişletilmiş yarım spektrum)
+de önbellekte tutulur. İşlemler görüntüleri yerinde değiştirmeyip yeni dizi döndürdüğü için
+dizinin kimliği (is) görüntünün sürümü olarak kullanılır. Aynı görüntüde filtre türü veya
+parametresi değiştirildiğinde ileri dönüşüm tekrar hesaplanmaz; yalnızca maske çarpımı ve
+ters dönüşüm yapılır.
+
+functools.lru_cache: Sınırlı boyutlu, en uzun süredir kullanılmayanı silen (LRU) önbellek
+"""
+
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+import cv2
+import numpy as np
+
+import fft_arka_uclari
+
+# Önbellekte tutulacak en fazla ızgara ve maske sayısı
+# (12 MP bir görüntü için bir ızgara ~96 MB, bir maske ~48 MB yer kaplar)
+DISTANCE_GRID_CACHE_SIZE = 2
+MASK_CACHE_SIZE = 8
+
+# Spektrumları önbellekte tutulacak en fazla görüntü sayısı (renkli görüntü ve gri tonlamalı
+# önizlemesi ayrı sayılır). 12 MP bir renkli görüntünün spektrumları ~150 MB yer kaplar.
+SPECTRUM_CACHE_SIZE = 2
+
+# Blok blok (overlap-save) filtrelemede maskenin uzamsal karşılığı olan çekirdeğin yarıçapı,
+# en küçük kesim frekansı d için KERNEL_SUPPORT * DFT boyutu / d olarak seçilir. Gaussian
+# alçak geçiren filtrede bu, uzamsal sigmanın yaklaşık 12 katıdır; ideal filtrelerin sinc
+# biçimli çekirdeğinde ise yalnızca ilk birkaç halka korunur (bkz. karolu_isleme).
+KERNEL_SUPPORT = 2.0
+
+# Butterworth filtresinin derecesi arttıkça kesimi keskinleşir ve çekirdeği yavaş sönümlenir;
+# bu dereceden büyük filtrelerde destek derece / BUTTERWORTH_SUPPORT_ORDER oranında büyütülür
+BUTTERWORTH_SUPPORT_ORDER = 3
+
+# frequency_mask fonksiyonunun desteklediği filtre türleri
+MASK_KINDS = (
+    "ideal_lowpass",
+    "ideal_highpass",
+    "band_pass",
+    "band_stop",
+    "butterworth_lowpass",
+    "butterworth_highpass",
+    "gaussian_lowpass",
+    "gaussian_highpass",
+    "homomorphic",
+)
+
+# Filtre türlerinin kesim frekansı olan (çekirdeğin genişliğini belirleyen) parametreleri
+CUTOFF_PARAMS = {
+    "ideal_lowpass": (0,),
+    "ideal_highpass": (0,),
+    "band_pass": (0, 1),
+    "band_stop": (0, 1),
+    "butterworth_lowpass": (0,),
+    "butterworth_highpass": (0,),
+    "gaussian_lowpass": (0,),
+    "gaussian_highpass": (0,),
+    "homomorphic": (2,),
+}
+
+
+@lru_cache(maxsize=DISTANCE_GRID_CACHE_SIZE)
+def distance_grid(rows, cols):
+    """
+    Merkezi kaydırılmış spektrumdaki her noktanın merkeze olan uzaklığının karesini hesaplar.
+
+    Parametreler:
+        rows (int): Spektrumun satır sayısı
+        cols (int): Spektrumun sütun sayısı
+
+    Dönüş:
+        numpy.ndarray: (rows, cols) boyutunda, salt okunur float64 uzaklık karesi dizisi
+    """
+    crow, ccol = rows // 2, cols // 2
+    u = np.arange(rows, dtype=np.float64) - crow
+    v = np.arange(cols, dtype=np.float64) - ccol
+
+    # Yayınlama (broadcasting) ile (rows, 1) + (1, cols) -> (rows, cols)
+    d_squared = u[:, np.newaxis] ** 2 + v[np.newaxis, :] ** 2
+
+    # Önbellekteki dizi paylaşıldığı için değiştirilmesini engelle
+    d_squared.setflags(write=False)
+    return d_squared
+
+
+@lru_cache(maxsize=DISTANCE_GRID_CACHE_SIZE)
+def ccs_distance_grid(rows, cols):
+    """
+    CCS biçimindeki yarım spektrumda her elemanın ait olduğu frekansın (0, 0) noktasına
+    olan uzaklığının karesini hesaplar.
+
+    CCS düzeni (cols çift ise; tek ise son sütun da iç sütundur):
+        - Sütun 0 ve son sütun (v = 0 ve v = cols / 2): Bu sütunlardaki değerler de gerçel
+          bir dizinin dönüşümü olduğundan dikeyde paketlenir. Satır 0 -> u = 0,
+          satır 2k-1 ve 2k -> u = k (gerçel ve sanal kısım), rows çift ise son satır -> u = rows / 2
+        - İç sütunlar 2k-1 ve 2k: v = k frekansının gerçel ve sanal kısmı; satır y -> u = y
+          (negatif frekanslar için u = y - rows)
+
+    Parametreler:
+        rows (int): Spektrumun satır sayısı
+        cols (int): Spektrumun sütun sayısı
+
+    Dönüş:
+        numpy.ndarray: (rows, cols) boyutunda, salt okunur float64 uzaklık karesi dizisi
+    """
+    y = np.arange(rows)
+    x = np.arange(cols)
+
+    # Yatay frekans: sütun 0 -> 0, sütun 2k-1 ve 2k -> k
+    v = (x + 1) // 2
+
+    # İç sütunlarda tam kompleks dikey dönüşüm, kenar sütunlarda paketlenmiş gerçel dönüşüm
+    u_inner = np.minimum(y, rows - y)
+    u_edge = (y + 1) // 2
+    edge = (x == 0) | ((x == cols - 1) & (cols % 2 == 0))
+    u = np.where(edge[np.newaxis, :], u_edge[:, np.newaxis], u_inner[:, np.newaxis])
+
+    d_squared = u.astype(np.float64) ** 2 + v[np.newaxis, :].astype(np.float64) ** 2
+
+    # Önbellekteki dizi paylaşıldığı için değiştirilmesini engelle
+    d_squared.setflags(write=False)
+    return d_squared
+
+
+@lru_cache(maxsize=DISTANCE_GRID_CACHE_SIZE)
+def half_plane_distance_grid(rows, half_cols):
+    """
+    Yarım düzlem düzenindeki spektrumda (np.fft.rfft2 / scipy.fft.rfft2 çıktısı) her
+    elemanın ait olduğu frekansın (0, 0) noktasına olan uzaklığının karesini hesaplar.
+    Sütun v -> v frekansı, satır y -> u = y (negatif frekanslar için u = y - rows).
+
+    Parametreler:
+        rows (int): Spektrumun satır sayısı
+        half_cols (int): Yarım spektrumun sütun sayısı (dönüşüm sütun sayısı // 2 + 1)
+
+    Dönüş:
+        numpy.ndarray: (rows, half_cols) boyutunda, salt okunur float64 uzaklık karesi dizisi
+    """
+    y = np.arange(rows)
+    u = np.minimum(y, rows - y).astype(np.float64)
+    v = np.arange(half_cols, dtype=np.float64)
+
+    d_squared = u[:, np.newaxis] ** 2 + v[np.newaxis, :] ** 2
+
+    # Önbellekteki dizi paylaşıldığı için değiştirilmesini engelle
+    d_squared.setflags(write=False)
+    return d_squared
+
+
+def _mask_from_distance(d_squared, kind, params):
+    """Uzaklık karesi ızgarasından filtre maskesini hesaplar (bkz. frequency_mask)."""
+    if kind == "ideal_lowpass":
+        radius, = params
+        mask = d_squared <= radius ** 2
+    elif kind == "ideal_highpass":
+        radius, = params
+        mask = d_squared > radius ** 2
+    elif kind == "band_pass":
+        inner_radius, outer_radius = params
+        mask = (d_squared >= inner_radius ** 2) & (d_squared <= outer_radius ** 2)
+    elif kind == "band_stop":
+        inner_radius, outer_radius = params
+        mask = (d_squared < inner_radius ** 2) | (d_squared > outer_radius ** 2)
+    elif kind == "butterworth_lowpass":
+        d0, n = params
+        mask = 1 / (1 + (np.sqrt(d_squared) / d0) ** (2 * n))
+    elif kind == "butterworth_highpass":
+        d0, n = params
+        # Sıfıra bölmeyi önlemek için küçük bir değer eklenir
+        mask = 1 / (1 + (d0 / (np.sqrt(d_squared) + 0.000001)) ** (2 * n))
+    elif kind == "gaussian_lowpass":
+        sigma, = params
+        mask = np.exp(-d_squared / (2 * sigma ** 2))
+    elif kind == "gaussian_highpass":
+        sigma, = params
+        mask = 1 - np.exp(-d_squared / (2 * sigma ** 2))
+    elif kind == "homomorphic":
+        gamma_h, gamma_l, d0 = params
+        d = np.sqrt(d_squared)
+        mask = gamma_l + (gamma_h - gamma_l) * (1 - np.exp(-((d ** 2) / (2 * (d0 ** 2)))))
+    else:
+        raise ValueError(f"Bilinmeyen filtre türü: {kind}")
+
+    # Homomorfik filtre float64 spektrumla, diğerleri float32 DFT çıktısıyla çarpılır
+    mask = mask.astype(np.float64 if kind == "homomorphic" else np.float32)
+    mask.setflags(write=False)
+    return mask
+
+
+@lru_cache(maxsize=MASK_CACHE_SIZE)
+def frequency_mask(shape, kind, *params):
+    """
+    Verilen filtre türü ve parametreler için merkezi kaydırılmış düzende frekans maskesini
+    oluşturur. Filtreleme spectrum_mask ile yapılır; bu maske görselleştirme içindir.
+
+    Desteklenen türler ve parametreleri:
+        ideal_lowpass, ideal_highpass: (radius,)
+        band_pass, band_stop: (inner_radius, outer_radius)
+        butterworth_lowpass, butterworth_highpass: (d0, n)
+        gaussian_lowpass, gaussian_highpass: (sigma,)
+        homomorphic: (gamma_h, gamma_l, d0)
+
+    Parametreler:
+        shape (tuple): Spektrumun (satır, sütun) boyutu
+        kind (str): Filtre türü (MASK_KINDS içindeki değerlerden biri)
+        *params: Filtre türüne ait parametreler
+
+    Dönüş:
+        numpy.ndarray: (satır, sütun) boyutunda salt okunur maske. Homomorfik filtre
+        maskesi float64, diğerleri float32 türündedir.
+    """
+    return _mask_from_distance(distance_grid(*shape), kind, params)
+
+
+@lru_cache(maxsize=MASK_CACHE_SIZE)
+def ccs_mask(shape, kind, *params):
+    """
+    frequency_mask ile aynı maskeyi CCS biçimindeki yarım spektrumun düzeninde oluşturur.
+    CCS dizisiyle eleman eleman çarpılarak filtre uygulanır.
+
+    Parametreler:
+        shape (tuple): Spektrumun (satır, sütun) boyutu
+        kind (str): Filtre türü (MASK_KINDS içindeki değerlerden biri)
+        *params: Filtre türüne ait parametreler
+
+    Dönüş:
+        numpy.ndarray: (satır, sütun) boyutunda salt okunur maske
+    """
+    return _mask_from_distance(ccs_distance_grid(*shape), kind, params)
+
+
+@lru_cache(maxsize=MASK_CACHE_SIZE)
+def half_plane_mask(shape, kind, *params):
+    """
+    frequency_mask ile aynı maskeyi yarım düzlem düzenindeki spektrumun düzeninde oluşturur.
+
+    Parametreler:
+        shape (tuple): Yarım spektrumun (satır, sütun // 2 + 1) boyutu
+        kind (str): Filtre türü (MASK_KINDS içindeki değerlerden biri)
+        *params: Filtre türüne ait parametreler
+
+    Dönüş:
+        numpy.ndarray: Yarım spektrumla aynı boyutta salt okunur maske
+    """
+    return _mask_from_distance(half_plane_distance_grid(*shape), kind, params)
+
+
+def spectrum_mask(backend, shape, kind, *params):
+    """Arka ucun spektrum düzenine (CCS veya yarım düzlem) göre maske; shape spektrumun boyutudur."""
+    if backend.layout == "ccs":
+        return ccs_mask(tuple(shape), kind, *params)
+    return half_plane_mask(tuple(shape), kind, *params)
+
+
+def kernel_radius(dft_shape, kind, params, support=KERNEL_SUPPORT, max_radius=None):
+    """
+    Maskenin uzamsal karşılığı olan çekirdeğin yarıçapını seçer. Kesim frekansı küçüldükçe
+    (Butterworth filtresinde derece büyüdükçe) çekirdek genişler; yarıçap DFT boyutunun
+    yarısını aşmaz.
+
+    Parametreler:
+        dft_shape (tuple): Maskenin tanımlı olduğu tam görüntü DFT boyutu (satır, sütun)
+        kind (str): Filtre türü
+        params (tuple): Filtre türüne ait parametreler
+        support (float): Çekirdek yarıçapı / (DFT boyutu / kesim frekansı) oranı
+        max_radius (int): İzin verilen en büyük yarıçap (örn. karo boyutu); None ise sınır yok
+
+    Dönüş:
+        int: Çekirdek yarıçapı (piksel)
+
+    Hata:
+        ValueError: Yarıçap max_radius değerini aşıyorsa
+    """
+    cutoffs = [params[i] for i in CUTOFF_PARAMS[kind] if params[i] > 0]
+    cutoff = max(min(cutoffs, default=1), 1)
+    if kind.startswith("butterworth"):
+        support *= max(1.0, params[1] / BUTTERWORTH_SUPPORT_ORDER)
+    largest = max(dft_shape)
+    radius = max(1, min(int(np.ceil(support * largest / cutoff)), largest // 2))
+    if max_radius is not None and radius > max_radius:
+        raise ValueError(f"Çekirdek yarıçapı ({radius} piksel) sınırı ({max_radius} piksel) aşıyor; "
+                         "daha büyük bir kesim frekansı veya karo boyutu kullanın")
+    return radius
+
+
+@lru_cache(maxsize=MASK_CACHE_SIZE)
+def spatial_kernel(dft_shape, kind, radius, *params):
+    """
+    Tam görüntünün DFT boyutunda tanımlı maskenin uzamsal karşılığı olan (2 * radius + 1)
+    kenarlı çekirdeği hesaplar.
+
+    Maske, tam boyuttaki frekans ızgarası yerine çekirdek boyutundaki bir ızgarada, aynı
+    frekansları karşılayacak şekilde ölçeklenmiş noktalarda örneklenir: çekirdek ızgarasının
+    k. frekansı tam ızgaranın k * DFT boyutu / çekirdek boyutu frekansına karşılık gelir.
+    Ters dönüşüm, gerçek çekirdeğin çekirdek boyutu periyoduyla katlanmış halini verir;
+    çekirdek bu sınır içinde sönümleniyorsa fark küçüktür. Maske ışınsal simetrik ve gerçel
+    olduğu için çekirdek de gerçel ve merkeze göre simetriktir.
+
+    Parametreler:
+        dft_shape (tuple): Maskenin tanımlı olduğu tam görüntü DFT boyutu (satır, sütun)
+        kind (str): Filtre türü (MASK_KINDS içindeki değerlerden biri)
+        radius (int): Çekirdek yarıçapı (bkz. kernel_radius)
+        *params: Filtre türüne ait parametreler
+
+    Dönüş:
+        numpy.ndarray: (2 * radius + 1, 2 * radius + 1) boyutunda, merkezi ortada, salt
+        okunur float64 çekirdek (ters dönüşüm 1 / N ile ölçeklenmiştir)
+    """
+    rows, cols = dft_shape
+    size = 2 * radius + 1
+    u = np.fft.fftfreq(size) * rows
+    v = np.fft.fftfreq(size) * cols
+    d_squared = u[:, np.newaxis] ** 2 + v[np.newaxis, :] ** 2
+
+    mask = _mask_from_distance(d_squared, kind, params)
+    kernel = np.fft.fftshift(np.fft.ifft2(mask).real)
+
+    # Önbellekteki dizi paylaşıldığı için değiştirilmesini engelle
+    kernel.setflags(write=False)
+    return kernel
+
+
+@lru_cache(maxsize=MASK_CACHE_SIZE)
+def block_kernel_spectrum(backend, block_shape, dft_shape, kind, radius, *params):
+    """
+    spatial_kernel çekirdeğinin blok boyutundaki spektrumunu arka ucun düzeninde hesaplar.
+    Çekirdeğin merkezi (0, 0) noktasına kaydırılır; böylece blok spektrumuyla çarpım
+    (backend.multiply) bloğu kaydırmadan filtreler.
+
+    Parametreler:
+        backend: fft_arka_uclari arka ucu
+        block_shape (tuple): Blok DFT boyutu (satır, sütun)
+        dft_shape, kind, radius, *params: bkz. spatial_kernel
+
+    Dönüş:
+        numpy.ndarray: Blok spektrumuyla aynı düzende, salt okunur spektrum
+    """
+    kernel = spatial_kernel(dft_shape, kind, radius, *params)
+    dtype = np.float64 if kind == "homomorphic" else np.float32
+
+    padded = np.zeros(block_shape, dtype)
+    size = kernel.shape[0]
+    padded[:size, :size] = kernel
+    padded = np.roll(padded, (-radius, -radius), axis=(0, 1))
+
+    spectrum = backend.forward(padded)
+    spectrum.setflags(write=False)
+    return spectrum
+
+
+def optimal_dft_shape(shape):
+    """Görüntü boyutuna (satır, sütun) karşılık gelen, sıfırla genişletilmiş DFT boyutu."""
+    rows, cols = shape
+    return cv2.getOptimalDFTSize(rows), cv2.getOptimalDFTSize(cols)
+
+
+def forward_dft(image, dst=None, backend=None):
+    """
+    Tek kanallı görüntüyü optimal DFT boyutuna sıfırla genişletip yarım spektrumunu hesaplar.
+
+    Parametreler:
+        image (numpy.ndarray): Tek kanallı görüntü
+        dst (numpy.ndarray): İsteğe bağlı; spektrumun yazılacağı dizi
+        backend: İsteğe bağlı; fft_arka_uclari arka ucu (varsayılan: boyuta göre seçilen)
+
+    Dönüş:
+        numpy.ndarray: Optimal DFT boyutunun yarım spektrumu (OpenCV ile CCS biçiminde
+        float32, diğer arka uçlarla yarım düzlem düzeninde complex64)
+    """
+    # Görüntü boyutunu optimize et
+    rows, cols = image.shape
+    optimal_rows, optimal_cols = optimal_dft_shape(image.shape)
+
+    # Görüntüyü optimal boyuta genişlet (sınırları sıfırla doldur)
+    padded = cv2.copyMakeBorder(image, 0, optimal_rows - rows, 0, optimal_cols - cols, cv2.BORDER_CONSTANT, value=0)
+
+    if backend is None:
+        backend = fft_arka_uclari.backend_for(padded.shape, np.float32)
+
+    # Gerçel girdinin yarım spektrumunu hesapla
+    return backend.forward(np.float32(padded), dst)
+
+
+def inverse_dft(spectrum, original_shape, backend=None, dft_shape=None):
+    """
+    Yarım spektrumun ters dönüşümünü alarak görüntüyü geri oluşturur.
+
+    Parametreler:
+        spectrum (numpy.ndarray): forward_dft çıktısı
+        original_shape (tuple): Orijinal görüntünün boyutu (satır, sütun)
+        backend: Spektrumu üreten arka uç (varsayılan: OpenCV)
+        dft_shape (tuple): Dönüşümün (satır, sütun) boyutu (varsayılan: spektrumun boyutu,
+            CCS biçimi için geçerlidir)
+
+    Dönüş:
+        numpy.ndarray: 0-255 aralığına normalize edilmiş uint8 görüntü
+    """
+    if backend is None:
+        backend = fft_arka_uclari.BACKENDS["opencv"]
+    if dft_shape is None:
+        dft_shape = spectrum.shape
+
+    # Ters dönüşüm doğrudan gerçel görüntü verir. Tam kompleks ters dönüşümün genliği
+    # (cv2.magnitude) ile aynı sonucu elde etmek için mutlak değer alınır
+    img_back = np.abs(backend.inverse(spectrum, dft_shape))
+
+    # Orijinal boyuta kırp ve normalize et
+    rows, cols = original_shape
+    img_back = img_back[0:rows, 0:cols]
+    cv2.normalize(img_back, img_back, 0, 255, cv2.NORM_MINMAX)
+
+    return np.uint8(img_back)
+
+
+def _ccs_edge_column(column):
+    """Dikeyde CCS ile paketlenmiş bir kenar sütununu tam kompleks sütuna açar."""
+    rows = len(column)
+    full = np.zeros(rows, np.complex128)
+    full[0] = column[0]
+    k = np.arange(1, (rows - 1) // 2 + 1)
+    full[k] = column[2 * k - 1] + 1j * column[2 * k]
+    full[rows - k] = np.conj(full[k])
+    if rows % 2 == 0:
+        full[rows // 2] = column[rows - 1]
+    return full
+
+
+def ccs_magnitude(spectrum):
+    """
+    CCS biçimindeki spektrumdan tam, merkezi kaydırılmış genlik spektrumunu hesaplar
+    (görselleştirme için).
+
+    Parametreler:
+        spectrum (numpy.ndarray): CCS biçiminde spektrum
+
+    Dönüş:
+        numpy.ndarray: (satır, sütun) boyutunda, merkezi kaydırılmış genlik spektrumu
+    """
+    rows, cols = spectrum.shape
+    half_cols = cols // 2 + 1
+
+    # Yarım düzlem: v = 0 .. cols // 2
+    half = np.empty((rows, half_cols), np.float64)
+    inner = np.arange(1, (cols - 1) // 2 + 1)
+    half[:, inner] = np.hypot(spectrum[:, 2 * inner - 1], spectrum[:, 2 * inner])
+    half[:, 0] = np.abs(_ccs_edge_column(spectrum[:, 0]))
+    if cols % 2 == 0:
+        half[:, cols // 2] = np.abs(_ccs_edge_column(spectrum[:, cols - 1]))
+
+    return _full_magnitude(half, cols)
+
+
+def _full_magnitude(half, cols):
+    """
+    Yarım düzlemin (v = 0 .. cols // 2) genliğinden tam, merkezi kaydırılmış genlik
+    spektrumunu oluşturur.
+    """
+    rows, half_cols = half.shape
+
+    # Eşlenik simetri: |F(u, v)| = |F(-u, -v)|
+    magnitude = np.empty((rows, cols), np.float64)
+    magnitude[:, :half_cols] = half
+    v = np.arange(half_cols, cols)
+    magnitude[:, half_cols:] = half[(-np.arange(rows)) % rows][:, cols - v]
+
+    return np.fft.fftshift(magnitude)
+
+
+def spectrum_magnitude(backend, spectrum, dft_shape):
+    """
+    Arka ucun ürettiği yarım spektrumdan tam, merkezi kaydırılmış genlik spektrumunu
+    hesaplar (görselleştirme için).
+
+    Parametreler:
+        backend: Spektrumu üreten fft_arka_uclari arka ucu
+        spectrum (numpy.ndarray): Yarım spektrum
+        dft_shape (tuple): Dönüşümün (satır, sütun) boyutu
+
+    Dönüş:
+        numpy.ndarray: dft_shape boyutunda, merkezi kaydırılmış genlik spektrumu
+    """
+    if backend.layout == "ccs":
+        return ccs_magnitude(spectrum)
+    return _full_magnitude(np.abs(spectrum).astype(np.float64), dft_shape[1])
+
+
+_spectrum_cache = OrderedDict()  # (id(görüntü), dönüşüm, arka uç) -> (görüntü, spektrumlar)
+_spectrum_lock = threading.Lock()
+
+
+def _channels(image):
+    """Gri tonlamalı görüntü için [görüntü], renkli görüntü için kanalların listesi."""
+    return [image] if image.ndim == 2 else [image[:,:,i] for i in range(image.shape[2])]
+
+
+def _cached_spectra(image, transform, backend, func, shape, dtype):
+    """
+    Görüntünün her kanalına func uygulanarak hesaplanan spektrumları önbellekten döndürür.
+    Kanalların spektrumları tek bir (kanal, satır, sütun) dizisinde tutulur; böylece maske
+    tüm kanallara tek bir çarpımla uygulanabilir.
+
+    Önbellek girdisi görüntünün kendisine referans tuttuğu için görüntü önbellekte kaldıkça
+    id() değeri başka bir diziye verilemez; yine de kimlik ayrıca kontrol edilir.
+
+    Parametreler:
+        image (numpy.ndarray): Gri tonlamalı veya renkli görüntü
+        transform (str): Dönüşümün adı (aynı görüntünün farklı dönüşümlerini ayırır)
+        backend: Spektrumu üreten fft_arka_uclari arka ucu (arka uç değişirse yeniden hesaplanır)
+        func (callable): func(kanal, dst) olarak çağrılır; kanalın spektrumunu dst'ye yazar
+        shape (tuple): Bir kanalın spektrumunun (satır, sütun) boyutu
+        dtype: Spektrumun veri türü
+
+    Dönüş:
+        numpy.ndarray: (kanal, satır, sütun) boyutunda salt okunur spektrum dizisi
+    """
+    key = (id(image), transform, backend.name)
+    with _spectrum_lock:
+        entry = _spectrum_cache.get(key)
+        if entry is not None and entry[0] is image:
+            _spectrum_cache.move_to_end(key)
+            return entry[1]
+
+    channels = _channels(image)
+    spectra = np.empty((len(channels),) + tuple(shape), dtype)
+    for channel, dst in zip(channels, spectra):
+        func(channel, dst)
+    # Önbellekteki dizi paylaşıldığı için değiştirilmesini engelle
+    spectra.setflags(write=False)
+
+    with _spectrum_lock:
+        _spectrum_cache[key] = (image, spectra)
+        _spectrum_cache.move_to_end(key)
+        # Görüntü başına tek girdi sayılır; aynı görüntünün farklı dönüşümleri birlikte silinir
+        while len({cache_key[0] for cache_key in _spectrum_cache}) > SPECTRUM_CACHE_SIZE:
+            _spectrum_cache.popitem(last=False)
+    return spectra
+
+
+def forward_spectra(image):
+    """
+    Görüntünün her kanalı için yarım spektrumu (bkz. forward_dft) döndürür. Aynı görüntü
+    için dönüşüm tekrar hesaplanmaz.
+
+    Parametreler:
+        image (numpy.ndarray): Gri tonlamalı veya renkli görüntü
+
+    Dönüş:
+        backend: Dönüşümü hesaplayan fft_arka_uclari arka ucu
+        spectra: (kanal, satır, sütun) boyutunda, optimal DFT boyutunun salt okunur yarım
+            spektrumları (düzeni arka uca bağlıdır)
+    """
+    dft_shape = optimal_dft_shape(image.shape[:2])
+    backend = fft_arka_uclari.backend_for(dft_shape, np.float32)
+    spectra = _cached_spectra(image, "dft", backend, lambda channel, dst: forward_dft(channel, dst, backend),
+                              backend.spectrum_shape(dft_shape), backend.spectrum_dtype(np.float32))
+    return backend, spectra
+
+
+def clear_spectrum_cache():
+    """Önbellekteki spektrumları siler (örn. yeni görüntü açıldığında belleği boşaltmak için)."""
+    with _spectrum_lock:
+        _spectrum_cache.clear()
+
+
+def _merge_channels(image, channels):
+    """Kanal listesini görüntünün biçimine (gri tonlamalı veya renkli) geri birleştirir."""
+    return channels[0] if image.ndim == 2 else cv2.merge(channels)
+
+
+def _filter_spectra(image, kind, params):
+    """
+    Görüntünün tüm kanallarının spektrumlarına maskeyi tek bir yayınlanmış (broadcast)
+    çarpımla uygular ve kanalları geri oluşturur.
+
+    Dönüş:
+        filtered_image: Filtrelenmiş görüntü
+        filtered_spectra: (kanal, satır, sütun) boyutunda filtrelenmiş yarım spektrumlar
+        backend: Spektrumları üreten arka uç
+    """
+    backend, spectra = forward_spectra(image)
+    dft_shape = optimal_dft_shape(image.shape[:2])
+
+    # Maske, sıfırla genişletilmiş spektrumun boyutunda ve arka ucun düzeninde olmalıdır
+    mask = spectrum_mask(backend, spectra.shape[1:], kind, *params)
+
+    # Filtreyi uygula
+    filtered_spectra = spectra * mask
+
+    # Görüntüyü geri oluştur
+    channels = [inverse_dft(spectrum, image.shape[:2], backend, dft_shape) for spectrum in filtered_spectra]
+    return _merge_channels(image, channels), filtered_spectra, backend
+
+
+def apply_frequency_mask(image, kind, *params):
+    """
+    Görüntüye frekans alanında bir maske uygular. Renkli görüntülerde her kanal
+    ayrı ayrı filtrelenir. İleri dönüşümler önbellekten alınır (bkz. forward_spectra).
+
+    Parametreler:
+        image (numpy.ndarray): Gri tonlamalı veya renkli görüntü
+        kind (str): Filtre türü (MASK_KINDS içindeki değerlerden biri, homomorfik hariç)
+        *params: Filtre türüne ait parametreler
+
+    Dönüş:
+        numpy.ndarray: Filtrelenmiş görüntü
+    """
+    filtered_image, _, _ = _filter_spectra(image, kind, params)
+    return filtered_image
+
+
+def filtered_spectrum_preview(gray_image, kind, *params):
+    """
+    Gri tonlamalı görüntünün filtrelenmiş halini ve filtrelenmiş genlik spektrumunu
+    yan yana içeren bir önizleme görüntüsü oluşturur.
+
+    Parametreler:
+        gray_image (numpy.ndarray): Gri tonlamalı görüntü
+        kind (str): Filtre türü
+        *params: Filtre türüne ait parametreler
+
+    Dönüş:
+        numpy.ndarray: Filtrelenmiş görüntü ve spektrumun yan yana birleştirildiği uint8 görüntü
+    """
+    filtered_image, (filtered_spectrum,), backend = _filter_spectra(gray_image, kind, params)
+
+    # Filtreli spektrumu hesapla
+    magnitude = spectrum_magnitude(backend, filtered_spectrum, optimal_dft_shape(gray_image.shape))
+    filtered_magnitude = 20 * np.log(magnitude + 1)
+    spectrum_image = cv2.normalize(filtered_magnitude, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
+
+    # Spektrum genişletilmiş boyuttaysa yan yana gösterebilmek için görüntü boyutuna getir
+    rows, cols = filtered_image.shape
+    if spectrum_image.shape != (rows, cols):
+        spectrum_image = cv2.resize(spectrum_image, (cols, rows))
+
+    return np.hstack((filtered_image, spectrum_image))
+
+
+def _log_spectrum(channel, dst=None, backend=None):
+    """
+    Kanalın logaritmasının yarım spektrumunu (float64) hesaplar.
+
+    Görüntüye küçük bir değer ekleyip logaritması alınır (0 değerlerini önlemek için):
+    ln(I) = ln(L) + ln(R), burada I görüntü, L aydınlatma, R reflektans
+    """
+    img_log = np.log1p(np.array(channel, dtype="float"))
+
+    if backend is None:
+        backend = fft_arka_uclari.backend_for(img_log.shape, np.float64)
+
+    # Fourier dönüşümünü hesapla
+    return backend.forward(img_log, dst)
+
+
+def log_spectra(image):
+    """
+    Homomorfik filtrenin kullandığı logaritmik spektrumları (her kanal için) döndürür.
+    Aynı görüntü için dönüşüm tekrar hesaplanmaz.
+
+    Parametreler:
+        image (numpy.ndarray): Gri tonlamalı veya renkli görüntü
+
+    Dönüş:
+        backend: Dönüşümü hesaplayan fft_arka_uclari arka ucu
+        spectra: (kanal, satır, sütun) boyutunda salt okunur, çift duyarlıklı yarım
+            spektrumlar (düzeni arka uca bağlıdır)
+    """
+    shape = image.shape[:2]
+    backend = fft_arka_uclari.backend_for(shape, np.float64)
+    spectra = _cached_spectra(image, "log", backend, lambda channel, dst: _log_spectrum(channel, dst, backend),
+                              backend.spectrum_shape(shape), backend.spectrum_dtype(np.float64))
+    return backend, spectra
+
+
+def _homomorphic_channel(backend, filtered_spectrum, shape):
+    """
+    Filtrelenmiş logaritmik spektrumdan tek bir kanalı geri oluşturur.
+
+    Dönüş:
+        numpy.ndarray: Filtrelenmiş kanal
+    """
+    # Ters Fourier dönüşümünü hesapla (np.fft.ifft2 gibi 1 / (satır * sütun) ile ölçeklenir)
+    img_ifft = backend.inverse(filtered_spectrum, shape, scale=True)
+
+    # Logaritmik dönüşümün tersini al
+    img_exp = np.expm1(img_ifft)
+
+    # Görüntüyü 0-255 aralığına normalize et
+    img_exp = cv2.normalize(img_exp, None, 0, 255, cv2.NORM_MINMAX)
+
+    return np.uint8(img_exp)
+
+
+def _homomorphic_filter(image, gamma_h, gamma_l, d0):
+    """
+    Görüntünün tüm kanallarının logaritmik spektrumlarına homomorfik maskeyi tek bir
+    yayınlanmış çarpımla uygular ve kanalları geri oluşturur.
+
+    Dönüş:
+        filtered_image: Filtrelenmiş görüntü
+        log_spectra: Filtrelemeden önceki spektrumlar
+        filtered_spectra: Filtrelenmiş spektrumlar
+        backend: Spektrumları üreten arka uç
+    """
+    backend, spectra = log_spectra(image)
+    mask = spectrum_mask(backend, spectra.shape[1:], "homomorphic", gamma_h, gamma_l, d0)
+
+    # Filtreyi uygula
+    filtered_spectra = spectra * mask
+
+    channels = [_homomorphic_channel(backend, spectrum, image.shape[:2]) for spectrum in filtered_spectra]
+    return _merge_channels(image, channels), spectra, filtered_spectra, backend
+
+
+def apply_homomorphic(image, gamma_h, gamma_l, d0):
+    """
+    Görüntüye homomorfik filtre uygular. Renkli görüntülerde her kanal ayrı ayrı filtrelenir.
+    Logaritmik spektrumlar önbellekten alınır (bkz. log_spectra).
+
+    Parametreler:
+        image (numpy.ndarray): Gri tonlamalı veya renkli görüntü
+        gamma_h: Yüksek frekans bileşenleri için gamma değeri (1.0'dan büyük)
+        gamma_l: Düşük frekans bileşenleri için gamma değeri (1.0'dan küçük)
+        d0: Kesim frekansı
+
+    Dönüş:
+        numpy.ndarray: Filtrelenmiş görüntü
+    """
+    filtered_image, _, _, _ = _homomorphic_filter(image, gamma_h, gamma_l, d0)
+    return filtered_image
+
+
+def homomorphic_spectra(gray_image, gamma_h, gamma_l, d0):
+    """
+    Homomorfik filtrenin maskesini, orijinal ve filtrelenmiş genlik spektrumlarını
+    görselleştirme için hazırlar.
+
+    Parametreler:
+        gray_image (numpy.ndarray): Gri tonlamalı görüntü
+        gamma_h, gamma_l, d0: Homomorfik filtre parametreleri
+
+    Dönüş:
+        mask_image, spectrum_image, filtered_spectrum_image: 0-255 aralığına normalize
+        edilmiş uint8 görüntüler
+    """
+    _, (log_spectrum,), (filtered_spectrum,), backend = _homomorphic_filter(gray_image, gamma_h, gamma_l, d0)
+
+    # Maskeyi normalize et (merkezi kaydırılmış düzende)
+    display_mask = frequency_mask(gray_image.shape, "homomorphic", gamma_h, gamma_l, d0)
+    mask_image = cv2.normalize(display_mask, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
+
+    # Fourier genlik spektrumunu hesapla
+    magnitude_spectrum = 20 * np.log(spectrum_magnitude(backend, log_spectrum, gray_image.shape) + 1)
+    spectrum_image = cv2.normalize(magnitude_spectrum, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
+
+    # Filtreli Fourier genlik spektrumunu hesapla
+    filtered_spectrum = 20 * np.log(spectrum_magnitude(backend, filtered_spectrum, gray_image.shape) + 1)
+    filtered_spectrum_image = cv2.normalize(filtered_spectrum, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
+
+    return mask_image, spectrum_image, filtered_spectrum_image
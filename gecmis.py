@@ -0,0 +1,232 @@
+"""
+İŞLEM GEÇMİŞİ (GERİ AL / YİNELE)
+---------------------------------
+
+Uygulamadaki her işlem geçmişe bir adım olarak eklenir. Her adım, işlemin adını ve
+parametrelerini (goruntu_islemleri.ISLEMLER içindeki adlarla) ve işlemin sonucunu saklar.
+
+Bellek kullanımı:
+- İşlemler görüntüleri yerinde değiştirmeyip yeni dizi döndürdüğü için adımlar görüntünün
+  kopyasını değil, aynı diziye referansı saklar. Aynı diziyi gösteren adımlar (örn.
+  "Orijinal Görüntü") belleği bir kez kullanır.
+- Saklanan görüntülerin toplam boyutu memory_limit değerini aşarsa en eski adımların
+  görüntüleri silinir; adımın adı ve parametreleri kalır.
+- Görüntüsü silinmiş bir adıma dönülmek istendiğinde, görüntüsü saklanan en yakın önceki
+  adımdan (kontrol noktası) başlanarak işlemler yeniden uygulanır.
+
+İlk adım (açılan görüntü) hiçbir zaman silinmez. Tüm işlemler aynı parametrelerle aynı
+sonucu verir (rastgele başlangıçlı K-Means modları sabit tohumla çalışır); yalnızca işlem
+kaydında (goruntu_islemleri.ISLEMLER) bulunmayan adlı adımlar yeniden üretilemez ve
+görüntüleri silinmez.
+"""
+
+import numpy as np
+
+import goruntu_islemleri
+
+# Geçmişte tutulacak görüntülerin varsayılan toplam boyutu (bayt)
+# (50 MP bir RGB görüntü ~150 MB yer kaplar)
+HISTORY_MEMORY_LIMIT = 1024 ** 3
+
+
+def _owner(image):
+    """Görüntünün belleğinin asıl sahibi olan diziyi döndürür (görünümler için taban dizi)."""
+    while isinstance(image.base, np.ndarray):
+        image = image.base
+    return image
+
+
+def _image_size(image):
+    """Görüntünün bellekte kapladığı alan; diskteki memmap dosyaları sayılmaz."""
+    owner = _owner(image)
+    return 0 if isinstance(owner, np.memmap) else owner.nbytes
+
+
+class HistoryStep:
+    """
+    Geçmişteki tek bir adım.
+
+    Nitelikler:
+        name (str): ISLEMLER içindeki işlem adı; orijinal görüntüye dönüş için None
+        params (tuple): İşlem parametreleri
+        from_original (bool): İşlem orijinal görüntüye mi (True) yoksa bir önceki adımın
+            sonucuna mı (False) uygulandı
+        image (numpy.ndarray): Adımın sonucu; bellek sınırı nedeniyle silindiyse None
+    """
+
+    def __init__(self, name, params, from_original, image):
+        self.name = name
+        self.params = tuple(params)
+        self.from_original = from_original
+        self.image = image
+
+    @property
+    def replayable(self):
+        """Adım yeniden uygulanarak birebir aynı sonuç elde edilebilir mi?"""
+        if self.name is None:
+            return True
+        return self.name in goruntu_islemleri.ISLEMLER
+
+    def replay(self, previous, original):
+        """
+        Adımı yeniden uygular.
+
+        Parametreler:
+            previous (numpy.ndarray): Bir önceki adımın sonucu
+            original (numpy.ndarray): Orijinal görüntü
+
+        Dönüş:
+            numpy.ndarray: Adımın sonucu
+        """
+        source = original if self.from_original else previous
+        if self.name is None:
+            return source
+        return goruntu_islemleri.apply_operation(source, self.name, *self.params)
+
+
+class History:
+    """
+    Geri alma ve yineleme destekleyen işlem geçmişi.
+
+    Parametreler:
+        memory_limit (int): Saklanan görüntülerin toplam boyutu için üst sınır (bayt)
+    """
+
+    def __init__(self, memory_limit=HISTORY_MEMORY_LIMIT):
+        self.memory_limit = memory_limit
+        self._steps = []
+        self._index = -1
+
+    def reset(self, original):
+        """
+        Geçmişi temizler ve yeni açılan görüntüyle başlatır.
+
+        Parametreler:
+            original (numpy.ndarray): Açılan görüntü
+        """
+        self._steps = [HistoryStep(None, (), True, original)]
+        self._index = 0
+
+    @property
+    def steps(self):
+        """Başlangıçtan güncel adıma kadar olan adımlar (yinelenebilir adımlar hariç)."""
+        return self._steps[1:self._index + 1]
+
+    @property
+    def effective_steps(self):
+        """
+        Güncel görüntüyü üreten adımlar. Orijinal görüntüye uygulanan son adımdan önceki
+        adımlar sonucu etkilemediği için dahil edilmez; "orijinale dönüş" adımları da atlanır.
+        İlk adım orijinal görüntüye uygulanır, sonrakiler bir önceki adımın sonucuna.
+        """
+        steps = self.steps
+        start = 0
+        for i, step in enumerate(steps):
+            if step.from_original:
+                start = i
+        return [step for step in steps[start:] if step.name is not None]
+
+    @property
+    def can_undo(self):
+        return self._index > 0
+
+    @property
+    def can_redo(self):
+        return self._index < len(self._steps) - 1
+
+    @property
+    def memory_usage(self):
+        """Saklanan görüntülerin toplam boyutu (bayt); ortak diziler bir kez sayılır."""
+        owners = {id(_owner(step.image)): step.image for step in self._steps if step.image is not None}
+        return sum(_image_size(image) for image in owners.values())
+
+    def push(self, image, name, params=(), from_original=False):
+        """
+        Yeni bir adım ekler. Güncel adımdan sonraki (yinelenebilir) adımlar silinir.
+
+        Parametreler:
+            image (numpy.ndarray): İşlemin sonucu
+            name (str): ISLEMLER içindeki işlem adı (orijinale dönüş için None)
+            params (tuple): İşlem parametreleri
+            from_original (bool): İşlem orijinal görüntüye uygulandıysa True
+        """
+        if self._index < 0:
+            raise ValueError("Geçmiş başlatılmadan adım eklenemez")
+
+        del self._steps[self._index + 1:]
+        self._steps.append(HistoryStep(name, params, from_original, image))
+        self._index += 1
+        self._enforce_limit()
+
+    def undo(self):
+        """
+        Bir önceki adıma döner.
+
+        Dönüş:
+            numpy.ndarray: Önceki adımın görüntüsü; geri alınacak adım yoksa None
+        """
+        if not self.can_undo:
+            return None
+        self._index -= 1
+        return self._materialize(self._index)
+
+    def redo(self):
+        """
+        Geri alınan adımı yeniden uygular.
+
+        Dönüş:
+            numpy.ndarray: Sonraki adımın görüntüsü; yinelenecek adım yoksa None
+        """
+        if not self.can_redo:
+            return None
+        self._index += 1
+        return self._materialize(self._index)
+
+    def _materialize(self, index):
+        """
+        Adımın görüntüsünü döndürür. Görüntü silinmişse en yakın kontrol noktasından
+        başlanarak işlemler yeniden uygulanır.
+        """
+        if self._steps[index].image is not None:
+            return self._steps[index].image
+
+        # Görüntüsü saklanan ya da orijinal görüntüden başlayan en yakın adımı bul
+        start = index
+        while self._steps[start].image is None and not self._steps[start].from_original:
+            start -= 1
+
+        original = self._steps[0].image
+        image = self._steps[start].image
+        if image is None:
+            image = self._steps[start].replay(None, original)
+        for step in self._steps[start + 1:index + 1]:
+            image = step.replay(image, original)
+
+        self._steps[index].image = image
+        self._enforce_limit()
+        return image
+
+    def _enforce_limit(self):
+        """Toplam boyut sınırı aşılırsa en eski adımların görüntülerini siler."""
+        # Toplam boyut bir kez hesaplanır ve silinen görüntülerin boyutu düşülür. Aynı diziyi
+        # gösteren adımlar belleği ancak hepsinin görüntüsü silinince bırakır; bu yüzden her
+        # dizinin kaç adımda kullanıldığı sayılır
+        references = {}
+        for step in self._steps:
+            if step.image is not None:
+                key = id(_owner(step.image))
+                references[key] = references.get(key, 0) + 1
+        usage = self.memory_usage
+
+        for i, step in enumerate(self._steps):
+            if usage <= self.memory_limit:
+                break
+            # İlk adım, güncel adım ve (işlem kaydında olmayan) yeniden üretilemeyen adımlar
+            # kontrol noktası olarak kalır
+            if i == 0 or i == self._index or step.image is None or not step.replayable:
+                continue
+            key = id(_owner(step.image))
+            references[key] -= 1
+            if not references[key]:
+                usage -= _image_size(step.image)
+            step.image = None
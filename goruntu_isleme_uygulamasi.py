@@ -1,4 +1,5 @@
 import os
+from functools import partial
 import tkinter as tk
 from tkinter import filedialog, Scale, Label, Button, Frame, HORIZONTAL, RIDGE, SUNKEN, RAISED, LEFT, RIGHT
 from tkinter import ttk
@@ -9,6 +10,18 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
+import arka_plan_isleri
+import boru_hatti
+import buyuk_goruntu
+import fft_arka_uclari
+import frekans_alani
+import gecmis
+import goruntu_islemleri
+import hough_donusumu
+import karolu_isleme
+import kumeleme
+import tarif
+
 """
 GÖRÜNTÜ İŞLEME UYGULAMASI
 -------------------------
@@ -37,6 +50,14 @@ class GoruntuIslemeUygulamasi:
     Bir sınıf, ilişkili verileri ve metodları bir arada tutan bir yapıdır.
     """
     
+    # Görüntü panellerinde gösterilen görüntünün en büyük kenarı (piksel)
+    DISPLAY_MAX_SIZE = 350
+    
+    # Klavyeyle kaydırıcı değiştirilirken son tuş bırakıldıktan sonra tam çözünürlüklü
+    # sonucun hesaplanması için beklenen süre (ms); basılı tutulan tuşun her tekrarı için
+    # ayrı hesaplama yapılmaz
+    KEY_RELEASE_DELAY_MS = 300
+    
     def __init__(self, root):
         """
         __init__ metodu, sınıfın yapıcı metodudur (constructor).
@@ -66,9 +87,40 @@ class GoruntuIslemeUygulamasi:
         self.current_image = None   # Şu anki (işlenmiş) görüntü verisini saklar
         self.file_path = None       # Açılan dosyanın yolunu saklar
         
+        # Kaydırıcı önizlemeleri için orijinal görüntünün ekran çözünürlüğündeki küçük kopyası
+        # (kaynak görüntü, küçük kopya) çifti olarak saklanır
+        self._preview_cache = None
+        
+        # Fourier spektrum önizlemeleri için güncel görüntünün gri tonlamalı hali
+        # (kaynak görüntü, gri görüntü) çifti olarak saklanır. Aynı gri görüntü kullanıldığı
+        # için ileri Fourier dönüşümü frekans_alani önbelleğinden gelir
+        self._gray_cache = None
+        
+        # Panellerde gösterilen görüntülerin önbelleği: Label -> (kaynak görüntü, gösterim boyutu,
+        # PhotoImage, gösterim tamponu). Aynı kaynak tekrar gösterilirken yeniden boyutlandırılmaz
+        self._render_cache = {}
+        
+        # Uzun süren işlemleri arayüzü dondurmadan arka planda çalıştıran yürütücü
+        self.jobs = arka_plan_isleri.JobExecutor(self.root, self._update_job_status)
+        
+        # Geri alma / yineleme için işlem geçmişi
+        self.history = gecmis.History()
+        
+        # İşlem zinciri düzenlenirken değişmeyen aşamaların çıktılarını saklayan önbellek
+        self.pipeline = boru_hatti.Pipeline()
+        
+        # FFT arka uçları temsilci boyutlarda arka planda ölçülür; ilk Fourier filtresi
+        # görüntünün kendi boyutunda ölçüm beklemez
+        fft_arka_uclari.start_benchmark()
+        
         # Arayüz bileşenlerini oluştur - create_widgets metodunu çağırarak UI elemanlarını oluşturuyoruz
         self.create_widgets()
         
+        # Klavye kısayolları: Ctrl+Z geri al, Ctrl+Y ve Ctrl+Shift+Z yinele
+        self.root.bind("<Control-z>", lambda event: self.undo())
+        self.root.bind("<Control-y>", lambda event: self.redo())
+        self.root.bind("<Control-Z>", lambda event: self.redo())
+        
     def create_widgets(self):
         """
         Uygulama arayüzünün tüm görsel bileşenlerini oluşturan metod.
@@ -121,6 +173,17 @@ class GoruntuIslemeUygulamasi:
         self.histogram_container = Frame(self.processed_area_frame, bg="#f0f0f0", relief=RIDGE, borderwidth=2, height=200)
         self.histogram_container.pack(side=tk.BOTTOM, fill=tk.BOTH, expand=False)
         
+        # Arka plan işi durumu - işin adı, ilerleme çubuğu ve iptal butonu
+        self.job_frame = Frame(self.processed_area_frame, bg="#f0f0f0")
+        self.job_frame.pack(side=tk.BOTTOM, fill=tk.X, pady=(0, 10))
+        
+        self.job_label = Label(self.job_frame, text="Hazır", bg="#f0f0f0", anchor="w", width=28)
+        self.job_label.pack(side=LEFT, padx=5)
+        self.job_cancel_button = Button(self.job_frame, text="İptal", command=self.jobs.cancel, state=tk.DISABLED)
+        self.job_cancel_button.pack(side=RIGHT, padx=5)
+        self.job_progress = ttk.Progressbar(self.job_frame, mode="determinate", maximum=1.0)
+        self.job_progress.pack(side=LEFT, fill=tk.X, expand=True, padx=5)
+        
         Label(self.histogram_container, text="Histogram", bg="#f0f0f0", font=("Arial", 10, "bold")).pack(pady=5)
         
         self.histogram_frame = Frame(self.histogram_container, height=160, bg="white", relief=SUNKEN, borderwidth=2)
@@ -208,6 +271,9 @@ class GoruntuIslemeUygulamasi:
         # Butonlar - command parametresi, butona tıklandığında çağrılacak metodu belirtir
         Button(file_frame, text="Görüntü Aç", command=self.open_image, width=20).pack(pady=2)
         Button(file_frame, text="Görüntüyü Kaydet", command=self.save_image, width=20).pack(pady=2)
+        # Uygulanan işlemler tarif olarak kaydedilip başka görüntülere uygulanabilir
+        Button(file_frame, text="Tarifi Kaydet", command=self.save_recipe, width=20).pack(pady=2)
+        Button(file_frame, text="Tarif Uygula", command=self.apply_recipe, width=20).pack(pady=2)
         
         # Temel işlemler bölümü
         basic_frame = Frame(self.left_frame, bg="#e0e0e0", relief=RAISED, borderwidth=1)
@@ -216,6 +282,13 @@ class GoruntuIslemeUygulamasi:
         Label(basic_frame, text="Temel İşlemler", bg="#e0e0e0", font=("Arial", 10, "bold")).pack(pady=5)
         
         Button(basic_frame, text="Orijinal Görüntü", command=self.show_original, width=20).pack(pady=2)
+        
+        # Geri al / yinele butonları yan yana
+        history_frame = Frame(basic_frame, bg="#e0e0e0")
+        history_frame.pack(pady=2)
+        Button(history_frame, text="Geri Al", command=self.undo, width=9).pack(side=LEFT, padx=2)
+        Button(history_frame, text="Yinele", command=self.redo, width=9).pack(side=LEFT, padx=2)
+        Button(basic_frame, text="İşlem Zincirini Düzenle", command=self.open_pipeline_dialog, width=20).pack(pady=2)
         Button(basic_frame, text="Gri Tonlama", command=self.convert_to_gray, width=20).pack(pady=2)
         Button(basic_frame, text="RGB Kanallara Ayır", command=self.split_channels, width=20).pack(pady=2)
         Button(basic_frame, text="Negatif", command=self.negative_image, width=20).pack(pady=2)
@@ -227,10 +300,13 @@ class GoruntuIslemeUygulamasi:
         Label(brightness_frame, text="Parlaklık Ayarı", bg="#e0e0e0", font=("Arial", 10, "bold")).pack(pady=5)
         
         # Scale: Kaydırıcı bileşeni, değer aralığı belirterek kullanıcıdan sayısal değer almak için kullanılır
+        # Kaydırıcı hareket ederken küçük önizleme, bırakıldığında tam çözünürlüklü sonuç hesaplanır
         self.brightness_scale = Scale(brightness_frame, from_=-100, to=100, orient=HORIZONTAL, 
-                                     command=self.adjust_brightness, length=200)
+                                     command=lambda val: self._preview_operation(goruntu_islemleri.adjust_brightness, int(val)),
+                                     length=200)
         self.brightness_scale.set(0)  # Başlangıç değerini 0 olarak ayarla
         self.brightness_scale.pack(pady=2)
+        self._bind_release(self.brightness_scale, self.adjust_brightness)
         
         # Eşikleme bölümü
         threshold_frame = Frame(self.left_frame, bg="#e0e0e0", relief=RAISED, borderwidth=1)
@@ -239,9 +315,11 @@ class GoruntuIslemeUygulamasi:
         Label(threshold_frame, text="Eşikleme", bg="#e0e0e0", font=("Arial", 10, "bold")).pack(pady=5)
         
         self.threshold_scale = Scale(threshold_frame, from_=0, to=255, orient=HORIZONTAL, 
-                                    command=self.apply_threshold, length=200)
+                                    command=lambda val: self._preview_operation(goruntu_islemleri.apply_threshold, int(val)),
+                                    length=200)
         self.threshold_scale.set(127)  # Başlangıç değerini 127 olarak ayarla (orta değer)
         self.threshold_scale.pack(pady=2)
+        self._bind_release(self.threshold_scale, self.apply_threshold)
         
         # Histogram işlemleri bölümü
         histogram_frame = Frame(self.left_frame, bg="#e0e0e0", relief=RAISED, borderwidth=1)
@@ -260,9 +338,11 @@ class GoruntuIslemeUygulamasi:
         
         # resolution: Kaydırıcının adım büyüklüğü
         self.contrast_scale = Scale(contrast_frame, from_=0.1, to=3.0, resolution=0.1, orient=HORIZONTAL, 
-                                   command=self.adjust_contrast, length=200)
+                                   command=lambda val: self._preview_operation(goruntu_islemleri.adjust_contrast, float(val)),
+                                   length=200)
         self.contrast_scale.set(1.0)  # Başlangıç değerini 1.0 olarak ayarla (normal kontrast)
         self.contrast_scale.pack(pady=2)
+        self._bind_release(self.contrast_scale, self.adjust_contrast)
         
         # -------------- SAĞ PANEL İÇİN KONTROL BUTONLARI (SEKMELİ YAPI) --------------
         
@@ -323,6 +403,205 @@ class GoruntuIslemeUygulamasi:
         Button(advanced_ops_frame_content, text="Hough Dönüşümü (Çemberler)", command=self.open_hough_circle_dialog, width=25).pack(pady=2)
         Button(advanced_ops_frame_content, text="K-Means Segmentasyon", command=self.open_kmeans_segmentation_dialog, width=25).pack(pady=2)
     
+    def _bind_release(self, scale, apply_func):
+        """
+        Kaydırıcı bırakıldığında (fare veya klavye ile) son değeri tam çözünürlüklü
+        görüntüye uygulayan olayları bağlar.
+
+        Değer son uygulanan değerle (başlangıçta kaydırıcının ilk değeriyle) aynıysa ve
+        görüntü o zamandan beri değişmediyse (örn. kaydırıcıya hareket ettirmeden tıklandıysa)
+        işlem tekrarlanmaz ve geçmişe yinelenen adım eklenmez; panelde güncel görüntü
+        gösterilir. Klavye ile değiştirmede işlem, son tuş bırakıldıktan
+        KEY_RELEASE_DELAY_MS sonra bir kez yapılır.
+
+        Parametreler:
+            scale (Scale): Kaydırıcı
+            apply_func: Kaydırıcı değerini alan tam çözünürlüklü işlem metodu
+        """
+        # Son uygulanan değer ve uygulamadan sonraki görüntü (başlangıçta bağlama anındaki
+        # değer ve görüntü)
+        state = {"value": scale.get(), "image": self.current_image, "pending": None}
+
+        def apply_value():
+            state["pending"] = None
+            value = scale.get()
+            if value == state["value"] and state["image"] is self.current_image:
+                # Kaydırıcı sürüklenip aynı değere geri getirildiyse panelde küçük kopyanın
+                # önizlemesi kalmıştır; güncel görüntü (gösterim önbelleğinden) tekrar gösterilir
+                self.display_image(self.current_image)
+                return
+            apply_func(value)
+            state["value"], state["image"] = value, self.current_image
+
+        def on_key_release(event):
+            if state["pending"] is not None:
+                self.root.after_cancel(state["pending"])
+            state["pending"] = self.root.after(self.KEY_RELEASE_DELAY_MS, apply_value)
+
+        scale.bind("<ButtonRelease-1>", lambda event: apply_value())
+        scale.bind("<KeyRelease>", on_key_release)
+
+    def _preview_image(self):
+        """
+        Orijinal görüntünün panel boyutuna küçültülmüş kopyasını döndürür. Küçük kopya,
+        orijinal görüntü değişene kadar önbellekte tutulur.
+
+        Dönüş:
+            numpy.ndarray: En büyük kenarı en fazla DISPLAY_MAX_SIZE olan görüntü
+        """
+        if self._preview_cache is None or self._preview_cache[0] is not self.original_image:
+            h, w = self.original_image.shape[:2]
+            display_size = self._display_size(h, w)
+            if display_size != (w, h):
+                # Küçültmede INTER_AREA, örtüşme (aliasing) olmadan ortalama alır.
+                # Küçük kopya panel boyutunda olduğu için gösterimde tekrar boyutlandırılmaz
+                proxy = cv2.resize(self.original_image, display_size, interpolation=cv2.INTER_AREA)
+            else:
+                proxy = self.original_image
+            self._preview_cache = (self.original_image, proxy)
+
+        return self._preview_cache[1]
+
+    def _gray_image(self, image):
+        """
+        Görüntünün gri tonlamalı halini döndürür. Aynı görüntü için aynı dizi döndürülür;
+        böylece farklı frekans filtreleri denenirken spektrum yeniden hesaplanmaz.
+        Arka plan işlerinden de çağrılır; önbellek tek bir demet ataması ile güncellenir.
+
+        Parametreler:
+            image (numpy.ndarray): Görüntü
+
+        Dönüş:
+            numpy.ndarray: Gri tonlamalı görüntü (görüntü zaten gri ise kendisi)
+        """
+        cache = self._gray_cache
+        if cache is None or cache[0] is not image:
+            if len(image.shape) > 2:
+                gray_image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            else:
+                gray_image = image
+            cache = (image, gray_image)
+            self._gray_cache = cache
+
+        return cache[1]
+
+    def _preview_operation(self, func, value):
+        """
+        Kaydırıcı hareket ederken işlemi yalnızca küçük önizleme görüntüsüne uygular ve
+        işlenmiş görüntü panelini günceller. current_image değiştirilmez; tam çözünürlüklü
+        sonuç kaydırıcı bırakıldığında hesaplanır.
+
+        Parametreler:
+            func: goruntu_islemleri içindeki işlem fonksiyonu
+            value: Kaydırıcı değeri
+        """
+        if self.original_image is None:
+            return
+
+        preview = func(self._preview_image(), value)
+        self._resize_and_display(preview, self.processed_image_label)
+
+    def _run_in_background(self, title, job_func, operation, spectrum_func=None):
+        """
+        Bir işlemi o anki görüntü üzerinde arka planda çalıştırır. İşlem bittiğinde sonuç
+        ana iş parçacığında current_image'e yazılır ve gösterilir.
+        
+        İş çalışırken görüntü başka bir işlemle değiştirilirse (örn. kaydırıcılar veya yeni
+        görüntü açma) sonuç eskimiş sayılır ve atılır.
+        
+        Parametreler:
+            title (str): Durum çubuğunda gösterilecek açıklama
+            job_func: job_func(job, görüntü) -> işlenmiş görüntü; işçi iş parçacığında çalışır
+            operation (tuple): Geçmişe kaydedilecek (işlem adı, parametreler)
+            spectrum_func: İsteğe bağlı; spectrum_func(gri görüntü) -> [(pencere başlığı, görüntü), ...].
+                Arka planda hesaplanır, sonuç kabul edilirse cv2.imshow ile gösterilir. Gri
+                tonlamalı görüntü yalnızca spektrum istendiğinde hesaplanır.
+        """
+        source = self.current_image
+        
+        def run(job):
+            windows = spectrum_func(self._gray_image(source)) if spectrum_func is not None else []
+            return job_func(job, source), windows
+        
+        def on_done(output):
+            # Görüntü bu arada değiştiyse sonuç eskimiştir
+            if self.current_image is not source:
+                return
+            
+            result, windows = output
+            for window_title, window_image in windows:
+                cv2.imshow(window_title, window_image)
+            
+            name, params = operation
+            self._commit(result, name, *params)
+        
+        def on_error(error):
+            messagebox.showerror("Hata", f"{title} sırasında bir hata oluştu: {error}")
+        
+        self.jobs.submit(run, on_done, on_error, title)
+    
+    def _commit(self, image, name, *params, from_original=False):
+        """
+        Bir işlemin sonucunu güncel görüntü yapar, işlem geçmişine ekler ve gösterir.
+        
+        Parametreler:
+            image (numpy.ndarray): İşlemin sonucu
+            name (str): goruntu_islemleri.ISLEMLER içindeki işlem adı (orijinale dönüş için None)
+            *params: İşlemin parametreleri
+            from_original (bool): İşlem orijinal görüntüye uygulandıysa True
+        """
+        self.current_image = image
+        self.history.push(image, name, params, from_original)
+        self.display_image(self.current_image)
+    
+    def undo(self):
+        """
+        Son işlemi geri alır. Önceki adımın görüntüsü bellek sınırı nedeniyle silinmişse
+        en yakın kontrol noktasından yeniden hesaplanır (bkz. gecmis modülü).
+        """
+        image = self.history.undo()
+        if image is not None:
+            self.current_image = image
+            self.display_image(self.current_image)
+    
+    def redo(self):
+        """
+        Geri alınan işlemi yeniden uygular.
+        """
+        image = self.history.redo()
+        if image is not None:
+            self.current_image = image
+            self.display_image(self.current_image)
+    
+    def _update_job_status(self, job):
+        """
+        Arka plan işinin durumunu arayüzde gösterir. JobExecutor tarafından her yoklamada
+        (yaklaşık 60 Hz) ana iş parçacığında çağrılır.
+        
+        Parametreler:
+            job (arka_plan_isleri.Job): Güncel iş, iş yoksa None
+        """
+        if job is None:
+            self.job_progress.stop()
+            self.job_progress.configure(mode="determinate", value=0)
+            self.job_label.configure(text="Hazır")
+            self.job_cancel_button.configure(state=tk.DISABLED)
+            return
+        
+        self.job_label.configure(text=f"{job.title}...")
+        self.job_cancel_button.configure(state=tk.NORMAL)
+        
+        if job.progress is None:
+            # İlerleme bildirmeyen işlerde çubuk yalnızca çalışıldığını gösterir
+            if str(self.job_progress["mode"]) != "indeterminate":
+                self.job_progress.configure(mode="indeterminate", maximum=1.0)
+                self.job_progress.start(self.jobs.POLL_INTERVAL_MS)
+        else:
+            if str(self.job_progress["mode"]) != "determinate":
+                self.job_progress.stop()
+                self.job_progress.configure(mode="determinate")
+            self.job_progress.configure(value=job.progress)
+    
     def open_image(self):
         """
         Dosya seçme dialogu açarak bir görüntü dosyası seçmeyi ve yüklemeyi sağlar.
@@ -337,17 +616,49 @@ class GoruntuIslemeUygulamasi:
         """
         # Dosya seçme dialogu aç ve desteklenen formatları belirt
         file_path = filedialog.askopenfilename(
-            filetypes=[("Image files", "*.jpg *.jpeg *.png *.bmp *.gif")]
+            filetypes=[("Image files", "*.jpg *.jpeg *.png *.bmp *.gif *.tif *.tiff *.npy")]
         )
         
         if file_path:
             self.file_path = file_path
-            # OpenCV ile görüntüyü oku - OpenCV görüntüleri NumPy dizisi olarak yükler
-            self.original_image = cv2.imread(file_path)
-            # BGR'den RGB'ye dönüştür (OpenCV BGR kullanır, ama biz RGB göstermek istiyoruz)
-            self.original_image = cv2.cvtColor(self.original_image, cv2.COLOR_BGR2RGB)
-            self.current_image = self.original_image.copy()  # İşlenecek görüntü için kopya oluştur
+            self.original_image = self._load_image(file_path)
+            # İşlemler görüntüyü yerinde değiştirmeyip yeni dizi döndürdüğü için kopya gerekmez
+            self.current_image = self.original_image
+            self.history.reset(self.original_image)  # Yeni görüntüyle geçmiş baştan başlar
+            frekans_alani.clear_spectrum_cache()  # Önceki görüntünün spektrumları artık kullanılmaz
+            hough_donusumu.clear_cache()  # Önceki görüntünün kenar haritaları ve Hough oyları
             self.display_image(self.current_image)  # Görüntüyü arayüzde göster
+
+    def _load_image(self, file_path):
+        """
+        Görüntü dosyasını RGB formatında yükler.
+
+        .npy ve sıkıştırılmamış TIFF dosyaları belleğe okunmaz; dosya üzerinde memmap olarak
+        açılır ve yalnızca erişilen bölgeler belleğe alınır. Diğer formatlar cv2.imread ile okunur.
+
+        Parametreler:
+            file_path (str): Görüntü dosyasının yolu
+
+        Dönüş:
+            numpy.ndarray: RGB görüntü
+        """
+        if file_path.lower().endswith(buyuk_goruntu.MEMMAP_EXTENSIONS):
+            try:
+                image = buyuk_goruntu.open_image_memmap(file_path)
+                # İşlemler 3 kanallı görüntü beklediği için gri görüntüler RGB'ye açılır
+                if image.ndim == 2:
+                    image = cv2.cvtColor(image, cv2.COLOR_GRAY2RGB)
+                return image
+            except ValueError:
+                # Sıkıştırılmış TIFF gibi memmap ile açılamayan dosyalar normal yoldan okunur
+                if file_path.lower().endswith(".npy"):
+                    raise
+
+        # OpenCV ile görüntüyü oku - OpenCV görüntüleri NumPy dizisi olarak yükler
+        image = cv2.imread(file_path)
+        # BGR'den RGB'ye dönüştür (OpenCV BGR kullanır, ama biz RGB göstermek istiyoruz)
+        # Dönüşüm yerinde yapılır, ikinci bir tam boyutlu dizi oluşturulmaz
+        return cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=image)
             
     def save_image(self):
         """
@@ -362,14 +673,229 @@ class GoruntuIslemeUygulamasi:
         # Dosya kaydetme dialogu aç
         file_path = filedialog.asksaveasfilename(
             defaultextension=".png",
-            filetypes=[("PNG files", "*.png"), ("JPEG files", "*.jpg"), ("All files", "*.*")]
+            filetypes=[("PNG files", "*.png"), ("JPEG files", "*.jpg"), ("TIFF files (sıkıştırılmamış)", "*.tif"),
+                       ("NumPy files", "*.npy"), ("All files", "*.*")]
         )
         
-        if file_path:
+        if file_path.lower().endswith(buyuk_goruntu.MEMMAP_EXTENSIONS):
+            # Pikseller RGB olarak şerit şerit yazılır, tam boyutlu BGR kopyası oluşturulmaz.
+            # Dosya geçici bir dosyanın yerine konarak yazılır; görüntü aynı dosyadan memmap
+            # ile açılmışsa orijinal görüntü ve geçmiş eski içeriği okumaya devam eder
+            try:
+                buyuk_goruntu.save_image_streaming(file_path, self.current_image)
+            except (OSError, ValueError) as e:
+                messagebox.showerror("Hata", f"Görüntü kaydedilemedi: {e}")
+        elif file_path:
             # RGB'den BGR'ye dönüştür (OpenCV BGR formatında kaydeder)
             save_image = cv2.cvtColor(self.current_image, cv2.COLOR_RGB2BGR)
             cv2.imwrite(file_path, save_image)  # Görüntüyü dosyaya kaydet
             
+    def save_recipe(self):
+        """
+        Açılan görüntüye uygulanan işlemleri (geri alınanlar hariç) bir tarif dosyasına kaydeder.
+        Tarif, toplu_isleme.py --recipe ile arayüz olmadan başka görüntülere uygulanabilir.
+        """
+        if not self.history.steps:
+            messagebox.showinfo("Bilgi", "Kaydedilecek bir işlem yok.")
+            return
+        
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[("JSON", "*.json"), ("YAML", "*.yaml *.yml")]
+        )
+        if not file_path:
+            return
+        
+        try:
+            tarif.save_recipe(file_path, tarif.recipe_from_history(self.history.steps))
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Hata", f"Tarif kaydedilemedi: {e}")
+    
+    def apply_recipe(self):
+        """
+        Bir tarif dosyasındaki işlemleri sırayla o anki görüntüye uygular. Adımlar arka planda
+        çalışır ve her biri geçmişe ayrı bir adım olarak eklenir.
+        """
+        if self.current_image is None:
+            return
+        
+        file_path = filedialog.askopenfilename(
+            filetypes=[("Tarif dosyaları", "*.json *.yaml *.yml")]
+        )
+        if not file_path:
+            return
+        
+        try:
+            steps = tarif.parse_recipe(tarif.load_recipe(file_path))
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Hata", f"Tarif okunamadı: {e}")
+            return
+        
+        source = self.current_image
+        original = self.original_image
+        
+        def run(job):
+            results = []
+            image = source
+            for i, (name, params, from_original) in enumerate(steps):
+                job.report(i, len(steps))
+                if name == tarif.ORIGINAL_OP:
+                    image = original
+                else:
+                    image = goruntu_islemleri.apply_operation(original if from_original else image, name, *params)
+                results.append(image)
+            return results
+        
+        def on_done(results):
+            # Görüntü bu arada değiştiyse sonuç eskimiştir
+            if self.current_image is not source:
+                return
+            for (name, params, from_original), image in zip(steps, results):
+                name = None if name == tarif.ORIGINAL_OP else name
+                self.history.push(image, name, params, from_original)
+            self.current_image = results[-1] if results else source
+            self.display_image(self.current_image)
+        
+        def on_error(error):
+            messagebox.showerror("Hata", f"Tarif uygulanırken bir hata oluştu: {error}")
+        
+        self.jobs.submit(run, on_done, on_error, "Tarif")
+    
+    def open_pipeline_dialog(self):
+        """
+        Güncel görüntüyü üreten işlem zincirini listeler ve bir aşamanın parametrelerini
+        değiştirip zinciri yeniden çalıştırmayı sağlar. Değişen aşamadan önceki aşamalar
+        önbellekten alınır (bkz. boru_hatti); yalnızca değişen aşama ve sonrası hesaplanır.
+        """
+        if self.original_image is None:
+            return
+        
+        steps = self.history.effective_steps
+        if not steps:
+            messagebox.showinfo("Bilgi", "Düzenlenecek bir işlem yok.")
+            return
+        
+        chain = []
+        # Pencere modal değildir; zincirin okunduğu geçmiş adımları saklanır. Ana pencereden
+        # yeni işlem uygulanır veya geri alınırsa zincir "Güncelle" sırasında yeniden okunur
+        state = {"steps": None}
+        
+        def load_chain():
+            steps = self.history.effective_steps
+            chain[:] = [(step.name, step.params) for step in steps]
+            state["steps"] = steps
+            # Geçmişte saklanan ara sonuçlar önbelleğe eklenir; ilk düzenlemede de tekrar
+            # hesaplanmaz
+            self.pipeline.prime(self.original_image, chain, [step.image for step in steps])
+        
+        def history_changed():
+            steps = self.history.effective_steps
+            return len(steps) != len(state["steps"]) or any(a is not b for a, b in zip(steps, state["steps"]))
+        
+        load_chain()
+        
+        def format_param(param):
+            # Nokta listeleri (perspektif) komut satırındaki gibi boşlukla ayrılmış yazılır
+            if isinstance(param, (list, tuple)):
+                return " ".join(format_param(p) for p in param)
+            # Verilmemiş isteğe bağlı parametreler (örn. ilgi bölgesi) boş yazılır;
+            # parse_roi boş metni tekrar None olarak okur
+            if param is None:
+                return ""
+            return str(param)
+        
+        pipeline_dialog = tk.Toplevel(self.root)
+        pipeline_dialog.title("İşlem Zinciri")
+        pipeline_dialog.geometry("420x360")
+        pipeline_dialog.resizable(False, False)
+        
+        Label(pipeline_dialog, text="Aşamalar (orijinal görüntüden başlayarak):").pack(pady=5)
+        steps_listbox = tk.Listbox(pipeline_dialog, height=10, width=55, exportselection=False)
+        steps_listbox.pack(pady=5)
+        
+        Label(pipeline_dialog, text="Parametreler (virgülle ayrılmış):").pack(pady=5)
+        params_entry = tk.Entry(pipeline_dialog, width=40)
+        params_entry.pack(pady=5)
+        
+        def refresh_list():
+            steps_listbox.delete(0, tk.END)
+            for i, (name, params) in enumerate(chain, 1):
+                steps_listbox.insert(tk.END, f"{i}. {name} {', '.join(format_param(p) for p in params)}")
+        
+        def on_select(event):
+            selection = steps_listbox.curselection()
+            if selection:
+                params_entry.delete(0, tk.END)
+                params_entry.insert(0, ",".join(format_param(p) for p in chain[selection[0]][1]))
+        
+        def apply_change():
+            selection = steps_listbox.curselection()
+            if not selection:
+                messagebox.showinfo("Bilgi", "Lütfen bir aşama seçin.")
+                return
+            
+            if history_changed():
+                # Eski zincir çalıştırılırsa sonradan uygulanan işlemler ve geri alma geçmişi
+                # kaybolurdu; zincir geçmişten yeniden okunur ve kullanıcıya bildirilir
+                load_chain()
+                refresh_list()
+                params_entry.delete(0, tk.END)
+                messagebox.showinfo("Bilgi", "İşlem geçmişi bu pencere açıldıktan sonra değişti; aşamalar "
+                                             "güncellendi. Lütfen aşamayı seçip değişikliği tekrar uygulayın.")
+                return
+            
+            index = selection[0]
+            name = chain[index][0]
+            text = params_entry.get().strip()
+            try:
+                params = goruntu_islemleri.parse_params(name, [p.strip() for p in text.split(",")] if text else [])
+            except ValueError as e:
+                messagebox.showerror("Hata", str(e))
+                return
+            
+            chain[index] = (name, params)
+            refresh_list()
+            steps_listbox.selection_set(index)
+            self.run_pipeline(list(chain), on_finished=lambda: state.update(steps=self.history.effective_steps))
+        
+        steps_listbox.bind("<<ListboxSelect>>", on_select)
+        refresh_list()
+        
+        Button(pipeline_dialog, text="Güncelle", command=apply_change, width=15).pack(pady=10)
+    
+    def run_pipeline(self, chain, on_finished=None):
+        """
+        İşlem zincirini orijinal görüntüye arka planda uygular. Önbellekte bulunan aşamalar
+        hesaplanmaz. Sonuçta işlem geçmişi yeni zincirin aşamalarıyla yeniden oluşturulur.
+        
+        Parametreler:
+            chain (list): (işlem adı, parametreler) çiftleri
+            on_finished (callable): İsteğe bağlı; geçmiş yeniden oluşturulduktan sonra çağrılır
+        """
+        original = self.original_image
+        source = self.current_image
+        
+        def run(job):
+            return self.pipeline.run_stages(original, chain, job.report)
+        
+        def on_done(outputs):
+            # Görüntü bu arada değiştiyse sonuç eskimiştir
+            if self.current_image is not source or self.original_image is not original:
+                return
+            
+            self.history.reset(original)
+            for i, ((name, params), image) in enumerate(zip(chain, outputs)):
+                self.history.push(image, name, params, from_original=(i == 0))
+            self.current_image = outputs[-1]
+            self.display_image(self.current_image)
+            if on_finished is not None:
+                on_finished()
+        
+        def on_error(error):
+            messagebox.showerror("Hata", f"İşlem zinciri çalıştırılırken bir hata oluştu: {error}")
+        
+        self.jobs.submit(run, on_done, on_error, "İşlem zinciri")
+    
     def display_image(self, image):
         """
         Verilen görüntüyü işlenmiş görüntü olarak gösterir ve orijinal görüntüyü de gösterir.
@@ -389,37 +915,76 @@ class GoruntuIslemeUygulamasi:
         # İşlenmiş görüntüyü göster
         self._resize_and_display(image, self.processed_image_label)
     
+    def _display_size(self, h, w):
+        """
+        Görüntünün panelde gösterileceği boyutu hesaplar. En-boy oranı korunur ve en büyük
+        kenar DISPLAY_MAX_SIZE değerini aşmaz; küçük görüntüler büyütülmez.
+        
+        Parametreler:
+            h (int): Görüntü yüksekliği
+            w (int): Görüntü genişliği
+        
+        Dönüş:
+            tuple: (genişlik, yükseklik) - cv2.resize'ın beklediği sırada
+        """
+        max_size = self.DISPLAY_MAX_SIZE  # Tek bir panel için maksimum boyut
+        
+        if h > max_size or w > max_size:
+            # En-boy oranını koru
+            if h > w:
+                return max(1, int(w * max_size / h)), max_size
+            return max_size, max(1, int(h * max_size / w))
+        return w, h
+    
     def _resize_and_display(self, image, target_label):
         """
         Verilen görüntüyü yeniden boyutlandırır ve hedef label'a yerleştirir.
         
+        Gösterim, label başına önbelleğe alınır:
+        - Label zaten aynı görüntü nesnesini aynı boyutta gösteriyorsa hiçbir şey yapılmaz.
+          Görüntüler yerinde değiştirilmediği için nesne kimliği (is) yeterli bir anahtardır;
+          önbellek kaynağa referans tuttuğu için kimlik başka bir nesneye geçemez.
+        - Gösterim boyutu değişmediyse küçültme önceden ayrılmış tampona yapılır ve mevcut
+          PhotoImage yerinde güncellenir (paste); yeni bir Tk görüntüsü oluşturulmaz.
+        
         Parametreler:
             image (numpy.ndarray): Gösterilecek görüntü
             target_label (tk.Label): Görüntünün yerleştirileceği Label
         """
-        # Görüntüyü yeniden boyutlandır - Eğer görüntü çok büyükse, ekrana sığdırmak için küçültüyoruz
         h, w = image.shape[:2]  # Görüntünün yükseklik ve genişliğini al
-        max_size = 350  # Tek bir panel için maksimum boyut
-        
-        if h > max_size or w > max_size:
-            # En-boy oranını koru
-            if h > w:
-                new_h, new_w = max_size, int(w * max_size / h)
-            else:
-                new_h, new_w = int(h * max_size / w), max_size
-                
-            display_img = cv2.resize(image, (new_w, new_h))  # Görüntüyü yeniden boyutlandır
+        display_size = self._display_size(h, w)
+        
+        cached = self._render_cache.get(target_label)
+        if cached is not None and cached[0] is image and cached[1] == display_size:
+            return  # Label bu görüntüyü zaten gösteriyor
+        
+        buffer = None
+        if display_size != (w, h):
+            # Görüntüyü yeniden boyutlandır - Eğer görüntü çok büyükse, ekrana sığdırmak için küçültüyoruz
+            new_w, new_h = display_size
+            if cached is not None and cached[3] is not None and cached[3].shape == (new_h, new_w) + image.shape[2:] \
+                    and cached[3].dtype == image.dtype:
+                buffer = cached[3]  # Önceki tamponu yeniden kullan
+            buffer = cv2.resize(image, display_size, dst=buffer)
+            display_img = buffer
         else:
-            display_img = image.copy()
+            display_img = image  # Image.fromarray veriyi zaten kopyalar
         
         # NumPy dizisini PIL Image'e dönüştür
         pil_img = Image.fromarray(display_img)
-        # PIL Image'i Tkinter PhotoImage'e dönüştür
-        tk_img = ImageTk.PhotoImage(pil_img)
         
-        # Görüntüyü Label'a yerleştir
-        target_label.configure(image=tk_img)
-        target_label.image = tk_img  # Referansı koru (Python'un çöp toplayıcısı silmesin diye)
+        if cached is not None and cached[1] == display_size:
+            # Aynı boyuttaki PhotoImage'in piksellerini yerinde güncelle
+            tk_img = cached[2]
+            tk_img.paste(pil_img)
+        else:
+            # PIL Image'i Tkinter PhotoImage'e dönüştür
+            tk_img = ImageTk.PhotoImage(pil_img)
+            # Görüntüyü Label'a yerleştir
+            target_label.configure(image=tk_img)
+            target_label.image = tk_img  # Referansı koru (Python'un çöp toplayıcısı silmesin diye)
+        
+        self._render_cache[target_label] = (image, display_size, tk_img, buffer)
     
     def show_original(self):
         """
@@ -427,8 +992,8 @@ class GoruntuIslemeUygulamasi:
         orijinal görüntüye dönmek için kullanılır.
         """
         if self.original_image is not None:
-            self.current_image = self.original_image.copy()  # Orijinalin kopyasını al
-            self.display_image(self.current_image)  # Görüntüyü göster
+            # Geçmişe bir adım olarak eklenir; böylece "Geri Al" ile önceki sonuca dönülebilir
+            self._commit(self.original_image, None, from_original=True)
             
     def convert_to_gray(self):
         """
@@ -443,21 +1008,16 @@ class GoruntuIslemeUygulamasi:
         """
         if self.original_image is None:
             return
-            
-        # RGB'den gri tonlamaya dönüştür
-        gray_image = cv2.cvtColor(self.original_image, cv2.COLOR_RGB2GRAY)
-        # Gri görüntüyü 3 kanallı RGB'ye dönüştür (gösterim için)
-        # Bu dönüşüm sadece görselleştirme içindir - her kanal aynı değeri alır
-        self.current_image = cv2.cvtColor(gray_image, cv2.COLOR_GRAY2RGB)
-        self.display_image(self.current_image)
-        
+
+        result = goruntu_islemleri.convert_to_gray(self.original_image)
+        self._commit(result, "gray", from_original=True)
+
     def split_channels(self):
         """
         Görüntüyü R, G, B (Kırmızı, Yeşil, Mavi) kanallarına ayırır ve
         her bir kanalı ayrı bir pencerede gösterir.
         
-        cv2.split: Çok kanallı bir görüntüyü ayrı kanallara ayıran OpenCV fonksiyonu
-        np.zeros_like: Belirtilen dizi gibi sıfırlardan oluşan bir dizi oluşturan NumPy fonksiyonu
+        goruntu_islemleri.split_channels: Her kanalı kendi renginde 3 kanallı görüntüye yerleştirir
         Toplevel: Tkinter'da yeni bir pencere oluşturmak için kullanılan sınıf
         """
         if self.original_image is None:
@@ -468,19 +1028,8 @@ class GoruntuIslemeUygulamasi:
         channels_window.title("RGB Kanalları")
         channels_window.geometry("800x600")
         
-        # Kanalları ayır - r, g, b tek kanallı (2B) görüntülerdir
-        r, g, b = cv2.split(self.original_image)
-        
-        # Tek kanallı görüntüleri 3 kanallı görüntülere dönüştür
-        # Her kanalı kendi renginde göstermek için:
-        r_img = np.zeros_like(self.original_image)  # Orijinal boyutunda sıfır dizisi
-        g_img = np.zeros_like(self.original_image)
-        b_img = np.zeros_like(self.original_image)
-        
-        # Her kanalı kendi pozisyonuna yerleştir (RGB formatında)
-        r_img[:,:,0] = r  # Kırmızı kanal, RGB'nin ilk kanalına (indeks 0)
-        g_img[:,:,1] = g  # Yeşil kanal, RGB'nin ikinci kanalına (indeks 1)
-        b_img[:,:,2] = b  # Mavi kanal, RGB'nin üçüncü kanalına (indeks 2)
+        # Kanalları ayır - her biri yalnızca kendi kanalı dolu 3 kanallı görüntüdür
+        r_img, g_img, b_img = goruntu_islemleri.split_channels(self.original_image)
         
         # Görüntüleri göster - Her kanal için bir çerçeve ve etiket oluştur
         frame_r = Frame(channels_window)
@@ -533,36 +1082,29 @@ class GoruntuIslemeUygulamasi:
         """
         if self.original_image is None:
             return
-            
+
         # 255'ten çıkararak negatif al
-        self.current_image = 255 - self.original_image
-        self.display_image(self.current_image)
-        
+        result = goruntu_islemleri.negative_image(self.original_image)
+        self._commit(result, "negative", from_original=True)
+
     def adjust_brightness(self, val):
         """
         Görüntünün parlaklığını ayarlar. Pozitif değerler parlaklığı artırır,
-        negatif değerler azaltır.
+        negatif değerler azaltır. Sonuç 0-255 aralığında doyurulur.
         
-        cv2.add: İki diziyi toplayan OpenCV fonksiyonu
-        cv2.subtract: Bir diziden başka bir diziyi çıkaran OpenCV fonksiyonu
-        np.ones_like: Belirtilen dizi gibi birlerden oluşan bir dizi oluşturan NumPy fonksiyonu
+        Değişim, 256 elemanlı doyurmalı toplama tablosu (bkz. nokta_islemleri) ile
+        cv2.LUT kullanılarak tek geçişte uygulanır; görüntü boyutunda ek dizi oluşturulmaz.
         
         Parametreler:
             val (str): Kaydırıcıdan gelen değer (string olarak)
         """
         if self.original_image is None:
             return
-            
+
         brightness = int(val)  # String'i integer'a dönüştür
-        if brightness > 0:
-            # Parlaklığı artır: Her piksele sabit bir değer ekle
-            self.current_image = cv2.add(self.original_image, np.ones_like(self.original_image) * brightness)
-        else:
-            # Parlaklığı azalt: Her pikselden sabit bir değer çıkar
-            self.current_image = cv2.subtract(self.original_image, np.ones_like(self.original_image) * abs(brightness))
-            
-        self.display_image(self.current_image)
-        
+        result = goruntu_islemleri.adjust_brightness(self.original_image, brightness)
+        self._commit(result, "brightness", brightness, from_original=True)
+
     def apply_threshold(self, val):
         """
         Görüntüye eşikleme (thresholding) uygular. Piksel değeri eşik değerinden
@@ -576,18 +1118,11 @@ class GoruntuIslemeUygulamasi:
         """
         if self.original_image is None:
             return
-            
+
         threshold = int(val)  # String'i integer'a dönüştür
-        # Görüntüyü gri tonlamaya çevir (eşikleme için)
-        gray_image = cv2.cvtColor(self.original_image, cv2.COLOR_RGB2GRAY)
-        # Eşikleme uygula
-        # _: İlk dönüş değeri eşik değeri, biz onu kullanmadığımız için _ ile göz ardı ediyoruz
-        _, thresholded = cv2.threshold(gray_image, threshold, 255, cv2.THRESH_BINARY)
-        
-        # Tek kanallı görüntüyü 3 kanallı görüntüye dönüştür (gösterim için)
-        self.current_image = cv2.cvtColor(thresholded, cv2.COLOR_GRAY2RGB)
-        self.display_image(self.current_image)
-        
+        result = goruntu_islemleri.apply_threshold(self.original_image, threshold)
+        self._commit(result, "threshold", threshold, from_original=True)
+
     def show_histogram(self):
         """
         Mevcut görüntünün histogramını hesaplar ve gösterir.
@@ -677,41 +1212,31 @@ class GoruntuIslemeUygulamasi:
         """
         if self.original_image is None:
             return
-            
-        # Görüntüyü gri tonlamaya çevir (histogram eşitleme tek kanallı görüntüler için çalışır)
-        gray_img = cv2.cvtColor(self.original_image, cv2.COLOR_RGB2GRAY)
-        
-        # Histogram eşitleme uygula
-        equalized = cv2.equalizeHist(gray_img)
-        
-        # Tek kanallı görüntüyü 3 kanallı görüntüye dönüştür (gösterim için)
-        self.current_image = cv2.cvtColor(equalized, cv2.COLOR_GRAY2RGB)
-        self.display_image(self.current_image)
-        
+
+        result = goruntu_islemleri.equalize_histogram(self.original_image)
+        self._commit(result, "equalize", from_original=True)
+
         # Histogramı göster
         self.show_histogram()
-        
+
     def adjust_contrast(self, val):
         """
         Görüntünün kontrastını ayarlar. 1.0'dan büyük değerler kontrastı artırır,
         küçük değerler azaltır.
         
-        cv2.convertScaleAbs: Piksel değerlerini ölçeklendiren ve mutlak değer alan OpenCV fonksiyonu
-        alpha: Kontrast faktörü (çarpan)
-        beta: Parlaklık faktörü (toplam)
+        cv2.convertScaleAbs ile hesaplanan 256 elemanlı tablo (bkz. nokta_islemleri)
+        görüntüye cv2.LUT ile tek geçişte uygulanır.
         
         Parametreler:
             val (str): Kaydırıcıdan gelen kontrast değeri (string olarak)
         """
         if self.original_image is None:
             return
-            
+
         contrast = float(val)  # String'i float'a dönüştür
-        # convertScaleAbs fonksiyonu: f(x) = alpha*x + beta
-        # alpha: kontrast faktörü, beta: parlaklık faktörü (burada 0)
-        self.current_image = cv2.convertScaleAbs(self.original_image, alpha=contrast, beta=0)
-        self.display_image(self.current_image)
-    
+        result = goruntu_islemleri.adjust_contrast(self.original_image, contrast)
+        self._commit(result, "contrast", contrast, from_original=True)
+
     def open_translation_dialog(self):
         """
         Görüntüyü taşımak için bir dialog penceresi açar. Bu dialog, kullanıcının 
@@ -763,18 +1288,10 @@ class GoruntuIslemeUygulamasi:
         """
         if self.current_image is None:
             return
-            
-        # Görüntü boyutları
-        h, w = self.current_image.shape[:2]
-        
-        # Taşıma matrisi oluştur [ [1, 0, tx], [0, 1, ty] ]
-        # İlk parametre 2x3'lük bir matris olmalı
-        M = np.float32([[1, 0, tx], [0, 1, ty]])
-        
-        # Görüntüyü taşı
-        self.current_image = cv2.warpAffine(self.current_image, M, (w, h))
-        self.display_image(self.current_image)
-    
+
+        result = goruntu_islemleri.translate_image(self.current_image, tx, ty)
+        self._commit(result, "translate", tx, ty)
+
     def flip_horizontal(self):
         """
         Görüntüyü yatay eksende aynalar (x eksenine göre çevirir).
@@ -785,11 +1302,10 @@ class GoruntuIslemeUygulamasi:
         """
         if self.current_image is None:
             return
-            
-        # Görüntüyü yatay eksende aynala (flipCode = 1)
-        self.current_image = cv2.flip(self.current_image, 1)
-        self.display_image(self.current_image)
-    
+
+        result = goruntu_islemleri.flip_horizontal(self.current_image)
+        self._commit(result, "flip_h")
+
     def flip_vertical(self):
         """
         Görüntüyü dikey eksende aynalar (y eksenine göre çevirir).
@@ -800,11 +1316,10 @@ class GoruntuIslemeUygulamasi:
         """
         if self.current_image is None:
             return
-            
-        # Görüntüyü dikey eksende aynala (flipCode = 0)
-        self.current_image = cv2.flip(self.current_image, 0)
-        self.display_image(self.current_image)
-    
+
+        result = goruntu_islemleri.flip_vertical(self.current_image)
+        self._commit(result, "flip_v")
+
     def open_shearing_dialog(self):
         """
         Görüntüyü eğmek (shearing) için bir dialog penceresi açar. Bu dialog,
@@ -856,17 +1371,10 @@ class GoruntuIslemeUygulamasi:
         """
         if self.current_image is None:
             return
-            
-        # Görüntü boyutları
-        h, w = self.current_image.shape[:2]
-        
-        # Eğme matrisi oluştur
-        M = np.float32([[1, sx, 0], [sy, 1, 0]])
-        
-        # Görüntüyü eğ
-        self.current_image = cv2.warpAffine(self.current_image, M, (w, h))
-        self.display_image(self.current_image)
-    
+
+        result = goruntu_islemleri.shear_image(self.current_image, sx, sy)
+        self._commit(result, "shear", sx, sy)
+
     def open_scaling_dialog(self):
         """
         Görüntüyü ölçeklemek (zoom in/out) için bir dialog penceresi açar.
@@ -918,20 +1426,10 @@ class GoruntuIslemeUygulamasi:
         """
         if self.current_image is None:
             return
-            
-        # Görüntü boyutları
-        h, w = self.current_image.shape[:2]
-        
-        # Yeni boyutları hesapla
-        new_w = int(w * sx)
-        new_h = int(h * sy)
-        
-        # Görüntüyü ölçekle (yeniden boyutlandır)
-        # Büyütme işlemi için cv2.INTER_CUBIC, küçültme işlemi için cv2.INTER_AREA önerilir
-        interpolation = cv2.INTER_CUBIC if sx > 1 or sy > 1 else cv2.INTER_AREA
-        self.current_image = cv2.resize(self.current_image, (new_w, new_h), interpolation=interpolation)
-        self.display_image(self.current_image)
-    
+
+        result = goruntu_islemleri.scale_image(self.current_image, sx, sy)
+        self._commit(result, "scale", sx, sy)
+
     def open_rotation_dialog(self):
         """
         Görüntüyü döndürmek için bir dialog penceresi açar.
@@ -975,31 +1473,10 @@ class GoruntuIslemeUygulamasi:
         """
         if self.current_image is None:
             return
-            
-        # Görüntü boyutları
-        h, w = self.current_image.shape[:2]
-        
-        # Görüntünün merkezi
-        center = (w // 2, h // 2)
-        
-        # Döndürme matrisi oluştur (merkez, açı, ölçek)
-        # Üçüncü parametre (1.0) ölçeği belirtir (1.0 = orijinal boyut)
-        M = cv2.getRotationMatrix2D(center, angle, 1.0)
-        
-        # Döndürülmüş görüntünün sınırlarını hesapla
-        cos = np.abs(M[0, 0])
-        sin = np.abs(M[0, 1])
-        new_w = int((h * sin) + (w * cos))
-        new_h = int((h * cos) + (w * sin))
-        
-        # Dönüşüm matrisini yeni merkeze göre ayarla
-        M[0, 2] += (new_w / 2) - center[0]
-        M[1, 2] += (new_h / 2) - center[1]
-        
-        # Görüntüyü döndür
-        self.current_image = cv2.warpAffine(self.current_image, M, (new_w, new_h))
-        self.display_image(self.current_image)
-    
+
+        result = goruntu_islemleri.rotate_image(self.current_image, angle)
+        self._commit(result, "rotate", angle)
+
     def open_cropping_dialog(self):
         """
         Görüntüyü kırpmak için bir dialog penceresi açar.
@@ -1085,12 +1562,10 @@ class GoruntuIslemeUygulamasi:
         """
         if self.current_image is None:
             return
-            
-        # Görüntüyü kırp
-        # NumPy dizisi dilimleme sözdizimi: array[y_start:y_end, x_start:x_end]
-        self.current_image = self.current_image[y_start:y_end, x_start:x_end].copy()
-        self.display_image(self.current_image)
-    
+
+        result = goruntu_islemleri.crop_image(self.current_image, x_start, y_start, x_end, y_end)
+        self._commit(result, "crop", x_start, y_start, x_end, y_end)
+
     def open_perspective_correction(self):
         """
         Perspektif düzeltme işlemi için bir OpenCV penceresi açar.
@@ -1175,9 +1650,6 @@ class GoruntuIslemeUygulamasi:
         if len(self.selected_points) != 4:
             return
         
-        # Kullanıcının seçtiği noktaları numpy array'e çevir
-        pts1 = np.float32(self.selected_points)
-        
         # Dialog ile hedef boyutları belirle
         perspective_dialog = tk.Toplevel(self.root)
         perspective_dialog.title("Perspektif Düzeltme Boyutları")
@@ -1206,22 +1678,11 @@ class GoruntuIslemeUygulamasi:
                     messagebox.showerror("Hata", "Genişlik ve yükseklik pozitif değerler olmalıdır.")
                     return
                 
-                # Düzeltme sonrası köşeleri belirle (çıkış boyutlarına göre)
-                pts2 = np.float32([[0, 0], [width, 0], [0, height], [width, height]])
-                
-                # Perspektif dönüşüm matrisini hesapla
-                matrix = cv2.getPerspectiveTransform(pts1, pts2)
-                
-                # Perspektif dönüşümünü uygula
-                # OpenCV BGR formatını kullanırken, bizim görüntümüz RGB formatında,
-                # bu yüzden gerekli dönüşümleri yapmalıyız
-                img_bgr = cv2.cvtColor(self.current_image, cv2.COLOR_RGB2BGR)
-                warped_image_bgr = cv2.warpPerspective(img_bgr, matrix, (width, height))
-                warped_image_rgb = cv2.cvtColor(warped_image_bgr, cv2.COLOR_BGR2RGB)
-                
-                # İşlenmiş görüntüyü güncelle ve göster
-                self.current_image = warped_image_rgb
-                self.display_image(self.current_image)
+                # Perspektif dönüşümünü uygula (dönüşüm her kanala ayrı uygulandığı için
+                # kanal sırası sonucu etkilemez)
+                points = tuple(tuple(point) for point in self.selected_points)
+                result = goruntu_islemleri.apply_perspective_correction(self.current_image, points, width, height)
+                self._commit(result, "perspective", points, width, height)
                 
                 # Dialog penceresini kapat
                 perspective_dialog.destroy()
@@ -1278,11 +1739,10 @@ class GoruntuIslemeUygulamasi:
         """
         if self.current_image is None:
             return
-        
-        # Görüntüyü ortalama filtresi ile filtrele
-        self.current_image = cv2.blur(self.current_image, (kernel_size, kernel_size))
-        self.display_image(self.current_image)
-    
+
+        result = karolu_isleme.apply_mean_filter(self.current_image, kernel_size)
+        self._commit(result, "mean", kernel_size)
+
     def open_median_filter_dialog(self):
         """
         Medyan filtresi uygulamak için bir dialog penceresi açar.
@@ -1327,10 +1787,9 @@ class GoruntuIslemeUygulamasi:
         """
         if self.current_image is None:
             return
-        
-        # Görüntüyü medyan filtresi ile filtrele
-        self.current_image = cv2.medianBlur(self.current_image, kernel_size)
-        self.display_image(self.current_image)
+
+        result = karolu_isleme.apply_median_filter(self.current_image, kernel_size)
+        self._commit(result, "median", kernel_size)
 
     def open_gaussian_filter_dialog(self):
         """
@@ -1382,79 +1841,42 @@ class GoruntuIslemeUygulamasi:
         """
         if self.current_image is None:
             return
-        
-        # Görüntüyü Gaussian filtresi ile filtrele
-        self.current_image = cv2.GaussianBlur(self.current_image, (kernel_size, kernel_size), sigma)
-        self.display_image(self.current_image)
-        
-    def apply_conservative_filter(self):
+
+        result = karolu_isleme.apply_gaussian_filter(self.current_image, kernel_size, sigma)
+        self._commit(result, "gaussian", kernel_size, sigma)
+
+    def apply_conservative_filter(self, window_size=3):
         """
         Görüntüye konservatif filtreleme uygular.
         
-        Konservatif filtreleme, bir piksel etrafındaki komşu piksellerin minimum ve maksimum değerleri
-        arasında sınırlama yaparak gürültüyü azaltan bir yöntemdir. Bu yöntem, kenarları korur ve
-        küçük gürültüleri giderir.
+        Konservatif filtreleme, bir pikseli komşu piksellerin (merkez piksel hariç) minimum ve
+        maksimum değerleri arasına sınırlayarak gürültüyü azaltan bir yöntemdir. Bu yöntem,
+        kenarları korur ve tekil gürültü piksellerini giderir.
         
-        OpenCV'de doğrudan bu filtre bulunmadığı için manuel olarak uygulanmıştır.
+        OpenCV'de doğrudan bu filtre bulunmadığı için komşuluk minimum/maksimumu
+        morfolojik aşındırma ve genişletme ile hesaplanır:
+        cv2.erode: Her pikselin komşuluğundaki minimum değeri bulur
+        cv2.dilate: Her pikselin komşuluğundaki maksimum değeri bulur
+        
+        Çekirdeğin merkezi 0 yapıldığı için merkez piksel kendi komşuluğuna dahil edilmez.
+        Tüm kanallar tek bir geçişte işlenir.
+        
+        Parametreler:
+            window_size (int): Komşuluk penceresinin boyutu (tek sayı, örn. 3 için 3x3 pencere)
         """
         if self.current_image is None:
             return
-            
-        # Görüntü bir kopya olarak alınır
-        result = self.current_image.copy()
-        
-        # Gri tonlama görüntüsü için işlemi gerçekleştir
-        if len(self.current_image.shape) == 2 or (len(self.current_image.shape) == 3 and self.current_image.shape[2] == 1):
-            # Gri tonlama görüntüsü
-            padded = cv2.copyMakeBorder(self.current_image, 1, 1, 1, 1, cv2.BORDER_REFLECT)
-            
-            for i in range(1, padded.shape[0]-1):
-                for j in range(1, padded.shape[1]-1):
-                    # 3x3 pencere
-                    window = padded[i-1:i+2, j-1:j+2]
-                    center = padded[i, j]
-                    
-                    # Minimum ve maksimum değerleri bul
-                    min_val = np.min(window)
-                    max_val = np.max(window)
-                    
-                    # Eğer merkez piksel minimum değerden küçükse, minimum olarak ayarla
-                    if center < min_val:
-                        result[i-1, j-1] = min_val
-                    # Eğer merkez piksel maksimum değerden büyükse, maksimum olarak ayarla
-                    elif center > max_val:
-                        result[i-1, j-1] = max_val
-                    # Aksi takdirde değişiklik yapma
-        else:
-            # Renkli görüntü (BGR)
-            # Her kanal için ayrı ayrı filtrele
-            for k in range(3):  # 3 kanal: B, G, R
-                padded = cv2.copyMakeBorder(self.current_image[:,:,k], 1, 1, 1, 1, cv2.BORDER_REFLECT)
-                
-                for i in range(1, padded.shape[0]-1):
-                    for j in range(1, padded.shape[1]-1):
-                        # 3x3 pencere
-                        window = padded[i-1:i+2, j-1:j+2]
-                        center = padded[i, j]
-                        
-                        # Minimum ve maksimum değerleri bul
-                        min_val = np.min(window)
-                        max_val = np.max(window)
-                        
-                        # Eğer merkez piksel minimum değerden küçükse, minimum olarak ayarla
-                        if center < min_val:
-                            result[i-1, j-1, k] = min_val
-                        # Eğer merkez piksel maksimum değerden büyükse, maksimum olarak ayarla
-                        elif center > max_val:
-                            result[i-1, j-1, k] = max_val
-                        # Aksi takdirde değişiklik yapma
-        
-        self.current_image = result
-        self.display_image(self.current_image)
+
+        # Büyük pencerelerde uzun sürebileceği için arka planda çalışır
+        self._run_in_background(
+            "Konservatif filtre",
+            lambda job, image: karolu_isleme.apply_conservative_filter(image, window_size),
+            ("conservative", (window_size,)))
 
     def open_conservative_filter_dialog(self):
         """
         Konservatif filtreleme işlemi için bir dialog penceresi açar.
+        Bu dialog, kullanıcının komşuluk penceresinin boyutunu belirlemesini sağlar.
         
         Konservatif filtre, görüntüdeki tuz ve biber gürültüsünü azaltırken
         kenarları koruyan bir filtreleme türüdür.
@@ -1462,21 +1884,31 @@ class GoruntuIslemeUygulamasi:
         if self.current_image is None:
             return
             
-        # Onay mesajı
-        confirm = messagebox.askyesno(
-            "Konservatif Filtreleme", 
-            "Konservatif filtreleme işlemi başlatılacak.\n\n"
-            "Bu işlem büyük görüntülerde uzun sürebilir.\n"
-            "Devam etmek istiyor musunuz?"
-        )
+        # Yeni bir dialog penceresi oluştur
+        conservative_dialog = tk.Toplevel(self.root)
+        conservative_dialog.title("Konservatif Filtre")
+        conservative_dialog.geometry("300x150")
+        conservative_dialog.resizable(False, False)
+        
+        # Pencere boyutu için seçim - Merkez piksel olması için tek sayı olmalı
+        Label(conservative_dialog, text="Pencere Boyutu:").pack(pady=5)
+        window_size_var = tk.StringVar(value="3")
+        window_sizes = ["3", "5", "7", "9", "11"]
+        window_dropdown = ttk.Combobox(conservative_dialog, textvariable=window_size_var, values=window_sizes, state="readonly", width=10)
+        window_dropdown.pack(pady=5)
+        
+        # Uygula butonu
+        def apply_conservative_filter():
+            window_size = int(window_size_var.get())
+            self.apply_conservative_filter(window_size)
+            conservative_dialog.destroy()  # Dialog penceresini kapat
         
-        if confirm:
-            # İşlemi başlat
-            self.apply_conservative_filter()
+        Button(conservative_dialog, text="Uygula", command=apply_conservative_filter, width=15).pack(pady=10)
 
     def open_crimmins_speckle_dialog(self):
         """
         Crimmins Speckle gürültü giderme işlemi için bir dialog penceresi açar.
+        Bu dialog, kullanıcının algoritmanın kaç kez (iterasyon) uygulanacağını belirlemesini sağlar.
         
         Crimmins Speckle algoritması, özellikle tuz ve biber gürültüsünü gidermekte
         etkili olan bir yöntemdir.
@@ -1484,19 +1916,27 @@ class GoruntuIslemeUygulamasi:
         if self.current_image is None:
             return
             
-        # Onay mesajı
-        confirm = messagebox.askyesno(
-            "Crimmins Speckle Filtreleme", 
-            "Crimmins Speckle filtreleme işlemi başlatılacak.\n\n"
-            "Bu işlem büyük görüntülerde uzun sürebilir.\n"
-            "Devam etmek istiyor musunuz?"
-        )
+        # Yeni bir dialog penceresi oluştur
+        crimmins_dialog = tk.Toplevel(self.root)
+        crimmins_dialog.title("Crimmins Speckle")
+        crimmins_dialog.geometry("300x150")
+        crimmins_dialog.resizable(False, False)
+        
+        # İterasyon sayısı için kaydırıcı
+        Label(crimmins_dialog, text="İterasyon Sayısı:").pack(pady=5)
+        iterations_scale = Scale(crimmins_dialog, from_=1, to=20, orient=HORIZONTAL, length=200)
+        iterations_scale.set(5)  # Varsayılan değer
+        iterations_scale.pack(pady=5)
+        
+        # Uygula butonu
+        def apply_crimmins_speckle():
+            iterations = int(iterations_scale.get())
+            self.apply_crimmins_speckle(iterations)
+            crimmins_dialog.destroy()  # Dialog penceresini kapat
         
-        if confirm:
-            # İşlemi başlat
-            self.apply_crimmins_speckle()
+        Button(crimmins_dialog, text="Uygula", command=apply_crimmins_speckle, width=15).pack(pady=10)
 
-    def apply_crimmins_speckle(self):
+    def apply_crimmins_speckle(self, iterations=5):
         """
         Görüntüye Crimmins speckle gürültü giderme algoritmasını uygular.
         
@@ -1504,162 +1944,28 @@ class GoruntuIslemeUygulamasi:
         gürültülü pikselleri tanıyan ve düzelten, özellikle speckle (nokta) gürültüsü 
         gidermede etkili bir yöntemdir.
         
+        Her iterasyonda piksel, 8 komşusunun her biri ile karşılaştırılır: komşu pikselden
+        en az 2 koyuysa 1 artırılır, en az 2 açıksa 1 azaltılır. Karşılaştırmalar
+        iterasyon başındaki görüntü üzerinden yapıldığı için tüm yönler ve tüm kanallar
+        kaydırılmış dizilerle tek seferde hesaplanır.
+        
         OpenCV'de doğrudan bu filtre bulunmadığı için manuel olarak uygulanmıştır.
+        
+        Parametreler:
+            iterations (int): Algoritmanın kaç kez uygulanacağı
         """
         if self.current_image is None:
             return
-            
-        # Görüntü bir kopya olarak alınır
-        result = self.current_image.copy()
-        
-        # Crimmins speckle gürültü giderme algoritması
-        def crimmins_one_iteration(img, copy):
-            # Yardımcı fonksiyonlar - sırasıyla 4 yönde ilerleyip filtreleme yapar
-            # Kuzey (yukarı)
-            for i in range(1, img.shape[0]):
-                for j in range(img.shape[1]):
-                    if img[i-1, j] >= img[i, j] + 2:
-                        copy[i, j] = copy[i, j] + 1
-                    elif img[i, j] >= img[i-1, j] + 2:
-                        copy[i, j] = copy[i, j] - 1
-            
-            # Güney (aşağı)
-            for i in range(img.shape[0]-2, -1, -1):
-                for j in range(img.shape[1]):
-                    if img[i+1, j] >= img[i, j] + 2:
-                        copy[i, j] = copy[i, j] + 1
-                    elif img[i, j] >= img[i+1, j] + 2:
-                        copy[i, j] = copy[i, j] - 1
-            
-            # Doğu (sağa)
-            for i in range(img.shape[0]):
-                for j in range(1, img.shape[1]):
-                    if img[i, j-1] >= img[i, j] + 2:
-                        copy[i, j] = copy[i, j] + 1
-                    elif img[i, j] >= img[i, j-1] + 2:
-                        copy[i, j] = copy[i, j] - 1
-            
-            # Batı (sola)
-            for i in range(img.shape[0]):
-                for j in range(img.shape[1]-2, -1, -1):
-                    if img[i, j+1] >= img[i, j] + 2:
-                        copy[i, j] = copy[i, j] + 1
-                    elif img[i, j] >= img[i, j+1] + 2:
-                        copy[i, j] = copy[i, j] - 1
-            
-            # Kuzeydoğu (sağ üst çapraz)
-            for i in range(1, img.shape[0]):
-                for j in range(1, img.shape[1]):
-                    if img[i-1, j-1] >= img[i, j] + 2:
-                        copy[i, j] = copy[i, j] + 1
-                    elif img[i, j] >= img[i-1, j-1] + 2:
-                        copy[i, j] = copy[i, j] - 1
-            
-            # Güneybatı (sol alt çapraz)
-            for i in range(img.shape[0]-2, -1, -1):
-                for j in range(img.shape[1]-2, -1, -1):
-                    if img[i+1, j+1] >= img[i, j] + 2:
-                        copy[i, j] = copy[i, j] + 1
-                    elif img[i, j] >= img[i+1, j+1] + 2:
-                        copy[i, j] = copy[i, j] - 1
-            
-            # Kuzeybatı (sol üst çapraz)
-            for i in range(1, img.shape[0]):
-                for j in range(img.shape[1]-2, -1, -1):
-                    if img[i-1, j+1] >= img[i, j] + 2:
-                        copy[i, j] = copy[i, j] + 1
-                    elif img[i, j] >= img[i-1, j+1] + 2:
-                        copy[i, j] = copy[i, j] - 1
-            
-            # Güneydoğu (sağ alt çapraz)
-            for i in range(img.shape[0]-2, -1, -1):
-                for j in range(1, img.shape[1]):
-                    if img[i+1, j-1] >= img[i, j] + 2:
-                        copy[i, j] = copy[i, j] + 1
-                    elif img[i, j] >= img[i+1, j-1] + 2:
-                        copy[i, j] = copy[i, j] - 1
-                        
-            return copy
-        
-        # Gri tonlama görüntüsü için işlemi gerçekleştir
-        if len(self.current_image.shape) == 2 or (len(self.current_image.shape) == 3 and self.current_image.shape[2] == 1):
-            # Gri tonlama görüntüsü
-            img_copy = self.current_image.copy()
-            # Algoritma 5 kez uygulandı
-            for _ in range(5):
-                img_copy = crimmins_one_iteration(img_copy, img_copy.copy())
-            result = img_copy
-        else:
-            # Renkli görüntü (BGR)
-            # Her kanal için ayrı ayrı filtrele
-            for k in range(3):  # 3 kanal: B, G, R
-                img_channel = self.current_image[:,:,k].copy()
-                img_copy = img_channel.copy()
-                # Algoritma 5 kez uygulandı
-                for _ in range(5):
-                    img_copy = crimmins_one_iteration(img_copy, img_copy.copy())
-                result[:,:,k] = img_copy
-        
-        self.current_image = result
-        self.display_image(self.current_image)
 
-    def _fourier_transform(self, image):
-        """
-        Görüntünün Fourier dönüşümünü hesaplar.
-        
-        Parametreler:
-            image: Dönüşüm uygulanacak görüntü
-            
-        Dönüş:
-            f_transform: Kompleks Fourier dönüşümü
-            magnitude_spectrum: Görselleştirme için kullanılabilecek genlik spektrumu
-            dft_shift: Merkezi kaydırılmış Fourier dönüşümü
-        """
-        # Görüntü boyutunu optimize et
-        rows, cols = image.shape
-        optimal_rows = cv2.getOptimalDFTSize(rows)
-        optimal_cols = cv2.getOptimalDFTSize(cols)
-        
-        # Görüntüyü optimal boyuta genişlet (sınırları sıfırla doldur)
-        padded = cv2.copyMakeBorder(image, 0, optimal_rows - rows, 0, optimal_cols - cols, cv2.BORDER_CONSTANT, value=0)
-        
-        # Fourier dönüşümünü hesapla
-        f_transform = cv2.dft(np.float32(padded), flags=cv2.DFT_COMPLEX_OUTPUT)
-        
-        # Düşük frekans bileşenlerini merkeze taşı
-        dft_shift = np.fft.fftshift(f_transform)
-        
-        # Fourier dönüşümünün genlik spektrumunu hesapla
-        magnitude_spectrum = 20 * np.log(cv2.magnitude(dft_shift[:,:,0], dft_shift[:,:,1]) + 1)
-        
-        return f_transform, magnitude_spectrum, dft_shift
+        def crimmins(job, image):
+            # İterasyonlar birbirini izlediği için tek tek uygulamak aynı sonucu verir;
+            # her iterasyondan sonra ilerleme bildirilir ve iptal kontrol edilir
+            for i in range(iterations):
+                job.report(i, iterations)
+                image = karolu_isleme.apply_crimmins_speckle(image, 1)
+            return image
 
-    def _inverse_fourier_transform(self, dft_shift, original_shape):
-        """
-        Fourier dönüşümünün tersini alarak görüntüyü geri oluşturur.
-        
-        Parametreler:
-            dft_shift: Merkezi kaydırılmış Fourier dönüşümü
-            original_shape: Orijinal görüntünün boyutu (satır, sütun)
-            
-        Dönüş:
-            Ters Fourier dönüşümü ile elde edilen görüntü
-        """
-        # Merkez kaydırmayı geri al
-        f_ishift = np.fft.ifftshift(dft_shift)
-        
-        # Ters Fourier dönüşümünü hesapla
-        img_back = cv2.idft(f_ishift)
-        
-        # Gerçek kısmını al ve normlandır
-        img_back = cv2.magnitude(img_back[:,:,0], img_back[:,:,1])
-        
-        # Orijinal boyuta kırp ve normalize et
-        rows, cols = original_shape
-        img_back = img_back[0:rows, 0:cols]
-        cv2.normalize(img_back, img_back, 0, 255, cv2.NORM_MINMAX)
-        
-        return np.uint8(img_back)
+        self._run_in_background("Crimmins speckle", crimmins, ("crimmins", (iterations,)))
 
     def open_fourier_lowpass_dialog(self):
         """
@@ -1671,12 +1977,6 @@ class GoruntuIslemeUygulamasi:
         if self.current_image is None:
             return
             
-        # Görüntü gri tonlamada değilse çevir
-        if len(self.current_image.shape) > 2:
-            gray_image = cv2.cvtColor(self.current_image, cv2.COLOR_BGR2GRAY)
-        else:
-            gray_image = self.current_image.copy()
-        
         # Yeni bir dialog penceresi oluştur
         lowpass_dialog = tk.Toplevel(self.root)
         lowpass_dialog.title("Fourier Alçak Geçiren Filtre")
@@ -1697,68 +1997,31 @@ class GoruntuIslemeUygulamasi:
         def apply_lowpass_filter():
             radius = radius_scale.get()
             show_spectrum = preview_var.get()
-            self.apply_fourier_lowpass(radius, gray_image, show_spectrum)
+            self.apply_fourier_lowpass(radius, show_spectrum)
             lowpass_dialog.destroy()  # Dialog penceresini kapat
         
         Button(lowpass_dialog, text="Uygula", command=apply_lowpass_filter, width=15).pack(pady=10)
     
-    def apply_fourier_lowpass(self, radius, gray_image, show_spectrum=False):
+    def apply_fourier_lowpass(self, radius, show_spectrum=False):
         """
         Görüntüye Fourier Alçak Geçiren Filtre uygular.
         
         Parametreler:
             radius: Filtre yarıçapı
-            gray_image: Gri tonlamalı görüntü
             show_spectrum: Genlik spektrumunu gösterme seçeneği
         """
-        # Fourier dönüşümünü hesapla
-        _, _, dft_shift = self._fourier_transform(gray_image)
-        
-        # Görüntü merkez koordinatlarını bul
-        rows, cols = gray_image.shape
-        crow, ccol = rows // 2, cols // 2
-        
-        # Merkez etrafında belirli yarıçapta maske oluştur
-        mask = np.zeros((rows, cols, 2), np.uint8)
-        center = [crow, ccol]
-        x, y = np.ogrid[:rows, :cols]
-        mask_area = (x - center[0]) ** 2 + (y - center[1]) ** 2 <= radius ** 2
-        mask[mask_area] = 1
-        
-        # Filtreyi uygula
-        filtered_dft = dft_shift * mask
-        
-        # Görüntüyü geri oluştur
-        filtered_image = self._inverse_fourier_transform(filtered_dft, (rows, cols))
-        
         # Genlik spektrumunu gösterme seçeneği
+        spectrum_func = None
         if show_spectrum:
-            # Filtreli spektrumu hesapla
-            filtered_spectrum = 20 * np.log(cv2.magnitude(filtered_dft[:,:,0], filtered_dft[:,:,1]) + 1)
-            
-            # Yan yana göstermek için
-            result = np.hstack((filtered_image, cv2.normalize(filtered_spectrum, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)))
-            cv2.imshow("Alçak Geçiren Filtre ve Spektrum", result)
-        
-        # Renkli görüntüye uygula (her kanalı ayrı filtrele)
-        if len(self.current_image.shape) > 2:
-            result = np.zeros_like(self.current_image)
-            for i in range(3):
-                # Her kanal için Fourier dönüşümünü hesapla
-                channel = self.current_image[:,:,i]
-                _, _, dft_shift_channel = self._fourier_transform(channel)
-                
-                # Filtreyi uygula
-                filtered_dft_channel = dft_shift_channel * mask
-                
-                # Kanalı geri oluştur
-                result[:,:,i] = self._inverse_fourier_transform(filtered_dft_channel, (rows, cols))
-                
-            self.current_image = result
-        else:
-            self.current_image = filtered_image
-            
-        self.display_image(self.current_image)
+            spectrum_func = lambda gray_image: [("Alçak Geçiren Filtre ve Spektrum",
+                                                 frekans_alani.filtered_spectrum_preview(gray_image, "ideal_lowpass", radius))]
+
+        # Renkli görüntüde her kanal ayrı filtrelenir
+        self._run_in_background(
+            "Alçak geçiren filtre",
+            lambda job, image: goruntu_islemleri.apply_fourier_lowpass(image, radius),
+            ("lowpass", (radius,)),
+            spectrum_func)
 
     def open_fourier_highpass_dialog(self):
         """
@@ -1770,12 +2033,6 @@ class GoruntuIslemeUygulamasi:
         if self.current_image is None:
             return
             
-        # Görüntü gri tonlamada değilse çevir
-        if len(self.current_image.shape) > 2:
-            gray_image = cv2.cvtColor(self.current_image, cv2.COLOR_BGR2GRAY)
-        else:
-            gray_image = self.current_image.copy()
-        
         # Yeni bir dialog penceresi oluştur
         highpass_dialog = tk.Toplevel(self.root)
         highpass_dialog.title("Fourier Yüksek Geçiren Filtre")
@@ -1796,68 +2053,31 @@ class GoruntuIslemeUygulamasi:
         def apply_highpass_filter():
             radius = radius_scale.get()
             show_spectrum = preview_var.get()
-            self.apply_fourier_highpass(radius, gray_image, show_spectrum)
+            self.apply_fourier_highpass(radius, show_spectrum)
             highpass_dialog.destroy()  # Dialog penceresini kapat
         
         Button(highpass_dialog, text="Uygula", command=apply_highpass_filter, width=15).pack(pady=10)
     
-    def apply_fourier_highpass(self, radius, gray_image, show_spectrum=False):
+    def apply_fourier_highpass(self, radius, show_spectrum=False):
         """
         Görüntüye Fourier Yüksek Geçiren Filtre uygular.
         
         Parametreler:
             radius: Filtre yarıçapı
-            gray_image: Gri tonlamalı görüntü
             show_spectrum: Genlik spektrumunu gösterme seçeneği
         """
-        # Fourier dönüşümünü hesapla
-        _, _, dft_shift = self._fourier_transform(gray_image)
-        
-        # Görüntü merkez koordinatlarını bul
-        rows, cols = gray_image.shape
-        crow, ccol = rows // 2, cols // 2
-        
-        # Merkez etrafında belirli yarıçapta maske oluştur (yüksek geçiren filtre için tersi)
-        mask = np.ones((rows, cols, 2), np.uint8)
-        center = [crow, ccol]
-        x, y = np.ogrid[:rows, :cols]
-        mask_area = (x - center[0]) ** 2 + (y - center[1]) ** 2 <= radius ** 2
-        mask[mask_area] = 0
-        
-        # Filtreyi uygula
-        filtered_dft = dft_shift * mask
-        
-        # Görüntüyü geri oluştur
-        filtered_image = self._inverse_fourier_transform(filtered_dft, (rows, cols))
-        
         # Genlik spektrumunu gösterme seçeneği
+        spectrum_func = None
         if show_spectrum:
-            # Filtreli spektrumu hesapla
-            filtered_spectrum = 20 * np.log(cv2.magnitude(filtered_dft[:,:,0], filtered_dft[:,:,1]) + 1)
-            
-            # Yan yana göstermek için
-            result = np.hstack((filtered_image, cv2.normalize(filtered_spectrum, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)))
-            cv2.imshow("Yüksek Geçiren Filtre ve Spektrum", result)
-        
-        # Renkli görüntüye uygula (her kanalı ayrı filtrele)
-        if len(self.current_image.shape) > 2:
-            result = np.zeros_like(self.current_image)
-            for i in range(3):
-                # Her kanal için Fourier dönüşümünü hesapla
-                channel = self.current_image[:,:,i]
-                _, _, dft_shift_channel = self._fourier_transform(channel)
-                
-                # Filtreyi uygula
-                filtered_dft_channel = dft_shift_channel * mask
-                
-                # Kanalı geri oluştur
-                result[:,:,i] = self._inverse_fourier_transform(filtered_dft_channel, (rows, cols))
-                
-            self.current_image = result
-        else:
-            self.current_image = filtered_image
-            
-        self.display_image(self.current_image)
+            spectrum_func = lambda gray_image: [("Yüksek Geçiren Filtre ve Spektrum",
+                                                 frekans_alani.filtered_spectrum_preview(gray_image, "ideal_highpass", radius))]
+
+        # Renkli görüntüde her kanal ayrı filtrelenir
+        self._run_in_background(
+            "Yüksek geçiren filtre",
+            lambda job, image: goruntu_islemleri.apply_fourier_highpass(image, radius),
+            ("highpass", (radius,)),
+            spectrum_func)
 
     def open_band_pass_dialog(self):
         """
@@ -1870,12 +2090,6 @@ class GoruntuIslemeUygulamasi:
         if self.current_image is None:
             return
             
-        # Görüntü gri tonlamada değilse çevir
-        if len(self.current_image.shape) > 2:
-            gray_image = cv2.cvtColor(self.current_image, cv2.COLOR_BGR2GRAY)
-        else:
-            gray_image = self.current_image.copy()
-        
         # Yeni bir dialog penceresi oluştur
         bandpass_dialog = tk.Toplevel(self.root)
         bandpass_dialog.title("Bant Geçiren Filtre")
@@ -1909,74 +2123,33 @@ class GoruntuIslemeUygulamasi:
                 return
                 
             show_spectrum = preview_var.get()
-            self.apply_band_pass(inner_radius, outer_radius, gray_image, show_spectrum)
+            self.apply_band_pass(inner_radius, outer_radius, show_spectrum)
             bandpass_dialog.destroy()  # Dialog penceresini kapat
         
         Button(bandpass_dialog, text="Uygula", command=apply_band_pass_filter, width=15).pack(pady=10)
     
-    def apply_band_pass(self, inner_radius, outer_radius, gray_image, show_spectrum=False):
+    def apply_band_pass(self, inner_radius, outer_radius, show_spectrum=False):
         """
         Görüntüye Bant Geçiren Filtre uygular.
         
         Parametreler:
             inner_radius: İç yarıçap (küçük değer)
             outer_radius: Dış yarıçap (büyük değer)
-            gray_image: Gri tonlamalı görüntü
             show_spectrum: Genlik spektrumunu gösterme seçeneği
         """
-        # Fourier dönüşümünü hesapla
-        _, _, dft_shift = self._fourier_transform(gray_image)
-        
-        # Görüntü merkez koordinatlarını bul
-        rows, cols = gray_image.shape
-        crow, ccol = rows // 2, cols // 2
-        
-        # Bant geçiren maske oluştur
-        mask = np.zeros((rows, cols, 2), np.uint8)
-        center = [crow, ccol]
-        x, y = np.ogrid[:rows, :cols]
-        
-        # İç ve dış daireler arasındaki alanı hesapla
-        mask_area = np.logical_and(
-            (x - center[0]) ** 2 + (y - center[1]) ** 2 >= inner_radius ** 2,
-            (x - center[0]) ** 2 + (y - center[1]) ** 2 <= outer_radius ** 2
-        )
-        mask[mask_area] = 1
-        
-        # Filtreyi uygula
-        filtered_dft = dft_shift * mask
-        
-        # Görüntüyü geri oluştur
-        filtered_image = self._inverse_fourier_transform(filtered_dft, (rows, cols))
-        
         # Genlik spektrumunu gösterme seçeneği
+        spectrum_func = None
         if show_spectrum:
-            # Filtreli spektrumu hesapla
-            filtered_spectrum = 20 * np.log(cv2.magnitude(filtered_dft[:,:,0], filtered_dft[:,:,1]) + 1)
-            
-            # Yan yana göstermek için
-            result = np.hstack((filtered_image, cv2.normalize(filtered_spectrum, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)))
-            cv2.imshow("Bant Geçiren Filtre ve Spektrum", result)
-        
-        # Renkli görüntüye uygula (her kanalı ayrı filtrele)
-        if len(self.current_image.shape) > 2:
-            result = np.zeros_like(self.current_image)
-            for i in range(3):
-                # Her kanal için Fourier dönüşümünü hesapla
-                channel = self.current_image[:,:,i]
-                _, _, dft_shift_channel = self._fourier_transform(channel)
-                
-                # Filtreyi uygula
-                filtered_dft_channel = dft_shift_channel * mask
-                
-                # Kanalı geri oluştur
-                result[:,:,i] = self._inverse_fourier_transform(filtered_dft_channel, (rows, cols))
-                
-            self.current_image = result
-        else:
-            self.current_image = filtered_image
-            
-        self.display_image(self.current_image)
+            spectrum_func = lambda gray_image: [("Bant Geçiren Filtre ve Spektrum",
+                                                 frekans_alani.filtered_spectrum_preview(gray_image, "band_pass",
+                                                                                         inner_radius, outer_radius))]
+
+        # Renkli görüntüde her kanal ayrı filtrelenir
+        self._run_in_background(
+            "Bant geçiren filtre",
+            lambda job, image: goruntu_islemleri.apply_band_pass(image, inner_radius, outer_radius),
+            ("band_pass", (inner_radius, outer_radius)),
+            spectrum_func)
 
     def open_band_stop_dialog(self):
         """
@@ -1988,12 +2161,6 @@ class GoruntuIslemeUygulamasi:
         if self.current_image is None:
             return
             
-        # Görüntü gri tonlamada değilse çevir
-        if len(self.current_image.shape) > 2:
-            gray_image = cv2.cvtColor(self.current_image, cv2.COLOR_BGR2GRAY)
-        else:
-            gray_image = self.current_image.copy()
-        
         # Yeni bir dialog penceresi oluştur
         bandstop_dialog = tk.Toplevel(self.root)
         bandstop_dialog.title("Bant Durduran Filtre")
@@ -2027,74 +2194,33 @@ class GoruntuIslemeUygulamasi:
                 return
                 
             show_spectrum = preview_var.get()
-            self.apply_band_stop(inner_radius, outer_radius, gray_image, show_spectrum)
+            self.apply_band_stop(inner_radius, outer_radius, show_spectrum)
             bandstop_dialog.destroy()  # Dialog penceresini kapat
         
         Button(bandstop_dialog, text="Uygula", command=apply_band_stop_filter, width=15).pack(pady=10)
     
-    def apply_band_stop(self, inner_radius, outer_radius, gray_image, show_spectrum=False):
+    def apply_band_stop(self, inner_radius, outer_radius, show_spectrum=False):
         """
         Görüntüye Bant Durduran Filtre uygular.
         
         Parametreler:
             inner_radius: İç yarıçap (küçük değer)
             outer_radius: Dış yarıçap (büyük değer)
-            gray_image: Gri tonlamalı görüntü
             show_spectrum: Genlik spektrumunu gösterme seçeneği
         """
-        # Fourier dönüşümünü hesapla
-        _, _, dft_shift = self._fourier_transform(gray_image)
-        
-        # Görüntü merkez koordinatlarını bul
-        rows, cols = gray_image.shape
-        crow, ccol = rows // 2, cols // 2
-        
-        # Bant durduran maske oluştur (bant geçiren maskenin tersi)
-        mask = np.ones((rows, cols, 2), np.uint8)
-        center = [crow, ccol]
-        x, y = np.ogrid[:rows, :cols]
-        
-        # İç ve dış daireler arasındaki alanı hesapla (1 yerine 0 atanacak)
-        mask_area = np.logical_and(
-            (x - center[0]) ** 2 + (y - center[1]) ** 2 >= inner_radius ** 2,
-            (x - center[0]) ** 2 + (y - center[1]) ** 2 <= outer_radius ** 2
-        )
-        mask[mask_area] = 0
-        
-        # Filtreyi uygula
-        filtered_dft = dft_shift * mask
-        
-        # Görüntüyü geri oluştur
-        filtered_image = self._inverse_fourier_transform(filtered_dft, (rows, cols))
-        
         # Genlik spektrumunu gösterme seçeneği
+        spectrum_func = None
         if show_spectrum:
-            # Filtreli spektrumu hesapla
-            filtered_spectrum = 20 * np.log(cv2.magnitude(filtered_dft[:,:,0], filtered_dft[:,:,1]) + 1)
-            
-            # Yan yana göstermek için
-            result = np.hstack((filtered_image, cv2.normalize(filtered_spectrum, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)))
-            cv2.imshow("Bant Durduran Filtre ve Spektrum", result)
-        
-        # Renkli görüntüye uygula (her kanalı ayrı filtrele)
-        if len(self.current_image.shape) > 2:
-            result = np.zeros_like(self.current_image)
-            for i in range(3):
-                # Her kanal için Fourier dönüşümünü hesapla
-                channel = self.current_image[:,:,i]
-                _, _, dft_shift_channel = self._fourier_transform(channel)
-                
-                # Filtreyi uygula
-                filtered_dft_channel = dft_shift_channel * mask
-                
-                # Kanalı geri oluştur
-                result[:,:,i] = self._inverse_fourier_transform(filtered_dft_channel, (rows, cols))
-                
-            self.current_image = result
-        else:
-            self.current_image = filtered_image
-            
-        self.display_image(self.current_image)
+            spectrum_func = lambda gray_image: [("Bant Durduran Filtre ve Spektrum",
+                                                 frekans_alani.filtered_spectrum_preview(gray_image, "band_stop",
+                                                                                         inner_radius, outer_radius))]
+
+        # Renkli görüntüde her kanal ayrı filtrelenir
+        self._run_in_background(
+            "Bant durduran filtre",
+            lambda job, image: goruntu_islemleri.apply_band_stop(image, inner_radius, outer_radius),
+            ("band_stop", (inner_radius, outer_radius)),
+            spectrum_func)
 
     def open_butterworth_filter_dialog(self):
         """
@@ -2106,12 +2232,6 @@ class GoruntuIslemeUygulamasi:
         if self.current_image is None:
             return
             
-        # Görüntü gri tonlamada değilse çevir
-        if len(self.current_image.shape) > 2:
-            gray_image = cv2.cvtColor(self.current_image, cv2.COLOR_BGR2GRAY)
-        else:
-            gray_image = self.current_image.copy()
-        
         # Yeni bir dialog penceresi oluştur
         butterworth_dialog = tk.Toplevel(self.root)
         butterworth_dialog.title("Butterworth Filtre")
@@ -2148,12 +2268,12 @@ class GoruntuIslemeUygulamasi:
             d0 = d0_scale.get()
             n = n_scale.get()
             show_spectrum = preview_var.get()
-            self.apply_butterworth(filter_type, d0, n, gray_image, show_spectrum)
+            self.apply_butterworth(filter_type, d0, n, show_spectrum)
             butterworth_dialog.destroy()  # Dialog penceresini kapat
         
         Button(butterworth_dialog, text="Uygula", command=apply_butterworth_filter, width=15).pack(pady=10)
     
-    def apply_butterworth(self, filter_type, d0, n, gray_image, show_spectrum=False):
+    def apply_butterworth(self, filter_type, d0, n, show_spectrum=False):
         """
         Görüntüye Butterworth Filtre uygular.
         
@@ -2161,66 +2281,21 @@ class GoruntuIslemeUygulamasi:
             filter_type: Filtre tipi ('lowpass' veya 'highpass')
             d0: Kesim frekansı
             n: Filtre derecesi
-            gray_image: Gri tonlamalı görüntü
             show_spectrum: Genlik spektrumunu gösterme seçeneği
         """
-        # Fourier dönüşümünü hesapla
-        _, _, dft_shift = self._fourier_transform(gray_image)
-        
-        # Görüntü merkez koordinatlarını bul
-        rows, cols = gray_image.shape
-        crow, ccol = rows // 2, cols // 2
-        
-        # Butterworth filtre maskesini oluştur
-        mask = np.zeros((rows, cols, 2), np.float32)
-        
-        for i in range(rows):
-            for j in range(cols):
-                # Merkeze olan uzaklığı hesapla
-                d = np.sqrt((i - crow) ** 2 + (j - ccol) ** 2)
-                
-                # Butterworth filtre fonksiyonunu uygula
-                if filter_type == 'lowpass':
-                    # Alçak geçiren Butterworth filtre
-                    mask[i, j] = 1 / (1 + (d / d0) ** (2 * n))
-                else:
-                    # Yüksek geçiren Butterworth filtre
-                    mask[i, j] = 1 / (1 + (d0 / (d + 0.000001)) ** (2 * n))
-        
-        # Filtreyi uygula
-        filtered_dft = dft_shift * mask
-        
-        # Görüntüyü geri oluştur
-        filtered_image = self._inverse_fourier_transform(filtered_dft, (rows, cols))
-        
         # Genlik spektrumunu gösterme seçeneği
+        spectrum_func = None
         if show_spectrum:
-            # Filtreli spektrumu hesapla
-            filtered_spectrum = 20 * np.log(cv2.magnitude(filtered_dft[:,:,0], filtered_dft[:,:,1]) + 1)
-            
-            # Yan yana göstermek için
-            result = np.hstack((filtered_image, cv2.normalize(filtered_spectrum, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)))
-            cv2.imshow("Butterworth Filtre ve Spektrum", result)
-        
-        # Renkli görüntüye uygula (her kanalı ayrı filtrele)
-        if len(self.current_image.shape) > 2:
-            result = np.zeros_like(self.current_image)
-            for i in range(3):
-                # Her kanal için Fourier dönüşümünü hesapla
-                channel = self.current_image[:,:,i]
-                _, _, dft_shift_channel = self._fourier_transform(channel)
-                
-                # Filtreyi uygula
-                filtered_dft_channel = dft_shift_channel * mask
-                
-                # Kanalı geri oluştur
-                result[:,:,i] = self._inverse_fourier_transform(filtered_dft_channel, (rows, cols))
-                
-            self.current_image = result
-        else:
-            self.current_image = filtered_image
-            
-        self.display_image(self.current_image)
+            kind = "butterworth_lowpass" if filter_type == 'lowpass' else "butterworth_highpass"
+            spectrum_func = lambda gray_image: [("Butterworth Filtre ve Spektrum",
+                                                 frekans_alani.filtered_spectrum_preview(gray_image, kind, d0, n))]
+
+        # Renkli görüntüde her kanal ayrı filtrelenir
+        self._run_in_background(
+            "Butterworth filtre",
+            lambda job, image: goruntu_islemleri.apply_butterworth(image, filter_type, d0, n),
+            ("butterworth", (filter_type, d0, n)),
+            spectrum_func)
 
     def open_gaussian_freq_dialog(self):
         """
@@ -2232,12 +2307,6 @@ class GoruntuIslemeUygulamasi:
         if self.current_image is None:
             return
             
-        # Görüntü gri tonlamada değilse çevir
-        if len(self.current_image.shape) > 2:
-            gray_image = cv2.cvtColor(self.current_image, cv2.COLOR_BGR2GRAY)
-        else:
-            gray_image = self.current_image.copy()
-        
         # Yeni bir dialog penceresi oluştur
         gaussian_filter_dialog = tk.Toplevel(self.root)
         gaussian_filter_dialog.title("Frekans Uzayı Gaussian Filtre")
@@ -2267,78 +2336,33 @@ class GoruntuIslemeUygulamasi:
             filter_type = filter_type_var.get()
             sigma = sigma_scale.get()
             show_spectrum = preview_var.get()
-            self.apply_gaussian_freq(filter_type, sigma, gray_image, show_spectrum)
+            self.apply_gaussian_freq(filter_type, sigma, show_spectrum)
             gaussian_filter_dialog.destroy()  # Dialog penceresini kapat
         
         Button(gaussian_filter_dialog, text="Uygula", command=apply_gaussian_filter_freq, width=15).pack(pady=10)
     
-    def apply_gaussian_freq(self, filter_type, sigma, gray_image, show_spectrum=False):
+    def apply_gaussian_freq(self, filter_type, sigma, show_spectrum=False):
         """
         Görüntüye frekans uzayında Gaussian Filtre uygular.
         
         Parametreler:
             filter_type: Filtre tipi ('lowpass' veya 'highpass')
             sigma: Gaussian fonksiyonunun standart sapması
-            gray_image: Gri tonlamalı görüntü
             show_spectrum: Genlik spektrumunu gösterme seçeneği
         """
-        # Fourier dönüşümünü hesapla
-        _, _, dft_shift = self._fourier_transform(gray_image)
-        
-        # Görüntü merkez koordinatlarını bul
-        rows, cols = gray_image.shape
-        crow, ccol = rows // 2, cols // 2
-        
-        # Gaussian filtre maskesini oluştur
-        mask = np.zeros((rows, cols, 2), np.float32)
-        
-        for i in range(rows):
-            for j in range(cols):
-                # Merkeze olan uzaklığı hesapla
-                d_squared = (i - crow) ** 2 + (j - ccol) ** 2
-                
-                # Gaussian filtre fonksiyonunu uygula
-                if filter_type == 'lowpass':
-                    # Alçak geçiren Gaussian filtre
-                    mask[i, j] = np.exp(-d_squared / (2 * sigma ** 2))
-                else:
-                    # Yüksek geçiren Gaussian filtre
-                    mask[i, j] = 1 - np.exp(-d_squared / (2 * sigma ** 2))
-        
-        # Filtreyi uygula
-        filtered_dft = dft_shift * mask
-        
-        # Görüntüyü geri oluştur
-        filtered_image = self._inverse_fourier_transform(filtered_dft, (rows, cols))
-        
         # Genlik spektrumunu gösterme seçeneği
+        spectrum_func = None
         if show_spectrum:
-            # Filtreli spektrumu hesapla
-            filtered_spectrum = 20 * np.log(cv2.magnitude(filtered_dft[:,:,0], filtered_dft[:,:,1]) + 1)
-            
-            # Yan yana göstermek için
-            result = np.hstack((filtered_image, cv2.normalize(filtered_spectrum, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)))
-            cv2.imshow("Gaussian Filtre ve Spektrum", result)
-        
-        # Renkli görüntüye uygula (her kanalı ayrı filtrele)
-        if len(self.current_image.shape) > 2:
-            result = np.zeros_like(self.current_image)
-            for i in range(3):
-                # Her kanal için Fourier dönüşümünü hesapla
-                channel = self.current_image[:,:,i]
-                _, _, dft_shift_channel = self._fourier_transform(channel)
-                
-                # Filtreyi uygula
-                filtered_dft_channel = dft_shift_channel * mask
-                
-                # Kanalı geri oluştur
-                result[:,:,i] = self._inverse_fourier_transform(filtered_dft_channel, (rows, cols))
-                
-            self.current_image = result
-        else:
-            self.current_image = filtered_image
-            
-        self.display_image(self.current_image)
+            kind = "gaussian_lowpass" if filter_type == 'lowpass' else "gaussian_highpass"
+            spectrum_func = lambda gray_image: [("Gaussian Filtre ve Spektrum",
+                                                 frekans_alani.filtered_spectrum_preview(gray_image, kind, sigma))]
+
+        # Renkli görüntüde her kanal ayrı filtrelenir
+        self._run_in_background(
+            "Gaussian frekans filtresi",
+            lambda job, image: goruntu_islemleri.apply_gaussian_freq(image, filter_type, sigma),
+            ("gaussian_freq", (filter_type, sigma)),
+            spectrum_func)
 
     def apply_homomorphic_filter(self):
         """
@@ -2351,12 +2375,6 @@ class GoruntuIslemeUygulamasi:
         if self.current_image is None:
             return
             
-        # Görüntü gri tonlamada değilse çevir
-        if len(self.current_image.shape) > 2:
-            gray_image = cv2.cvtColor(self.current_image, cv2.COLOR_BGR2GRAY)
-        else:
-            gray_image = self.current_image.copy()
-        
         # Yeni bir dialog penceresi oluştur
         homomorphic_dialog = tk.Toplevel(self.root)
         homomorphic_dialog.title("Homomorfik Filtre")
@@ -2391,12 +2409,12 @@ class GoruntuIslemeUygulamasi:
             gamma_l = gamma_l_scale.get()
             d0 = d0_scale.get()
             show_spectrum = preview_var.get()
-            self.apply_homomorphic(gamma_h, gamma_l, d0, gray_image, show_spectrum)
+            self.apply_homomorphic(gamma_h, gamma_l, d0, show_spectrum)
             homomorphic_dialog.destroy()  # Dialog penceresini kapat
         
         Button(homomorphic_dialog, text="Uygula", command=apply_homomorphic_filter, width=15).pack(pady=10)
     
-    def apply_homomorphic(self, gamma_h, gamma_l, d0, gray_image, show_spectrum=False):
+    def apply_homomorphic(self, gamma_h, gamma_l, d0, show_spectrum=False):
         """
         Görüntüye homomorfik filtre uygular.
         
@@ -2404,105 +2422,25 @@ class GoruntuIslemeUygulamasi:
             gamma_h: Yüksek frekans bileşenleri için gamma değeri (1.0'dan büyük)
             gamma_l: Düşük frekans bileşenleri için gamma değeri (1.0'dan küçük)
             d0: Kesim frekansı
-            gray_image: Gri tonlamalı görüntü
             show_spectrum: Genlik spektrumunu gösterme seçeneği
         """
-        # Görüntüye küçük bir değer ekleyip logaritmasını al (0 değerlerini önlemek için)
-        # ln(I) = ln(L) + ln(R), burada I görüntü, L aydınlatma, R reflektans
-        img_log = np.log1p(np.array(gray_image, dtype="float"))
-        
-        # Fourier dönüşümünü hesapla
-        img_fft = np.fft.fft2(img_log)
-        
-        # Düşük frekans bileşenlerini merkeze taşı
-        img_fft_shift = np.fft.fftshift(img_fft)
-        
-        # Görüntü boyutlarını al
-        rows, cols = gray_image.shape
-        crow, ccol = rows // 2, cols // 2
-        
-        # Homomorfik filtre maskesi oluştur
-        y, x = np.ogrid[0:rows, 0:cols]
-        d = np.sqrt((y - crow) ** 2 + (x - ccol) ** 2)
-        mask = gamma_l + (gamma_h - gamma_l) * (1 - np.exp(-((d ** 2) / (2 * (d0 ** 2)))))
-        
-        # Filtreyi uygula
-        img_fft_shift_filtered = img_fft_shift * mask
-        
         # Genlik spektrumunu gösterme seçeneği
+        spectrum_func = None
         if show_spectrum:
-            # Maskeyi normalize edip göster
-            mask_normalized = cv2.normalize(mask, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
-            
-            # Fourier genlik spektrumunu hesapla
-            magnitude_spectrum = 20 * np.log(np.abs(img_fft_shift) + 1)
-            magnitude_spectrum_normalized = cv2.normalize(magnitude_spectrum, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
-            
-            # Filtreli Fourier genlik spektrumunu hesapla
-            filtered_spectrum = 20 * np.log(np.abs(img_fft_shift_filtered) + 1)
-            filtered_spectrum_normalized = cv2.normalize(filtered_spectrum, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
-            
-            # Maskeyi ve spektrumları göster
-            cv2.imshow("Filtre Maskesi", mask_normalized)
-            cv2.imshow("Orijinal Spektrum", magnitude_spectrum_normalized)
-            cv2.imshow("Filtreli Spektrum", filtered_spectrum_normalized)
-        
-        # Merkez kaydırmasını geri al
-        img_fft_filtered = np.fft.ifftshift(img_fft_shift_filtered)
-        
-        # Ters Fourier dönüşümünü hesapla
-        img_ifft = np.fft.ifft2(img_fft_filtered)
-        
-        # Kompleks sayıların gerçek kısmını al
-        img_ifft_real = np.real(img_ifft)
-        
-        # Logaritmik dönüşümün tersini al
-        img_exp = np.expm1(img_ifft_real)
-        
-        # Görüntüyü 0-255 aralığına normalize et
-        img_exp = cv2.normalize(img_exp, None, 0, 255, cv2.NORM_MINMAX)
-        img_out = np.uint8(img_exp)
-        
-        # Renkli görüntüye uygula (her kanalı ayrı filtrele)
-        if len(self.current_image.shape) > 2:
-            result = np.zeros_like(self.current_image)
-            for i in range(3):
-                # Her kanal için işlemi tekrarla
-                channel = self.current_image[:,:,i]
-                
-                # Görüntüye küçük bir değer ekleyip logaritmasını al
-                channel_log = np.log1p(np.array(channel, dtype="float"))
-                
-                # Fourier dönüşümünü hesapla
-                channel_fft = np.fft.fft2(channel_log)
-                
-                # Düşük frekans bileşenlerini merkeze taşı
-                channel_fft_shift = np.fft.fftshift(channel_fft)
-                
-                # Filtreyi uygula
-                channel_fft_shift_filtered = channel_fft_shift * mask
-                
-                # Merkez kaydırmasını geri al
-                channel_fft_filtered = np.fft.ifftshift(channel_fft_shift_filtered)
-                
-                # Ters Fourier dönüşümünü hesapla
-                channel_ifft = np.fft.ifft2(channel_fft_filtered)
-                
-                # Kompleks sayıların gerçek kısmını al
-                channel_ifft_real = np.real(channel_ifft)
-                
-                # Logaritmik dönüşümün tersini al
-                channel_exp = np.expm1(channel_ifft_real)
-                
-                # Görüntüyü 0-255 aralığına normalize et
-                channel_exp = cv2.normalize(channel_exp, None, 0, 255, cv2.NORM_MINMAX)
-                result[:,:,i] = np.uint8(channel_exp)
-                
-            self.current_image = result
-        else:
-            self.current_image = img_out
-            
-        self.display_image(self.current_image)
+            def spectrum_func(gray_image):
+                mask_image, spectrum_image, filtered_spectrum_image = frekans_alani.homomorphic_spectra(gray_image, gamma_h, gamma_l, d0)
+
+                # Maskeyi ve spektrumları göster
+                return [("Filtre Maskesi", mask_image),
+                        ("Orijinal Spektrum", spectrum_image),
+                        ("Filtreli Spektrum", filtered_spectrum_image)]
+
+        # Renkli görüntüde her kanal ayrı filtrelenir
+        self._run_in_background(
+            "Homomorfik filtre",
+            lambda job, image: goruntu_islemleri.apply_homomorphic(image, gamma_h, gamma_l, d0),
+            ("homomorphic", (gamma_h, gamma_l, d0)),
+            spectrum_func)
 
     def apply_sobel_filter(self):
         """
@@ -2512,22 +2450,9 @@ class GoruntuIslemeUygulamasi:
         """
         if self.current_image is None:
             return
-            
-        gray_image = cv2.cvtColor(self.current_image, cv2.COLOR_RGB2GRAY)
-        
-        # Sobel filtresi uygula
-        grad_x = cv2.Sobel(gray_image, cv2.CV_64F, 1, 0, ksize=3)
-        grad_y = cv2.Sobel(gray_image, cv2.CV_64F, 0, 1, ksize=3)
-        
-        # Gradyan büyüklüğünü hesapla
-        gradient_magnitude = cv2.magnitude(grad_x, grad_y)
-        
-        # Gradyan büyüklüğünü normalize et
-        sobel_output = cv2.normalize(gradient_magnitude, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
-        
-        # Tek kanallı görüntüyü 3 kanallı görüntüye dönüştür (gösterim için)
-        self.current_image = cv2.cvtColor(sobel_output, cv2.COLOR_GRAY2RGB)
-        self.display_image(self.current_image)
+
+        result = karolu_isleme.apply_sobel_filter(self.current_image)
+        self._commit(result, "sobel")
 
     def apply_prewitt_filter(self):
         """
@@ -2537,26 +2462,9 @@ class GoruntuIslemeUygulamasi:
         """
         if self.current_image is None:
             return
-            
-        gray_image = cv2.cvtColor(self.current_image, cv2.COLOR_RGB2GRAY)
-        
-        # Prewitt çekirdekleri
-        kernel_x = np.array([[-1, 0, 1], [-1, 0, 1], [-1, 0, 1]])
-        kernel_y = np.array([[-1, -1, -1], [0, 0, 0], [1, 1, 1]])
-        
-        # Prewitt filtresi uygula
-        grad_x = cv2.filter2D(gray_image, cv2.CV_64F, kernel_x)
-        grad_y = cv2.filter2D(gray_image, cv2.CV_64F, kernel_y)
-        
-        # Gradyan büyüklüğünü hesapla
-        gradient_magnitude = cv2.magnitude(grad_x, grad_y)
-        
-        # Gradyan büyüklüğünü normalize et
-        prewitt_output = cv2.normalize(gradient_magnitude, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
-        
-        # Tek kanallı görüntüyü 3 kanallı görüntüye dönüştür (gösterim için)
-        self.current_image = cv2.cvtColor(prewitt_output, cv2.COLOR_GRAY2RGB)
-        self.display_image(self.current_image)
+
+        result = karolu_isleme.apply_prewitt_filter(self.current_image)
+        self._commit(result, "prewitt")
 
     def apply_roberts_cross_filter(self):
         """
@@ -2566,26 +2474,9 @@ class GoruntuIslemeUygulamasi:
         """
         if self.current_image is None:
             return
-            
-        gray_image = cv2.cvtColor(self.current_image, cv2.COLOR_RGB2GRAY)
-        
-        # Roberts Cross çekirdekleri
-        kernel_x = np.array([[1, 0], [0, -1]])
-        kernel_y = np.array([[0, 1], [-1, 0]])
-        
-        # Roberts Cross filtresi uygula
-        grad_x = cv2.filter2D(gray_image, cv2.CV_64F, kernel_x)
-        grad_y = cv2.filter2D(gray_image, cv2.CV_64F, kernel_y)
-        
-        # Gradyan büyüklüğünü hesapla
-        gradient_magnitude = cv2.magnitude(grad_x, grad_y)
-        
-        # Gradyan büyüklüğünü normalize et
-        roberts_output = cv2.normalize(gradient_magnitude, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
-        
-        # Tek kanallı görüntüyü 3 kanallı görüntüye dönüştür (gösterim için)
-        self.current_image = cv2.cvtColor(roberts_output, cv2.COLOR_GRAY2RGB)
-        self.display_image(self.current_image)
+
+        result = karolu_isleme.apply_roberts_cross_filter(self.current_image)
+        self._commit(result, "roberts")
 
     def apply_compass_filter(self):
         """
@@ -2595,33 +2486,9 @@ class GoruntuIslemeUygulamasi:
         """
         if self.current_image is None:
             return
-            
-        gray_image = cv2.cvtColor(self.current_image, cv2.COLOR_RGB2GRAY)
-        
-        # Compass çekirdekleri (Kirsch operatörü gibi)
-        kernels = [
-            np.array([[5, 5, 5], [-3, 0, -3], [-3, -3, -3]]),  # Kuzey
-            np.array([[5, 5, -3], [5, 0, -3], [-3, -3, -3]]),  # Kuzeydoğu
-            np.array([[5, -3, -3], [5, 0, -3], [5, -3, -3]]),  # Doğu
-            np.array([[-3, -3, -3], [5, 0, -3], [5, 5, -3]]),  # Güneydoğu
-            np.array([[-3, -3, -3], [-3, 0, -3], [5, 5, 5]]),  # Güney
-            np.array([[-3, -3, -3], [-3, 0, 5], [-3, 5, 5]]),  # Güneybatı
-            np.array([[-3, -3, 5], [-3, 0, 5], [-3, -3, 5]]),  # Batı
-            np.array([[-3, 5, 5], [-3, 0, 5], [-3, -3, -3]])   # Kuzeybatı
-        ]
-        
-        # Her bir çekirdekle konvolüsyon yap
-        max_gradient = np.zeros_like(gray_image, dtype=np.float64)
-        for kernel in kernels:
-            gradient = cv2.filter2D(gray_image, cv2.CV_64F, kernel)
-            np.maximum(max_gradient, np.abs(gradient), out=max_gradient) # En büyük gradyanı al
-            
-        # Sonucu normalize et
-        compass_output = cv2.normalize(max_gradient, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
-        
-        # Tek kanallı görüntüyü 3 kanallı görüntüye dönüştür (gösterim için)
-        self.current_image = cv2.cvtColor(compass_output, cv2.COLOR_GRAY2RGB)
-        self.display_image(self.current_image)
+
+        result = karolu_isleme.apply_compass_filter(self.current_image)
+        self._commit(result, "compass")
 
     def open_canny_dialog(self):
         """
@@ -2667,15 +2534,9 @@ class GoruntuIslemeUygulamasi:
         """
         if self.current_image is None:
             return
-            
-        gray_image = cv2.cvtColor(self.current_image, cv2.COLOR_RGB2GRAY)
-        
-        # Canny kenar algılama uygula
-        edges = cv2.Canny(gray_image, low_threshold, high_threshold)
-        
-        # Tek kanallı görüntüyü 3 kanallı görüntüye dönüştür (gösterim için)
-        self.current_image = cv2.cvtColor(edges, cv2.COLOR_GRAY2RGB)
-        self.display_image(self.current_image)
+
+        result = goruntu_islemleri.apply_canny_filter(self.current_image, low_threshold, high_threshold)
+        self._commit(result, "canny", low_threshold, high_threshold)
 
     def apply_laplacian_filter(self):
         """
@@ -2685,12 +2546,8 @@ class GoruntuIslemeUygulamasi:
             messagebox.showerror("Hata", "Lütfen önce bir görüntü açın.")
             return
 
-        gray_image = cv2.cvtColor(self.current_image, cv2.COLOR_RGB2GRAY)
-        laplacian = cv2.Laplacian(gray_image, cv2.CV_64F)
-        laplacian_abs = cv2.convertScaleAbs(laplacian) # Mutlak değeri alıp 8-bit'e çevir
-
-        self.current_image = cv2.cvtColor(laplacian_abs, cv2.COLOR_GRAY2RGB)
-        self.display_image(self.current_image)
+        result = karolu_isleme.apply_laplacian_filter(self.current_image)
+        self._commit(result, "laplacian")
 
     def open_gabor_filter_dialog(self):
         """
@@ -2758,13 +2615,8 @@ class GoruntuIslemeUygulamasi:
         if self.current_image is None:
             return
 
-        gray_image = cv2.cvtColor(self.current_image, cv2.COLOR_RGB2GRAY)
-        
-        gabor_kernel = cv2.getGaborKernel((ksize, ksize), sigma, theta, lambd, gamma, psi, ktype=cv2.CV_32F)
-        filtered_img = cv2.filter2D(gray_image, cv2.CV_8UC3, gabor_kernel)
-        
-        self.current_image = cv2.cvtColor(filtered_img, cv2.COLOR_GRAY2RGB)
-        self.display_image(self.current_image)
+        result = goruntu_islemleri.apply_gabor_filter(self.current_image, ksize, sigma, theta, lambd, gamma, psi)
+        self._commit(result, "gabor", ksize, sigma, theta, lambd, gamma, psi)
 
     def open_hough_line_dialog(self):
         """
@@ -2776,9 +2628,15 @@ class GoruntuIslemeUygulamasi:
 
         hough_dialog = tk.Toplevel(self.root)
         hough_dialog.title("Hough Çizgi Dönüşümü Ayarları")
-        hough_dialog.geometry("300x300") # Pencere boyutu ayarlandı
+        hough_dialog.geometry("300x760") # Pencere boyutu ayarlandı
         hough_dialog.resizable(False, False)
 
+        # Standart mod sonsuz doğrular, olasılıksal mod (HoughLinesP) uç noktaları belli
+        # doğru parçaları bulur
+        mode_var = tk.StringVar(value="standard")
+        ttk.Radiobutton(hough_dialog, text="Standart (doğrular)", variable=mode_var, value="standard").pack(pady=(5, 0))
+        ttk.Radiobutton(hough_dialog, text="Olasılıksal (doğru parçaları)", variable=mode_var, value="probabilistic").pack()
+
         Label(hough_dialog, text="Rho (Piksel Çözünürlüğü):").pack(pady=5)
         rho_scale = Scale(hough_dialog, from_=1, to=10, resolution=1, orient=HORIZONTAL, length=200)
         rho_scale.set(1)
@@ -2789,59 +2647,162 @@ class GoruntuIslemeUygulamasi:
         theta_accuracy_scale.set(1) # 1 derece hassasiyet
         theta_accuracy_scale.pack(pady=5)
 
+        # Doğrultusu bilinen nesneler için açı aralığının daraltılması oylamayı hızlandırır
+        Label(hough_dialog, text="Açı Aralığı (Derece, standart mod):").pack(pady=5)
+        min_theta_scale = Scale(hough_dialog, from_=0, to=180, resolution=1, orient=HORIZONTAL, length=200)
+        min_theta_scale.set(0)
+        min_theta_scale.pack()
+        max_theta_scale = Scale(hough_dialog, from_=0, to=180, resolution=1, orient=HORIZONTAL, length=200)
+        max_theta_scale.set(180)
+        max_theta_scale.pack()
+
+        Label(hough_dialog, text="En Kısa Parça Uzunluğu (olasılıksal mod):").pack(pady=5)
+        min_line_length_scale = Scale(hough_dialog, from_=0, to=500, resolution=5, orient=HORIZONTAL, length=200)
+        min_line_length_scale.set(50)
+        min_line_length_scale.pack()
+
+        Label(hough_dialog, text="En Büyük Boşluk (olasılıksal mod):").pack(pady=5)
+        max_line_gap_scale = Scale(hough_dialog, from_=0, to=100, resolution=1, orient=HORIZONTAL, length=200)
+        max_line_gap_scale.set(10)
+        max_line_gap_scale.pack()
+
+        Label(hough_dialog, text="İlgi Bölgesi (x1 y1 x2 y2, boş: tümü):").pack(pady=5)
+        roi_entry = tk.Entry(hough_dialog, width=25)
+        roi_entry.pack(pady=5)
+
         Label(hough_dialog, text="Eşik Değeri (Threshold):").pack(pady=5)
         threshold_scale = Scale(hough_dialog, from_=10, to=500, resolution=10, orient=HORIZONTAL, length=200)
         threshold_scale.set(150)
         threshold_scale.pack(pady=5)
-        
-        # Olasılıksal Hough için minLineLength ve maxLineGap eklenebilir.
-        # Şimdilik standart HoughLines kullanılıyor.
 
-        def apply_hough():
+        def read_params():
+            """
+            Dialogdaki değerleri seçili modun parametrelerine çevirir; geçersizse None.
+            Standart mod: (rho, theta, eşik, min_theta, max_theta, roi)
+            Olasılıksal mod: (rho, theta, eşik, en kısa uzunluk, en büyük boşluk, roi)
+            """
             rho = int(rho_scale.get())
             theta_accuracy_degrees = int(theta_accuracy_scale.get())
             theta_accuracy_radians = theta_accuracy_degrees * np.pi / 180.0 # Radyana çevir
             threshold = int(threshold_scale.get())
-            self.apply_hough_line_transform(rho, theta_accuracy_radians, threshold)
+            roi_text = roi_entry.get().strip()
+            try:
+                roi = goruntu_islemleri.parse_roi(roi_text)
+            except ValueError as e:
+                messagebox.showerror("Hata", str(e))
+                return None
+
+            if mode_var.get() == "probabilistic":
+                return rho, theta_accuracy_radians, threshold, int(min_line_length_scale.get()), int(max_line_gap_scale.get()), roi
+
+            min_theta = min_theta_scale.get() * np.pi / 180.0
+            max_theta = max_theta_scale.get() * np.pi / 180.0
+            if min_theta >= max_theta:
+                messagebox.showerror("Hata", "Açı aralığının en az değeri en fazla değerinden küçük olmalıdır.")
+                return None
+            return rho, theta_accuracy_radians, threshold, min_theta, max_theta, roi
+
+        def preview_threshold(value):
+            # Kenar haritası ve akümülatör önbellekte olduğu için eşik değişimi yalnızca
+            # oyların taranmasıdır; sonuç onaylanmadan işlenmiş görüntü panelinde gösterilir
+            params = read_params()
+            if params is None or self.current_image is None:
+                return
+            if mode_var.get() == "probabilistic":
+                transform = goruntu_islemleri.apply_hough_segment_transform
+            else:
+                transform = goruntu_islemleri.apply_hough_line_transform
+            try:
+                preview = transform(self.current_image, *params)
+            except ValueError as e:
+                messagebox.showerror("Hata", str(e))
+                return
+            self._resize_and_display(preview, self.processed_image_label)
+
+        self._bind_release(threshold_scale, preview_threshold)
+
+        def apply_hough():
+            params = read_params()
+            if params is None:
+                return
+            if mode_var.get() == "probabilistic":
+                self.apply_hough_segment_transform(*params)
+            else:
+                self.apply_hough_line_transform(*params)
             hough_dialog.destroy()
 
-        Button(hough_dialog, text="Uygula", command=apply_hough).pack(pady=10)
+        def save_segments():
+            if mode_var.get() != "probabilistic":
+                messagebox.showinfo("Bilgi", "Doğru parçaları yalnızca olasılıksal modda kaydedilebilir.")
+                return
+            params = read_params()
+            if params is not None:
+                self.save_hough_segments(*params)
+
+        Button(hough_dialog, text="Uygula", command=apply_hough).pack(pady=(10, 2))
+        Button(hough_dialog, text="Parçaları Kaydet (JSON)", command=save_segments).pack(pady=2)
 
-    def apply_hough_line_transform(self, rho, theta_accuracy, threshold):
+    def apply_hough_line_transform(self, rho, theta_accuracy, threshold, min_theta=0.0, max_theta=np.pi, roi=None):
         """
         Görüntüye Hough Çizgi Dönüşümü uygular ve bulunan çizgileri çizer.
         """
         if self.current_image is None:
             return
 
-        gray_image = cv2.cvtColor(self.current_image, cv2.COLOR_RGB2GRAY)
-        # Kenarları bulmak için Canny uygulanır
-        edges = cv2.Canny(gray_image, 50, 150, apertureSize=3)
+        try:
+            result = goruntu_islemleri.apply_hough_line_transform(self.current_image, rho, theta_accuracy, threshold,
+                                                                 min_theta, max_theta, roi)
+        except ValueError as e:
+            messagebox.showerror("Hata", str(e))
+            return
+        self._commit(result, "hough_lines", rho, theta_accuracy, threshold, min_theta, max_theta, roi)
 
-        lines = cv2.HoughLines(edges, rho, theta_accuracy, threshold)
+    def apply_hough_segment_transform(self, rho, theta_accuracy, threshold, min_line_length, max_line_gap, roi=None):
+        """
+        Görüntüye olasılıksal Hough Dönüşümü uygular ve bulunan doğru parçalarını çizer.
+        """
+        if self.current_image is None:
+            return
 
-        img_with_lines = self.current_image.copy() # Çizgileri orijinal (veya o anki işlenmiş) renkli görüntü üzerine çiz
+        try:
+            result = goruntu_islemleri.apply_hough_segment_transform(self.current_image, rho, theta_accuracy, threshold,
+                                                                    min_line_length, max_line_gap, roi)
+        except ValueError as e:
+            messagebox.showerror("Hata", str(e))
+            return
+        self._commit(result, "hough_segments", rho, theta_accuracy, threshold, min_line_length, max_line_gap, roi)
 
-        if lines is not None:
-            for line in lines:
-                rho_val, theta_val = line[0]
-                a = np.cos(theta_val)
-                b = np.sin(theta_val)
-                x0 = a * rho_val
-                y0 = b * rho_val
-                # x1, y1, x2, y2 noktalarını hesapla (çizginin başlangıç ve bitiş noktaları)
-                x1 = int(x0 + 1000 * (-b))
-                y1 = int(y0 + 1000 * (a))
-                x2 = int(x0 - 1000 * (-b))
-                y2 = int(y0 - 1000 * (a))
-                cv2.line(img_with_lines, (x1, y1), (x2, y2), (0, 0, 255), 2) # Kırmızı çizgiler
+    def save_hough_segments(self, rho, theta_accuracy, threshold, min_line_length, max_line_gap, roi=None):
+        """
+        O anki görüntüde bulunan doğru parçalarını JSON dosyasına kaydeder. Parçalar önizleme
+        veya uygulama sırasında bulunduysa algılama tekrar çalıştırılmaz.
+        """
+        if self.current_image is None:
+            return
+
+        try:
+            segments = goruntu_islemleri.find_hough_segments(self.current_image, rho, theta_accuracy, threshold,
+                                                             min_line_length, max_line_gap, roi)
+        except ValueError as e:
+            messagebox.showerror("Hata", str(e))
+            return
+
+        file_path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON", "*.json")])
+        if not file_path:
+            return
+
+        try:
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write(hough_donusumu.segments_to_json(segments, indent=2))
+        except OSError as e:
+            messagebox.showerror("Hata", f"Parçalar kaydedilemedi: {e}")
+            return
+        messagebox.showinfo("Bilgi", f"{len(segments)} doğru parçası kaydedildi.")
 
-        self.current_image = img_with_lines
-        self.display_image(self.current_image)
-        
     def open_kmeans_segmentation_dialog(self):
         """
-        K-Means segmentasyonu için küme sayısını (K) ayarlamak üzere bir dialog açar.
+        K-Means segmentasyonu için küme sayısını (K) ve hızlı mod ayarlarını seçmek üzere
+        bir dialog açar.
         """
         if self.current_image is None:
             messagebox.showerror("Hata", "Lütfen önce bir görüntü açın.")
@@ -2849,7 +2810,7 @@ class GoruntuIslemeUygulamasi:
 
         kmeans_dialog = tk.Toplevel(self.root)
         kmeans_dialog.title("K-Means Segmentasyon Ayarları")
-        kmeans_dialog.geometry("300x150")
+        kmeans_dialog.geometry("300x470")
         kmeans_dialog.resizable(False, False)
 
         Label(kmeans_dialog, text="Küme Sayısı (K):").pack(pady=5)
@@ -2857,12 +2818,44 @@ class GoruntuIslemeUygulamasi:
         k_scale.set(8) # Varsayılan K değeri
         k_scale.pack(pady=5)
 
+        mode_var = tk.StringVar(value="exact")
+        ttk.Radiobutton(kmeans_dialog, text="Tam Mod (tüm pikseller)", variable=mode_var, value="exact").pack()
+        ttk.Radiobutton(kmeans_dialog, text="Hızlı Mod (örneklem + mini-batch)", variable=mode_var, value="fast").pack()
+        ttk.Radiobutton(kmeans_dialog, text="Palet Modu (renk histogramı)", variable=mode_var, value="palette").pack(pady=(0, 5))
+
+        Label(kmeans_dialog, text="Örneklem Büyüklüğü (hızlı mod):").pack()
+        sample_scale = Scale(kmeans_dialog, from_=10000, to=500000, resolution=10000, orient=HORIZONTAL, length=200)
+        sample_scale.set(kumeleme.DEFAULT_SAMPLE_SIZE)
+        sample_scale.pack()
+
+        Label(kmeans_dialog, text="Deneme Sayısı (hızlı mod):").pack()
+        attempts_scale = Scale(kmeans_dialog, from_=1, to=10, resolution=1, orient=HORIZONTAL, length=200)
+        attempts_scale.set(kumeleme.DEFAULT_ATTEMPTS)
+        attempts_scale.pack()
+
+        Label(kmeans_dialog, text="Kanal Başına Bit (palet modu):").pack()
+        bits_scale = Scale(kmeans_dialog, from_=4, to=8, resolution=1, orient=HORIZONTAL, length=200)
+        bits_scale.set(kumeleme.DEFAULT_PALETTE_BITS)
+        bits_scale.pack()
+
         def apply_kmeans():
             k_clusters = int(k_scale.get())
-            self.apply_kmeans_segmentation(k_clusters)
+            mode = mode_var.get()
+            if mode == "fast":
+                self.apply_fast_kmeans_segmentation(k_clusters, int(sample_scale.get()), int(attempts_scale.get()))
+            elif mode == "palette":
+                self.apply_palette_kmeans_segmentation(k_clusters, int(bits_scale.get()))
+            else:
+                self.apply_kmeans_segmentation(k_clusters)
             kmeans_dialog.destroy()
 
-        Button(kmeans_dialog, text="Uygula", command=apply_kmeans).pack(pady=10)
+        def compare():
+            # Tam mod seçiliyse hızlı mod karşılaştırılır
+            bits = int(bits_scale.get()) if mode_var.get() == "palette" else None
+            self.compare_kmeans_modes(int(k_scale.get()), int(sample_scale.get()), int(attempts_scale.get()), bits)
+
+        Button(kmeans_dialog, text="Uygula", command=apply_kmeans).pack(pady=5)
+        Button(kmeans_dialog, text="Tam Mod ile Karşılaştır", command=compare).pack()
 
     def apply_kmeans_segmentation(self, k_clusters):
         """
@@ -2871,24 +2864,62 @@ class GoruntuIslemeUygulamasi:
         if self.current_image is None:
             return
 
-        img_data = self.current_image.reshape((-1, 3)) # Piksel verilerini (R,G,B) formatına getir
-        img_data = np.float32(img_data) # cv2.kmeans için float32 olmalı
+        self._run_in_background(
+            "K-Means segmentasyonu",
+            lambda job, image: goruntu_islemleri.apply_kmeans_segmentation(image, k_clusters),
+            ("kmeans", (k_clusters,)))
 
-        # Kümeleme kriterleri ve uygulama
-        criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 10, 1.0) # 10 iterasyon veya epsilon=1.0
-        attempts = 10 # Farklı başlangıç merkezleriyle 10 kez çalıştır
-        
-        # labels: her pikselin hangi kümeye ait olduğu
-        # centers: küme merkezlerinin renkleri
-        ret, labels, centers = cv2.kmeans(img_data, k_clusters, None, criteria, attempts, cv2.KMEANS_RANDOM_CENTERS)
+    def apply_fast_kmeans_segmentation(self, k_clusters, sample_size, attempts):
+        """
+        Görüntüye K-Means segmentasyonunun hızlı modunu (örneklem üzerinde kümeleme) uygular.
+        """
+        if self.current_image is None:
+            return
 
-        centers = np.uint8(centers) # Renk değerlerini uint8'e çevir
-        segmented_data = centers[labels.flatten()] # Her pikseli ait olduğu kümenin merkez rengiyle boya
-        
-        segmented_image = segmented_data.reshape((self.current_image.shape)) # Veriyi orijinal görüntü boyutuna geri getir
+        self._run_in_background(
+            "Hızlı K-Means segmentasyonu",
+            lambda job, image: goruntu_islemleri.apply_fast_kmeans_segmentation(image, k_clusters, sample_size, attempts),
+            ("kmeans_fast", (k_clusters, sample_size, attempts)))
 
-        self.current_image = segmented_image
-        self.display_image(self.current_image)
+    def apply_palette_kmeans_segmentation(self, k_clusters, bits):
+        """
+        Görüntüye K-Means segmentasyonunun palet modunu (renk histogramı üzerinde kümeleme) uygular.
+        """
+        if self.current_image is None:
+            return
+
+        self._run_in_background(
+            "Palet K-Means segmentasyonu",
+            lambda job, image: goruntu_islemleri.apply_palette_kmeans_segmentation(image, k_clusters, bits),
+            ("kmeans_palette", (k_clusters, bits)))
+
+    def compare_kmeans_modes(self, k_clusters, sample_size, attempts, bits=None):
+        """
+        K-Means'in hızlı modunu (bits verilirse palet modunu) ve tam modunu o anki görüntü
+        üzerinde arka planda çalıştırıp süre ve toplam kare hata (inertia) değerlerini
+        gösterir. Görüntü değiştirilmez.
+        """
+        if self.current_image is None:
+            return
+
+        source = self.current_image
+        method = None if bits is None else partial(kumeleme.palette_kmeans, bits=bits, attempts=attempts)
+        mode_name = "Hızlı mod" if bits is None else "Palet modu"
+
+        def run(job):
+            return kumeleme.compare_with_exact(source, k_clusters, sample_size, attempts, method=method)
+
+        def on_done(report):
+            messagebox.showinfo(
+                "K-Means Karşılaştırması",
+                f"Tam mod: {report['exact_time']:.2f} sn, inertia {report['exact_inertia']:.4g}\n"
+                f"{mode_name}: {report['fast_time']:.2f} sn, inertia {report['fast_inertia']:.4g}\n"
+                f"Hızlanma: {report['speedup']:.1f}x, inertia oranı ({mode_name.lower()} / tam): {report['inertia_ratio']:.3f}")
+
+        def on_error(error):
+            messagebox.showerror("Hata", f"K-Means karşılaştırması sırasında bir hata oluştu: {error}")
+
+        self.jobs.submit(run, on_done, on_error, "K-Means karşılaştırması")
 
     def open_hough_circle_dialog(self):
         """
@@ -2900,7 +2931,7 @@ class GoruntuIslemeUygulamasi:
 
         hough_circle_dialog = tk.Toplevel(self.root)
         hough_circle_dialog.title("Hough Çember Dönüşümü Ayarları")
-        hough_circle_dialog.geometry("350x530") # Pencere boyutu 450'den 530'a çıkarıldı
+        hough_circle_dialog.geometry("350x700") # Pencere boyutu 450'den 700'e çıkarıldı
         hough_circle_dialog.resizable(False, False)
 
         Label(hough_circle_dialog, text="dp (Ters Akümülatör Oranı):").pack(pady=5)
@@ -2933,55 +2964,78 @@ class GoruntuIslemeUygulamasi:
         max_radius_scale.set(0) # 0 -> maksimum olası yarıçapı kullanır
         max_radius_scale.pack(pady=2)
 
+        # Seviye > 0: adaylar küçültülmüş görüntüde bulunur, tam çözünürlükte iyileştirilir
+        Label(hough_circle_dialog, text="Piramit Seviyesi (0: Tam Çözünürlük):").pack(pady=5)
+        level_scale = Scale(hough_circle_dialog, from_=0, to=hough_donusumu.MAX_PYRAMID_LEVEL, resolution=1,
+                            orient=HORIZONTAL, length=300)
+        level_scale.set(0)
+        level_scale.pack(pady=2)
+
+        def auto_level():
+            level_scale.set(hough_donusumu.auto_pyramid_level(self.current_image, int(min_radius_scale.get())))
+
+        Button(hough_circle_dialog, text="Seviyeyi Yarıçapa Göre Seç", command=auto_level).pack(pady=2)
+
+        def read_params():
+            return (float(dp_scale.get()), int(min_dist_scale.get()), int(param1_scale.get()),
+                    int(param2_scale.get()), int(min_radius_scale.get()), int(max_radius_scale.get()),
+                    int(level_scale.get()))
+
+        def preview_circles(value):
+            # Bulanıklaştırılmış görüntü ve piramit önbellekte olduğu için yalnızca arama
+            # tekrarlanır; sonuç onaylanmadan işlenmiş görüntü panelinde gösterilir
+            if self.current_image is None:
+                return
+            preview = goruntu_islemleri.apply_hough_circle_transform(self.current_image, *read_params())
+            self._resize_and_display(preview, self.processed_image_label)
+
+        for scale in (param2_scale, min_radius_scale, max_radius_scale, level_scale):
+            self._bind_release(scale, preview_circles)
+
         def apply_hough_circle():
-            dp = float(dp_scale.get())
-            min_dist = int(min_dist_scale.get())
-            param1 = int(param1_scale.get())
-            param2 = int(param2_scale.get())
-            min_radius = int(min_radius_scale.get())
-            max_radius = int(max_radius_scale.get())
-            self.apply_hough_circle_transform(dp, min_dist, param1, param2, min_radius, max_radius)
+            self.apply_hough_circle_transform(*read_params())
             hough_circle_dialog.destroy()
 
-        Button(hough_circle_dialog, text="Uygula", command=apply_hough_circle).pack(pady=10)
+        Button(hough_circle_dialog, text="Uygula", command=apply_hough_circle).pack(pady=(10, 2))
+        Button(hough_circle_dialog, text="Çemberleri Kaydet (JSON)",
+               command=lambda: self.save_hough_circles(*read_params())).pack(pady=2)
 
-    def apply_hough_circle_transform(self, dp, minDist, param1, param2, minRadius, maxRadius):
+    def apply_hough_circle_transform(self, dp, minDist, param1, param2, minRadius, maxRadius, pyramid_level=0):
         """
         Görüntüye Hough Çember Dönüşümü uygular ve bulunan çemberleri çizer.
         """
         if self.current_image is None:
             return
 
-        # Görüntüyü gri tonlamaya çevir ve biraz bulanıklaştır (gürültüyü azaltmak için)
-        gray_image = cv2.cvtColor(self.current_image, cv2.COLOR_RGB2GRAY)
-        gray_image = cv2.medianBlur(gray_image, 5) # Median blur genellikle çember algılamada iyi sonuç verir
-
-        # HoughCircles fonksiyonu ile çemberleri algıla
-        circles = cv2.HoughCircles(
-            gray_image, 
-            cv2.HOUGH_GRADIENT, # Algılama metodu
-            dp=dp,              # Ters akümülatör çözünürlük oranı (1 ise aynı çözünürlük)
-            minDist=minDist,        # Algılanan çemberlerin merkezleri arasındaki minimum mesafe
-            param1=param1,        # Canny kenar algılayıcısının üst eşik değeri
-            param2=param2,        # Çember merkezleri için akümülatör eşiği (küçükse daha fazla çember bulunur)
-            minRadius=minRadius,    # Minimum çember yarıçapı
-            maxRadius=maxRadius     # Maksimum çember yarıçapı
-        )
+        result, circles = goruntu_islemleri.detect_hough_circles(self.current_image, dp, minDist, param1, param2,
+                                                                 minRadius, maxRadius, pyramid_level)
+        if not len(circles):
+            messagebox.showinfo("Bilgi", "Belirtilen parametrelerle çember bulunamadı.")
 
-        img_with_circles = self.current_image.copy()
+        self._commit(result, "hough_circles", dp, minDist, param1, param2, minRadius, maxRadius, pyramid_level)
 
-        if circles is not None:
-            circles = np.uint16(np.around(circles)) # Çember koordinatlarını ve yarıçapını tam sayıya yuvarla
-            for i in circles[0, :]:
-                # Dış çemberi çiz (yeşil)
-                cv2.circle(img_with_circles, (i[0], i[1]), i[2], (0, 255, 0), 2)
-                # Merkez noktasını çiz (mavi)
-                cv2.circle(img_with_circles, (i[0], i[1]), 2, (0, 0, 255), 3)
-        else:
-            messagebox.showinfo("Bilgi", "Belirtilen parametrelerle çember bulunamadı.")
+    def save_hough_circles(self, dp, minDist, param1, param2, minRadius, maxRadius, pyramid_level=0):
+        """
+        O anki görüntüde bulunan çemberleri JSON dosyasına kaydeder. Çemberler önizleme veya
+        uygulama sırasında bulunduysa arama tekrar çalıştırılmaz.
+        """
+        if self.current_image is None:
+            return
 
-        self.current_image = img_with_circles
-        self.display_image(self.current_image)
+        circles = hough_donusumu.find_circles(self.current_image, dp, minDist, param1, param2,
+                                              minRadius, maxRadius, pyramid_level)
+
+        file_path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON", "*.json")])
+        if not file_path:
+            return
+
+        try:
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write(hough_donusumu.circles_to_json(circles, indent=2))
+        except OSError as e:
+            messagebox.showerror("Hata", f"Çemberler kaydedilemedi: {e}")
+            return
+        messagebox.showinfo("Bilgi", f"{len(circles)} çember kaydedildi.")
 
     def open_morph_dialog(self, operation_type):
         """
@@ -3015,8 +3069,6 @@ class GoruntuIslemeUygulamasi:
                     messagebox.showerror("Hata", "Çekirdek boyutu ve iterasyon pozitif olmalıdır.")
                     return
                 
-                kernel = np.ones((k_size, k_size), np.uint8)
-
                 # Görüntüyü gri tonlama ve ikiliye çevir (isteğe bağlı, ama morfolojik işlemler genelde ikili görüntülerde daha anlamlı)
                 # Eğer orijinal görüntü üzerinde çalışmak isteniyorsa bu adım atlanabilir veya kullanıcıya seçenek sunulabilir.
                 # Şimdilik orijinal (veya o anki işlenmiş) görüntü üzerinde çalışalım.
@@ -3028,9 +3080,11 @@ class GoruntuIslemeUygulamasi:
                 processed_image = None
 
                 if operation_type == "Erode":
-                    processed_image = cv2.erode(target_image, kernel, iterations=iters)
+                    processed_image = karolu_isleme.apply_erode(target_image, k_size, iters)
+                    operation_name = "erode"
                 elif operation_type == "Dilate":
-                    processed_image = cv2.dilate(target_image, kernel, iterations=iters)
+                    processed_image = karolu_isleme.apply_dilate(target_image, k_size, iters)
+                    operation_name = "dilate"
                 
                 if processed_image is not None:
                     # Eğer işlem ikili görüntü üzerinde yapıldıysa ve sonuç tek kanallıysa RGB'ye çevir
@@ -3038,8 +3092,7 @@ class GoruntuIslemeUygulamasi:
                     #    self.current_image = cv2.cvtColor(processed_image, cv2.COLOR_GRAY2RGB)
                     # else:
                     #    self.current_image = processed_image
-                    self.current_image = processed_image # Direkt ata, display_image zaten RGB bekliyor
-                    self.display_image(self.current_image)
+                    self._commit(processed_image, operation_name, k_size, iters) # Direkt ata, display_image zaten RGB bekliyor
                 
                 morph_dialog.destroy()
             except ValueError:
@@ -0,0 +1,1287 @@
+"""
+GÖRÜNTÜ İŞLEMLERİ (ARAYÜZDEN BAĞIMSIZ ÇEKİRDEK)
+-----------------------------------------------
+
+Bu modül, uygulamadaki tüm görüntü işleme işlemlerini saf fonksiyonlar olarak içerir.
+Her fonksiyon bir NumPy dizisi (RGB formatlı görüntü) ve parametreler alır, sonucu
+yeni bir NumPy dizisi olarak döndürür. Girdi görüntüsü hiçbir zaman değiştirilmez.
+
+Fonksiyonlar Tkinter'a, pencereye veya ekrana ihtiyaç duymaz. Bu sayede aynı işlemler
+arayüz olmadan; örneğin toplu işlemede, sunucularda, ayrı işlemlerde (process) veya
+performans ölçümlerinde çalıştırılabilir. GoruntuIslemeUygulamasi sınıfı bu fonksiyonları
+çağırıp sonucu ekranda gösteren ince bir katmandır.
+
+Fonksiyon adları, arayüz sınıfındaki karşılık gelen metodların adlarıyla aynıdır.
+"""
+
+import inspect
+from itertools import groupby
+
+import cv2
+import numpy as np
+
+import frekans_alani
+import hough_donusumu
+import islem_birlestirme
+import kumeleme
+import nokta_islemleri
+
+
+# ------------ TEMEL İŞLEMLER ------------
+
+def convert_to_gray(image):
+    """
+    Görüntüyü gri tonlamalı hale dönüştürür.
+
+    cv2.cvtColor: OpenCV'de renk dönüşümü için kullanılan fonksiyon
+    COLOR_RGB2GRAY: RGB'den gri tonlamaya dönüşüm sabiti
+    COLOR_GRAY2RGB: Gri tonlamadan RGB'ye dönüşüm sabiti (gösterim için)
+
+    Parametreler:
+        image (numpy.ndarray): RGB görüntü
+
+    Dönüş:
+        numpy.ndarray: Her kanalı aynı gri değeri taşıyan 3 kanallı görüntü
+    """
+    # RGB'den gri tonlamaya dönüştür
+    gray_image = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+    # Gri görüntüyü 3 kanallı RGB'ye dönüştür (gösterim için)
+    return cv2.cvtColor(gray_image, cv2.COLOR_GRAY2RGB)
+
+
+def split_channels(image):
+    """
+    Görüntüyü R, G, B kanallarına ayırır. Her kanal kendi renginde gösterilebilmesi
+    için 3 kanallı bir görüntüye yerleştirilir.
+
+    Parametreler:
+        image (numpy.ndarray): RGB görüntü
+
+    Dönüş:
+        tuple: (r_img, g_img, b_img) - yalnızca ilgili kanalı dolu olan 3 kanallı görüntüler
+    """
+    # Kanalları ayır - r, g, b tek kanallı (2B) görüntülerdir
+    r, g, b = cv2.split(image)
+
+    r_img = np.zeros_like(image)  # Orijinal boyutunda sıfır dizisi
+    g_img = np.zeros_like(image)
+    b_img = np.zeros_like(image)
+
+    # Her kanalı kendi pozisyonuna yerleştir (RGB formatında)
+    r_img[:,:,0] = r
+    g_img[:,:,1] = g
+    b_img[:,:,2] = b
+
+    return r_img, g_img, b_img
+
+
+def negative_image(image):
+    """
+    Görüntünün negatifini alır. Her piksel değerini 255'ten çıkararak
+    renkleri tersine çevirir.
+
+    cv2.LUT: Her pikseli 256 elemanlı tablodaki karşılığıyla değiştiren OpenCV fonksiyonu
+
+    Parametreler:
+        image (numpy.ndarray): uint8 görüntü
+
+    Dönüş:
+        numpy.ndarray: Negatif görüntü
+    """
+    return cv2.LUT(image, nokta_islemleri.negative_lut())
+
+
+def adjust_brightness(image, brightness):
+    """
+    Görüntünün parlaklığını ayarlar. Pozitif değerler parlaklığı artırır,
+    negatif değerler azaltır. Sonuç 0-255 aralığında doyurulur.
+
+    cv2.LUT: Her pikseli 256 elemanlı tablodaki karşılığıyla değiştiren OpenCV fonksiyonu
+
+    Parametreler:
+        image (numpy.ndarray): uint8 görüntü
+        brightness (int): Parlaklık değişimi (-255 ile 255 arası)
+
+    Dönüş:
+        numpy.ndarray: Parlaklığı ayarlanmış görüntü
+    """
+    # Sabit ekleme/çıkarma için tam boyutlu bir dizi oluşturmak yerine
+    # 256 elemanlı doyurmalı toplama tablosu tek geçişte uygulanır
+    return cv2.LUT(image, nokta_islemleri.brightness_lut(brightness))
+
+
+def apply_threshold(image, threshold):
+    """
+    Görüntüye eşikleme (thresholding) uygular. Piksel değeri eşik değerinden
+    büyükse beyaz (255), küçükse siyah (0) olur.
+
+    cv2.threshold: Görüntüye eşikleme uygulayan OpenCV fonksiyonu
+    THRESH_BINARY: İkili eşikleme türü - eşiğin üstü 255, altı 0 olur
+
+    Parametreler:
+        image (numpy.ndarray): RGB görüntü
+        threshold (int): Eşik değeri (0-255)
+
+    Dönüş:
+        numpy.ndarray: 3 kanallı ikili (binary) görüntü
+    """
+    # Görüntüyü gri tonlamaya çevir (eşikleme için)
+    gray_image = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+    _, thresholded = cv2.threshold(gray_image, threshold, 255, cv2.THRESH_BINARY)
+    # Tek kanallı görüntüyü 3 kanallı görüntüye dönüştür (gösterim için)
+    return cv2.cvtColor(thresholded, cv2.COLOR_GRAY2RGB)
+
+
+def equalize_histogram(image):
+    """
+    Histogram eşitleme uygular. Bu işlem, görüntünün kontrastını artırır
+    ve detayları daha görünür hale getirir.
+
+    cv2.equalizeHist: Histogram eşitleme uygulayan OpenCV fonksiyonu
+
+    Parametreler:
+        image (numpy.ndarray): RGB görüntü
+
+    Dönüş:
+        numpy.ndarray: Eşitlenmiş 3 kanallı gri görüntü
+    """
+    # Görüntüyü gri tonlamaya çevir (histogram eşitleme tek kanallı görüntüler için çalışır)
+    gray_img = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+    equalized = cv2.equalizeHist(gray_img)
+    # Tek kanallı görüntüyü 3 kanallı görüntüye dönüştür (gösterim için)
+    return cv2.cvtColor(equalized, cv2.COLOR_GRAY2RGB)
+
+
+def adjust_contrast(image, contrast):
+    """
+    Görüntünün kontrastını ayarlar. 1.0'dan büyük değerler kontrastı artırır,
+    küçük değerler azaltır.
+
+    cv2.convertScaleAbs: Piksel değerlerini ölçeklendiren ve mutlak değer alan OpenCV fonksiyonu
+
+    Parametreler:
+        image (numpy.ndarray): uint8 görüntü
+        contrast (float): Kontrast faktörü (çarpan)
+
+    Dönüş:
+        numpy.ndarray: Kontrastı ayarlanmış görüntü
+    """
+    # convertScaleAbs fonksiyonu: f(x) = alpha*x + beta
+    # Tablo 256 değer için convertScaleAbs ile hesaplanır, görüntüye cv2.LUT ile uygulanır
+    return cv2.LUT(image, nokta_islemleri.contrast_lut(contrast))
+
+
+def adjust_gamma(image, gamma):
+    """
+    Gama düzeltmesi uygular: f(x) = 255 * (x / 255) ^ (1 / gamma)
+    1.0'dan büyük değerler koyu tonları aydınlatır, küçük değerler koyulaştırır.
+
+    Parametreler:
+        image (numpy.ndarray): uint8 görüntü
+        gamma (float): Gama değeri (pozitif)
+
+    Dönüş:
+        numpy.ndarray: Gama düzeltmesi uygulanmış görüntü
+    """
+    return cv2.LUT(image, nokta_islemleri.gamma_lut(gamma))
+
+
+# ------------ GEOMETRİK DÖNÜŞÜMLER ------------
+
+def translate_image(image, tx, ty):
+    """
+    Görüntüyü belirtilen miktarda x ve y eksenlerinde taşır.
+
+    cv2.warpAffine: Görüntüye afin dönüşümü uygulayan OpenCV fonksiyonu
+
+    Parametreler:
+        image (numpy.ndarray): Görüntü
+        tx (int): X ekseninde taşıma miktarı
+        ty (int): Y ekseninde taşıma miktarı
+
+    Dönüş:
+        numpy.ndarray: Taşınmış görüntü
+    """
+    h, w = image.shape[:2]
+    # Taşıma matrisi [ [1, 0, tx], [0, 1, ty] ]
+    M = np.float32([[1, 0, tx], [0, 1, ty]])
+    return cv2.warpAffine(image, M, (w, h))
+
+
+def flip_horizontal(image):
+    """
+    Görüntüyü yatay eksende aynalar (soldan sağa ters çevirir).
+
+    Parametreler:
+        image (numpy.ndarray): Görüntü
+
+    Dönüş:
+        numpy.ndarray: Aynalanmış görüntü
+    """
+    # flipCode = 1: Yatay eksende aynalama
+    return cv2.flip(image, 1)
+
+
+def flip_vertical(image):
+    """
+    Görüntüyü dikey eksende aynalar (yukarıdan aşağıya ters çevirir).
+
+    Parametreler:
+        image (numpy.ndarray): Görüntü
+
+    Dönüş:
+        numpy.ndarray: Aynalanmış görüntü
+    """
+    # flipCode = 0: Dikey eksende aynalama
+    return cv2.flip(image, 0)
+
+
+def shear_image(image, sx, sy):
+    """
+    Görüntüyü belirtilen miktarda x ve y eksenlerinde eğer.
+
+    Parametreler:
+        image (numpy.ndarray): Görüntü
+        sx (float): X ekseninde eğme miktarı
+        sy (float): Y ekseninde eğme miktarı
+
+    Dönüş:
+        numpy.ndarray: Eğilmiş görüntü
+    """
+    h, w = image.shape[:2]
+    # Eğme matrisi
+    M = np.float32([[1, sx, 0], [sy, 1, 0]])
+    return cv2.warpAffine(image, M, (w, h))
+
+
+def scale_image(image, sx, sy):
+    """
+    Görüntüyü belirtilen oranda ölçekler (büyütür veya küçültür).
+
+    cv2.resize: Görüntüyü yeniden boyutlandıran OpenCV fonksiyonu
+
+    Parametreler:
+        image (numpy.ndarray): Görüntü
+        sx (float): X ekseninde ölçekleme oranı
+        sy (float): Y ekseninde ölçekleme oranı
+
+    Dönüş:
+        numpy.ndarray: Ölçeklenmiş görüntü
+    """
+    h, w = image.shape[:2]
+    new_w = int(w * sx)
+    new_h = int(h * sy)
+
+    # Büyütme işlemi için cv2.INTER_CUBIC, küçültme işlemi için cv2.INTER_AREA önerilir
+    interpolation = cv2.INTER_CUBIC if sx > 1 or sy > 1 else cv2.INTER_AREA
+    return cv2.resize(image, (new_w, new_h), interpolation=interpolation)
+
+
+def rotate_image(image, angle):
+    """
+    Görüntüyü belirtilen açıda döndürür. Çıktı boyutu, döndürülen görüntünün
+    tamamı sığacak şekilde büyütülür.
+
+    cv2.getRotationMatrix2D: Döndürme matrisi oluşturan OpenCV fonksiyonu
+
+    Parametreler:
+        image (numpy.ndarray): Görüntü
+        angle (int): Döndürme açısı (derece, pozitif değerler saat yönünün tersine)
+
+    Dönüş:
+        numpy.ndarray: Döndürülmüş görüntü
+    """
+    h, w = image.shape[:2]
+    center = (w // 2, h // 2)
+
+    # Döndürme matrisi oluştur (merkez, açı, ölçek)
+    M = cv2.getRotationMatrix2D(center, angle, 1.0)
+
+    # Döndürülmüş görüntünün sınırlarını hesapla
+    cos = np.abs(M[0, 0])
+    sin = np.abs(M[0, 1])
+    new_w = int((h * sin) + (w * cos))
+    new_h = int((h * cos) + (w * sin))
+
+    # Dönüşüm matrisini yeni merkeze göre ayarla
+    M[0, 2] += (new_w / 2) - center[0]
+    M[1, 2] += (new_h / 2) - center[1]
+
+    return cv2.warpAffine(image, M, (new_w, new_h))
+
+
+def crop_image(image, x_start, y_start, x_end, y_end):
+    """
+    Görüntüyü belirtilen koordinatlardan kırpar.
+
+    Parametreler:
+        image (numpy.ndarray): Görüntü
+        x_start (int): Kırpılacak bölgenin sol kenarı
+        y_start (int): Kırpılacak bölgenin üst kenarı
+        x_end (int): Kırpılacak bölgenin sağ kenarı
+        y_end (int): Kırpılacak bölgenin alt kenarı
+
+    Dönüş:
+        numpy.ndarray: Kırpılmış görüntü (kopya)
+    """
+    # NumPy dizisi dilimleme sözdizimi: array[y_start:y_end, x_start:x_end]
+    return image[y_start:y_end, x_start:x_end].copy()
+
+
+def apply_perspective_correction(image, points, width, height):
+    """
+    Seçilen 4 nokta kullanılarak perspektif düzeltme uygular.
+
+    cv2.getPerspectiveTransform: 4 nokta çiftinden perspektif dönüşüm matrisini hesaplar
+    cv2.warpPerspective: Perspektif dönüşümünü uygular
+
+    Parametreler:
+        image (numpy.ndarray): Görüntü
+        points (list): Sol Üst, Sağ Üst, Sol Alt, Sağ Alt sırasıyla 4 (x, y) noktası
+        width (int): Çıktı genişliği
+        height (int): Çıktı yüksekliği
+
+    Dönüş:
+        numpy.ndarray: Düzeltilmiş görüntü
+    """
+    pts1 = np.float32(points)
+    # Düzeltme sonrası köşeler (çıkış boyutlarına göre)
+    pts2 = np.float32([[0, 0], [width, 0], [0, height], [width, height]])
+
+    matrix = cv2.getPerspectiveTransform(pts1, pts2)
+    return cv2.warpPerspective(image, matrix, (width, height))
+
+
+def parse_points(value):
+    """
+    Perspektif düzeltme noktalarını okur.
+
+    Parametreler:
+        value: "x1 y1 x2 y2 x3 y3 x4 y4" biçiminde metin (komut satırı) veya
+            4 (x, y) çiftinden oluşan liste (JSON tarifi)
+
+    Dönüş:
+        tuple: 4 adet (x, y) çifti
+
+    Hata:
+        ValueError: Tam olarak 4 nokta verilmemişse
+    """
+    numbers = value.split() if isinstance(value, str) else [c for point in value for c in point]
+    if len(numbers) != 8:
+        raise ValueError("Perspektif düzeltme için 4 nokta (8 sayı) gerekli")
+    coords = [float(n) for n in numbers]
+    return tuple(zip(coords[0::2], coords[1::2]))
+
+
+def parse_roi(value):
+    """
+    İlgi bölgesini okur.
+
+    Parametreler:
+        value: "x_start y_start x_end y_end" biçiminde metin (komut satırı) veya
+            4 sayıdan oluşan liste (JSON tarifi); None veya boş metin tüm görüntü demektir
+
+    Dönüş:
+        tuple veya None: (x_start, y_start, x_end, y_end)
+
+    Hata:
+        ValueError: Tam olarak 4 sayı verilmemişse
+    """
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    numbers = value.split() if isinstance(value, str) else list(value)
+    if len(numbers) != 4:
+        raise ValueError("İlgi bölgesi için 4 sayı gerekli: x_start y_start x_end y_end")
+    return tuple(int(n) for n in numbers)
+
+
+# ------------ MEKANSAL FİLTRELER ------------
+
+def apply_mean_filter(image, kernel_size):
+    """
+    Görüntüye ortalama filtresi uygular.
+
+    cv2.blur: Ortalama filtresi uygulayan OpenCV fonksiyonu
+
+    Parametreler:
+        image (numpy.ndarray): Görüntü
+        kernel_size (int): Filtre çekirdeğinin boyutu (örn. 3 için 3x3 çekirdek)
+
+    Dönüş:
+        numpy.ndarray: Filtrelenmiş görüntü
+    """
+    return cv2.blur(image, (kernel_size, kernel_size))
+
+
+def apply_median_filter(image, kernel_size):
+    """
+    Görüntüye medyan filtresi uygular.
+
+    cv2.medianBlur: Medyan filtresi uygulayan OpenCV fonksiyonu
+
+    Parametreler:
+        image (numpy.ndarray): Görüntü
+        kernel_size (int): Filtre çekirdeğinin boyutu (tek sayı olmalı)
+
+    Dönüş:
+        numpy.ndarray: Filtrelenmiş görüntü
+    """
+    return cv2.medianBlur(image, kernel_size)
+
+
+def apply_gaussian_filter(image, kernel_size, sigma):
+    """
+    Görüntüye mekansal Gaussian filtresi uygular.
+
+    cv2.GaussianBlur: Gaussian filtresi uygulayan OpenCV fonksiyonu
+
+    Parametreler:
+        image (numpy.ndarray): Görüntü
+        kernel_size (int): Filtre çekirdeğinin boyutu (tek sayı olmalı)
+        sigma (float): Gaussian fonksiyonunun standart sapması
+
+    Dönüş:
+        numpy.ndarray: Filtrelenmiş görüntü
+    """
+    return cv2.GaussianBlur(image, (kernel_size, kernel_size), sigma)
+
+
+def apply_conservative_filter(image, window_size=3):
+    """
+    Görüntüye konservatif filtreleme uygular.
+
+    Konservatif filtreleme, bir pikseli komşu piksellerin (merkez piksel hariç) minimum ve
+    maksimum değerleri arasına sınırlayarak gürültüyü azaltan bir yöntemdir. Bu yöntem,
+    kenarları korur ve tekil gürültü piksellerini giderir.
+
+    OpenCV'de doğrudan bu filtre bulunmadığı için komşuluk minimum/maksimumu
+    morfolojik aşındırma ve genişletme ile hesaplanır:
+    cv2.erode: Her pikselin komşuluğundaki minimum değeri bulur
+    cv2.dilate: Her pikselin komşuluğundaki maksimum değeri bulur
+
+    Çekirdeğin merkezi 0 yapıldığı için merkez piksel kendi komşuluğuna dahil edilmez.
+    Tüm kanallar tek bir geçişte işlenir.
+
+    Parametreler:
+        image (numpy.ndarray): Görüntü
+        window_size (int): Komşuluk penceresinin boyutu (tek sayı, örn. 3 için 3x3 pencere)
+
+    Dönüş:
+        numpy.ndarray: Filtrelenmiş görüntü
+    """
+    # Merkez pikseli hariç tutan komşuluk çekirdeği
+    kernel = np.ones((window_size, window_size), np.uint8)
+    kernel[window_size // 2, window_size // 2] = 0
+
+    # Komşuluk minimum ve maksimum değerleri (kenarlar yansıtılarak doldurulur)
+    min_vals = cv2.erode(image, kernel, borderType=cv2.BORDER_REFLECT)
+    max_vals = cv2.dilate(image, kernel, borderType=cv2.BORDER_REFLECT)
+
+    # Merkez piksel minimumdan küçükse minimuma, maksimumdan büyükse maksimuma çekilir
+    # Aksi takdirde değişiklik yapılmaz
+    return np.minimum(np.maximum(image, min_vals), max_vals)
+
+
+def apply_crimmins_speckle(image, iterations=5):
+    """
+    Görüntüye Crimmins speckle gürültü giderme algoritmasını uygular.
+
+    Crimmins algoritması piksel değerlerini, komşu piksellerle karşılaştırarak
+    gürültülü pikselleri tanıyan ve düzelten, özellikle speckle (nokta) gürültüsü
+    gidermede etkili bir yöntemdir.
+
+    Her iterasyonda piksel, 8 komşusunun her biri ile karşılaştırılır: komşu pikselden
+    en az 2 koyuysa 1 artırılır, en az 2 açıksa 1 azaltılır. Karşılaştırmalar
+    iterasyon başındaki görüntü üzerinden yapıldığı için tüm yönler ve tüm kanallar
+    kaydırılmış dizilerle tek seferde hesaplanır.
+
+    OpenCV'de doğrudan bu filtre bulunmadığı için manuel olarak uygulanmıştır.
+
+    Parametreler:
+        image (numpy.ndarray): uint8 görüntü
+        iterations (int): Algoritmanın kaç kez uygulanacağı
+
+    Dönüş:
+        numpy.ndarray: Filtrelenmiş görüntü
+    """
+    # Taşmayı önlemek için işlemler int16 üzerinde yapılır
+    img = image.astype(np.int16)
+    rows, cols = img.shape[:2]
+
+    for _ in range(iterations):
+        result = img.copy()
+
+        # Her komşu çifti bir kez karşılaştırılır: (dy, dx) yönündeki fark, karşı yön
+        # (-dy, -dx) için ters işaretlidir. Bu 4 yön Güney, Doğu, Güneydoğu ve Güneybatı'dır.
+        for dy, dx in ((1, 0), (0, 1), (1, 1), (1, -1)):
+            # Piksel ve komşusunun dilimleri
+            pixel = (slice(0, rows - dy), slice(max(0, -dx), cols - max(0, dx)))
+            neighbor = (slice(dy, rows), slice(max(0, dx), cols - max(0, -dx)))
+
+            diff = img[neighbor] - img[pixel]
+            # Komşu en az 2 açıksa +1, en az 2 koyuysa -1
+            step = (diff >= 2).astype(np.int16) - (diff <= -2)
+
+            result[pixel] += step
+            result[neighbor] -= step
+
+        # Sonucu 0-255 aralığında tut
+        img = np.clip(result, 0, 255)
+
+    return img.astype(np.uint8)
+
+
+def apply_erode(image, kernel_size, iterations=1):
+    """
+    Görüntüye morfolojik aşındırma (erosion) uygular.
+
+    cv2.erode: Her pikseli çekirdek komşuluğundaki minimum değerle değiştirir
+
+    Parametreler:
+        image (numpy.ndarray): Görüntü
+        kernel_size (int): Kare yapısal elemanın boyutu
+        iterations (int): İşlemin kaç kez tekrarlanacağı
+
+    Dönüş:
+        numpy.ndarray: Aşındırılmış görüntü
+    """
+    kernel = np.ones((kernel_size, kernel_size), np.uint8)
+    return cv2.erode(image, kernel, iterations=iterations)
+
+
+def apply_dilate(image, kernel_size, iterations=1):
+    """
+    Görüntüye morfolojik genişletme (dilation) uygular.
+
+    cv2.dilate: Her pikseli çekirdek komşuluğundaki maksimum değerle değiştirir
+
+    Parametreler:
+        image (numpy.ndarray): Görüntü
+        kernel_size (int): Kare yapısal elemanın boyutu
+        iterations (int): İşlemin kaç kez tekrarlanacağı
+
+    Dönüş:
+        numpy.ndarray: Genişletilmiş görüntü
+    """
+    kernel = np.ones((kernel_size, kernel_size), np.uint8)
+    return cv2.dilate(image, kernel, iterations=iterations)
+
+
+# ------------ FREKANS ALANI FİLTRELERİ ------------
+
+def apply_fourier_lowpass(image, radius):
+    """
+    Görüntüye Fourier Alçak Geçiren Filtre uygular.
+
+    Parametreler:
+        image (numpy.ndarray): Görüntü (renkliyse her kanal ayrı filtrelenir)
+        radius: Filtre yarıçapı
+
+    Dönüş:
+        numpy.ndarray: Filtrelenmiş görüntü
+    """
+    return frekans_alani.apply_frequency_mask(image, "ideal_lowpass", radius)
+
+
+def apply_fourier_highpass(image, radius):
+    """
+    Görüntüye Fourier Yüksek Geçiren Filtre uygular.
+
+    Parametreler:
+        image (numpy.ndarray): Görüntü (renkliyse her kanal ayrı filtrelenir)
+        radius: Filtre yarıçapı
+
+    Dönüş:
+        numpy.ndarray: Filtrelenmiş görüntü
+    """
+    return frekans_alani.apply_frequency_mask(image, "ideal_highpass", radius)
+
+
+def apply_band_pass(image, inner_radius, outer_radius):
+    """
+    Görüntüye Bant Geçiren Filtre uygular.
+
+    Parametreler:
+        image (numpy.ndarray): Görüntü (renkliyse her kanal ayrı filtrelenir)
+        inner_radius: İç yarıçap (küçük değer)
+        outer_radius: Dış yarıçap (büyük değer)
+
+    Dönüş:
+        numpy.ndarray: Filtrelenmiş görüntü
+    """
+    return frekans_alani.apply_frequency_mask(image, "band_pass", inner_radius, outer_radius)
+
+
+def apply_band_stop(image, inner_radius, outer_radius):
+    """
+    Görüntüye Bant Durduran Filtre uygular.
+
+    Parametreler:
+        image (numpy.ndarray): Görüntü (renkliyse her kanal ayrı filtrelenir)
+        inner_radius: İç yarıçap (küçük değer)
+        outer_radius: Dış yarıçap (büyük değer)
+
+    Dönüş:
+        numpy.ndarray: Filtrelenmiş görüntü
+    """
+    return frekans_alani.apply_frequency_mask(image, "band_stop", inner_radius, outer_radius)
+
+
+def apply_butterworth(image, filter_type, d0, n):
+    """
+    Görüntüye Butterworth Filtre uygular.
+
+    Parametreler:
+        image (numpy.ndarray): Görüntü (renkliyse her kanal ayrı filtrelenir)
+        filter_type: Filtre tipi ('lowpass' veya 'highpass')
+        d0: Kesim frekansı
+        n: Filtre derecesi
+
+    Dönüş:
+        numpy.ndarray: Filtrelenmiş görüntü
+    """
+    kind = "butterworth_lowpass" if filter_type == 'lowpass' else "butterworth_highpass"
+    return frekans_alani.apply_frequency_mask(image, kind, d0, n)
+
+
+def apply_gaussian_freq(image, filter_type, sigma):
+    """
+    Görüntüye frekans uzayında Gaussian Filtre uygular.
+
+    Parametreler:
+        image (numpy.ndarray): Görüntü (renkliyse her kanal ayrı filtrelenir)
+        filter_type: Filtre tipi ('lowpass' veya 'highpass')
+        sigma: Gaussian fonksiyonunun standart sapması
+
+    Dönüş:
+        numpy.ndarray: Filtrelenmiş görüntü
+    """
+    kind = "gaussian_lowpass" if filter_type == 'lowpass' else "gaussian_highpass"
+    return frekans_alani.apply_frequency_mask(image, kind, sigma)
+
+
+def apply_homomorphic(image, gamma_h, gamma_l, d0):
+    """
+    Görüntüye homomorfik filtre uygular.
+
+    Parametreler:
+        image (numpy.ndarray): Görüntü (renkliyse her kanal ayrı filtrelenir)
+        gamma_h: Yüksek frekans bileşenleri için gamma değeri (1.0'dan büyük)
+        gamma_l: Düşük frekans bileşenleri için gamma değeri (1.0'dan küçük)
+        d0: Kesim frekansı
+
+    Dönüş:
+        numpy.ndarray: Filtrelenmiş görüntü
+    """
+    return frekans_alani.apply_homomorphic(image, gamma_h, gamma_l, d0)
+
+
+# ------------ KENAR ALGILAMA ------------
+
+def sobel_magnitude(gray_image):
+    """
+    Sobel gradyan büyüklüğünü hesaplar.
+
+    Parametreler:
+        gray_image (numpy.ndarray): Tek kanallı görüntü
+
+    Dönüş:
+        numpy.ndarray: float64 gradyan büyüklüğü
+    """
+    grad_x = cv2.Sobel(gray_image, cv2.CV_64F, 1, 0, ksize=3)
+    grad_y = cv2.Sobel(gray_image, cv2.CV_64F, 0, 1, ksize=3)
+    return cv2.magnitude(grad_x, grad_y)
+
+
+def prewitt_magnitude(gray_image):
+    """
+    Prewitt gradyan büyüklüğünü hesaplar.
+
+    Parametreler:
+        gray_image (numpy.ndarray): Tek kanallı görüntü
+
+    Dönüş:
+        numpy.ndarray: float64 gradyan büyüklüğü
+    """
+    # Prewitt çekirdekleri
+    kernel_x = np.array([[-1, 0, 1], [-1, 0, 1], [-1, 0, 1]])
+    kernel_y = np.array([[-1, -1, -1], [0, 0, 0], [1, 1, 1]])
+
+    grad_x = cv2.filter2D(gray_image, cv2.CV_64F, kernel_x)
+    grad_y = cv2.filter2D(gray_image, cv2.CV_64F, kernel_y)
+    return cv2.magnitude(grad_x, grad_y)
+
+
+def roberts_cross_magnitude(gray_image):
+    """
+    Roberts Cross gradyan büyüklüğünü hesaplar.
+
+    Parametreler:
+        gray_image (numpy.ndarray): Tek kanallı görüntü
+
+    Dönüş:
+        numpy.ndarray: float64 gradyan büyüklüğü
+    """
+    # Roberts Cross çekirdekleri
+    kernel_x = np.array([[1, 0], [0, -1]])
+    kernel_y = np.array([[0, 1], [-1, 0]])
+
+    grad_x = cv2.filter2D(gray_image, cv2.CV_64F, kernel_x)
+    grad_y = cv2.filter2D(gray_image, cv2.CV_64F, kernel_y)
+    return cv2.magnitude(grad_x, grad_y)
+
+
+def compass_magnitude(gray_image):
+    """
+    Compass (Kirsch benzeri) filtrenin sekiz yöndeki en büyük yanıtını hesaplar.
+
+    Parametreler:
+        gray_image (numpy.ndarray): Tek kanallı görüntü
+
+    Dönüş:
+        numpy.ndarray: float64 en büyük gradyan
+    """
+    # Compass çekirdekleri (Kirsch operatörü gibi)
+    kernels = [
+        np.array([[5, 5, 5], [-3, 0, -3], [-3, -3, -3]]),  # Kuzey
+        np.array([[5, 5, -3], [5, 0, -3], [-3, -3, -3]]),  # Kuzeydoğu
+        np.array([[5, -3, -3], [5, 0, -3], [5, -3, -3]]),  # Doğu
+        np.array([[-3, -3, -3], [5, 0, -3], [5, 5, -3]]),  # Güneydoğu
+        np.array([[-3, -3, -3], [-3, 0, -3], [5, 5, 5]]),  # Güney
+        np.array([[-3, -3, -3], [-3, 0, 5], [-3, 5, 5]]),  # Güneybatı
+        np.array([[-3, -3, 5], [-3, 0, 5], [-3, -3, 5]]),  # Batı
+        np.array([[-3, 5, 5], [-3, 0, 5], [-3, -3, -3]])   # Kuzeybatı
+    ]
+
+    # Her bir çekirdekle konvolüsyon yap ve en büyük gradyanı al
+    max_gradient = np.zeros_like(gray_image, dtype=np.float64)
+    for kernel in kernels:
+        gradient = cv2.filter2D(gray_image, cv2.CV_64F, kernel)
+        np.maximum(max_gradient, np.abs(gradient), out=max_gradient)
+
+    return max_gradient
+
+
+def gradient_to_rgb(magnitude):
+    """
+    Gradyan büyüklüğünü 0-255 aralığına normalize edip 3 kanallı görüntüye dönüştürür.
+
+    Parametreler:
+        magnitude (numpy.ndarray): float64 gradyan büyüklüğü
+
+    Dönüş:
+        numpy.ndarray: 3 kanallı uint8 görüntü
+    """
+    output = cv2.normalize(magnitude, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
+    return cv2.cvtColor(output, cv2.COLOR_GRAY2RGB)
+
+
+def apply_sobel_filter(image):
+    """
+    Sobel filtresi ile kenar algılama yapar.
+
+    Parametreler:
+        image (numpy.ndarray): RGB görüntü
+
+    Dönüş:
+        numpy.ndarray: Gradyan büyüklüğünü gösteren 3 kanallı görüntü
+    """
+    gray_image = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+    return gradient_to_rgb(sobel_magnitude(gray_image))
+
+
+def apply_prewitt_filter(image):
+    """
+    Prewitt filtresi ile kenar algılama yapar.
+
+    Parametreler:
+        image (numpy.ndarray): RGB görüntü
+
+    Dönüş:
+        numpy.ndarray: Gradyan büyüklüğünü gösteren 3 kanallı görüntü
+    """
+    gray_image = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+    return gradient_to_rgb(prewitt_magnitude(gray_image))
+
+
+def apply_roberts_cross_filter(image):
+    """
+    Roberts Cross filtresi ile kenar algılama yapar.
+
+    Parametreler:
+        image (numpy.ndarray): RGB görüntü
+
+    Dönüş:
+        numpy.ndarray: Gradyan büyüklüğünü gösteren 3 kanallı görüntü
+    """
+    gray_image = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+    return gradient_to_rgb(roberts_cross_magnitude(gray_image))
+
+
+def apply_compass_filter(image):
+    """
+    Compass (Kirsch benzeri) filtre ile kenar algılama yapar. Sekiz yöndeki
+    çekirdeklerin en büyük yanıtı alınır.
+
+    Parametreler:
+        image (numpy.ndarray): RGB görüntü
+
+    Dönüş:
+        numpy.ndarray: En büyük gradyanı gösteren 3 kanallı görüntü
+    """
+    gray_image = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+    return gradient_to_rgb(compass_magnitude(gray_image))
+
+
+def apply_canny_filter(image, low_threshold, high_threshold):
+    """
+    Canny kenar algılama filtresini uygular.
+
+    Parametreler:
+        image (numpy.ndarray): RGB görüntü
+        low_threshold (int): Düşük eşik değeri
+        high_threshold (int): Yüksek eşik değeri
+
+    Dönüş:
+        numpy.ndarray: Kenar haritasını gösteren 3 kanallı görüntü
+    """
+    gray_image = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+    edges = cv2.Canny(gray_image, low_threshold, high_threshold)
+    return cv2.cvtColor(edges, cv2.COLOR_GRAY2RGB)
+
+
+def apply_laplacian_filter(image):
+    """
+    Laplace filtresi uygular. Kenarları vurgulamak için kullanılır.
+
+    Parametreler:
+        image (numpy.ndarray): RGB görüntü
+
+    Dönüş:
+        numpy.ndarray: Laplace yanıtının mutlak değerini gösteren 3 kanallı görüntü
+    """
+    gray_image = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+    laplacian = cv2.Laplacian(gray_image, cv2.CV_64F)
+    laplacian_abs = cv2.convertScaleAbs(laplacian)  # Mutlak değeri alıp 8-bit'e çevir
+    return cv2.cvtColor(laplacian_abs, cv2.COLOR_GRAY2RGB)
+
+
+def apply_gabor_filter(image, ksize, sigma, theta, lambd, gamma, psi):
+    """
+    Görüntüye Gabor filtresi uygular.
+
+    Parametreler:
+        image (numpy.ndarray): RGB görüntü
+        ksize (int): Çekirdek boyutu (tek sayı)
+        sigma (float): Gaussian zarfının standart sapması
+        theta (float): Yönelim açısı (radyan)
+        lambd (float): Sinüzoidal bileşenin dalga boyu
+        gamma (float): En boy oranı
+        psi (float): Faz ofseti (radyan)
+
+    Dönüş:
+        numpy.ndarray: Filtre yanıtını gösteren 3 kanallı görüntü
+    """
+    gray_image = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+    gabor_kernel = cv2.getGaborKernel((ksize, ksize), sigma, theta, lambd, gamma, psi, ktype=cv2.CV_32F)
+    filtered_img = cv2.filter2D(gray_image, cv2.CV_8UC3, gabor_kernel)
+    return cv2.cvtColor(filtered_img, cv2.COLOR_GRAY2RGB)
+
+
+# ------------ GELİŞMİŞ İŞLEMLER ------------
+
+def find_hough_lines(image, rho, theta_accuracy, threshold, min_theta=0.0, max_theta=np.pi, roi=None):
+    """
+    Görüntüdeki doğruları standart Hough Çizgi Dönüşümü ile bulur. Kenar haritası ve
+    akümülatör görüntü ve parametreler başına önbellekte tutulur (bkz. hough_donusumu);
+    yalnızca eşik değiştiğinde dönüşüm yeniden hesaplanmaz.
+
+    Parametreler:
+        image (numpy.ndarray): RGB görüntü
+        rho (int): Uzaklık çözünürlüğü (piksel)
+        theta_accuracy (float): Açı çözünürlüğü (radyan)
+        threshold (int): Akümülatör eşiği
+        min_theta (float): Aranan en küçük doğru açısı (radyan)
+        max_theta (float): Aranan en büyük doğru açısı (radyan)
+        roi (tuple veya None): Yalnızca bu bölgede ara: (x_start, y_start, x_end, y_end)
+
+    Dönüş:
+        numpy.ndarray veya None: (N, 1, 2) boyutunda (rho, theta) çiftleri
+    """
+    return hough_donusumu.find_lines(image, rho, theta_accuracy, threshold, min_theta, max_theta, roi)
+
+
+def draw_hough_lines(image, lines):
+    """
+    Hough dönüşümüyle bulunan doğruları görüntünün bir kopyası üzerine çizer.
+
+    Parametreler:
+        image (numpy.ndarray): RGB görüntü
+        lines (numpy.ndarray veya None): find_hough_lines çıktısı
+
+    Dönüş:
+        numpy.ndarray: Doğruların kırmızı ile çizildiği görüntü
+    """
+    img_with_lines = image.copy()
+    # Doğrunun (x0, y0) noktasından her iki yönde görüntünün köşegeni kadar uzatılması,
+    # görüntü boyutundan bağımsız olarak tüm görüntüyü kesmesini sağlar
+    extent = float(np.hypot(*image.shape[:2]))
+
+    if lines is not None:
+        for line in lines:
+            rho_val, theta_val = line[0]
+            a = np.cos(theta_val)
+            b = np.sin(theta_val)
+            x0 = a * rho_val
+            y0 = b * rho_val
+            # x1, y1, x2, y2 noktalarını hesapla (çizginin başlangıç ve bitiş noktaları)
+            x1 = int(x0 + extent * (-b))
+            y1 = int(y0 + extent * (a))
+            x2 = int(x0 - extent * (-b))
+            y2 = int(y0 - extent * (a))
+            cv2.line(img_with_lines, (x1, y1), (x2, y2), (0, 0, 255), 2)
+
+    return img_with_lines
+
+
+def apply_hough_line_transform(image, rho, theta_accuracy, threshold, min_theta=0.0, max_theta=np.pi, roi=None):
+    """
+    Görüntüye Hough Çizgi Dönüşümü uygular ve bulunan çizgileri çizer.
+
+    Dönüş:
+        numpy.ndarray: Doğruların çizildiği görüntü
+    """
+    lines = find_hough_lines(image, rho, theta_accuracy, threshold, min_theta, max_theta, roi)
+    return draw_hough_lines(image, lines)
+
+
+def find_hough_segments(image, rho, theta_accuracy, threshold, min_line_length=0, max_line_gap=0, roi=None):
+    """
+    Görüntüdeki doğru parçalarını olasılıksal Hough Dönüşümü ile bulur. Kenar haritası ve
+    sonuç önbellekte tutulur (bkz. hough_donusumu); aynı parametrelerle tekrar çağrıldığında
+    algılama yeniden çalıştırılmaz.
+
+    Parametreler:
+        image (numpy.ndarray): RGB görüntü
+        rho (int): Uzaklık çözünürlüğü (piksel)
+        theta_accuracy (float): Açı çözünürlüğü (radyan)
+        threshold (int): Akümülatör eşiği
+        min_line_length (int): En kısa parça uzunluğu (piksel)
+        max_line_gap (int): Aynı doğru üzerinde birleştirilen en büyük boşluk (piksel)
+        roi (tuple veya None): Yalnızca bu bölgede ara: (x_start, y_start, x_end, y_end)
+
+    Dönüş:
+        numpy.ndarray: x1, y1, x2, y2, length, angle alanlı yapılandırılmış dizi
+            (bkz. hough_donusumu.SEGMENT_DTYPE, JSON için hough_donusumu.segments_to_json)
+    """
+    return hough_donusumu.find_segments(image, rho, theta_accuracy, threshold, min_line_length, max_line_gap, roi)
+
+
+def draw_hough_segments(image, segments):
+    """
+    Doğru parçalarını görüntünün bir kopyası üzerine çizer.
+
+    Parametreler:
+        image (numpy.ndarray): RGB görüntü
+        segments (numpy.ndarray): find_hough_segments çıktısı
+
+    Dönüş:
+        numpy.ndarray: Parçaların kırmızı ile çizildiği görüntü
+    """
+    img_with_segments = image.copy()
+    for x1, y1, x2, y2 in zip(segments["x1"], segments["y1"], segments["x2"], segments["y2"]):
+        cv2.line(img_with_segments, (int(x1), int(y1)), (int(x2), int(y2)), (0, 0, 255), 2)
+    return img_with_segments
+
+
+def detect_hough_segments(image, rho, theta_accuracy, threshold, min_line_length=0, max_line_gap=0, roi=None):
+    """
+    Doğru parçalarını bulur ve çizer; parçaları çizimle birlikte döndürür.
+
+    Dönüş:
+        tuple: (parçaların çizildiği görüntü, find_hough_segments çıktısı)
+    """
+    segments = find_hough_segments(image, rho, theta_accuracy, threshold, min_line_length, max_line_gap, roi)
+    return draw_hough_segments(image, segments), segments
+
+
+def apply_hough_segment_transform(image, rho, theta_accuracy, threshold, min_line_length=0, max_line_gap=0, roi=None):
+    """
+    Görüntüye olasılıksal Hough Dönüşümü uygular ve bulunan doğru parçalarını çizer.
+
+    Dönüş:
+        numpy.ndarray: Parçaların çizildiği görüntü
+    """
+    return detect_hough_segments(image, rho, theta_accuracy, threshold, min_line_length, max_line_gap, roi)[0]
+
+
+def find_hough_circles(image, dp, minDist, param1, param2, minRadius, maxRadius, pyramid_level=0):
+    """
+    Görüntüdeki çemberleri Hough Çember Dönüşümü ile bulur. Bulanıklaştırılmış gri tonlamalı
+    görüntü ve piramidi önbellekte tutulur (bkz. hough_donusumu); parametre değiştiğinde
+    yeniden hesaplanmaz.
+
+    Parametreler:
+        image (numpy.ndarray): RGB görüntü
+        dp (float): Ters akümülatör çözünürlük oranı
+        minDist (int): Algılanan çemberlerin merkezleri arasındaki minimum mesafe
+        param1 (int): Canny kenar algılayıcısının üst eşik değeri
+        param2 (int): Çember merkezleri için akümülatör eşiği
+        minRadius (int): Minimum çember yarıçapı
+        maxRadius (int): Maksimum çember yarıçapı (0 -> sınırsız)
+        pyramid_level (int): 0 ise tam çözünürlükte arama; daha büyükse adaylar 2**seviye kat
+            küçültülmüş görüntüde bulunup tam çözünürlükte iyileştirilir (-1: otomatik)
+
+    Dönüş:
+        numpy.ndarray veya None: (1, N, 3) boyutunda (x, y, r) değerleri
+    """
+    circles = hough_donusumu.find_circles(image, dp, minDist, param1, param2, minRadius, maxRadius, pyramid_level)
+    # cv2.HoughCircles ile aynı biçim
+    return circles[None] if len(circles) else None
+
+
+def draw_hough_circles(image, circles):
+    """
+    Bulunan çemberleri görüntünün bir kopyası üzerine çizer.
+
+    Parametreler:
+        image (numpy.ndarray): RGB görüntü
+        circles (numpy.ndarray veya None): find_hough_circles çıktısı
+
+    Dönüş:
+        numpy.ndarray: Çemberlerin (yeşil) ve merkezlerinin (mavi) çizildiği görüntü
+    """
+    img_with_circles = image.copy()
+
+    if circles is not None:
+        circles = np.uint16(np.around(circles))  # Koordinatları ve yarıçapı tam sayıya yuvarla
+        for i in circles[0, :]:
+            cv2.circle(img_with_circles, (i[0], i[1]), i[2], (0, 255, 0), 2)
+            cv2.circle(img_with_circles, (i[0], i[1]), 2, (0, 0, 255), 3)
+
+    return img_with_circles
+
+
+def detect_hough_circles(image, dp, minDist, param1, param2, minRadius, maxRadius, pyramid_level=0):
+    """
+    Çemberleri bulur ve çizer; çemberleri çizimle birlikte döndürür.
+
+    Dönüş:
+        tuple: (çemberlerin çizildiği görüntü, (N, 3) boyutunda (x, y, r) dizisi; JSON için
+            hough_donusumu.circles_to_list)
+    """
+    circles = hough_donusumu.find_circles(image, dp, minDist, param1, param2, minRadius, maxRadius, pyramid_level)
+    return draw_hough_circles(image, circles[None] if len(circles) else None), circles
+
+
+def apply_hough_circle_transform(image, dp, minDist, param1, param2, minRadius, maxRadius, pyramid_level=0):
+    """
+    Görüntüye Hough Çember Dönüşümü uygular ve bulunan çemberleri çizer.
+
+    Dönüş:
+        numpy.ndarray: Çemberlerin çizildiği görüntü
+    """
+    return detect_hough_circles(image, dp, minDist, param1, param2, minRadius, maxRadius, pyramid_level)[0]
+
+
+def apply_kmeans_segmentation(image, k_clusters):
+    """
+    Görüntüye K-Means kümeleme tabanlı segmentasyon uygular. Her piksel,
+    ait olduğu kümenin merkez rengiyle boyanır.
+
+    cv2.kmeans: K-Means kümeleme algoritmasını uygulayan OpenCV fonksiyonu
+
+    Parametreler:
+        image (numpy.ndarray): RGB görüntü
+        k_clusters (int): Küme sayısı
+
+    Dönüş:
+        numpy.ndarray: Segmentlenmiş görüntü
+    """
+    labels, centers, _ = kumeleme.exact_kmeans(kumeleme.pixel_data(image), k_clusters)
+    return kumeleme.segment(image, labels, centers)
+
+
+def apply_fast_kmeans_segmentation(image, k_clusters, sample_size=kumeleme.DEFAULT_SAMPLE_SIZE,
+                                   attempts=kumeleme.DEFAULT_ATTEMPTS):
+    """
+    K-Means segmentasyonunun hızlı modu: kümeler piksellerin bir örneklemi üzerinde
+    k-means++ başlangıcı ve mini-batch iyileştirme ile bulunur, ardından tüm pikseller tek
+    bir vektörel geçişte en yakın merkeze atanır (bkz. kumeleme.fast_kmeans). Aynı
+    parametrelerle her zaman aynı sonucu verir.
+
+    Parametreler:
+        image (numpy.ndarray): RGB görüntü
+        k_clusters (int): Küme sayısı
+        sample_size (int): Örneklem büyüklüğü
+        attempts (int): Farklı başlangıçlarla deneme sayısı
+
+    Dönüş:
+        numpy.ndarray: Segmentlenmiş görüntü
+    """
+    labels, centers, _ = kumeleme.fast_kmeans(kumeleme.pixel_data(image), k_clusters, sample_size, attempts)
+    return kumeleme.segment(image, labels, centers)
+
+
+def apply_palette_kmeans_segmentation(image, k_clusters, bits=kumeleme.DEFAULT_PALETTE_BITS):
+    """
+    K-Means segmentasyonunun palet modu: pikseller yerine, kanal başına bits bite nicemlenmiş
+    renk histogramı ağırlıklı olarak kümelenir ve pikseller bir arama tablosuyla kümelere
+    atanır (bkz. kumeleme.palette_kmeans). Aynı parametrelerle her zaman aynı sonucu verir.
+
+    Parametreler:
+        image (numpy.ndarray): RGB görüntü
+        k_clusters (int): Küme sayısı
+        bits (int): Kanal başına nicemleme biti (8 ise renkler nicemlenmez)
+
+    Dönüş:
+        numpy.ndarray: Segmentlenmiş görüntü
+    """
+    labels, centers, _ = kumeleme.palette_kmeans(kumeleme.pixel_data(image), k_clusters, bits)
+    return kumeleme.segment(image, labels, centers)
+
+
+# ------------ İŞLEM KAYDI ------------
+
+# Kısa işlem adı -> (fonksiyon, parametre türleri)
+# Parametre türleri, metin olarak gelen parametreleri (örn. komut satırından) dönüştürmek için
+# kullanılır. Sonda varsayılan değeri olan parametreler verilmeyebilir.
+ISLEMLER = {
+    "gray": (convert_to_gray, ()),
+    "negative": (negative_image, ()),
+    "brightness": (adjust_brightness, (int,)),
+    "threshold": (apply_threshold, (int,)),
+    "equalize": (equalize_histogram, ()),
+    "contrast": (adjust_contrast, (float,)),
+    "gamma": (adjust_gamma, (float,)),
+    "translate": (translate_image, (int, int)),
+    "flip_h": (flip_horizontal, ()),
+    "flip_v": (flip_vertical, ()),
+    "shear": (shear_image, (float, float)),
+    "scale": (scale_image, (float, float)),
+    "rotate": (rotate_image, (float,)),
+    "crop": (crop_image, (int, int, int, int)),
+    "perspective": (apply_perspective_correction, (parse_points, int, int)),
+    "mean": (apply_mean_filter, (int,)),
+    "median": (apply_median_filter, (int,)),
+    "gaussian": (apply_gaussian_filter, (int, float)),
+    "conservative": (apply_conservative_filter, (int,)),
+    "crimmins": (apply_crimmins_speckle, (int,)),
+    "erode": (apply_erode, (int, int)),
+    "dilate": (apply_dilate, (int, int)),
+    "lowpass": (apply_fourier_lowpass, (int,)),
+    "highpass": (apply_fourier_highpass, (int,)),
+    "band_pass": (apply_band_pass, (int, int)),
+    "band_stop": (apply_band_stop, (int, int)),
+    "butterworth": (apply_butterworth, (str, float, int)),
+    "gaussian_freq": (apply_gaussian_freq, (str, float)),
+    "homomorphic": (apply_homomorphic, (float, float, float)),
+    "sobel": (apply_sobel_filter, ()),
+    "prewitt": (apply_prewitt_filter, ()),
+    "roberts": (apply_roberts_cross_filter, ()),
+    "compass": (apply_compass_filter, ()),
+    "canny": (apply_canny_filter, (int, int)),
+    "laplacian": (apply_laplacian_filter, ()),
+    "gabor": (apply_gabor_filter, (int, float, float, float, float, float)),
+    "hough_lines": (apply_hough_line_transform, (int, float, int, float, float, parse_roi)),
+    "hough_segments": (apply_hough_segment_transform, (int, float, int, int, int, parse_roi)),
+    "hough_circles": (apply_hough_circle_transform, (float, int, int, int, int, int, int)),
+    "kmeans": (apply_kmeans_segmentation, (int,)),
+    "kmeans_fast": (apply_fast_kmeans_segmentation, (int, int, int)),
+    "kmeans_palette": (apply_palette_kmeans_segmentation, (int, int)),
+}
+
+
+def parse_params(name, params):
+    """
+    Metin olarak verilen parametreleri işlemin beklediği türlere dönüştürür.
+
+    Parametreler:
+        name (str): ISLEMLER içindeki işlem adı
+        params (list): Metin parametreler (örn. ["5", "1.2"])
+
+    Dönüş:
+        tuple: Dönüştürülmüş parametreler
+
+    Hata:
+        ValueError: İşlem bilinmiyorsa, parametre sayısı veya türü uygun değilse
+    """
+    if name not in ISLEMLER:
+        raise ValueError(f"Bilinmeyen işlem: {name}")
+
+    func, types = ISLEMLER[name]
+    if len(params) > len(types):
+        raise ValueError(f"'{name}' en fazla {len(types)} parametre alır, {len(params)} verildi")
+
+    try:
+        converted = tuple(t(p) for t, p in zip(types, params))
+    except ValueError:
+        raise ValueError(f"'{name}' için geçersiz parametre: {','.join(map(str, params))}") from None
+
+    # Eksik zorunlu parametreleri işlem çalışmadan önce yakala
+    try:
+        inspect.signature(func).bind(None, *converted)
+    except TypeError:
+        raise ValueError(f"'{name}' için eksik parametre: {len(types)} parametre bekleniyor") from None
+
+    return converted
+
+
+def apply_operation(image, name, *params):
+    """
+    ISLEMLER içindeki bir işlemi adıyla çağırır.
+
+    Parametreler:
+        image (numpy.ndarray): RGB görüntü
+        name (str): İşlem adı (örn. "gaussian")
+        *params: İşlemin parametreleri
+
+    Dönüş:
+        numpy.ndarray: İşlenmiş görüntü
+    """
+    func, _ = ISLEMLER[name]
+    return func(image, *params)
+
+
+def _segment_kind(op):
+    """apply_chain için işlemin türü: nokta işlemi, birleştirilebilir uzamsal filtre veya diğer."""
+    if op[0] in nokta_islemleri.NOKTA_ISLEMLERI:
+        return "point"
+    if op[0] in islem_birlestirme.FUSIBLE:
+        return "spatial"
+    return None
+
+
+def apply_chain(image, chain, approximate=False):
+    """
+    Bir işlem zincirini sırayla uygular. Her işlemin çıktısı bir sonrakinin girdisidir.
+
+    Art arda gelen nokta işlemleri (parlaklık, kontrast, gama, negatif, eşikleme,
+    histogram eşitleme) tek bir arama tablosunda birleştirilip tek geçişte uygulanır
+    (bkz. nokta_islemleri). Art arda gelen uzamsal filtreler (ortalama, medyan, Gaussian,
+    aşındırma, genişletme) birleştirilip iki ortak tampon arasında çalıştırılır
+    (bkz. islem_birlestirme). Sonuç, işlemlerin tek tek uygulanmasıyla aynıdır;
+    approximate=True ile doğrusal filtreler de birleştirilir ve sonuç birleştirilen
+    aşama başına en fazla bir gri seviyesi farklı olabilir.
+
+    Parametreler:
+        image (numpy.ndarray): RGB görüntü
+        chain (list): (işlem adı, parametreler) çiftleri,
+            örn. [("gray", ()), ("gaussian", (5, 1.2)), ("canny", (100, 200))]
+        approximate (bool): Yaklaşık doğrusal filtre birleştirmelerine izin ver
+
+    Dönüş:
+        numpy.ndarray: Zincirin son çıktısı
+    """
+    for kind, ops in groupby(chain, key=_segment_kind):
+        ops = list(ops)
+        # Tek bir işlem için birleştirme bir kazanç sağlamaz
+        if kind == "point" and len(ops) > 1:
+            image = nokta_islemleri.apply_point_chain(image, ops)
+            continue
+        if kind == "spatial" and len(ops) > 1:
+            image = islem_birlestirme.run_fused(image, ops, approximate)
+            continue
+        for name, params in ops:
+            image = apply_operation(image, name, *params)
+    return image
@@ -0,0 +1,458 @@
+"""
+HOUGH DÖNÜŞÜMÜ
+--------------
+
+Hough çizgi dönüşümünün ara sonuçlarını görüntü ve parametre başına önbellekte tutar:
+
+- Kenar haritası (Canny): görüntü, Canny eşikleri ve ilgi bölgesi (ROI) başına bir kez
+  hesaplanır.
+- Oylar: cv2.HoughLinesWithAccumulator ile akümülatördeki tüm (rho, theta, oy) adayları
+  bir kez çıkarılır ve oya göre azalan sırada saklanır. Yalnızca eşik değiştiğinde kenar
+  haritası ve akümülatör yeniden hesaplanmaz; sonuç saklanan adayların taranmasıyla bulunur.
+- Doğru parçaları: olasılıksal Hough dönüşümü (cv2.HoughLinesP) kenar haritasındaki
+  piksellerin rastgele bir kısmıyla oylar ve sonsuz doğrular yerine uç noktaları belli doğru
+  parçaları bulur. Parçalar (x1, y1, x2, y2, uzunluk, açı) alanlı yapılandırılmış bir dizi
+  olarak döner ve JSON'a çevrilebilir; ölçüm kodu algılamayı tekrar çalıştırmadan kullanır.
+
+- Çemberler: gri tonlamalı, medyan filtreyle bulanıklaştırılmış görüntü ve ondan türetilen
+  küçültülmüş piramit seviyeleri (cv2.pyrDown) önbellekte tutulur. Çok ölçekli aramada
+  adaylar küçük bir piramit seviyesinde bulunur, her aday tam çözünürlükte yalnızca
+  çevresindeki küçük bir pencerede doğrulanıp iyileştirilir. Parametre değiştiğinde
+  bulanıklaştırma ve piramit yeniden hesaplanmaz.
+
+İlgi bölgesi ve theta aralığı oylama uzayını küçültür: yalnızca bölgedeki kenar pikselleri
+ve aralıktaki açılar oylanır. Bulunan doğruların rho değerleri ve parçaların uç noktaları her
+zaman tam görüntünün koordinatlarına göre verilir.
+
+Görüntüler yerinde değiştirilmediği için (bkz. frekans_alani) önbellek anahtarı olarak
+görüntünün kimliği kullanılır.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+# Canny kenar bulucu için varsayılan eşikler
+CANNY_LOW = 50
+CANNY_HIGH = 150
+
+# find_segments çıktısının alanları: uç noktalar (piksel), uzunluk (piksel) ve
+# x ekseninden saat yönünde (görüntüde y aşağı doğru) [0, 180) derece açı
+SEGMENT_DTYPE = np.dtype([
+    ("x1", np.int32), ("y1", np.int32), ("x2", np.int32), ("y2", np.int32),
+    ("length", np.float32), ("angle", np.float32),
+])
+
+# Çember aramasından önce uygulanan medyan filtrenin çekirdek boyutu
+CIRCLE_BLUR_SIZE = 5
+
+# Çok ölçekli çember aramasında kullanılabilecek en küçük piramit seviyesi (her seviye
+# görüntüyü yarıya küçültür). AUTO_LEVEL ile seviye yarıçap aralığına göre seçilir
+MAX_PYRAMID_LEVEL = 4
+AUTO_LEVEL = -1
+
+# Otomatik seviye seçiminde küçük seviyedeki en küçük yarıçap ve en kısa kenar (piksel);
+# daha küçük çemberler ve görüntüler piramitte güvenilir şekilde bulunamaz
+COARSE_MIN_RADIUS = 5
+COARSE_MIN_SIZE = 256
+
+# En küçük yarıçap 0 verildiğinde otomatik seviye seçiminde varsayılan olarak kullanılan değer
+DEFAULT_MIN_RADIUS = 8
+
+# Adayların tam çözünürlükte doğrulandığı pencerede merkez ve yarıçap için tolerans
+# (küçük seviyenin pikseli cinsinden)
+REFINE_TOLERANCE = 2
+
+# Ara sonuçları önbellekte tutulan en fazla görüntü sayısı
+HOUGH_CACHE_SIZE = 4
+
+_hough_cache = OrderedDict()  # (id(görüntü), ara sonuç, parametreler) -> (görüntü, sonuç)
+_hough_lock = threading.Lock()
+
+
+def _cached(image, kind, params, func):
+    """
+    func() sonucunu görüntü, ara sonuç türü ve parametreler başına önbellekten döndürür.
+    Sonuç paylaşıldığı için salt okunur yapılır.
+
+    Parametreler:
+        image (numpy.ndarray): Sonucun ait olduğu görüntü
+        kind (str): Ara sonucun türü (örn. "edges", "votes")
+        params (tuple): Sonucu belirleyen parametreler
+        func (callable): Sonucu hesaplayan argümansız fonksiyon
+
+    Dönüş:
+        numpy.ndarray: Salt okunur sonuç
+    """
+    key = (id(image), kind, params)
+    with _hough_lock:
+        entry = _hough_cache.get(key)
+        if entry is not None and entry[0] is image:
+            _hough_cache.move_to_end(key)
+            return entry[1]
+
+    result = func()
+    result.setflags(write=False)
+
+    with _hough_lock:
+        _hough_cache[key] = (image, result)
+        _hough_cache.move_to_end(key)
+        # Görüntü başına tek girdi sayılır; aynı görüntünün tüm ara sonuçları birlikte silinir
+        while len({cache_key[0] for cache_key in _hough_cache}) > HOUGH_CACHE_SIZE:
+            _hough_cache.popitem(last=False)
+    return result
+
+
+def clear_cache():
+    """Önbellekteki kenar haritalarını, oyları, parçaları ve piramitleri siler (örn. yeni görüntü açıldığında)."""
+    with _hough_lock:
+        _hough_cache.clear()
+
+
+def normalize_roi(image, roi):
+    """
+    İlgi bölgesini görüntünün sınırlarına kırpar.
+
+    Parametreler:
+        image (numpy.ndarray): Görüntü
+        roi (tuple veya None): (x_start, y_start, x_end, y_end), crop_image ile aynı biçimde;
+            None ise tüm görüntü
+
+    Dönüş:
+        tuple: Görüntü içinde kalan (x_start, y_start, x_end, y_end)
+
+    Hata:
+        ValueError: Bölge görüntünün dışında kalıyor veya boşsa
+    """
+    h, w = image.shape[:2]
+    if roi is None:
+        return 0, 0, w, h
+    x_start, y_start, x_end, y_end = (int(c) for c in roi)
+    x_start, x_end = max(x_start, 0), min(x_end, w)
+    y_start, y_end = max(y_start, 0), min(y_end, h)
+    if x_start >= x_end or y_start >= y_end:
+        raise ValueError(f"İlgi bölgesi görüntünün dışında veya boş: {tuple(roi)}")
+    return x_start, y_start, x_end, y_end
+
+
+def edge_map(image, roi=None, low=CANNY_LOW, high=CANNY_HIGH):
+    """
+    Görüntünün (veya ilgi bölgesinin) Canny kenar haritasını döndürür.
+
+    Parametreler:
+        image (numpy.ndarray): RGB veya gri tonlamalı görüntü
+        roi (tuple veya None): (x_start, y_start, x_end, y_end) ilgi bölgesi
+        low (int): Canny alt eşiği
+        high (int): Canny üst eşiği
+
+    Dönüş:
+        numpy.ndarray: İlgi bölgesi boyutunda, salt okunur ikili kenar haritası
+    """
+    x_start, y_start, x_end, y_end = roi = normalize_roi(image, roi)
+
+    def compute():
+        region = image[y_start:y_end, x_start:x_end]
+        gray_image = cv2.cvtColor(region, cv2.COLOR_RGB2GRAY) if region.ndim == 3 else region
+        return cv2.Canny(gray_image, low, high, apertureSize=3)
+
+    return _cached(image, "edges", (roi, low, high), compute)
+
+
+def line_votes(image, rho, theta_accuracy, min_theta=0.0, max_theta=np.pi, roi=None,
+               low=CANNY_LOW, high=CANNY_HIGH):
+    """
+    Standart Hough dönüşümünün akümülatöründeki tüm aday doğruları oylarıyla döndürür.
+
+    Parametreler:
+        image (numpy.ndarray): RGB veya gri tonlamalı görüntü
+        rho (int): Uzaklık çözünürlüğü (piksel)
+        theta_accuracy (float): Açı çözünürlüğü (radyan)
+        min_theta (float): Oylanan en küçük açı (radyan)
+        max_theta (float): Oylanan en büyük açı (radyan)
+        roi (tuple veya None): (x_start, y_start, x_end, y_end) ilgi bölgesi
+        low (int): Canny alt eşiği
+        high (int): Canny üst eşiği
+
+    Dönüş:
+        numpy.ndarray: (N, 3) boyutunda, oya göre azalan sırada salt okunur
+            (rho, theta, oy) dizisi; rho tam görüntünün koordinatlarına göredir
+    """
+    roi = normalize_roi(image, roi)
+    edges = edge_map(image, roi, low, high)
+
+    def compute():
+        # Eşik 0: akümülatörde en az bir oy alan tüm adaylar (yerel en büyükler) döner
+        votes = cv2.HoughLinesWithAccumulator(edges, rho, theta_accuracy, 0,
+                                              min_theta=min_theta, max_theta=max_theta)
+        if votes is None:
+            return np.empty((0, 3), np.float32)
+        votes = votes.reshape(-1, 3)
+        # Bölgenin sol üst köşesi (x0, y0) iken tam görüntüde rho' = rho + x0 cos θ + y0 sin θ
+        x_start, y_start = roi[:2]
+        if x_start or y_start:
+            theta = votes[:, 1]
+            votes[:, 0] += x_start * np.cos(theta) + y_start * np.sin(theta)
+        return votes
+
+    return _cached(image, "votes", (roi, low, high, rho, theta_accuracy, min_theta, max_theta), compute)
+
+
+def find_lines(image, rho, theta_accuracy, threshold, min_theta=0.0, max_theta=np.pi, roi=None,
+               low=CANNY_LOW, high=CANNY_HIGH):
+    """
+    Akümülatör eşiğini aşan doğruları döndürür. Kenar haritası ve oylar önbellekten
+    alındığı için eşiğin değiştirilmesi yalnızca saklanan adayların taranmasıdır.
+
+    Parametreler:
+        image (numpy.ndarray): RGB veya gri tonlamalı görüntü
+        rho, theta_accuracy, min_theta, max_theta, roi, low, high: bkz. line_votes
+        threshold (int): Akümülatör eşiği
+
+    Dönüş:
+        numpy.ndarray veya None: cv2.HoughLines ile aynı biçimde (N, 1, 2) boyutunda
+            (rho, theta) çiftleri; eşiği aşan doğru yoksa None
+    """
+    votes = line_votes(image, rho, theta_accuracy, min_theta, max_theta, roi, low, high)
+    # cv2.HoughLines gibi yalnızca eşikten büyük oylar kabul edilir
+    lines = votes[votes[:, 2] > threshold, None, :2]
+    return lines if len(lines) else None
+
+
+def find_segments(image, rho, theta_accuracy, threshold, min_line_length=0, max_line_gap=0, roi=None,
+                  low=CANNY_LOW, high=CANNY_HIGH):
+    """
+    Olasılıksal Hough dönüşümü ile doğru parçalarını bulur. Kenar haritası ve sonuç
+    önbellekte tutulur (cv2.HoughLinesP sabit bir tohumla çalıştığı için sonuç aynıdır).
+
+    Parametreler:
+        image (numpy.ndarray): RGB veya gri tonlamalı görüntü
+        rho (int): Uzaklık çözünürlüğü (piksel)
+        theta_accuracy (float): Açı çözünürlüğü (radyan)
+        threshold (int): Akümülatör eşiği
+        min_line_length (int): Bundan kısa parçalar atılır (piksel)
+        max_line_gap (int): Aynı doğru üzerindeki noktalar arasında birleştirilen en büyük
+            boşluk (piksel)
+        roi (tuple veya None): (x_start, y_start, x_end, y_end) ilgi bölgesi
+        low (int): Canny alt eşiği
+        high (int): Canny üst eşiği
+
+    Dönüş:
+        numpy.ndarray: SEGMENT_DTYPE türünde salt okunur yapılandırılmış dizi; uç noktalar
+            tam görüntünün koordinatlarına göredir
+    """
+    roi = normalize_roi(image, roi)
+    edges = edge_map(image, roi, low, high)
+
+    def compute():
+        lines = cv2.HoughLinesP(edges, rho, theta_accuracy, threshold,
+                                minLineLength=min_line_length, maxLineGap=max_line_gap)
+        if lines is None:
+            return np.empty(0, SEGMENT_DTYPE)
+        lines = lines.reshape(-1, 4) + np.array(roi[:2] * 2, np.int32)
+        segments = np.empty(len(lines), SEGMENT_DTYPE)
+        for i, field in enumerate(("x1", "y1", "x2", "y2")):
+            segments[field] = lines[:, i]
+        dx = (lines[:, 2] - lines[:, 0]).astype(np.float32)
+        dy = (lines[:, 3] - lines[:, 1]).astype(np.float32)
+        segments["length"] = np.hypot(dx, dy)
+        segments["angle"] = np.degrees(np.arctan2(dy, dx)) % 180.0
+        return segments
+
+    return _cached(image, "segments", (roi, low, high, rho, theta_accuracy, threshold,
+                                       min_line_length, max_line_gap), compute)
+
+
+def segments_to_list(segments):
+    """
+    Yapılandırılmış parça dizisini sözlüklerin listesine çevirir (JSON/YAML için).
+
+    Parametreler:
+        segments (numpy.ndarray): find_segments çıktısı
+
+    Dönüş:
+        list: {"x1", "y1", "x2", "y2", "length", "angle"} sözlükleri
+    """
+    return [
+        {name: round(value, 3) if isinstance(value, float) else value
+         for name, value in zip(SEGMENT_DTYPE.names, record)}
+        for record in segments.tolist()
+    ]
+
+
+def segments_to_json(segments, indent=None):
+    """
+    Parçaları JSON metnine çevirir.
+
+    Parametreler:
+        segments (numpy.ndarray): find_segments çıktısı
+        indent (int veya None): json.dumps girinti değeri
+
+    Dönüş:
+        str: Parça sözlüklerinin JSON listesi
+    """
+    return json.dumps(segments_to_list(segments), indent=indent)
+
+
+def pyramid_level(image, level):
+    """
+    Çember araması için hazırlanan piramidin bir seviyesini döndürür. Seviye 0, görüntünün
+    medyan filtreyle bulanıklaştırılmış gri tonlamalı halidir; her seviye bir öncekinin
+    cv2.pyrDown ile yarıya küçültülmüşüdür. Tüm seviyeler önbellekte tutulur.
+
+    Parametreler:
+        image (numpy.ndarray): RGB veya gri tonlamalı görüntü
+        level (int): Piramit seviyesi (0: tam çözünürlük)
+
+    Dönüş:
+        numpy.ndarray: Salt okunur gri tonlamalı görüntü
+    """
+    def compute():
+        if level == 0:
+            gray_image = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY) if image.ndim == 3 else image
+            return cv2.medianBlur(gray_image, CIRCLE_BLUR_SIZE)
+        return cv2.pyrDown(pyramid_level(image, level - 1))
+
+    return _cached(image, "pyramid", (level, CIRCLE_BLUR_SIZE), compute)
+
+
+def auto_pyramid_level(image, min_radius):
+    """
+    Çok ölçekli çember araması için en çok küçültülmüş güvenilir piramit seviyesini seçer: en küçük
+    yarıçap COARSE_MIN_RADIUS'tan, kısa kenar COARSE_MIN_SIZE'dan küçük kalmamalıdır.
+
+    Parametreler:
+        image (numpy.ndarray): Görüntü
+        min_radius (int): Aranan en küçük yarıçap (0 ise DEFAULT_MIN_RADIUS)
+
+    Dönüş:
+        int: 0 ile MAX_PYRAMID_LEVEL arasında seviye
+    """
+    min_radius = min_radius or DEFAULT_MIN_RADIUS
+    short_side = min(image.shape[:2])
+    level = 0
+    while (level < MAX_PYRAMID_LEVEL and min_radius >> (level + 1) >= COARSE_MIN_RADIUS
+           and short_side >> (level + 1) >= COARSE_MIN_SIZE):
+        level += 1
+    return level
+
+
+def _hough_circles(gray_image, dp, min_dist, param1, param2, min_radius, max_radius):
+    """cv2.HoughCircles (gradyan yöntemi); (N, 3) boyutunda (x, y, r) dizisi döndürür."""
+    circles = cv2.HoughCircles(gray_image, cv2.HOUGH_GRADIENT, dp=dp, minDist=min_dist,
+                               param1=param1, param2=param2, minRadius=min_radius, maxRadius=max_radius)
+    return np.empty((0, 3), np.float32) if circles is None else circles.reshape(-1, 3)
+
+
+def _refine_circle(full, candidate, scale, dp, param1, param2, min_radius, max_radius):
+    """
+    Küçük seviyede bulunan adayı tam çözünürlükte, çevresindeki pencerede yeniden arar.
+
+    Dönüş:
+        numpy.ndarray veya None: Tam görüntü koordinatlarında (x, y, r); aday tam
+            çözünürlükte doğrulanamazsa None
+    """
+    tolerance = REFINE_TOLERANCE * scale
+    x, y, r = candidate * scale
+    r_low = max(min_radius, int(r - tolerance))
+    r_high = int(np.ceil(r + tolerance))
+    if max_radius > 0:
+        r_high = min(r_high, max_radius)
+    if r_low > r_high:
+        return None
+
+    # Pencere, en büyük yarıçaplı çemberi ve merkezdeki toleransı kapsar
+    h, w = full.shape
+    half = r_high + tolerance + 2
+    x_start, y_start = max(int(x - half), 0), max(int(y - half), 0)
+    x_end, y_end = min(int(x + half) + 1, w), min(int(y + half) + 1, h)
+
+    # Pencerede tek çember aranır; sonuçlar oya göre sıralı olduğundan ilk uygun olan alınır
+    circles = _hough_circles(full[y_start:y_end, x_start:x_end], dp, 2 * half, param1, param2, r_low, r_high)
+    circles[:, 0] += x_start
+    circles[:, 1] += y_start
+    for circle in circles:
+        if np.hypot(circle[0] - x, circle[1] - y) <= tolerance:
+            return circle
+    return None
+
+
+def find_circles(image, dp, min_dist, param1, param2, min_radius=0, max_radius=0, level=0):
+    """
+    Hough çember dönüşümü. level 0 iken tam çözünürlükte cv2.HoughCircles çalıştırılır.
+    Daha büyük seviyelerde kaba-ince arama yapılır: adaylar 2**level kat küçültülmüş piramit
+    seviyesinde bulunur; her aday tam çözünürlükte, çevresindeki küçük bir pencerede
+    doğrulanır ve konumu ile yarıçapı iyileştirilir. Bulanıklaştırma, piramit ve sonuçlar
+    önbellekte tutulur.
+
+    Parametreler:
+        image (numpy.ndarray): RGB veya gri tonlamalı görüntü
+        dp (float): Ters akümülatör çözünürlük oranı
+        min_dist (int): Çember merkezleri arasındaki en küçük mesafe (piksel)
+        param1 (int): Canny kenar bulucunun üst eşiği
+        param2 (int): Çember merkezleri için akümülatör eşiği
+        min_radius (int): En küçük yarıçap (piksel)
+        max_radius (int): En büyük yarıçap (piksel, 0: sınırsız)
+        level (int): Aday aramasının yapılacağı piramit seviyesi; AUTO_LEVEL ise
+            auto_pyramid_level ile seçilir
+
+    Dönüş:
+        numpy.ndarray: (N, 3) boyutunda, salt okunur (x, y, r) dizisi; koordinatlar tam
+            görüntüye göredir
+    """
+    if level == AUTO_LEVEL:
+        level = auto_pyramid_level(image, min_radius)
+    level = min(max(level, 0), MAX_PYRAMID_LEVEL)
+    full = pyramid_level(image, 0)
+
+    def compute():
+        if level == 0:
+            return _hough_circles(full, dp, min_dist, param1, param2, min_radius, max_radius)
+
+        scale = 1 << level
+        # Akümülatör eşiği küçük seviyede de aynı kalır: düşürüldüğünde aday sayısı, dolayısıyla
+        # tam çözünürlükteki doğrulama maliyeti hızla artar. Yarıçap aralığı toleransla genişletilir
+        candidates = _hough_circles(
+            pyramid_level(image, level), dp, max(min_dist / scale, 1.0), param1,
+            param2, max(min_radius // scale - REFINE_TOLERANCE, 0),
+            max_radius // scale + REFINE_TOLERANCE if max_radius > 0 else 0,
+        )
+
+        circles = []
+        for candidate in candidates:
+            circle = _refine_circle(full, candidate, scale, dp, param1, param2, min_radius, max_radius)
+            # Farklı adaylar tam çözünürlükte aynı çembere yakınsayabilir
+            if circle is not None and all(np.hypot(*(circle[:2] - kept[:2])) >= min_dist for kept in circles):
+                circles.append(circle)
+        return np.array(circles, np.float32).reshape(-1, 3)
+
+    return _cached(image, "circles", (dp, min_dist, param1, param2, min_radius, max_radius, level), compute)
+
+
+def circles_to_list(circles):
+    """
+    Çember dizisini sözlüklerin listesine çevirir (JSON/YAML için).
+
+    Parametreler:
+        circles (numpy.ndarray): find_circles çıktısı
+
+    Dönüş:
+        list: {"x", "y", "r"} sözlükleri
+    """
+    return [{"x": round(x, 2), "y": round(y, 2), "r": round(r, 2)} for x, y, r in circles.tolist()]
+
+
+def circles_to_json(circles, indent=None):
+    """
+    Çemberleri JSON metnine çevirir.
+
+    Parametreler:
+        circles (numpy.ndarray): find_circles çıktısı
+        indent (int veya None): json.dumps girinti değeri
+
+    Dönüş:
+        str: Çember sözlüklerinin JSON listesi
+    """
+    return json.dumps(circles_to_list(circles), indent=indent)
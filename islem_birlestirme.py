@@ -0,0 +1,208 @@
+"""
+İŞLEM BİRLEŞTİRME (FUSION) PLANLAYICISI
+---------------------------------------
+
+Bir işlem zincirinde art arda gelen uzamsal filtreler (ortalama, medyan, Gaussian,
+aşındırma, genişletme) tek tek çalıştırıldığında her biri yeni bir tam boyutlu çıktı
+ayırır ve görüntünün üzerinden ayrı bir geçiş yapar. Planlayıcı, zinciri çalıştırmadan
+önce uyumlu aşamaları birleştirir ve kalan aşamaları iki ortak tampon (ping-pong) arasında
+çalıştırır: her aşama bir önceki aşamanın tamponundan okuyup diğerine yazar.
+
+Birebir aynı sonucu veren birleştirmeler (her zaman uygulanır):
+    erode(k, i) -> erode(k, j)    =>  erode(k, i + j)
+    dilate(k, i) -> dilate(k, j)  =>  dilate(k, i + j)
+    erode(k, i) -> dilate(k, i)   =>  açma  (cv2.MORPH_OPEN)
+    dilate(k, i) -> erode(k, i)   =>  kapama (cv2.MORPH_CLOSE)
+
+Yaklaşık sonuç veren birleştirmeler (approximate=True ile):
+    ortalama / Gaussian / ayrılabilir çekirdek dizileri
+        => çekirdeklerin konvolüsyonu ile tek bir ayrılabilir konvolüsyon (cv2.sepFilter2D)
+Birleşik çekirdek, kesilmiş gerçek çekirdeklerin tam konvolüsyonudur; fark yalnızca ara
+sonuçların 8 bite yuvarlanmamasından gelir. Çekirdekler negatif olmayan ve toplamı 1 olan
+yumuşatma çekirdekleri olduğundan her yuvarlama hatası en fazla yarım gri seviyesidir ve
+sonraki aşamalarda büyümez: birleştirilen her aşama sonucu en fazla bir gri seviyesi
+değiştirir (iki aşamalı bir zincirde pratikte 0 veya 1). Yalnızca tek boyutlu (merkezli) çekirdekler
+birleştirilir; çift boyutlu ortalama çekirdeklerinin merkezi kaydığı için birleştirilmez.
+Birleşik çekirdeğin maliyeti ayrı geçişlerin toplamını aşıyorsa (ortalama filtresi kayan
+toplamla çekirdek boyutundan bağımsız sürede çalışır) birleştirme yapılmaz.
+"""
+
+import cv2
+import numpy as np
+
+
+def _kernel(size):
+    return np.ones((size, size), np.uint8)
+
+
+def _mean(src, dst, kernel_size):
+    return cv2.blur(src, (kernel_size, kernel_size), dst=dst)
+
+
+def _median(src, dst, kernel_size):
+    return cv2.medianBlur(src, kernel_size, dst=dst)
+
+
+def _gaussian(src, dst, kernel_size, sigma):
+    return cv2.GaussianBlur(src, (kernel_size, kernel_size), sigma, dst=dst)
+
+
+def _erode(src, dst, kernel_size, iterations=1):
+    return cv2.erode(src, _kernel(kernel_size), dst=dst, iterations=iterations)
+
+
+def _dilate(src, dst, kernel_size, iterations=1):
+    return cv2.dilate(src, _kernel(kernel_size), dst=dst, iterations=iterations)
+
+
+def _open(src, dst, kernel_size, iterations=1):
+    return cv2.morphologyEx(src, cv2.MORPH_OPEN, _kernel(kernel_size), dst=dst, iterations=iterations)
+
+
+def _close(src, dst, kernel_size, iterations=1):
+    return cv2.morphologyEx(src, cv2.MORPH_CLOSE, _kernel(kernel_size), dst=dst, iterations=iterations)
+
+
+def _separable(src, dst, kernel):
+    return cv2.sepFilter2D(src, -1, kernel, kernel, dst=dst)
+
+
+# Plan aşamaları: ad -> func(kaynak, hedef, *parametreler)
+# İlk beşi goruntu_islemleri.ISLEMLER içindeki aynı adlı işlemlerle aynı sonucu verir.
+ASAMALAR = {
+    "mean": _mean,
+    "median": _median,
+    "gaussian": _gaussian,
+    "erode": _erode,
+    "dilate": _dilate,
+    "open": _open,
+    "close": _close,
+    "separable": _separable,
+}
+
+# Ortalama filtresinin (cv2.blur) çekirdek katsayısı cinsinden yaklaşık maliyeti
+BOX_FILTER_COST = 3
+
+# Planlayıcının işleyebildiği ISLEMLER adları
+FUSIBLE = {"mean", "median", "gaussian", "erode", "dilate"}
+
+
+def _linear_kernel(name, params):
+    """Doğrusal aşamanın tek boyutlu çekirdeği; doğrusal değilse veya merkezli değilse None."""
+    if name == "separable":
+        return params[0]
+    if name == "mean" and params[0] % 2 == 1:
+        return np.full(params[0], 1.0 / params[0])
+    if name == "gaussian":
+        return cv2.getGaussianKernel(params[0], params[1]).ravel()
+    return None
+
+
+def _linear_cost(name, params, kernel):
+    """
+    Aşamanın piksel başına yaklaşık maliyeti (çekirdek katsayısı sayısı cinsinden).
+    cv2.blur kayan toplam kullandığı için maliyeti çekirdek boyutundan bağımsızdır.
+    """
+    return BOX_FILTER_COST if name == "mean" else len(kernel)
+
+
+def _morph_params(params):
+    kernel_size, iterations = (tuple(params) + (1,))[:2]
+    return kernel_size, iterations
+
+
+def _fuse(first, second, approximate):
+    """
+    İki ardışık aşamayı tek bir aşamada birleştirir.
+
+    Dönüş:
+        tuple: Birleşik aşama (ad, parametreler); birleştirilemiyorsa None
+    """
+    (name1, params1), (name2, params2) = first, second
+
+    if name1 in ("erode", "dilate") and name2 in ("erode", "dilate"):
+        kernel1, iterations1 = _morph_params(params1)
+        kernel2, iterations2 = _morph_params(params2)
+        if kernel1 != kernel2:
+            return None
+        if name1 == name2:
+            return name1, (kernel1, iterations1 + iterations2)
+        if iterations1 == iterations2:
+            return ("open" if name1 == "erode" else "close"), (kernel1, iterations1)
+        return None
+
+    if not approximate:
+        return None
+
+    kernel1 = _linear_kernel(name1, params1)
+    kernel2 = _linear_kernel(name2, params2)
+    if kernel1 is None or kernel2 is None:
+        return None
+    # Birleşik çekirdek iki ayrı geçişten pahalıysa (örn. büyük ortalama filtreleri)
+    # birleştirme yapılmaz
+    kernel = np.convolve(kernel1, kernel2)
+    if len(kernel) > _linear_cost(name1, params1, kernel1) + _linear_cost(name2, params2, kernel2):
+        return None
+    # Kayan nokta hataları çekirdeğin simetrisini bozarsa OpenCV simetrik çekirdekler için
+    # hızlı yolu kullanmaz; çekirdek tekrar simetrik yapılır
+    return "separable", ((kernel + kernel[::-1]) / 2,)
+
+
+def plan_chain(chain, approximate=False):
+    """
+    Zincirdeki uyumlu ardışık aşamaları birleştirir.
+
+    Parametreler:
+        chain (list): FUSIBLE içindeki işlemlerden oluşan (işlem adı, parametreler) çiftleri
+        approximate (bool): Sonucu birleştirilen aşama başına en fazla bir gri
+            seviyesi değiştirebilen doğrusal çekirdek birleştirmelerini de uygula
+
+    Dönüş:
+        list: ASAMALAR içindeki adlarla (aşama adı, parametreler) çiftleri
+    """
+    plan = []
+    for stage in chain:
+        stage = (stage[0], tuple(stage[1]))
+        # Birleşik aşama bir sonraki aşamayla tekrar birleştirilebilir
+        # (örn. gaussian -> gaussian -> mean => tek bir ayrılabilir konvolüsyon)
+        while plan:
+            fused = _fuse(plan[-1], stage, approximate)
+            if fused is None:
+                break
+            plan.pop()
+            stage = fused
+        plan.append(stage)
+    return plan
+
+
+def run_plan(image, plan):
+    """
+    Planı iki ortak tampon arasında çalıştırır. Girdi görüntüsü değiştirilmez; sonuç,
+    girdiyle bellek paylaşmayan yeni bir dizidir.
+
+    Parametreler:
+        image (numpy.ndarray): Görüntü
+        plan (list): plan_chain çıktısı
+
+    Dönüş:
+        numpy.ndarray: Son aşamanın çıktısı (plan boşsa girdi görüntüsü)
+    """
+    buffers = [np.empty_like(image), np.empty_like(image)] if len(plan) > 1 else [None]
+    for i, (name, params) in enumerate(plan):
+        image = ASAMALAR[name](image, buffers[i % len(buffers)], *params)
+    return image
+
+
+def run_fused(image, chain, approximate=False):
+    """
+    Uzamsal filtre zincirini birleştirip çalıştırır.
+
+    Parametreler:
+        image (numpy.ndarray): Görüntü
+        chain (list): FUSIBLE içindeki işlemlerden oluşan (işlem adı, parametreler) çiftleri
+        approximate (bool): Yaklaşık doğrusal çekirdek birleştirmelerini de uygula
+
+    Dönüş:
+        numpy.ndarray: Zincirin çıktısı
+    """
+    return run_plan(image, plan_chain(chain, approximate))
@@ -0,0 +1,436 @@
+"""
+KAROLU (TILED) PARALEL İŞLEME
+-----------------------------
+
+Çok büyük görüntülerde (100+ megapiksel uydu veya mikroskop görüntüleri) mekansal filtreler
+tek çağrıda ve tek iş parçacığında çalıştığında hem bellek hem de işlemci kullanımı verimsizdir.
+Bu modül görüntüyü örtüşen karolara böler, karoları bir iş parçacığı havuzunda işler ve
+sonuçları çıktı dizisinde birleştirir.
+
+Her karo, filtrenin komşuluk yarıçapı kadar bir kenar payı (halo) ile birlikte işlenir ve
+sonuçtan yalnızca karonun kendi bölgesi alınır. Görüntü kenarına denk gelen karolarda kenar
+payı görüntü sınırında kesildiği için OpenCV'nin kenar doldurma davranışı da değişmez.
+Böylece sonuç, görüntünün tek parça işlenmesiyle bit düzeyinde aynıdır.
+
+OpenCV fonksiyonları çalışırken GIL'i bıraktığı için iş parçacıkları gerçek paralellik sağlar.
+
+Karolanamayan işlemler:
+    - Canny: Histerezis eşiklemesi kenarları tüm görüntü boyunca takip eder.
+    - Gabor: cv2.filter2D büyük çekirdeklerde DFT tabanlı yönteme geçtiği için sonuç
+      karo boyutuna göre son basamakta değişebilir.
+
+Frekans alanı filtreleri (Butterworth, Gauss, homomorfik) tüm görüntünün tek bir DFT'sini
+gerektirir; 20k x 20k bir görüntüde bu, kanal başına gigabaytlarca spektrum demektir. Bu
+filtreler karolar halinde overlap-save yöntemiyle uygulanır: maskenin uzamsal karşılığı olan
+çekirdek (bkz. frekans_alani.spatial_kernel) her karoya, çekirdek yarıçapı kadar kenar
+payıyla birlikte blok boyutunda bir DFT ile uygulanır ve sonuçtan karonun kendi bölgesi
+alınır. Görüntü kenarlarında, tam görüntü DFT'sindeki gibi karşı kenardan (dairesel) kenar
+payı okunur. Çekirdek sonlu bir yarıçapta kesildiği için sonuç tam görüntü filtresinden en
+fazla bir gri seviyesi farklıdır. Çekirdek yarıçapı karo boyutunu aşamaz (aşarsa ValueError);
+böylece blok boyutu ve bellek kullanımı görüntü boyutuna değil karo boyutuna bağlı kalır.
+
+İdeal (keskin kesimli) alçak/yüksek geçiren ve bant filtrelerinin sinc biçimli çekirdeği çok
+yavaş sönümlenir; kesilmiş çekirdekle sonuç tam görüntü filtresinden onlarca gri seviyesi
+farklı olabilir. Bu filtrelerin karolu karşılıkları (apply_fourier_lowpass, ...) support
+parametresi büyütülerek doğrudan çağrılabilir, ancak KAROLU_ISLEMLER'de yer almazlar; toplu
+işlemenin --stream modu bunları Canny gibi reddeder.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import cv2
+import numpy as np
+
+import fft_arka_uclari
+import frekans_alani
+import goruntu_islemleri
+
+# Varsayılan karo kenar uzunluğu (piksel)
+TILE_SIZE = 1024
+
+
+def iter_tiles(shape, tile_size, halo):
+    """
+    Görüntüyü karolara bölen dilimleri üretir.
+
+    Parametreler:
+        shape (tuple): Görüntü boyutu (satır, sütun, ...)
+        tile_size (int): Karo kenar uzunluğu
+        halo (int): Her karonun çevresine eklenecek kenar payı
+
+    Dönüş:
+        generator: (core, region, inner) üçlüleri
+            core: Karonun görüntüdeki bölgesi
+            region: Kenar payıyla birlikte okunacak bölge
+            inner: region üzerinde hesaplanan sonuçtan core'a karşılık gelen bölge
+    """
+    rows, cols = shape[:2]
+    for y0 in range(0, rows, tile_size):
+        y1 = min(rows, y0 + tile_size)
+        ys, ye = max(0, y0 - halo), min(rows, y1 + halo)
+        for x0 in range(0, cols, tile_size):
+            x1 = min(cols, x0 + tile_size)
+            xs, xe = max(0, x0 - halo), min(cols, x1 + halo)
+
+            core = (slice(y0, y1), slice(x0, x1))
+            region = (slice(ys, ye), slice(xs, xe))
+            inner = (slice(y0 - ys, y1 - ys), slice(x0 - xs, x1 - xs))
+            yield core, region, inner
+
+
+def _process_tile(image, func, post, tile):
+    """Tek bir karoyu kenar payıyla işler ve karonun kendi bölgesini döndürür."""
+    core, region, inner = tile
+    result = func(image[region])[inner]
+    return core, (post(result) if post is not None else result)
+
+
+def map_tiles(image, func, halo, tile_size=TILE_SIZE, workers=None, post=None):
+    """
+    func fonksiyonunu her karoya paralel olarak uygular.
+
+    Parametreler:
+        image (numpy.ndarray): Görüntü (numpy.memmap de olabilir)
+        func (callable): Boyutu koruyan işlem, func(bölge) -> bölge boyutunda sonuç
+        halo (int): Kenar payı (filtrenin komşuluk yarıçapı)
+        tile_size (int): Karo kenar uzunluğu
+        workers (int): İş parçacığı sayısı (None ise çekirdek sayısı)
+        post (callable): Kırpılmış karo sonucuna iş parçacığında uygulanacak ek işlem
+
+    Dönüş:
+        generator: (core, sonuç) çiftleri, karo sırasıyla
+    """
+    tiles = iter_tiles(image.shape, tile_size, halo)
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        yield from executor.map(partial(_process_tile, image, func, post), tiles)
+
+
+def run_tiled(image, func, halo, tile_size=TILE_SIZE, workers=None, out=None):
+    """
+    Boyutu koruyan bir işlemi görüntüye karolar halinde uygular. Sonuç, func(image) ile
+    bit düzeyinde aynıdır.
+
+    Parametreler:
+        image (numpy.ndarray): Görüntü
+        func (callable): Boyutu koruyan işlem
+        halo (int): Kenar payı (filtrenin komşuluk yarıçapı)
+        tile_size (int): Karo kenar uzunluğu
+        workers (int): İş parçacığı sayısı (None ise çekirdek sayısı)
+        out (numpy.ndarray): Sonucun yazılacağı dizi (None ise oluşturulur)
+
+    Dönüş:
+        numpy.ndarray: İşlenmiş görüntü
+    """
+    rows, cols = image.shape[:2]
+
+    # Tek karoya sığan görüntüde havuz kurmaya gerek yok
+    if rows <= tile_size and cols <= tile_size and out is None:
+        return func(image)
+
+    for core, result in map_tiles(image, func, halo, tile_size, workers):
+        if out is None:
+            # Çıktının türü ve kanal sayısı ilk karodan öğrenilir
+            out = np.empty((rows, cols) + result.shape[2:], dtype=result.dtype)
+        out[core] = result
+
+    return out
+
+
+def _run_gradient_filter(image, magnitude_func, halo, tile_size, workers, out):
+    """
+    Gradyan tabanlı kenar filtrelerini karolar halinde uygular.
+
+    Bu filtrelerin çıktısı tüm görüntünün en küçük ve en büyük gradyanına göre normalize
+    edildiği için iki geçiş yapılır: ilk geçişte yalnızca karoların uç değerleri toplanır,
+    ikinci geçişte gradyan yeniden hesaplanıp ortak ölçekle 8-bit'e çevrilir. Böylece
+    görüntü boyutunda float64 bir ara dizi tutulmaz.
+    """
+    def magnitude(tile):
+        return magnitude_func(cv2.cvtColor(tile, cv2.COLOR_RGB2GRAY))
+
+    rows, cols = image.shape[:2]
+    if rows <= tile_size and cols <= tile_size and out is None:
+        return goruntu_islemleri.gradient_to_rgb(magnitude(image))
+
+    # 1. geçiş: tüm görüntünün en küçük ve en büyük gradyanı
+    extrema = [result for _, result in map_tiles(image, magnitude, halo, tile_size, workers,
+                                                   post=lambda m: cv2.minMaxLoc(m)[:2])]
+    smin = min(e[0] for e in extrema)
+    smax = max(e[1] for e in extrema)
+
+    # cv2.normalize(..., 0, 255, NORM_MINMAX) ile aynı ölçek ve kaydırma
+    scale = 255 * (1.0 / (smax - smin) if smax - smin > np.finfo(np.float64).eps else 0)
+    shift = -smin * scale
+
+    def to_rgb(m):
+        return cv2.cvtColor((m * scale + shift).astype(np.uint8), cv2.COLOR_GRAY2RGB)
+
+    # 2. geçiş: ortak ölçekle 8-bit'e çevir
+    if out is None:
+        out = np.empty((rows, cols, 3), dtype=np.uint8)
+    for core, result in map_tiles(image, magnitude, halo, tile_size, workers, post=to_rgb):
+        out[core] = result
+
+    return out
+
+
+def _block_indices(start, stop, radius, size, period):
+    """
+    Karonun kenar payıyla birlikte bir eksendeki görüntü indislerini ve bunların bloktaki
+    konumlarını döndürür. Tam görüntü filtresindeki gibi görüntü DFT boyutunda (period)
+    dairesel kabul edilir: kenar payı görüntünün karşı kenarından alınır, sıfırla
+    genişletilmiş bölgeye (size <= indis < period) düşen konumlar sıfır kalır.
+    """
+    indices = np.arange(start - radius, stop + radius) % period
+    positions = np.flatnonzero(indices < size)
+    return indices[positions], positions
+
+
+def _filter_block(image, plan, post, tile):
+    """Bir karoyu kenar payıyla birlikte blok DFT'si ile filtreler (overlap-save)."""
+    backend, block_shape, kernel_spectrum, radius, dft_shape, homomorphic = plan
+    core, _, _ = tile
+    rows = core[0].stop - core[0].start
+    cols = core[1].stop - core[1].start
+
+    # Bloğun ilk satırı/sütunu karonun radius piksel öncesine karşılık gelir
+    row_indices, row_positions = _block_indices(core[0].start, core[0].stop, radius, image.shape[0], dft_shape[0])
+    col_indices, col_positions = _block_indices(core[1].start, core[1].stop, radius, image.shape[1], dft_shape[1])
+    source = image[np.ix_(row_indices, col_indices)]
+    positions = np.ix_(row_positions, col_positions)
+
+    results = []
+    for channel in frekans_alani._channels(source):
+        block = np.zeros(block_shape, np.float64 if homomorphic else np.float32)
+        block[positions] = np.log1p(channel, dtype=np.float64) if homomorphic else channel
+
+        spectrum = backend.multiply(backend.forward(block), kernel_spectrum)
+        filtered = backend.inverse(spectrum, block_shape, scale=True)[radius:radius + rows, radius:radius + cols]
+
+        # Tam görüntü filtresindeki gibi: genlik veya logaritmik dönüşümün tersi
+        results.append(np.expm1(filtered) if homomorphic else np.abs(filtered))
+
+    result = results[0] if source.ndim == 2 else np.dstack(results)
+    return core, post(result)
+
+
+def _run_frequency_filter(image, whole_func, kind, params, tile_size, workers, out, support):
+    """
+    Frekans alanı filtresini karolar halinde overlap-save yöntemiyle uygular.
+
+    Tam görüntü filtresinin çıktısı her kanalın en küçük ve en büyük değerine göre 0-255
+    aralığına normalize edildiği için gradyan filtrelerindeki gibi iki geçiş yapılır: ilk
+    geçişte karoların kanal başına uç değerleri toplanır, ikinci geçişte filtre yeniden
+    uygulanıp ortak ölçekle 8-bit'e çevrilir.
+    """
+    rows, cols = image.shape[:2]
+    if rows <= tile_size and cols <= tile_size and out is None:
+        return whole_func(image, *params)
+
+    # Maske, tam görüntünün (homomorfik filtrede genişletilmemiş) DFT boyutunda tanımlıdır
+    homomorphic = kind == "homomorphic"
+    dft_shape = (rows, cols) if homomorphic else frekans_alani.optimal_dft_shape((rows, cols))
+    # Yarıçap karo boyutuyla sınırlıdır; aksi halde blok (ve bellek) kesim frekansı küçüldükçe
+    # görüntü boyutuna kadar büyürdü
+    radius = frekans_alani.kernel_radius(dft_shape, kind, params, support, max_radius=tile_size)
+
+    # Karo kenar payından küçükse her blokta filtrelenen alanın çoğu kenar payı olur
+    tile_size = max(tile_size, 2 * radius)
+    block_shape = frekans_alani.optimal_dft_shape((tile_size + 2 * radius, tile_size + 2 * radius))
+    backend = fft_arka_uclari.backend_for(block_shape, np.float64 if homomorphic else np.float32)
+    kernel_spectrum = frekans_alani.block_kernel_spectrum(backend, block_shape, dft_shape, kind, radius, *params)
+    plan = (backend, block_shape, kernel_spectrum, radius, dft_shape, homomorphic)
+
+    def map_blocks(post):
+        # Kenar payı _filter_block içinde dairesel olarak okunur
+        tiles = iter_tiles(image.shape, tile_size, 0)
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            yield from executor.map(partial(_filter_block, image, plan, post), tiles)
+
+    # 1. geçiş: kanal başına en küçük ve en büyük değer
+    extrema = [result for _, result in map_blocks(lambda r: (r.min(axis=(0, 1)), r.max(axis=(0, 1))))]
+    smin = np.min([e[0] for e in extrema], axis=0)
+    smax = np.max([e[1] for e in extrema], axis=0)
+
+    # cv2.normalize(..., 0, 255, NORM_MINMAX) ile aynı ölçek ve kaydırma
+    spread = smax - smin
+    scale = 255 * np.where(spread > np.finfo(np.float64).eps, 1.0 / np.maximum(spread, np.finfo(np.float64).eps), 0)
+    shift = -smin * scale
+
+    # 2. geçiş: ortak ölçekle 8-bit'e çevir
+    if out is None:
+        out = np.empty(image.shape, dtype=np.uint8)
+    for core, result in map_blocks(lambda r: (r * scale + shift).astype(np.uint8)):
+        out[core] = result
+
+    return out
+
+
+# ------------ KAROLU FİLTRELER ------------
+# Fonksiyonlar goruntu_islemleri'ndeki karşılıklarıyla aynı parametreleri alır ve aynı sonucu
+# döndürür; ek olarak karo boyutu, iş parçacığı sayısı ve çıktı dizisi verilebilir.
+
+# Piksel bazındaki işlemler komşuluğa bakmadığı için kenar payı gerekmez
+
+def convert_to_gray(image, tile_size=TILE_SIZE, workers=None, out=None):
+    return run_tiled(image, goruntu_islemleri.convert_to_gray, 0, tile_size, workers, out)
+
+
+def negative_image(image, tile_size=TILE_SIZE, workers=None, out=None):
+    return run_tiled(image, goruntu_islemleri.negative_image, 0, tile_size, workers, out)
+
+
+def adjust_brightness(image, brightness, tile_size=TILE_SIZE, workers=None, out=None):
+    func = partial(goruntu_islemleri.adjust_brightness, brightness=brightness)
+    return run_tiled(image, func, 0, tile_size, workers, out)
+
+
+def apply_threshold(image, threshold, tile_size=TILE_SIZE, workers=None, out=None):
+    func = partial(goruntu_islemleri.apply_threshold, threshold=threshold)
+    return run_tiled(image, func, 0, tile_size, workers, out)
+
+
+def adjust_contrast(image, contrast, tile_size=TILE_SIZE, workers=None, out=None):
+    func = partial(goruntu_islemleri.adjust_contrast, contrast=contrast)
+    return run_tiled(image, func, 0, tile_size, workers, out)
+
+
+def adjust_gamma(image, gamma, tile_size=TILE_SIZE, workers=None, out=None):
+    func = partial(goruntu_islemleri.adjust_gamma, gamma=gamma)
+    return run_tiled(image, func, 0, tile_size, workers, out)
+
+
+def apply_mean_filter(image, kernel_size, tile_size=TILE_SIZE, workers=None, out=None):
+    func = partial(goruntu_islemleri.apply_mean_filter, kernel_size=kernel_size)
+    return run_tiled(image, func, kernel_size // 2, tile_size, workers, out)
+
+
+def apply_median_filter(image, kernel_size, tile_size=TILE_SIZE, workers=None, out=None):
+    func = partial(goruntu_islemleri.apply_median_filter, kernel_size=kernel_size)
+    return run_tiled(image, func, kernel_size // 2, tile_size, workers, out)
+
+
+def apply_gaussian_filter(image, kernel_size, sigma, tile_size=TILE_SIZE, workers=None, out=None):
+    func = partial(goruntu_islemleri.apply_gaussian_filter, kernel_size=kernel_size, sigma=sigma)
+    return run_tiled(image, func, kernel_size // 2, tile_size, workers, out)
+
+
+def apply_conservative_filter(image, window_size=3, tile_size=TILE_SIZE, workers=None, out=None):
+    func = partial(goruntu_islemleri.apply_conservative_filter, window_size=window_size)
+    return run_tiled(image, func, window_size // 2, tile_size, workers, out)
+
+
+def apply_crimmins_speckle(image, iterations=5, tile_size=TILE_SIZE, workers=None, out=None):
+    # Her iterasyon yalnızca 1 piksellik komşuluğa baktığı için etki alanı iterasyon sayısı kadardır
+    func = partial(goruntu_islemleri.apply_crimmins_speckle, iterations=iterations)
+    return run_tiled(image, func, iterations, tile_size, workers, out)
+
+
+def apply_erode(image, kernel_size, iterations=1, tile_size=TILE_SIZE, workers=None, out=None):
+    func = partial(goruntu_islemleri.apply_erode, kernel_size=kernel_size, iterations=iterations)
+    return run_tiled(image, func, iterations * (kernel_size // 2), tile_size, workers, out)
+
+
+def apply_dilate(image, kernel_size, iterations=1, tile_size=TILE_SIZE, workers=None, out=None):
+    func = partial(goruntu_islemleri.apply_dilate, kernel_size=kernel_size, iterations=iterations)
+    return run_tiled(image, func, iterations * (kernel_size // 2), tile_size, workers, out)
+
+
+def apply_laplacian_filter(image, tile_size=TILE_SIZE, workers=None, out=None):
+    # Mutlak değer alma piksel bazında olduğu için tek geçiş yeterlidir
+    return run_tiled(image, goruntu_islemleri.apply_laplacian_filter, 1, tile_size, workers, out)
+
+
+def apply_sobel_filter(image, tile_size=TILE_SIZE, workers=None, out=None):
+    return _run_gradient_filter(image, goruntu_islemleri.sobel_magnitude, 1, tile_size, workers, out)
+
+
+def apply_prewitt_filter(image, tile_size=TILE_SIZE, workers=None, out=None):
+    return _run_gradient_filter(image, goruntu_islemleri.prewitt_magnitude, 1, tile_size, workers, out)
+
+
+def apply_roberts_cross_filter(image, tile_size=TILE_SIZE, workers=None, out=None):
+    return _run_gradient_filter(image, goruntu_islemleri.roberts_cross_magnitude, 1, tile_size, workers, out)
+
+
+def apply_compass_filter(image, tile_size=TILE_SIZE, workers=None, out=None):
+    return _run_gradient_filter(image, goruntu_islemleri.compass_magnitude, 1, tile_size, workers, out)
+
+
+# Frekans alanı filtreleri overlap-save ile çalışır; sonuç tam görüntü filtresine yakındır
+# ancak birebir aynı değildir (bkz. modül açıklaması). support, çekirdek yarıçapını belirler
+# (bkz. frekans_alani.kernel_radius). İdeal filtreler (ilk dördü) varsayılan destekle
+# belirgin biçimde farklı sonuç verdiği için KAROLU_ISLEMLER'de yer almaz.
+
+def apply_fourier_lowpass(image, radius, tile_size=TILE_SIZE, workers=None, out=None,
+                          support=frekans_alani.KERNEL_SUPPORT):
+    return _run_frequency_filter(image, goruntu_islemleri.apply_fourier_lowpass, "ideal_lowpass", (radius,),
+                                 tile_size, workers, out, support)
+
+
+def apply_fourier_highpass(image, radius, tile_size=TILE_SIZE, workers=None, out=None,
+                           support=frekans_alani.KERNEL_SUPPORT):
+    return _run_frequency_filter(image, goruntu_islemleri.apply_fourier_highpass, "ideal_highpass", (radius,),
+                                 tile_size, workers, out, support)
+
+
+def apply_band_pass(image, inner_radius, outer_radius, tile_size=TILE_SIZE, workers=None, out=None,
+                    support=frekans_alani.KERNEL_SUPPORT):
+    return _run_frequency_filter(image, goruntu_islemleri.apply_band_pass, "band_pass", (inner_radius, outer_radius),
+                                 tile_size, workers, out, support)
+
+
+def apply_band_stop(image, inner_radius, outer_radius, tile_size=TILE_SIZE, workers=None, out=None,
+                    support=frekans_alani.KERNEL_SUPPORT):
+    return _run_frequency_filter(image, goruntu_islemleri.apply_band_stop, "band_stop", (inner_radius, outer_radius),
+                                 tile_size, workers, out, support)
+
+
+def apply_butterworth(image, filter_type, d0, n, tile_size=TILE_SIZE, workers=None, out=None,
+                      support=frekans_alani.KERNEL_SUPPORT):
+    kind = "butterworth_lowpass" if filter_type == 'lowpass' else "butterworth_highpass"
+    whole_func = partial(goruntu_islemleri.apply_butterworth, filter_type=filter_type)
+    return _run_frequency_filter(image, lambda image, d0, n: whole_func(image, d0=d0, n=n), kind, (d0, n),
+                                 tile_size, workers, out, support)
+
+
+def apply_gaussian_freq(image, filter_type, sigma, tile_size=TILE_SIZE, workers=None, out=None,
+                        support=frekans_alani.KERNEL_SUPPORT):
+    kind = "gaussian_lowpass" if filter_type == 'lowpass' else "gaussian_highpass"
+    whole_func = partial(goruntu_islemleri.apply_gaussian_freq, filter_type=filter_type)
+    return _run_frequency_filter(image, lambda image, sigma: whole_func(image, sigma=sigma), kind, (sigma,),
+                                 tile_size, workers, out, support)
+
+
+def apply_homomorphic(image, gamma_h, gamma_l, d0, tile_size=TILE_SIZE, workers=None, out=None,
+                      support=frekans_alani.KERNEL_SUPPORT):
+    return _run_frequency_filter(image, goruntu_islemleri.apply_homomorphic, "homomorphic", (gamma_h, gamma_l, d0),
+                                 tile_size, workers, out, support)
+
+
+# goruntu_islemleri.ISLEMLER adlarından karolu karşılıklara eşleme
+KAROLU_ISLEMLER = {
+    "gray": convert_to_gray,
+    "negative": negative_image,
+    "brightness": adjust_brightness,
+    "threshold": apply_threshold,
+    "contrast": adjust_contrast,
+    "gamma": adjust_gamma,
+    "mean": apply_mean_filter,
+    "median": apply_median_filter,
+    "gaussian": apply_gaussian_filter,
+    "conservative": apply_conservative_filter,
+    "crimmins": apply_crimmins_speckle,
+    "erode": apply_erode,
+    "dilate": apply_dilate,
+    "laplacian": apply_laplacian_filter,
+    "sobel": apply_sobel_filter,
+    "prewitt": apply_prewitt_filter,
+    "roberts": apply_roberts_cross_filter,
+    "compass": apply_compass_filter,
+    "butterworth": apply_butterworth,
+    "gaussian_freq": apply_gaussian_freq,
+    "homomorphic": apply_homomorphic,
+}
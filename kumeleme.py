@@ -0,0 +1,448 @@
+"""
+K-MEANS KÜMELEME
+----------------
+
+K-Means segmentasyonunun tam ve hızlı modlarını içerir.
+
+Tam mod (exact_kmeans), tüm pikselleri cv2.kmeans'e verir ve rastgele başlangıç merkezleriyle
+10 kez çalıştırır. 24 MP bir görüntüde bu, 24 milyon nokta üzerinde on ayrı kümeleme demektir.
+
+Hızlı mod (fast_kmeans) kümeleri görüntünün küçük bir örneklemi üzerinde bulur:
+1. Örnekleme: Pikseller tarama sırasında eşit aralıklı katmanlara bölünür ve her katmandan
+   rastgele bir piksel seçilir (katmanlı örnekleme); böylece örneklem görüntünün her
+   bölgesinden gelir. İstenirse tamamen rastgele örnekleme de yapılabilir.
+2. k-means++ başlangıcı: İlk merkez rastgele seçilir; sonraki her merkez, en yakın merkeze
+   olan uzaklığının karesiyle orantılı olasılıkla seçilir. Merkezler birbirinden uzak
+   başladığı için rastgele başlangıca göre çok daha az deneme yeterlidir.
+3. Mini-batch iyileştirme: Her adımda örneklemden küçük bir grup (batch) alınır, grubun
+   noktaları en yakın merkeze atanır ve merkezler o ana kadar atanan nokta sayısıyla
+   azalan bir öğrenme oranıyla grubun ortalamasına doğru kaydırılır.
+4. Atama: Tüm pikseller, parçalar halinde tek bir vektörel en yakın merkez hesabıyla
+   (||x - c||² = ||x||² - 2 x·c + ||c||²) kümelere atanır.
+
+Birden fazla deneme yapılırsa örneklem üzerindeki toplam kare hatası (inertia) en küçük olan
+merkezler kullanılır.
+
+Palet modu (palette_kmeans) pikseller yerine görüntünün renk histogramını kümeler. Bir
+fotoğrafta farklı renk sayısı piksel sayısından çok daha azdır; renkler kanal başına 5 bite
+indirgendiğinde (nicemleme) en fazla 32³ renk kalır. Daha yüksek bit sayısı paleti inceltir
+ve inertia değerini biraz düşürür, ancak renkli görüntülerde paleti on kat büyütür; 6 bitte
+palet modu tam moddan bile yavaş olabilir. Her renk kutusu, içindeki
+piksellerin ortalama rengiyle ve piksel sayısı ağırlığıyla temsil edilir; ağırlıklı K-Means
+(k-means++ başlangıcı + Lloyd iterasyonları) bu küçük palet üzerinde çalışır. Pikseller
+kümelere, renk kutusundan küme indisine giden bir arama tablosuyla (LUT) atanır.
+
+compare_with_exact bir hızlı modun süresini ve tüm pikseller üzerindeki inertia değerini
+tam modla karşılaştırır.
+"""
+
+import time
+
+import cv2
+import numpy as np
+
+# Hızlı modun varsayılan örneklem büyüklüğü ve deneme sayısı
+DEFAULT_SAMPLE_SIZE = 100000
+DEFAULT_ATTEMPTS = 3
+
+# Mini-batch iyileştirmenin grup büyüklüğü, en fazla adım sayısı ve durma eşiği
+# (merkezlerin bir adımdaki en büyük kayması, renk birimi cinsinden)
+BATCH_SIZE = 4096
+MAX_ITERATIONS = 100
+TOLERANCE = 0.05
+
+# Palet modunun varsayılan nicemleme biti (kanal başına) ve Lloyd iterasyonlarının en fazla sayısı.
+# 5 bitte palet en fazla 32³ = 32768 renktir; renkli bir fotoğrafta 6 bit 100-200 bin renk
+# verebilir ve palet modu tam moddan yavaşlar. 30 iterasyondan sonra inertia en fazla
+# on binde bir oranında değişir.
+DEFAULT_PALETTE_BITS = 5
+LLOYD_MAX_ITERATIONS = 30
+
+# Tüm piksellerin atanmasında bir seferde işlenen piksel sayısı
+# (1 milyon piksel ve 16 küme için uzaklık matrisi ~64 MB yer kaplar)
+ASSIGN_CHUNK = 1 << 20
+
+
+def pixel_data(image):
+    """Görüntünün piksellerini (N, kanal) boyutunda bir görünüm olarak döndürür (kopyalamadan)."""
+    return image.reshape((-1, image.shape[2] if image.ndim == 3 else 1))
+
+
+def exact_kmeans(pixels, k_clusters, seed=0):
+    """
+    Tüm piksellerle cv2.kmeans (rastgele başlangıç, 10 deneme). OpenCV'nin rastgele sayı
+    üreteci seed ile başlatıldığı için aynı girdi her zaman aynı sonucu verir (geri alma
+    geçmişi adımı yeniden üretebilir).
+
+    Parametreler:
+        pixels (numpy.ndarray): (N, kanal) boyutunda piksel verisi
+        k_clusters (int): Küme sayısı
+        seed (int): OpenCV rastgele sayı üretecinin tohumu
+
+    Dönüş:
+        labels: (N,) boyutunda küme indisleri
+        centers: (k, kanal) boyutunda float32 küme merkezleri
+        inertia: Her pikselin merkezine olan uzaklığının karelerinin toplamı
+    """
+    data = np.float32(pixels)  # cv2.kmeans için float32 olmalı
+
+    # Kümeleme kriterleri: 10 iterasyon veya epsilon=1.0
+    criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 10, 1.0)
+    attempts = 10  # Farklı başlangıç merkezleriyle 10 kez çalıştır
+
+    # Üreteç iş parçacığına özgüdür; kmeans ile aynı iş parçacığında başlatılır
+    cv2.setRNGSeed(seed)
+    # labels: her pikselin hangi kümeye ait olduğu, centers: küme merkezlerinin renkleri
+    inertia, labels, centers = cv2.kmeans(data, k_clusters, None, criteria, attempts, cv2.KMEANS_RANDOM_CENTERS)
+    return labels.ravel(), centers, inertia
+
+
+def sample_pixels(pixels, sample_size, rng, stratified=True):
+    """
+    Piksellerden bir örneklem seçer.
+
+    Parametreler:
+        pixels (numpy.ndarray): (N, kanal) boyutunda piksel verisi
+        sample_size (int): Örneklem büyüklüğü (N'den büyükse tüm pikseller kullanılır)
+        rng (numpy.random.Generator): Rastgele sayı üreteci
+        stratified (bool): True ise tarama sırasında eşit aralıklı her katmandan bir piksel,
+            False ise tamamen rastgele pikseller seçilir
+
+    Dönüş:
+        numpy.ndarray: (örneklem, kanal) boyutunda float32 örneklem
+    """
+    count = len(pixels)
+    if sample_size >= count:
+        return np.float32(pixels)
+
+    if stratified:
+        stride = count / sample_size
+        indices = ((np.arange(sample_size) + rng.random(sample_size)) * stride).astype(np.int64)
+    else:
+        indices = rng.choice(count, sample_size, replace=False)
+    return np.float32(pixels[np.sort(indices)])
+
+
+def _squared_distances(points, centers):
+    """Her noktanın her merkeze olan uzaklığının karesi, (nokta, merkez) boyutunda."""
+    distances = (points ** 2).sum(axis=1)[:, np.newaxis] - 2 * points @ centers.T + (centers ** 2).sum(axis=1)
+    # Yuvarlama hataları küçük negatif değerler üretebilir
+    return np.maximum(distances, 0, out=distances)
+
+
+def kmeans_plus_plus(points, k_clusters, rng, weights=None):
+    """
+    k-means++ ile başlangıç merkezlerini seçer.
+
+    Parametreler:
+        points (numpy.ndarray): (n, kanal) boyutunda noktalar
+        k_clusters (int): Küme sayısı
+        rng (numpy.random.Generator): Rastgele sayı üreteci
+        weights (numpy.ndarray): İsteğe bağlı; (n,) boyutunda nokta ağırlıkları (örn. bir
+            renkteki piksel sayısı). Seçim olasılığı ağırlık ile uzaklık karesinin çarpımıyla
+            orantılıdır.
+
+    Dönüş:
+        numpy.ndarray: (k, kanal) boyutunda float32 merkezler
+    """
+    centers = np.empty((k_clusters, points.shape[1]), np.float32)
+    first = rng.choice(len(points), p=weights / weights.sum()) if weights is not None else rng.integers(len(points))
+    centers[0] = points[first]
+
+    # Her noktanın şimdiye kadar seçilen merkezlere olan en küçük uzaklığının karesi
+    closest = _squared_distances(points, centers[:1]).ravel()
+    for i in range(1, k_clusters):
+        scores = closest * weights if weights is not None else closest
+        total = scores.sum()
+        # Tüm noktalar seçilmiş merkezlerle çakışıyorsa (az renkli görüntü) rastgele seç
+        index = rng.choice(len(points), p=scores / total) if total > 0 else rng.integers(len(points))
+        centers[i] = points[index]
+        np.minimum(closest, _squared_distances(points, centers[i:i + 1]).ravel(), out=closest)
+    return centers
+
+
+def mini_batch_kmeans(points, centers, rng, batch_size=BATCH_SIZE, max_iterations=MAX_ITERATIONS,
+                      tolerance=TOLERANCE):
+    """
+    Merkezleri mini-batch adımlarıyla iyileştirir. Her merkezin öğrenme oranı, o merkeze o
+    ana kadar atanan nokta sayısının tersidir; böylece merkez, kendisine atanan tüm
+    noktaların ortalamasına yakınsar.
+
+    Parametreler:
+        points (numpy.ndarray): (n, kanal) boyutunda float32 noktalar
+        centers (numpy.ndarray): (k, kanal) boyutunda başlangıç merkezleri
+        rng (numpy.random.Generator): Rastgele sayı üreteci
+        batch_size (int): Her adımda kullanılan nokta sayısı
+        max_iterations (int): En fazla adım sayısı
+        tolerance (float): Merkezlerin bir adımdaki en büyük kayması bu değerin altına
+            düşünce durulur
+
+    Dönüş:
+        numpy.ndarray: (k, kanal) boyutunda float32 merkezler
+    """
+    centers = np.array(centers, np.float64)
+    k_clusters = len(centers)
+    counts = np.zeros(k_clusters)
+
+    for _ in range(max_iterations):
+        batch = points[rng.integers(len(points), size=min(batch_size, len(points)))]
+        labels = _squared_distances(batch, centers).argmin(axis=1)
+
+        batch_counts = np.bincount(labels, minlength=k_clusters)
+        batch_sums = np.stack([np.bincount(labels, weights=batch[:, c], minlength=k_clusters)
+                               for c in range(batch.shape[1])], axis=1)
+
+        # c <- c + (grup toplamı - n * c) / toplam sayı; grup noktası almayan merkez değişmez
+        counts += batch_counts
+        assigned = batch_counts > 0
+        step = (batch_sums[assigned] - batch_counts[assigned, np.newaxis] * centers[assigned]) / counts[assigned, np.newaxis]
+        centers[assigned] += step
+
+        if not len(step) or np.abs(step).max() < tolerance:
+            break
+
+    return np.float32(centers)
+
+
+def assign_labels(pixels, centers, chunk=ASSIGN_CHUNK):
+    """
+    Tüm pikselleri en yakın merkeze atar.
+
+    Parametreler:
+        pixels (numpy.ndarray): (N, kanal) boyutunda piksel verisi
+        centers (numpy.ndarray): (k, kanal) boyutunda merkezler
+        chunk (int): Bir seferde işlenen piksel sayısı
+
+    Dönüş:
+        labels: (N,) boyutunda int32 küme indisleri
+        inertia: Her pikselin merkezine olan uzaklığının karelerinin toplamı
+    """
+    centers = np.float32(centers)
+    labels = np.empty(len(pixels), np.int32)
+    inertia = 0.0
+    for start in range(0, len(pixels), chunk):
+        distances = _squared_distances(np.float32(pixels[start:start + chunk]), centers)
+        nearest = distances.argmin(axis=1)
+        labels[start:start + chunk] = nearest
+        inertia += float(distances[np.arange(len(nearest)), nearest].sum(dtype=np.float64))
+    return labels, inertia
+
+
+def fast_kmeans(pixels, k_clusters, sample_size=DEFAULT_SAMPLE_SIZE, attempts=DEFAULT_ATTEMPTS, seed=0,
+                stratified=True):
+    """
+    Örneklem üzerinde k-means++ ve mini-batch ile kümeleme, ardından tüm piksellerin ataması.
+
+    Parametreler:
+        pixels (numpy.ndarray): (N, kanal) boyutunda piksel verisi
+        k_clusters (int): Küme sayısı
+        sample_size (int): Kümelerin bulunduğu örneklemin büyüklüğü
+        attempts (int): Farklı başlangıçlarla deneme sayısı
+        seed (int): Rastgele sayı üreteci tohumu (aynı tohum aynı sonucu verir)
+        stratified (bool): Katmanlı örnekleme kullan (bkz. sample_pixels)
+
+    Dönüş:
+        labels: (N,) boyutunda küme indisleri
+        centers: (k, kanal) boyutunda float32 küme merkezleri
+        inertia: Her pikselin merkezine olan uzaklığının karelerinin toplamı
+    """
+    rng = np.random.default_rng(seed)
+    sample = sample_pixels(pixels, sample_size, rng, stratified)
+
+    best_centers, best_inertia = None, np.inf
+    for _ in range(max(1, attempts)):
+        centers = mini_batch_kmeans(sample, kmeans_plus_plus(sample, k_clusters, rng), rng)
+        inertia = _squared_distances(sample, centers).min(axis=1).sum(dtype=np.float64)
+        if inertia < best_inertia:
+            best_centers, best_inertia = centers, inertia
+
+    labels, inertia = assign_labels(pixels, best_centers)
+    return labels, best_centers, inertia
+
+
+def color_palette(pixels, bits=DEFAULT_PALETTE_BITS):
+    """
+    Piksellerin renk histogramını (paletini) çıkarır. Renkler kanal başına bits bite
+    nicemlenir; aynı kutuya düşen pikseller tek bir palet girdisinde toplanır.
+
+    Parametreler:
+        pixels (numpy.ndarray): (N, kanal) boyutunda uint8 piksel verisi (bkz. pixel_data);
+            gri görüntülerde (N, 1) veya (N,)
+        bits (int): Kanal başına nicemleme biti (1-8; 8 ise nicemleme yapılmaz)
+
+    Dönüş:
+        bins: (N,) boyutunda, her pikselin renk kutusu indisi
+        bin_entries: Renk kutusu indisinden palet girdisine arama tablosu
+        palette: (M, kanal) boyutunda, her girdideki piksellerin ortalama rengi (float64)
+        weights: (M,) boyutunda, her girdideki piksel sayısı
+        scatter: Piksellerin kendi girdilerinin ortalamasına olan uzaklıklarının karelerinin
+            toplamı (inertia hesabı için)
+
+    Hata:
+        ValueError: bits 1-8 aralığında değilse veya pikseller en fazla 4 kanallı, (N, kanal)
+            boyutunda uint8 veri değilse (örn. pixel_data'dan geçirilmemiş bir görüntü)
+    """
+    if not 1 <= bits <= 8:
+        raise ValueError(f"Nicemleme biti 1 ile 8 arasında olmalıdır: {bits}")
+    if pixels.ndim == 1:
+        pixels = pixels[:, np.newaxis]
+    # Renk kodu kanal başına bits bit kullanır; en fazla 4 kanal 64 bitlik koda sığar
+    if pixels.ndim != 2 or pixels.shape[1] > 4 or pixels.dtype != np.uint8:
+        raise ValueError(f"Piksel verisi (N, kanal) boyutunda (en fazla 4 kanal) uint8 olmalıdır: "
+                         f"{pixels.shape}, {pixels.dtype}")
+
+    channels = pixels.shape[1]
+    shift = 8 - bits
+    codes = np.zeros(len(pixels), np.int64)
+    for c in range(channels):
+        codes |= (pixels[:, c] >> shift).astype(np.int64) << (bits * (channels - 1 - c))
+
+    # 21 bite kadar (3 kanalda 7 bit) tüm kutular için sayaç tutulabilir (en fazla 2 milyon);
+    # daha fazlasında (örn. 3 kanalda 8 bit, 16 milyon kutu) yalnızca görüntüde geçen renkler
+    # kullanılır
+    if bits * channels <= 21:
+        bins, bin_count = codes, 1 << (bits * channels)
+    else:
+        _, bins = np.unique(codes, return_inverse=True)
+        bins = bins.ravel()
+        bin_count = bins.max() + 1
+
+    counts = np.bincount(bins, minlength=bin_count)
+    sums = np.stack([np.bincount(bins, weights=pixels[:, c], minlength=bin_count) for c in range(channels)], axis=1)
+    squares = np.bincount(bins, weights=np.square(pixels, dtype=np.float64).sum(axis=1), minlength=bin_count)
+
+    # Boş kutular atılır
+    used = np.flatnonzero(counts)
+    weights = counts[used]
+    palette = sums[used] / weights[:, np.newaxis]
+    scatter = float(squares[used].sum() - (weights * (palette ** 2).sum(axis=1)).sum())
+
+    bin_entries = np.zeros(bin_count, np.int32)
+    bin_entries[used] = np.arange(len(used))
+    return bins, bin_entries, palette, weights, max(scatter, 0.0)
+
+
+def weighted_kmeans(points, weights, k_clusters, rng, attempts=DEFAULT_ATTEMPTS,
+                    max_iterations=LLOYD_MAX_ITERATIONS, tolerance=TOLERANCE):
+    """
+    Ağırlıklı noktalar üzerinde K-Means (ağırlıklı k-means++ başlangıcı + Lloyd iterasyonları).
+    En yakın merkez araması float32, merkez güncellemesi float64 ile yapılır.
+
+    Parametreler:
+        points (numpy.ndarray): (n, kanal) boyutunda noktalar
+        weights (numpy.ndarray): (n,) boyutunda nokta ağırlıkları
+        k_clusters (int): Küme sayısı
+        rng (numpy.random.Generator): Rastgele sayı üreteci
+        attempts (int): Farklı başlangıçlarla deneme sayısı
+        max_iterations (int): Deneme başına en fazla Lloyd iterasyonu
+        tolerance (float): Merkezlerin en büyük kayması bu değerin altına düşünce durulur
+
+    Dönüş:
+        labels: (n,) boyutunda küme indisleri
+        centers: (k, kanal) boyutunda float32 küme merkezleri
+        inertia: Ağırlıklı toplam kare hata
+    """
+    points = np.asarray(points, np.float64)
+    weights = np.asarray(weights, np.float64)
+    # En yakın merkez araması (iterasyonların en pahalı adımı) float32 ile yapılır; merkezler
+    # ağırlıklı toplamlardan float64 ile hesaplanır
+    points32 = np.float32(points)
+    best = None
+    for _ in range(max(1, attempts)):
+        centers = np.float64(kmeans_plus_plus(points32, k_clusters, rng, weights))
+        for _ in range(max_iterations):
+            labels = _squared_distances(points32, np.float32(centers)).argmin(axis=1)
+            totals = np.bincount(labels, weights=weights, minlength=k_clusters)
+            sums = np.stack([np.bincount(labels, weights=weights * points[:, c], minlength=k_clusters)
+                             for c in range(points.shape[1])], axis=1)
+
+            # Noktası kalmayan küme merkezi yerinde bırakılır
+            assigned = totals > 0
+            updated = centers.copy()
+            updated[assigned] = sums[assigned] / totals[assigned, np.newaxis]
+            shift = np.abs(updated - centers).max()
+            centers = updated
+            if shift < tolerance:
+                break
+
+        distances = _squared_distances(points, centers)
+        labels = distances.argmin(axis=1)
+        inertia = float((distances[np.arange(len(points)), labels] * weights).sum())
+        if best is None or inertia < best[2]:
+            best = (labels, np.float32(centers), inertia)
+    return best
+
+
+def palette_kmeans(pixels, k_clusters, bits=DEFAULT_PALETTE_BITS, attempts=DEFAULT_ATTEMPTS, seed=0):
+    """
+    Renk paleti üzerinde ağırlıklı K-Means; pikseller arama tablosuyla kümelere atanır.
+    Aynı renk kutusundaki tüm pikseller aynı kümeye düşer.
+
+    Parametreler:
+        pixels (numpy.ndarray): (N, kanal) boyutunda uint8 piksel verisi
+        k_clusters (int): Küme sayısı
+        bits (int): Kanal başına nicemleme biti (bkz. color_palette)
+        attempts (int): Farklı başlangıçlarla deneme sayısı
+        seed (int): Rastgele sayı üreteci tohumu (aynı tohum aynı sonucu verir)
+
+    Dönüş:
+        labels: (N,) boyutunda küme indisleri
+        centers: (k, kanal) boyutunda float32 küme merkezleri
+        inertia: Her pikselin merkezine olan uzaklığının karelerinin toplamı
+    """
+    bins, bin_entries, palette, weights, scatter = color_palette(pixels, bits)
+    entry_labels, centers, palette_inertia = weighted_kmeans(palette, weights, k_clusters,
+                                                             np.random.default_rng(seed), attempts)
+
+    # Renk kutusu -> küme indisi tablosu; her piksel tek bir tablo okumasıyla atanır
+    bin_labels = entry_labels.astype(np.int32)[bin_entries]
+    labels = bin_labels[bins]
+
+    # Pikselin merkezine uzaklığının karesi = kutu ortalamasının merkeze uzaklığının karesi
+    # + pikselin kutu ortalamasına uzaklığının karesi (kutu içi toplamlar)
+    return labels, centers, palette_inertia + scatter
+
+
+def segment(image, labels, centers):
+    """Her pikseli kümesinin merkez rengiyle boyar."""
+    centers = np.uint8(centers)
+    return centers[labels].reshape(image.shape)
+
+
+def compare_with_exact(image, k_clusters, sample_size=DEFAULT_SAMPLE_SIZE, attempts=DEFAULT_ATTEMPTS, seed=0,
+                       method=None):
+    """
+    Hızlı modu tam modla karşılaştırır.
+
+    Parametreler:
+        image (numpy.ndarray): RGB görüntü
+        k_clusters (int): Küme sayısı
+        sample_size, attempts, seed: Hızlı modun parametreleri (bkz. fast_kmeans)
+        method (callable): İsteğe bağlı; fast_kmeans yerine karşılaştırılacak mod,
+            method(pikseller, k) -> (labels, centers, inertia) (örn. palette_kmeans)
+
+    Dönüş:
+        dict: exact_time, fast_time (sn), exact_inertia, fast_inertia (tüm pikseller
+        üzerinde toplam kare hata), inertia_ratio (hızlı / tam) ve speedup (tam / hızlı süre)
+    """
+    pixels = pixel_data(image)
+
+    start = time.perf_counter()
+    _, _, exact_inertia = exact_kmeans(pixels, k_clusters)
+    exact_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    if method is None:
+        _, _, fast_inertia = fast_kmeans(pixels, k_clusters, sample_size, attempts, seed)
+    else:
+        _, _, fast_inertia = method(pixels, k_clusters)
+    fast_time = time.perf_counter() - start
+
+    return {
+        "exact_time": exact_time,
+        "fast_time": fast_time,
+        "exact_inertia": exact_inertia,
+        "fast_inertia": fast_inertia,
+        "inertia_ratio": fast_inertia / exact_inertia if exact_inertia else 1.0,
+        "speedup": exact_time / fast_time if fast_time else float("inf"),
+    }
@@ -0,0 +1,239 @@
+"""
+NOKTA İŞLEMLERİ (LOOKUP TABLE)
+------------------------------
+
+Parlaklık, kontrast, gama, negatif, eşikleme ve histogram eşitleme; çıktı pikselinin
+yalnızca aynı pikselin 0-255 arasındaki değerine bağlı olduğu "nokta işlemleri"dir.
+Bu tür bir işlem 256 elemanlı bir arama tablosu (lookup table, LUT) ile tam olarak
+ifade edilebilir: çıktı = lut[girdi].
+
+İki LUT art arda uygulanacağına bunların bileşimi tek bir LUT olarak hesaplanabilir:
+    lut_toplam = lut2[lut1]
+Bu nedenle herhangi uzunluktaki bir nokta işlemi zinciri, görüntü üzerinde tek bir
+geçişe (cv2.LUT) indirgenir. Her işlem için ayrı tam boyutlu ara görüntü oluşturulmaz.
+
+Eşikleme ve histogram eşitleme, uygulamadaki karşılıklarıyla aynı sonucu vermek için
+önce gri tonlamaya çevirir. Gri dönüşüm kanallar arası bir işlem olduğu için LUT ile
+ifade edilemez; zincir bu noktada ikiye bölünür: gri dönüşümden önceki işlemler RGB
+görüntüye, sonrakiler tek kanallı gri görüntüye tek bir LUT olarak uygulanır.
+
+Histogram eşitleme tablosu görüntünün histogramına bağlıdır. Histogram gri görüntüden
+bir kez hesaplanır; zincirdeki önceki işlemlerin etkisi görüntü yerine histogram
+üzerinde (256 eleman) uygulanır.
+
+Tablolar, OpenCV fonksiyonlarının yuvarlama ve doyurma (saturation) davranışıyla aynı
+şekilde hesaplanır. Bu sayede sonuç, işlemlerin tek tek uygulanmasıyla birebir aynıdır.
+"""
+
+from functools import lru_cache
+from itertools import takewhile
+
+import cv2
+import numpy as np
+
+# Önbellekte tutulacak en fazla tablo sayısı (her tablo yalnızca 256 bayttır)
+LUT_CACHE_SIZE = 256
+
+# Birim tablo: her değeri kendisine eşler
+IDENTITY_LUT = np.arange(256, dtype=np.uint8)
+IDENTITY_LUT.setflags(write=False)
+
+
+def _read_only(lut):
+    """Önbellekteki tablonun yanlışlıkla değiştirilmesini engeller."""
+    lut.setflags(write=False)
+    return lut
+
+
+@lru_cache(maxsize=1)
+def negative_lut():
+    """
+    Negatif tablosu: f(x) = 255 - x
+
+    Dönüş:
+        numpy.ndarray: 256 elemanlı, salt okunur uint8 tablo
+    """
+    return _read_only(255 - IDENTITY_LUT)
+
+
+@lru_cache(maxsize=LUT_CACHE_SIZE)
+def brightness_lut(brightness):
+    """
+    Parlaklık tablosu: f(x) = x + brightness (0-255 aralığında doyurulur)
+
+    Parametreler:
+        brightness (int): Parlaklık değişimi
+
+    Dönüş:
+        numpy.ndarray: 256 elemanlı, salt okunur uint8 tablo
+    """
+    values = IDENTITY_LUT.astype(np.int32) + int(brightness)
+    return _read_only(np.clip(values, 0, 255).astype(np.uint8))
+
+
+@lru_cache(maxsize=LUT_CACHE_SIZE)
+def contrast_lut(contrast):
+    """
+    Kontrast tablosu: f(x) = |contrast * x| (cv2.convertScaleAbs ile aynı yuvarlama)
+
+    Parametreler:
+        contrast (float): Kontrast faktörü (çarpan)
+
+    Dönüş:
+        numpy.ndarray: 256 elemanlı, salt okunur uint8 tablo
+    """
+    # Tabloyu aynı OpenCV fonksiyonuyla hesaplamak yuvarlamanın birebir aynı olmasını sağlar
+    return _read_only(cv2.convertScaleAbs(IDENTITY_LUT.reshape(1, -1), alpha=contrast, beta=0).ravel())
+
+
+@lru_cache(maxsize=LUT_CACHE_SIZE)
+def gamma_lut(gamma):
+    """
+    Gama düzeltme tablosu: f(x) = 255 * (x / 255) ^ (1 / gamma)
+
+    1.0'dan büyük gama değerleri koyu tonları aydınlatır, küçük değerler koyulaştırır.
+
+    Parametreler:
+        gamma (float): Gama değeri (pozitif)
+
+    Dönüş:
+        numpy.ndarray: 256 elemanlı, salt okunur uint8 tablo
+
+    Hata:
+        ValueError: Gama pozitif değilse
+    """
+    if gamma <= 0:
+        raise ValueError("Gama değeri pozitif olmalıdır")
+
+    values = 255.0 * (IDENTITY_LUT / 255.0) ** (1.0 / gamma)
+    return _read_only(np.clip(np.rint(values), 0, 255).astype(np.uint8))
+
+
+@lru_cache(maxsize=LUT_CACHE_SIZE)
+def threshold_lut(threshold):
+    """
+    İkili eşikleme tablosu: f(x) = 255 if x > threshold else 0 (cv2.THRESH_BINARY)
+
+    Parametreler:
+        threshold (int): Eşik değeri
+
+    Dönüş:
+        numpy.ndarray: 256 elemanlı, salt okunur uint8 tablo
+    """
+    _, lut = cv2.threshold(IDENTITY_LUT.reshape(1, -1), threshold, 255, cv2.THRESH_BINARY)
+    return _read_only(lut.ravel())
+
+
+def equalization_lut(histogram):
+    """
+    Verilen histogram için histogram eşitleme tablosunu hesaplar. Tablo, cv2.equalizeHist
+    fonksiyonunun kullandığı tabloyla birebir aynıdır.
+
+    Parametreler:
+        histogram (numpy.ndarray): 256 elemanlı piksel sayıları
+
+    Dönüş:
+        numpy.ndarray: 256 elemanlı uint8 tablo
+    """
+    histogram = np.asarray(histogram, dtype=np.int64)
+    total = int(histogram.sum())
+    if total == 0:
+        return IDENTITY_LUT.copy()
+
+    # İlk dolu kutu 0'a eşlenir; tüm pikseller aynı değerdeyse görüntü değişmez
+    first = int(np.flatnonzero(histogram)[0])
+    if histogram[first] == total:
+        return np.full(256, first, dtype=np.uint8)
+
+    # OpenCV ölçeği ve çarpımı float32 ile hesaplar, sonucu en yakın çift sayıya yuvarlar
+    scale = np.float32(255.0 / (total - histogram[first]))
+    cumulative = (np.cumsum(histogram) - histogram[first]).astype(np.float32)
+    lut = np.clip(np.rint(cumulative * scale), 0, 255).astype(np.uint8)
+    lut[:first + 1] = 0
+    return lut
+
+
+# İşlem adı -> (tablo fonksiyonu, gri dönüşüm gerektirir mi)
+# Adlar goruntu_islemleri.ISLEMLER içindeki adlarla aynıdır. "gray" ve "equalize" için
+# tablo fonksiyonu yoktur: gri dönüşüm birim tablodur, eşitleme tablosu histograma bağlıdır.
+NOKTA_ISLEMLERI = {
+    "gray": (None, True),
+    "negative": (negative_lut, False),
+    "brightness": (brightness_lut, False),
+    "contrast": (contrast_lut, False),
+    "gamma": (gamma_lut, False),
+    "threshold": (threshold_lut, True),
+    "equalize": (None, True),
+}
+
+
+def compile_lut(chain, histogram=None):
+    """
+    Bir nokta işlemi zincirini tek bir tabloya derler.
+
+    Parametreler:
+        chain (list): (işlem adı, parametreler) çiftleri
+        histogram (numpy.ndarray): Zincirin girdisinin histogramı. Yalnızca zincirde
+            "equalize" varsa gereklidir.
+
+    Dönüş:
+        numpy.ndarray: 256 elemanlı uint8 tablo
+
+    Hata:
+        ValueError: İşlem bir nokta işlemi değilse veya eşitleme için histogram verilmemişse
+    """
+    lut = IDENTITY_LUT
+    for name, params in chain:
+        if name not in NOKTA_ISLEMLERI:
+            raise ValueError(f"'{name}' bir nokta işlemi değil")
+
+        if name == "equalize":
+            if histogram is None:
+                raise ValueError("Histogram eşitleme için girdi histogramı gerekli")
+            # Önceki işlemlerden sonraki histogram: her kutunun sayısı eşlendiği değere eklenir
+            current = np.bincount(lut, weights=histogram, minlength=256)
+            step = equalization_lut(current)
+        elif name == "gray":
+            continue
+        else:
+            step = NOKTA_ISLEMLERI[name][0](*params)
+
+        # Bileşim: önce mevcut tablo, sonra yeni adım
+        lut = step[lut]
+
+    return lut
+
+
+def apply_point_chain(image, chain):
+    """
+    Bir nokta işlemi zincirini görüntüye tek geçişte uygular. Sonuç, işlemlerin
+    goruntu_islemleri içindeki karşılıklarıyla sırayla uygulanmasıyla aynıdır.
+
+    cv2.LUT: Her pikseli tablodaki karşılığıyla değiştiren OpenCV fonksiyonu
+
+    Parametreler:
+        image (numpy.ndarray): RGB uint8 görüntü
+        chain (list): (işlem adı, parametreler) çiftleri, örn.
+            [("brightness", (20,)), ("contrast", (1.5,)), ("gamma", (0.8,))]
+
+    Dönüş:
+        numpy.ndarray: İşlenmiş görüntü
+    """
+    # Gri dönüşüm gerektiren ilk işleme kadar olan kısım renkli görüntüye uygulanır
+    color_chain = list(takewhile(lambda op: not NOKTA_ISLEMLERI[op[0]][1], chain))
+    gray_chain = chain[len(color_chain):]
+
+    if not gray_chain:
+        return cv2.LUT(image, compile_lut(color_chain))
+
+    if color_chain:
+        image = cv2.LUT(image, compile_lut(color_chain))
+    gray_image = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+
+    histogram = None
+    if any(name == "equalize" for name, _ in gray_chain):
+        histogram = np.bincount(gray_image.ravel(), minlength=256)
+
+    result = cv2.LUT(gray_image, compile_lut(gray_chain, histogram))
+    # Tek kanallı görüntüyü 3 kanallı görüntüye dönüştür (gösterim için)
+    return cv2.cvtColor(result, cv2.COLOR_GRAY2RGB)
@@ -0,0 +1,215 @@
+"""
+İŞLEM TARİFLERİ (RECIPE)
+------------------------
+
+Arayüzde uygulanan işlemler, işlem geçmişinden (bkz. gecmis) bir "tarif" olarak dışa
+aktarılabilir. Tarif; işlem adlarını (goruntu_islemleri.ISLEMLER), parametrelerini ve
+işlemin orijinal görüntüye mi yoksa bir önceki sonuca mı uygulandığını içerir. Aynı tarif
+daha sonra arayüz olmadan, başka görüntülere tam hızda uygulanabilir:
+
+    python toplu_isleme.py "taramalar/*.png" -o sonuclar --recipe ayarlar.json
+
+Tarif dosyası biçimi (JSON):
+    {
+      "version": 1,
+      "steps": [
+        {"op": "gaussian", "params": [5, 1.2], "from_original": false},
+        {"op": "canny", "params": [100, 200], "from_original": false}
+      ]
+    }
+
+Uzantısı .yaml veya .yml olan dosyalar YAML olarak okunur ve yazılır; bunun için PyYAML
+kurulu olmalıdır (pip install pyyaml). PyYAML isteğe bağlıdır; JSON her zaman desteklenir.
+
+Tüm işlemler aynı parametrelerle aynı sonucu verir; rastgele başlangıçlı K-Means modları
+da sabit tohumla çalıştığı için bir tarif aynı görüntüde her zaman aynı sonucu üretir.
+"""
+
+import json
+import os
+
+import goruntu_islemleri
+
+try:
+    import yaml
+except ImportError:  # YAML desteği isteğe bağlıdır
+    yaml = None
+
+# Tarif dosyası biçiminin sürümü
+RECIPE_VERSION = 1
+
+# Orijinal görüntüye dönüş adımının tarifteki adı
+ORIGINAL_OP = "original"
+
+YAML_EXTENSIONS = (".yaml", ".yml")
+
+
+def recipe_from_history(steps):
+    """
+    İşlem geçmişindeki adımlardan bir tarif oluşturur.
+
+    Parametreler:
+        steps (list): gecmis.HistoryStep nesneleri (History.steps)
+
+    Dönüş:
+        dict: Tarif
+    """
+    return {
+        "version": RECIPE_VERSION,
+        "steps": [
+            {
+                "op": ORIGINAL_OP if step.name is None else step.name,
+                "params": _to_plain(step.params),
+                "from_original": step.from_original,
+            }
+            for step in steps
+        ],
+    }
+
+
+def _to_plain(value):
+    """Parametreleri JSON/YAML'a yazılabilir türlere (liste, int, float, str) çevirir."""
+    if isinstance(value, (list, tuple)):
+        return [_to_plain(v) for v in value]
+    # NumPy sayıları (örn. np.float64) yerleşik türlere çevrilir
+    if hasattr(value, "item"):
+        return value.item()
+    return value
+
+
+def parse_recipe(recipe):
+    """
+    Tarifi doğrular ve adımlarını (işlem adı, parametreler, orijinalden mi) üçlülerine çevirir.
+
+    Parametreler:
+        recipe (dict): Tarif
+
+    Dönüş:
+        list: (işlem adı, parametreler, from_original) üçlüleri
+
+    Hata:
+        ValueError: Tarif biçimi, sürümü, işlem adı veya parametreleri geçersizse
+    """
+    if not isinstance(recipe, dict) or not isinstance(recipe.get("steps"), list):
+        raise ValueError("Geçersiz tarif: 'steps' listesi bulunamadı")
+    if recipe.get("version", RECIPE_VERSION) != RECIPE_VERSION:
+        raise ValueError(f"Desteklenmeyen tarif sürümü: {recipe.get('version')}")
+
+    steps = []
+    for i, step in enumerate(recipe["steps"], 1):
+        if not isinstance(step, dict) or "op" not in step:
+            raise ValueError(f"Geçersiz tarif adımı ({i}): 'op' alanı bulunamadı")
+
+        name = step["op"]
+        from_original = bool(step.get("from_original", False))
+        if name == ORIGINAL_OP:
+            steps.append((name, (), True))
+            continue
+
+        try:
+            params = goruntu_islemleri.parse_params(name, list(step.get("params", [])))
+        except ValueError as e:
+            raise ValueError(f"Tarif adımı {i}: {e}") from None
+        steps.append((name, params, from_original))
+
+    return steps
+
+
+def recipe_to_chain(recipe):
+    """
+    Tarifi goruntu_islemleri.apply_chain ile çalıştırılabilecek bir işlem zincirine çevirir.
+
+    Orijinal görüntüye uygulanan bir adım, kendisinden önceki tüm adımların sonucunu
+    kullanmaz. Bu nedenle zincir, orijinal görüntüye uygulanan son adımdan başlar; önceki
+    adımlar hiç çalıştırılmaz.
+
+    Parametreler:
+        recipe (dict): Tarif
+
+    Dönüş:
+        list: (işlem adı, parametreler) çiftleri
+    """
+    steps = parse_recipe(recipe)
+
+    start = 0
+    for i, (_, _, from_original) in enumerate(steps):
+        if from_original:
+            start = i
+
+    return [(name, params) for name, params, _ in steps[start:] if name != ORIGINAL_OP]
+
+
+def run_recipe(image, recipe, approximate=False):
+    """
+    Tarifi bir görüntüye uygular.
+
+    Parametreler:
+        image (numpy.ndarray): RGB görüntü (tarifin "orijinal görüntüsü")
+        recipe (dict): Tarif
+        approximate (bool): Ardışık doğrusal filtreleri yaklaşık olarak birleştir
+            (bkz. goruntu_islemleri.apply_chain)
+
+    Dönüş:
+        numpy.ndarray: İşlenmiş görüntü
+    """
+    return goruntu_islemleri.apply_chain(image, recipe_to_chain(recipe), approximate)
+
+
+def _is_yaml(path):
+    return os.path.splitext(path)[1].lower() in YAML_EXTENSIONS
+
+
+def _require_yaml():
+    if yaml is None:
+        raise ValueError("YAML tarifleri için PyYAML gerekli (pip install pyyaml)")
+
+
+def save_recipe(path, recipe):
+    """
+    Tarifi dosyaya yazar. Biçim dosya uzantısından seçilir (.json, .yaml/.yml).
+
+    Parametreler:
+        path (str): Tarif dosyasının yolu
+        recipe (dict): Tarif
+    """
+    if _is_yaml(path):
+        _require_yaml()
+
+    with open(path, "w", encoding="utf-8") as f:
+        if _is_yaml(path):
+            yaml.safe_dump(recipe, f, allow_unicode=True, sort_keys=False)
+        else:
+            json.dump(recipe, f, ensure_ascii=False, indent=2)
+
+
+def load_recipe(path):
+    """
+    Tarif dosyasını okur ve doğrular.
+
+    Parametreler:
+        path (str): Tarif dosyasının yolu
+
+    Dönüş:
+        dict: Tarif
+
+    Hata:
+        ValueError: Dosya okunamazsa veya tarif geçersizse
+    """
+    if _is_yaml(path):
+        _require_yaml()
+
+    with open(path, encoding="utf-8") as f:
+        if _is_yaml(path):
+            try:
+                recipe = yaml.safe_load(f)
+            except yaml.YAMLError as e:
+                raise ValueError(f"{path} okunamadı: {e}") from None
+        else:
+            try:
+                recipe = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path} okunamadı: {e}") from None
+
+    # Hatalı tarif, görüntüler işlenmeye başlamadan yakalanır
+    parse_recipe(recipe)
+    return recipe
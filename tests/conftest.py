@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Modüller paket olmadan depo kök dizininde durduğu için testlerin bunları içe aktarabilmesi
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,113 @@
+"""
+boru_hatti.py artımlı işlem zincirinin önbellek davranışını doğrular: değişmeyen aşamalar
+tekrar hesaplanmaz, k. aşama değişince yalnızca k. ve sonraki aşamalar hesaplanır ve
+önbellek bayt sınırına göre LRU sırasıyla boşaltılır.
+"""
+
+import numpy as np
+import pytest
+
+import boru_hatti
+import goruntu_islemleri
+
+
+CHAIN = [("gaussian", (5, 1.2)), ("brightness", (20,)), ("negative", ()), ("mean", (3,))]
+
+# Her aşamanın değiştirilmiş hali (negative parametresiz olduğu için başka bir işlemle değişir)
+CHANGED = [("gaussian", (7, 2.0)), ("brightness", (40,)), ("gamma", (0.8,)), ("mean", (5,))]
+
+
+@pytest.fixture
+def image():
+    return np.random.default_rng(0).integers(0, 256, (30, 40, 3), dtype=np.uint8)
+
+
+@pytest.fixture
+def computed(monkeypatch):
+    """Hesaplanan (önbellekten gelmeyen) aşamaların adlarını kaydeder."""
+    names = []
+    apply_operation = goruntu_islemleri.apply_operation
+
+    def recording(image, name, *params):
+        names.append(name)
+        return apply_operation(image, name, *params)
+
+    monkeypatch.setattr(goruntu_islemleri, "apply_operation", recording)
+    return names
+
+
+def apply_one_by_one(image, chain):
+    outputs = []
+    for name, params in chain:
+        image = goruntu_islemleri.apply_operation(image, name, *params)
+        outputs.append(image)
+    return outputs
+
+
+def test_outputs_match_one_by_one(image):
+    outputs = boru_hatti.Pipeline().run_stages(image, CHAIN)
+    for output, expected in zip(outputs, apply_one_by_one(image, CHAIN)):
+        np.testing.assert_array_equal(output, expected)
+
+
+def test_unchanged_chain_is_served_from_cache(image, computed):
+    pipeline = boru_hatti.Pipeline()
+    first = pipeline.run(image, CHAIN)
+    assert computed == [name for name, _ in CHAIN]
+
+    computed.clear()
+    # Aynı içerikli başka bir dizi de aynı anahtarı verir
+    second = pipeline.run(image.copy(), CHAIN)
+    assert computed == []
+    assert second is first
+    assert pipeline.cache.hits == len(CHAIN)
+
+
+@pytest.mark.parametrize("index", range(len(CHAIN)))
+def test_changing_stage_recomputes_it_and_later_stages(image, computed, index):
+    pipeline = boru_hatti.Pipeline()
+    pipeline.run(image, CHAIN)
+
+    chain = list(CHAIN)
+    chain[index] = CHANGED[index]
+
+    computed.clear()
+    outputs = pipeline.run_stages(image, chain)
+    assert computed == [name for name, _ in chain[index:]]
+    np.testing.assert_array_equal(outputs[-1], apply_one_by_one(image, chain)[-1])
+
+
+def test_primed_outputs_are_not_recomputed(image, computed):
+    outputs = apply_one_by_one(image, CHAIN)
+    pipeline = boru_hatti.Pipeline()
+    # Silinmiş (None) geçmiş görüntüleri atlanır
+    pipeline.prime(image, CHAIN, outputs[:2] + [None, outputs[3]])
+
+    computed.clear()
+    result = pipeline.run_stages(image, CHAIN)
+    assert computed == ["negative"]
+    assert result[0] is outputs[0] and result[1] is outputs[1]
+
+
+def test_stage_cache_evicts_least_recently_used_by_bytes():
+    images = [np.full((10, 10), i, np.uint8) for i in range(4)]
+    cache = boru_hatti.StageCache(limit=3 * images[0].nbytes)
+    for i, img in enumerate(images[:3]):
+        cache.put(str(i), img)
+
+    # "0" kullanıldığı için en eski kullanılmayan "1"dir
+    assert cache.get("0") is images[0]
+    cache.put("3", images[3])
+    assert cache.get("1") is None
+    assert [cache.get(key) is not None for key in ("0", "2", "3")] == [True, True, True]
+    assert cache.nbytes == 3 * images[0].nbytes
+
+    # Aynı anahtar tekrar eklenince boyut iki kez sayılmaz
+    cache.put("3", images[3])
+    assert cache.nbytes == 3 * images[0].nbytes and len(cache) == 3
+
+
+def test_stage_cache_skips_images_larger_than_limit():
+    cache = boru_hatti.StageCache(limit=50)
+    cache.put("big", np.zeros(100, np.uint8))
+    assert len(cache) == 0 and cache.nbytes == 0
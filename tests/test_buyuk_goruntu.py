@@ -0,0 +1,47 @@
+"""
+buyuk_goruntu.py memmap okuma / şerit şerit kaydetme yolunun, görüntü açıldığı dosyanın
+üzerine kaydedildiğinde de doğru çalıştığını doğrular.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+import buyuk_goruntu
+
+
+@pytest.fixture
+def image():
+    return np.random.default_rng(0).integers(1, 256, (37, 29, 3), dtype=np.uint8)
+
+
+@pytest.mark.parametrize("ext", [".npy", ".tif"])
+def test_round_trip(tmp_path, image, ext):
+    path = str(tmp_path / f"goruntu{ext}")
+    buyuk_goruntu.save_image_streaming(path, image, strip_rows=8)
+    np.testing.assert_array_equal(buyuk_goruntu.open_image_memmap(path), image)
+
+
+@pytest.mark.parametrize("ext", [".npy", ".tif"])
+def test_save_over_own_source(tmp_path, image, ext):
+    path = str(tmp_path / f"goruntu{ext}")
+    buyuk_goruntu.save_image_streaming(path, image)
+    source = buyuk_goruntu.open_image_memmap(path)
+
+    # Aynı dosyaya kaydetmek, dosyayı okumadan önce kesmemeli
+    buyuk_goruntu.save_image_streaming(path, source, strip_rows=8)
+    np.testing.assert_array_equal(buyuk_goruntu.open_image_memmap(path), image)
+
+    # İşlenmiş bir sonuç kaydedildiğinde açık memmap eski içeriği görmeye devam eder
+    processed = 255 - image
+    buyuk_goruntu.save_image_streaming(path, processed)
+    np.testing.assert_array_equal(source, image)
+    np.testing.assert_array_equal(buyuk_goruntu.open_image_memmap(path), processed)
+    assert os.listdir(tmp_path) == [os.path.basename(path)]
+
+
+def test_failed_save_leaves_no_temp_file(tmp_path, image):
+    with pytest.raises(ValueError):
+        buyuk_goruntu.save_image_streaming(str(tmp_path / "goruntu.png"), image)
+    assert os.listdir(tmp_path) == []
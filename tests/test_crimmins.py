@@ -0,0 +1,137 @@
+"""
+Crimmins speckle filtresinin vektörel uygulamasını, önceki iç içe döngülü uygulamayla
+küçük görüntülerde karşılaştırır.
+"""
+
+import numpy as np
+import pytest
+
+import goruntu_islemleri
+
+
+def crimmins_one_iteration(img, copy):
+    # Önceki uygulamanın döngüsü (değiştirilmeden kopyalandı)
+    # Yardımcı fonksiyonlar - sırasıyla 4 yönde ilerleyip filtreleme yapar
+    # Kuzey (yukarı)
+    for i in range(1, img.shape[0]):
+        for j in range(img.shape[1]):
+            if img[i-1, j] >= img[i, j] + 2:
+                copy[i, j] = copy[i, j] + 1
+            elif img[i, j] >= img[i-1, j] + 2:
+                copy[i, j] = copy[i, j] - 1
+
+    # Güney (aşağı)
+    for i in range(img.shape[0]-2, -1, -1):
+        for j in range(img.shape[1]):
+            if img[i+1, j] >= img[i, j] + 2:
+                copy[i, j] = copy[i, j] + 1
+            elif img[i, j] >= img[i+1, j] + 2:
+                copy[i, j] = copy[i, j] - 1
+
+    # Doğu (sağa)
+    for i in range(img.shape[0]):
+        for j in range(1, img.shape[1]):
+            if img[i, j-1] >= img[i, j] + 2:
+                copy[i, j] = copy[i, j] + 1
+            elif img[i, j] >= img[i, j-1] + 2:
+                copy[i, j] = copy[i, j] - 1
+
+    # Batı (sola)
+    for i in range(img.shape[0]):
+        for j in range(img.shape[1]-2, -1, -1):
+            if img[i, j+1] >= img[i, j] + 2:
+                copy[i, j] = copy[i, j] + 1
+            elif img[i, j] >= img[i, j+1] + 2:
+                copy[i, j] = copy[i, j] - 1
+
+    # Kuzeydoğu (sağ üst çapraz)
+    for i in range(1, img.shape[0]):
+        for j in range(1, img.shape[1]):
+            if img[i-1, j-1] >= img[i, j] + 2:
+                copy[i, j] = copy[i, j] + 1
+            elif img[i, j] >= img[i-1, j-1] + 2:
+                copy[i, j] = copy[i, j] - 1
+
+    # Güneybatı (sol alt çapraz)
+    for i in range(img.shape[0]-2, -1, -1):
+        for j in range(img.shape[1]-2, -1, -1):
+            if img[i+1, j+1] >= img[i, j] + 2:
+                copy[i, j] = copy[i, j] + 1
+            elif img[i, j] >= img[i+1, j+1] + 2:
+                copy[i, j] = copy[i, j] - 1
+
+    # Kuzeybatı (sol üst çapraz)
+    for i in range(1, img.shape[0]):
+        for j in range(img.shape[1]-2, -1, -1):
+            if img[i-1, j+1] >= img[i, j] + 2:
+                copy[i, j] = copy[i, j] + 1
+            elif img[i, j] >= img[i-1, j+1] + 2:
+                copy[i, j] = copy[i, j] - 1
+
+    # Güneydoğu (sağ alt çapraz)
+    for i in range(img.shape[0]-2, -1, -1):
+        for j in range(1, img.shape[1]):
+            if img[i+1, j-1] >= img[i, j] + 2:
+                copy[i, j] = copy[i, j] + 1
+            elif img[i, j] >= img[i+1, j-1] + 2:
+                copy[i, j] = copy[i, j] - 1
+
+    return copy
+
+
+def reference_crimmins(image, iterations):
+    """Önceki uygulamanın gri tonlamalı ve renkli görüntü yolları (iterasyon sayısı parametreli)."""
+    result = image.copy()
+    if len(image.shape) == 2 or (len(image.shape) == 3 and image.shape[2] == 1):
+        img_copy = image.copy()
+        for _ in range(iterations):
+            img_copy = crimmins_one_iteration(img_copy, img_copy.copy())
+        result = img_copy
+    else:
+        for k in range(3):
+            img_channel = image[:,:,k].copy()
+            img_copy = img_channel.copy()
+            for _ in range(iterations):
+                img_copy = crimmins_one_iteration(img_copy, img_copy.copy())
+            result[:,:,k] = img_copy
+    return result
+
+
+def random_image(shape, seed):
+    # Değerler 40-215 aralığında: her iterasyon bir pikseli en fazla 8 seviye taşıyabildiği için
+    # eski döngünün uint8 taşması bu testlerde oluşmaz
+    return np.random.default_rng(seed).integers(40, 216, shape, dtype=np.uint8)
+
+
+@pytest.mark.parametrize("shape", [(9, 11), (1, 7), (7, 1), (1, 1), (2, 2), (8, 6, 3), (1, 5, 3), (5, 1, 3)])
+@pytest.mark.parametrize("iterations", [0, 1, 2, 5])
+def test_matches_reference_loop(shape, iterations):
+    image = random_image(shape, seed=sum(shape) + iterations)
+    expected = reference_crimmins(image, iterations)
+    result = goruntu_islemleri.apply_crimmins_speckle(image, iterations)
+    assert result.dtype == np.uint8
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_speckle_is_removed_like_reference():
+    image = np.full((7, 7), 100, np.uint8)
+    image[3, 3] = 200
+    image[1, 5] = 10
+    np.testing.assert_array_equal(goruntu_islemleri.apply_crimmins_speckle(image, 5),
+                                  reference_crimmins(image, 5))
+
+
+def test_clips_instead_of_wrapping():
+    # Eski döngü uint8 üzerinde topladığı için taşıyordu: 255'lerin ortasındaki 250, 8 artışla
+    # 258 yerine 2 olurdu; sıfırların ortasındaki 5, 8 azalışla -3 yerine 253 olurdu
+    bright = np.full((3, 3), 255, np.uint8)
+    bright[1, 1] = 250
+    dark = np.zeros((3, 3), np.uint8)
+    dark[1, 1] = 5
+
+    with np.errstate(over="ignore"):
+        assert reference_crimmins(bright, 1)[1, 1] == 2
+        assert reference_crimmins(dark, 1)[1, 1] == 253
+
+    assert goruntu_islemleri.apply_crimmins_speckle(bright, 1)[1, 1] == 255
+    assert goruntu_islemleri.apply_crimmins_speckle(dark, 1)[1, 1] == 0
@@ -0,0 +1,64 @@
+"""
+fft_arka_uclari.py arka uç seçiminin görüntünün kendi boyutunda ölçüm yapmadığını ve
+wisdom dosyasının yalnızca istenirse yazıldığını doğrular.
+"""
+
+import numpy as np
+import pytest
+
+import fft_arka_uclari
+
+
+@pytest.fixture
+def measured(monkeypatch):
+    """Ölçülen boyutları kaydeden, ölçüm yapmayan benchmark."""
+    shapes = []
+
+    def fake_benchmark(shape, dtype):
+        shapes.append((shape, dtype))
+        return {name: float(i) for i, name in enumerate(reversed(list(fft_arka_uclari.BACKENDS)))}
+
+    monkeypatch.setattr(fft_arka_uclari, "benchmark", fake_benchmark)
+    monkeypatch.setattr(fft_arka_uclari, "_timings", {})
+    monkeypatch.setattr(fft_arka_uclari, "_benchmark_thread", None)
+    monkeypatch.setattr(fft_arka_uclari, "_forced_backend", None)
+    return shapes
+
+
+@pytest.mark.parametrize("shape, size", [((100, 100), 256), ((300, 400), 256), ((512, 512), 512),
+                                         ((700, 800), 1024), ((3000, 4000), 2048)])
+def test_nearest_benchmark_size(shape, size):
+    assert fft_arka_uclari.nearest_benchmark_size(shape) == size
+
+
+@pytest.mark.skipif(len(fft_arka_uclari.BACKENDS) == 1, reason="Yalnızca OpenCV kurulu")
+def test_new_shapes_reuse_representative_measurements(measured):
+    for shape in [(600, 900), (700, 800), (1000, 1000)]:
+        fft_arka_uclari.backend_for(shape, np.float32)
+    assert measured == [((1024, 1024), "float32")]
+
+
+@pytest.mark.skipif(len(fft_arka_uclari.BACKENDS) == 1, reason="Yalnızca OpenCV kurulu")
+def test_backend_for_does_not_wait_for_background_benchmark(measured, monkeypatch):
+    class RunningThread:
+        def is_alive(self):
+            return True
+
+    monkeypatch.setattr(fft_arka_uclari, "_benchmark_thread", RunningThread())
+    backend = fft_arka_uclari.backend_for((1200, 1600), np.float32)
+    assert backend is fft_arka_uclari._default_backend()
+    assert measured == []
+
+
+@pytest.mark.skipif(fft_arka_uclari.pyfftw is None, reason="pyFFTW kurulu değil")
+def test_wisdom_is_written_only_when_requested(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(fft_arka_uclari, "FFTW_WISDOM_PATH", None)
+    backend = fft_arka_uclari.PyFFTWBackend()
+    backend.forward(np.zeros((8, 12), np.float32))
+    assert list(tmp_path.iterdir()) == []
+
+    path = tmp_path / "wisdom"
+    fft_arka_uclari.set_wisdom_path(str(path))
+    backend.forward(np.zeros((8, 14), np.float32))
+    assert path.exists()
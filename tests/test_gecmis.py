@@ -0,0 +1,55 @@
+"""
+gecmis.py bellek sınırının uygulanmasını ve silinen adımların yeniden üretilmesini doğrular.
+"""
+
+import numpy as np
+import pytest
+
+import gecmis
+import goruntu_islemleri
+
+
+@pytest.fixture
+def image():
+    return np.random.default_rng(0).integers(0, 256, (24, 32, 3), dtype=np.uint8)
+
+
+def push(history, image, name, *params):
+    result = goruntu_islemleri.apply_operation(image, name, *params)
+    history.push(result, name, params)
+    return result
+
+
+def test_limit_evicts_old_steps_and_replays_them(image):
+    history = gecmis.History(memory_limit=2 * image.nbytes)
+    history.reset(image)
+    current, results = image, []
+    for i in range(10):
+        current = push(history, current, "kmeans" if i % 2 else "brightness", *((3,) if i % 2 else (i + 1,)))
+        results.append(current)
+
+    # Yalnızca ilk adım ve güncel adım saklanır
+    assert history.memory_usage <= history.memory_limit
+    assert sum(step.image is not None for step in history._steps) == 2
+
+    # Silinen adımlar geri alınınca birebir aynı sonuçla yeniden üretilir
+    for expected in reversed(results[:-1]):
+        np.testing.assert_array_equal(history.undo(), expected)
+    for expected in results[1:]:
+        np.testing.assert_array_equal(history.redo(), expected)
+
+
+def test_shared_images_are_counted_once(image):
+    history = gecmis.History(memory_limit=3 * image.nbytes)
+    history.reset(image)
+    first = push(history, image, "negative")
+    # Aynı diziyi gösteren adımlar (orijinale dönüş ve bir görünüm)
+    history.push(first, None, (), True)
+    history.push(first[:, ::-1][:, ::-1], None, (), True)
+    assert history.memory_usage == 2 * image.nbytes
+
+    # Sınır aşıldığında ortak dizi, onu gösteren tüm adımlar silinene kadar sayılmaya devam eder
+    push(history, first, "brightness", 10)
+    push(history, history._steps[-1].image, "brightness", 20)
+    assert history.memory_usage <= history.memory_limit
+    assert history.memory_usage == 3 * image.nbytes
@@ -0,0 +1,41 @@
+"""
+islem_birlestirme.py yaklaşık (doğrusal) birleştirmelerinin ardışık uygulamadan en fazla
+birleştirilen aşama başına bir gri seviyesi farklı olduğunu doğrular.
+"""
+
+import cv2
+import numpy as np
+import pytest
+
+import islem_birlestirme
+
+
+CHAINS = [
+    [("gaussian", (3, 2.0)), ("gaussian", (3, 2.0))],
+    [("gaussian", (5, 0)), ("gaussian", (7, 3.0))],
+    [("gaussian", (9, 1.0)), ("gaussian", (9, 1.0))],
+    [("mean", (3,)), ("gaussian", (5, 1.0))],
+    [("gaussian", (3, 2.0)), ("gaussian", (3, 2.0)), ("mean", (3,))],
+]
+
+
+@pytest.mark.parametrize("chain", CHAINS)
+@pytest.mark.parametrize("shape", [(40, 50), (40, 50, 3)])
+def test_linear_fusion_is_within_one_level_per_stage(chain, shape):
+    image = np.random.default_rng(0).integers(0, 256, shape, dtype=np.uint8)
+    plan = islem_birlestirme.plan_chain(chain, approximate=True)
+    assert plan == [("separable", plan[0][1])]
+
+    exact = islem_birlestirme.run_plan(image, islem_birlestirme.plan_chain(chain))
+    fused = islem_birlestirme.run_plan(image, plan)
+    assert np.abs(exact.astype(int) - fused).max() <= len(chain) - 1
+
+
+def test_gaussians_fuse_to_convolution_of_truncated_kernels():
+    # Birleşik çekirdek, kesilmiş 3'lük çekirdeklerin tam konvolüsyonudur
+    # (sigma'ları birleştirilmiş daha geniş bir Gaussian değil)
+    kernel = cv2.getGaussianKernel(3, 2.0).ravel()
+    (name, (fused,)), = islem_birlestirme.plan_chain(
+        [("gaussian", (3, 2.0)), ("gaussian", (3, 2.0))], approximate=True)
+    assert name == "separable"
+    np.testing.assert_allclose(fused, np.convolve(kernel, kernel))
@@ -0,0 +1,52 @@
+"""
+karolu_isleme.py frekans alanı filtrelerinin karo karo sonucunu tam görüntü filtresiyle
+karşılaştırır ve --stream modunda kullanılamayan filtreleri doğrular.
+"""
+
+import numpy as np
+import pytest
+
+import buyuk_goruntu
+import frekans_alani
+import goruntu_islemleri
+import karolu_isleme
+
+
+@pytest.fixture(scope="module")
+def image():
+    # Düzgün değişen bir desen üzerine gürültü: farklar kenar ve dokularda görünür
+    rng = np.random.default_rng(0)
+    y, x = np.mgrid[:300, :400]
+    base = 128 + 60 * np.sin(x / 17.0) * np.cos(y / 23.0)
+    noisy = base[..., None] + rng.normal(0, 20, (300, 400, 3))
+    return np.clip(noisy, 0, 255).astype(np.uint8)
+
+
+@pytest.mark.parametrize("name, params", [
+    ("butterworth", ("lowpass", 40, 2)),
+    ("butterworth", ("highpass", 40, 10)),
+    ("gaussian_freq", ("lowpass", 30)),
+    ("gaussian_freq", ("highpass", 20)),
+    ("homomorphic", (2.0, 0.5, 30)),
+])
+def test_tiled_frequency_filter_is_within_one_level(image, name, params):
+    tiled = karolu_isleme.KAROLU_ISLEMLER[name](image, *params, tile_size=128)
+    whole = goruntu_islemleri.ISLEMLER[name][0](image, *params)
+    assert np.abs(tiled.astype(int) - whole).max() <= 1
+
+
+@pytest.mark.parametrize("name", ["lowpass", "highpass", "band_pass", "band_stop"])
+def test_ideal_filters_are_not_streamable(tmp_path, name):
+    assert name not in karolu_isleme.KAROLU_ISLEMLER
+    with pytest.raises(ValueError, match=name):
+        buyuk_goruntu.process_file_streaming(str(tmp_path / "girdi.npy"), str(tmp_path / "cikti.npy"),
+                                             [(name, (30,))])
+
+
+def test_kernel_radius_is_bounded_by_tile_size(image):
+    with pytest.raises(ValueError, match="yarıçap"):
+        frekans_alani.kernel_radius((20000, 20000), "gaussian_lowpass", (30,), max_radius=1024)
+    assert frekans_alani.kernel_radius((20000, 20000), "gaussian_lowpass", (40,), max_radius=1024) == 1000
+
+    with pytest.raises(ValueError):
+        karolu_isleme.apply_gaussian_freq(image, "lowpass", 3, tile_size=128)
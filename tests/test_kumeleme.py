@@ -0,0 +1,43 @@
+"""
+kumeleme.py palet modunun girdi denetimini ve inertia hesabını doğrular.
+"""
+
+import numpy as np
+import pytest
+
+import kumeleme
+
+
+def direct_inertia(pixels, labels, centers):
+    """Her pikselin merkezine olan uzaklığının karelerinin toplamı, doğrudan hesapla."""
+    return float(((pixels.astype(np.float64) - centers[labels]) ** 2).sum())
+
+
+@pytest.mark.parametrize("shape", [(30, 40, 3), (30, 40)])
+@pytest.mark.parametrize("bits", [3, 5, 8])
+def test_palette_kmeans_inertia_matches_pixels(shape, bits):
+    image = np.random.default_rng(0).integers(0, 256, shape, dtype=np.uint8)
+    pixels = kumeleme.pixel_data(image)
+    labels, centers, inertia = kumeleme.palette_kmeans(pixels, 4, bits)
+
+    assert centers.shape == (4, pixels.shape[1])
+    assert inertia == pytest.approx(direct_inertia(pixels, labels, centers.astype(np.float64)), rel=1e-6)
+    # Aynı tohum aynı sonucu verir
+    np.testing.assert_array_equal(kumeleme.palette_kmeans(pixels, 4, bits)[0], labels)
+
+
+def test_color_palette_accepts_single_channel_vector():
+    grey = np.random.default_rng(0).integers(0, 256, 500, dtype=np.uint8)
+    _, _, palette, weights, _ = kumeleme.color_palette(grey, 5)
+    assert palette.shape[1] == 1
+    assert weights.sum() == len(grey)
+
+
+@pytest.mark.parametrize("pixels", [
+    np.zeros((30, 40), np.uint8),          # pixel_data'dan geçirilmemiş gri görüntü
+    np.zeros((30, 40, 3), np.uint8),       # pixel_data'dan geçirilmemiş renkli görüntü
+    np.zeros((100, 3), np.float32),
+])
+def test_color_palette_rejects_invalid_input(pixels):
+    with pytest.raises(ValueError):
+        kumeleme.color_palette(pixels, 5)
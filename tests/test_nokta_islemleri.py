@@ -0,0 +1,76 @@
+"""
+nokta_islemleri.py arama tablosu zincirlerinin, işlemlerin goruntu_islemleri içindeki
+karşılıklarıyla tek tek uygulanmasıyla birebir aynı sonucu verdiğini doğrular.
+"""
+
+import numpy as np
+import pytest
+
+import goruntu_islemleri
+import nokta_islemleri
+
+
+def apply_one_by_one(image, chain):
+    for name, params in chain:
+        image = goruntu_islemleri.apply_operation(image, name, *params)
+    return image
+
+
+def random_op(rng):
+    name = rng.choice(list(nokta_islemleri.NOKTA_ISLEMLERI))
+    if name == "brightness":
+        return name, (int(rng.integers(-120, 121)),)
+    if name == "contrast":
+        return name, (float(np.round(rng.uniform(0.2, 3.0), 2)),)
+    if name == "gamma":
+        return name, (float(np.round(rng.uniform(0.2, 3.0), 2)),)
+    if name == "threshold":
+        return name, (int(rng.integers(0, 256)),)
+    return name, ()
+
+
+@pytest.fixture(scope="module")
+def image():
+    return np.random.default_rng(0).integers(0, 256, (23, 31, 3), dtype=np.uint8)
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_random_chain_matches_one_by_one(image, seed):
+    rng = np.random.default_rng(seed)
+    chain = [random_op(rng) for _ in range(rng.integers(2, 7))]
+    np.testing.assert_array_equal(nokta_islemleri.apply_point_chain(image, chain), apply_one_by_one(image, chain))
+
+
+@pytest.mark.parametrize("chain", [
+    [("brightness", (20,)), ("contrast", (1.5,)), ("gamma", (0.8,))],
+    [("brightness", (255,)), ("brightness", (-255,))],
+    [("contrast", (0.5,)), ("equalize", ()), ("negative", ())],
+    [("gamma", (2.2,)), ("gray", ()), ("equalize", ()), ("threshold", (128,))],
+    [("negative", ()), ("threshold", (0,)), ("equalize", ())],
+])
+def test_chain_matches_one_by_one(image, chain):
+    np.testing.assert_array_equal(nokta_islemleri.apply_point_chain(image, chain), apply_one_by_one(image, chain))
+
+
+def test_equalization_of_constant_image_matches_opencv():
+    image = np.full((8, 8, 3), 77, np.uint8)
+    chain = [("brightness", (10,)), ("equalize", ())]
+    np.testing.assert_array_equal(nokta_islemleri.apply_point_chain(image, chain), apply_one_by_one(image, chain))
+
+
+def test_apply_chain_uses_single_lut_pass(image, monkeypatch):
+    chain = [("brightness", (20,)), ("contrast", (1.5,)), ("gamma", (0.8,)), ("negative", ())]
+    expected = apply_one_by_one(image, chain)
+
+    calls = []
+    original = nokta_islemleri.apply_point_chain
+    monkeypatch.setattr(nokta_islemleri, "apply_point_chain", lambda *args: calls.append(args) or original(*args))
+    np.testing.assert_array_equal(goruntu_islemleri.apply_chain(image, chain), expected)
+    assert len(calls) == 1
+
+
+def test_compile_lut_rejects_non_point_operation():
+    with pytest.raises(ValueError):
+        nokta_islemleri.compile_lut([("gaussian", (5, 1.0))])
+    with pytest.raises(ValueError):
+        nokta_islemleri.compile_lut([("equalize", ())])
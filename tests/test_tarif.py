@@ -0,0 +1,99 @@
+"""
+tarif.py tariflerinin JSON/YAML dosyalarına yazılıp okunduğunda aynı adımları verdiğini ve
+tarifin, arayüzde uygulanan işlemlerle aynı sonucu ürettiğini doğrular.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+import gecmis
+import goruntu_islemleri
+import tarif
+
+
+@pytest.fixture(scope="module")
+def image():
+    return np.random.default_rng(0).integers(0, 256, (40, 48, 3), dtype=np.uint8)
+
+
+# (işlem adı, parametreler, orijinalden mi); None orijinal görüntüye dönüş adımıdır
+STEPS = [
+    ("brightness", (20,), False),
+    ("gaussian", (5, np.float64(1.2)), False),
+    (None, (), True),
+    ("perspective", (((2, 3), (44, 1), (0, 38), (47, 39)), 32, 24), True),
+    ("contrast", (1.5,), False),
+    ("hough_lines", (1, 1.0, 30, 0.0, float(np.pi), None), False),
+]
+
+
+def build_history(image, steps=STEPS):
+    """Adımları arayüzdeki gibi uygulayıp geçmişe ekler."""
+    history = gecmis.History()
+    history.reset(image)
+    current = image
+    for name, params, from_original in steps:
+        source = image if from_original else current
+        current = source if name is None else goruntu_islemleri.apply_operation(source, name, *params)
+        history.push(current, name, params, from_original)
+    return history, current
+
+
+@pytest.mark.parametrize("extension", [".json", ".yaml"])
+def test_round_trip(tmp_path, image, extension):
+    if extension == ".yaml" and tarif.yaml is None:
+        pytest.skip("PyYAML kurulu değil")
+
+    history, _ = build_history(image)
+    path = str(tmp_path / f"tarif{extension}")
+    tarif.save_recipe(path, tarif.recipe_from_history(history.steps))
+
+    parsed = tarif.parse_recipe(tarif.load_recipe(path))
+    expected = [(tarif.ORIGINAL_OP if name is None else name,
+                 goruntu_islemleri.parse_params(name, list(tarif._to_plain(params))) if name else (),
+                 from_original)
+                for name, params, from_original in STEPS]
+    assert parsed == expected
+
+
+def test_recipe_reproduces_history(tmp_path, image):
+    history, current = build_history(image)
+    path = str(tmp_path / "tarif.json")
+    tarif.save_recipe(path, tarif.recipe_from_history(history.steps))
+
+    result = tarif.run_recipe(image, tarif.load_recipe(path))
+    np.testing.assert_array_equal(result, current)
+
+
+def test_chain_starts_at_last_from_original_step(image):
+    history, _ = build_history(image)
+    chain = tarif.recipe_to_chain(tarif.recipe_from_history(history.steps))
+    # Orijinal görüntüye uygulanan son adımdan (perspektif) önceki adımlar çalıştırılmaz
+    assert [name for name, _ in chain] == ["perspective", "contrast", "hough_lines"]
+
+
+@pytest.mark.parametrize("recipe", [
+    [],
+    {"steps": "gaussian"},
+    {"version": 99, "steps": []},
+    {"steps": [{"params": [5]}]},
+    {"steps": [{"op": "yok_boyle_islem"}]},
+    {"steps": [{"op": "gaussian", "params": ["bes", 1.2]}]},
+    {"steps": [{"op": "hough_lines", "params": [1, 1.0, 30, 0.0, 3.1, "None"]}]},
+])
+def test_invalid_recipes_are_rejected(recipe):
+    with pytest.raises(ValueError):
+        tarif.parse_recipe(recipe)
+
+
+def test_load_rejects_broken_file(tmp_path):
+    path = tmp_path / "bozuk.json"
+    path.write_text("{\"steps\": [", encoding="utf-8")
+    with pytest.raises(ValueError):
+        tarif.load_recipe(str(path))
+
+    path.write_text(json.dumps({"steps": [{"op": "mean", "params": []}]}), encoding="utf-8")
+    with pytest.raises(ValueError):
+        tarif.load_recipe(str(path))
@@ -0,0 +1,241 @@
+"""
+TOPLU GÖRÜNTÜ İŞLEME (KOMUT SATIRI)
+-----------------------------------
+
+Bir dosya desenine (glob) uyan tüm görüntülere aynı işlem zincirini uygular ve sonuçları
+bir çıktı klasörüne kaydeder. Dosyalar, birden fazla işlem (process) arasında paylaştırılır;
+her dosyanın süresi ve toplam işlem hızı (dosya/sn) raporlanır.
+
+Kullanım örneği:
+    python toplu_isleme.py "taramalar/*.png" -o sonuclar --op gray --op gaussian:5,1.2 --op canny:100,200 -j 8
+
+İşlem zinciri, arayüzde kaydedilen bir tariften de okunabilir (bkz. tarif):
+    python toplu_isleme.py "taramalar/*.png" -o sonuclar --recipe ayarlar.json
+
+İşlem adları ve parametre türleri goruntu_islemleri.ISLEMLER sözlüğünde tanımlıdır.
+Parametreler, ilgili fonksiyona sırasıyla geçirilir (açılar radyan cinsindendir).
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import cv2
+
+import buyuk_goruntu
+import goruntu_islemleri
+import karolu_isleme
+import tarif
+
+
+def parse_operation(text):
+    """
+    "ad:p1,p2,..." biçimindeki işlem tanımını (ad, parametreler) çiftine dönüştürür.
+
+    Parametreler:
+        text (str): İşlem tanımı, örn. "gaussian:5,1.2" veya "gray"
+
+    Dönüş:
+        tuple: (işlem adı, dönüştürülmüş parametreler)
+    """
+    name, _, param_text = text.partition(":")
+    params = [p.strip() for p in param_text.split(",")] if param_text else []
+
+    try:
+        return name.strip(), goruntu_islemleri.parse_params(name.strip(), params)
+    except ValueError as e:
+        # argparse, ArgumentTypeError mesajını doğrudan kullanıcıya gösterir
+        raise argparse.ArgumentTypeError(str(e)) from None
+
+
+def _init_worker():
+    """
+    İşçi süreçlerinde OpenCV'nin kendi iş parçacığı havuzunu kapatır. Paralellik dosyalar
+    arasında sağlandığı için her sürecin tüm çekirdekleri kullanmaya çalışması
+    çekirdeklerin gereğinden fazla paylaşılmasına yol açar.
+    """
+    cv2.setNumThreads(1)
+
+
+def output_paths(paths, output_dir):
+    """
+    Her girdi için çıktı yolunu belirler. Çıktılar, girdilerin ortak klasörüne göre göreli
+    yollarıyla çıktı klasörüne yazılır; böylece farklı alt klasörlerdeki aynı adlı dosyalar
+    birbirinin üzerine yazılmaz.
+
+    Parametreler:
+        paths (list): Girdi dosyalarının yolları
+        output_dir (str): Çıktı klasörü
+
+    Dönüş:
+        list: (girdi yolu, çıktı yolu) çiftleri
+
+    Hata:
+        ValueError: Bir çıktı girdilerden birinin kendisiyse veya iki girdi aynı çıktıya
+            yazılacaksa
+    """
+    input_dirs = [os.path.dirname(os.path.abspath(path)) for path in paths]
+    root = os.path.commonpath(input_dirs)
+
+    inputs = {os.path.normcase(os.path.realpath(path)) for path in paths}
+    jobs = []
+    seen = {}
+    for path in paths:
+        output_path = os.path.join(output_dir, os.path.relpath(os.path.abspath(path), root))
+        key = os.path.normcase(os.path.realpath(output_path))
+        if key in inputs:
+            raise ValueError(f"çıktı girdinin üzerine yazılacak: {output_path} (başka bir -o klasörü seçin)")
+        if key in seen:
+            raise ValueError(f"{seen[key]} ve {path} aynı çıktıya yazılacak: {output_path}")
+        seen[key] = path
+        jobs.append((path, output_path))
+    return jobs
+
+
+def process_file(input_path, output_path, chain, stream=False, approximate=False, tile_workers=None):
+    """
+    Tek bir görüntüyü okur, işlem zincirini uygular ve sonucu kaydeder.
+
+    Parametreler:
+        input_path (str): Girdi görüntüsünün yolu
+        output_path (str): Çıktı dosyasının yolu (klasörü yoksa oluşturulur)
+        chain (list): (işlem adı, parametreler) çiftleri
+        stream (bool): True ise .npy/.tif girdiler belleğe okunmadan, memmap üzerinde
+            karo karo işlenir (bkz. buyuk_goruntu.process_file_streaming)
+        approximate (bool): Ardışık doğrusal filtreleri yaklaşık olarak birleştir
+            (bkz. islem_birlestirme)
+        tile_workers (int): stream modunda karoları işleyen iş parçacığı sayısı
+            (None: çekirdek sayısı)
+
+    Dönüş:
+        tuple: (girdi yolu, geçen süre (sn), hata mesajı veya None)
+    """
+    start = time.perf_counter()
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+
+        if stream:
+            buyuk_goruntu.process_file_streaming(input_path, output_path, chain, workers=tile_workers)
+            return input_path, time.perf_counter() - start, None
+
+        image = cv2.imread(input_path)
+        if image is None:
+            raise ValueError("görüntü okunamadı")
+
+        # Uygulama gibi RGB üzerinde çalış, kaydederken BGR'ye geri dön
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        result = goruntu_islemleri.apply_chain(image, chain, approximate)
+
+        if not cv2.imwrite(output_path, cv2.cvtColor(result, cv2.COLOR_RGB2BGR)):
+            raise ValueError(f"{output_path} yazılamadı")
+    except Exception as e:
+        return input_path, time.perf_counter() - start, str(e)
+
+    return input_path, time.perf_counter() - start, None
+
+
+def run_batch(jobs, chain, workers, stream=False, approximate=False):
+    """
+    Dosyaları işlem havuzunda işler ve her dosya bittikçe sonucunu raporlar.
+
+    Parametreler:
+        jobs (list): (girdi yolu, çıktı yolu) çiftleri (bkz. output_paths)
+        chain (list): (işlem adı, parametreler) çiftleri
+        workers (int): İşçi süreç sayısı (1 ise dosyalar bu süreçte sırayla işlenir)
+        stream (bool): Büyük dosyaları memmap üzerinde karo karo işle
+        approximate (bool): Ardışık doğrusal filtreleri yaklaşık olarak birleştir
+
+    Dönüş:
+        int: Hatalı dosya sayısı
+    """
+    total = len(jobs)
+    failures = 0
+    start = time.perf_counter()
+
+    def report(done, result):
+        path, elapsed, error = result
+        status = f"HATA: {error}" if error else "tamam"
+        print(f"[{done}/{total}] {path}  {elapsed:.3f} sn  {status}")
+
+    if workers == 1:
+        # Tek süreçte karolar tüm çekirdeklere dağıtılır
+        results = (process_file(path, output_path, chain, stream, approximate) for path, output_path in jobs)
+        for done, result in enumerate(results, 1):
+            failures += result[2] is not None
+            report(done, result)
+    else:
+        # Paralellik dosyalar arasında sağlanır; her süreç karoları tek iş parçacığında işler,
+        # aksi halde süreç sayısı x çekirdek sayısı kadar iş parçacığı oluşur
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            futures = [executor.submit(process_file, path, output_path, chain, stream, approximate, 1)
+                       for path, output_path in jobs]
+            for done, future in enumerate(as_completed(futures), 1):
+                result = future.result()
+                failures += result[2] is not None
+                report(done, result)
+
+    elapsed = time.perf_counter() - start
+    throughput = total / elapsed if elapsed > 0 else 0.0
+    print(f"{total} dosya {elapsed:.2f} sn içinde işlendi ({throughput:.2f} dosya/sn), {failures} hata")
+
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Bir klasördeki görüntülere işlem zinciri uygular.",
+        epilog="İşlemler: " + ", ".join(goruntu_islemleri.ISLEMLER),
+    )
+    parser.add_argument("input", help='Girdi dosya deseni, örn. "taramalar/*.png"')
+    parser.add_argument("-o", "--output-dir", required=True, help="Çıktı klasörü")
+    parser.add_argument("--op", dest="chain", action="append", type=parse_operation, default=[],
+                        metavar="AD[:P1,P2,...]", help="Uygulanacak işlem (sırayla, birden fazla verilebilir)")
+    parser.add_argument("--recipe", metavar="DOSYA",
+                        help="Arayüzde kaydedilen tarif dosyası (.json, .yaml); --op işlemleri tariften sonra uygulanır")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="İşçi süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument("--stream", action="store_true",
+                        help="Belleğe sığmayan .npy/.tif dosyalarını memmap üzerinde karo karo işle "
+                             "(-j 1 ile karolar tüm çekirdeklere dağıtılır, aksi halde her süreç tek iş parçacığı kullanır)")
+    parser.add_argument("--fuse-linear", action="store_true",
+                        help="Ardışık ortalama/Gaussian filtrelerini tek konvolüsyonda birleştir "
+                             "(daha hızlı, sonuç aşama başına en fazla bir gri seviyesi farklı olabilir)")
+    args = parser.parse_args(argv)
+
+    if args.workers < 1:
+        parser.error("--workers en az 1 olmalıdır")
+
+    chain = args.chain
+    if args.recipe:
+        try:
+            chain = tarif.recipe_to_chain(tarif.load_recipe(args.recipe)) + chain
+        except (OSError, ValueError) as e:
+            parser.error(f"tarif okunamadı: {e}")
+    if not chain:
+        parser.error("en az bir --op veya --recipe gerekli")
+
+    paths = sorted(glob.glob(args.input, recursive=True))
+    if not paths:
+        parser.error(f"'{args.input}' ile eşleşen dosya bulunamadı")
+
+    if args.stream:
+        unsupported = [name for name, _ in chain if name not in karolu_isleme.KAROLU_ISLEMLER]
+        if unsupported:
+            parser.error(f"--stream ile kullanılamayan işlemler: {', '.join(unsupported)}")
+
+    try:
+        jobs = output_paths(paths, args.output_dir)
+    except ValueError as e:
+        parser.error(str(e))
+
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    failures = run_batch(jobs, chain, args.workers, args.stream, args.fuse_linear)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())